@@ -0,0 +1,153 @@
+"""Benchmark health check cycle time against instance count.
+
+Starts a local stub HTTP server whose /health endpoints respond after a
+per-instance delay, then times serial (one check at a time) and concurrent
+cycles for increasing instance counts.
+
+Run from the repository root:
+
+    python -m application_uptime_monitor.benchmarks.health_check_cycle
+"""
+
+import argparse
+import logging
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Tuple
+
+from application_uptime_monitor.src.main import (
+    Config,
+    close_region_sessions,
+    create_region_sessions,
+    run_health_check_cycle,
+)
+
+
+class StubHealthHandler(BaseHTTPRequestHandler):
+    """Respond to /<delay_ms>/health after sleeping delay_ms milliseconds."""
+
+    def do_GET(self) -> None:  # noqa: N802
+        """Handle a health check request."""
+        delay_ms = int(self.path.strip("/").split("/")[0])
+        time.sleep(delay_ms / 1000)
+        body = b'{"status": "ok"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        """Silence per-request logging."""
+
+
+class StubServer(ThreadingHTTPServer):
+    """Threaded stub server with a listen backlog large enough for bursts."""
+
+    daemon_threads = True
+    request_queue_size = 256
+
+
+def start_stub_server() -> Tuple[ThreadingHTTPServer, int]:
+    """Start the stub server on an ephemeral port.
+
+    Returns:
+        Tuple of (server, port)
+    """
+    server = StubServer(("127.0.0.1", 0), StubHealthHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, server.server_address[1]
+
+
+def build_config(port: int, delays_ms: List[int], concurrency: int, regions: int) -> Config:
+    """Build a configuration spreading stub instances across regions.
+
+    Args:
+        port: Stub server port
+        delays_ms: Response delay for each instance
+        concurrency: Maximum concurrent checks
+        regions: Number of regions
+
+    Returns:
+        Configuration object
+    """
+    region_instances: List[List[str]] = [[] for _ in range(regions)]
+    for index, delay_ms in enumerate(delays_ms):
+        region_instances[index % regions].append(f"http://127.0.0.1:{port}/{delay_ms}")
+
+    return Config(
+        regions=[
+            {
+                "name": f"region-{index}",
+                "instances": instances,
+                "health_check_timeout": 5.0,
+                "priority": index + 1,
+            }
+            for index, instances in enumerate(region_instances)
+            if instances
+        ],
+        routing={
+            "max_concurrent_checks": concurrency,
+            "cycle_deadline_seconds": 60.0,
+        },
+    )
+
+
+def time_cycle(config: Config, repeats: int) -> float:
+    """Time the best of several cycles with warm region sessions.
+
+    Args:
+        config: Configuration object
+        repeats: Number of cycles to run
+
+    Returns:
+        Best cycle wall time in milliseconds
+    """
+    sessions = create_region_sessions(config)
+    try:
+        best = float("inf")
+        for _ in range(repeats):
+            _, timing = run_health_check_cycle(config, sessions=sessions)
+            best = min(best, timing.wall_time_ms)
+        return best
+    finally:
+        close_region_sessions(sessions)
+
+
+def main() -> None:
+    """Run the benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=[5, 10, 20, 40, 80])
+    parser.add_argument("--min-delay-ms", type=int, default=20)
+    parser.add_argument("--max-delay-ms", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--regions", type=int, default=3)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.getLogger("application_uptime_monitor").setLevel(logging.WARNING)
+
+    server, port = start_stub_server()
+    rng = random.Random(42)
+
+    print(f"{'instances':>9} {'max delay':>10} {'serial ms':>10} {'concurrent ms':>14} {'speedup':>8}")
+    try:
+        for count in args.counts:
+            delays = [rng.randint(args.min_delay_ms, args.max_delay_ms) for _ in range(count)]
+            serial = time_cycle(build_config(port, delays, 1, args.regions), args.repeats)
+            concurrent = time_cycle(
+                build_config(port, delays, args.concurrency, args.regions), args.repeats
+            )
+            print(
+                f"{count:>9} {max(delays):>10} {serial:>10.1f} "
+                f"{concurrent:>14.1f} {serial / concurrent:>7.1f}x"
+            )
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
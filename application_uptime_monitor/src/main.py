@@ -6,15 +6,21 @@ degradation, and automatically routes traffic to healthy instances with failover
 
 import json
 import logging
+import math
+import os
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Deque, Dict, List, Optional, Tuple
 
 import requests
 import yaml
+from requests.adapters import HTTPAdapter
 from pydantic import BaseModel, Field, field_validator
 from pydantic_settings import BaseSettings
 
@@ -87,6 +93,29 @@ class RoutingConfig(BaseModel):
     metrics_retention_hours: int = Field(
         default=24, description="Hours to retain performance metrics"
     )
+    max_concurrent_checks: int = Field(
+        default=20,
+        description="Maximum number of health checks running at once",
+    )
+    metrics_compaction_cycles: int = Field(
+        default=120,
+        description="Cycles between compactions of the metrics log",
+    )
+    cycle_deadline_seconds: Optional[float] = Field(
+        default=None,
+        description=(
+            "Maximum wall time for one health check cycle "
+            "(defaults to health_check_interval_seconds)"
+        ),
+    )
+
+    @field_validator("max_concurrent_checks")
+    @classmethod
+    def validate_max_concurrent_checks(cls, v: int) -> int:
+        """Validate concurrency cap is positive."""
+        if v < 1:
+            raise ValueError("max_concurrent_checks must be at least 1")
+        return v
 
 
 class Config(BaseModel):
@@ -106,6 +135,10 @@ class Config(BaseModel):
         default="logs/metrics.json",
         description="Path to store performance metrics",
     )
+    metrics_log_file: str = Field(
+        default="logs/metrics.jsonl",
+        description="Path to append-only health check log used by the monitoring loop",
+    )
     routing_state_file: str = Field(
         default="logs/routing_state.json",
         description="Path to store current routing state",
@@ -138,7 +171,7 @@ class InstanceMetrics:
 
     instance_url: str
     region: str
-    health_checks: List[HealthCheckResult] = field(default_factory=list)
+    health_checks: Deque[HealthCheckResult] = field(default_factory=deque)
     current_status: InstanceStatus = InstanceStatus.UNKNOWN
     consecutive_failures: int = 0
     last_healthy_time: Optional[datetime] = None
@@ -148,11 +181,13 @@ class InstanceMetrics:
     ) -> List[HealthCheckResult]:
         """Get health checks within time window."""
         cutoff = datetime.now() - timedelta(minutes=window_minutes)
-        return [
-            check
-            for check in self.health_checks
-            if check.timestamp >= cutoff
-        ]
+        recent = []
+        for check in reversed(self.health_checks):
+            if check.timestamp < cutoff:
+                break
+            recent.append(check)
+        recent.reverse()
+        return recent
 
     def calculate_success_rate(self, window_minutes: int) -> float:
         """Calculate success rate within time window."""
@@ -175,6 +210,18 @@ class InstanceMetrics:
         )
 
 
+@dataclass
+class CycleTiming:
+    """Timing summary for one health check cycle."""
+
+    started_at: datetime
+    wall_time_ms: float
+    checks_completed: int
+    checks_timed_out: int
+    slowest_instance: Optional[str] = None
+    slowest_response_time_ms: float = 0.0
+
+
 @dataclass
 class RoutingState:
     """Current traffic routing state."""
@@ -220,6 +267,7 @@ def perform_health_check(
     region_config: RegionConfig,
     timeout: float,
     api_key: Optional[str] = None,
+    session: Optional[requests.Session] = None,
 ) -> HealthCheckResult:
     """Perform health check on an instance.
 
@@ -228,22 +276,22 @@ def perform_health_check(
         region_config: Region configuration
         timeout: Request timeout in seconds
         api_key: Optional API key for authentication
+        session: Optional pooled HTTP session to reuse connections
 
     Returns:
         HealthCheckResult with check outcome
     """
     health_url = f"{instance_url.rstrip('/')}{region_config.health_check_endpoint}"
-    start_time = time.time()
+    start_time = time.perf_counter()
+    http = session or requests
 
     try:
         headers = {}
         if api_key:
             headers["Authorization"] = f"Bearer {api_key}"
 
-        response = requests.get(
-            health_url, timeout=timeout, headers=headers
-        )
-        response_time_ms = (time.time() - start_time) * 1000
+        response = http.get(health_url, timeout=timeout, headers=headers)
+        response_time_ms = (time.perf_counter() - start_time) * 1000
 
         if response.status_code == 200:
             status = InstanceStatus.HEALTHY
@@ -260,12 +308,12 @@ def perform_health_check(
         success = False
         error_message = "Request timeout"
     except requests.exceptions.RequestException as e:
-        response_time_ms = (time.time() - start_time) * 1000
+        response_time_ms = (time.perf_counter() - start_time) * 1000
         status = InstanceStatus.UNHEALTHY
         success = False
         error_message = str(e)
     except Exception as e:
-        response_time_ms = (time.time() - start_time) * 1000
+        response_time_ms = (time.perf_counter() - start_time) * 1000
         status = InstanceStatus.UNKNOWN
         success = False
         error_message = f"Unexpected error: {e}"
@@ -281,49 +329,233 @@ def perform_health_check(
     )
 
 
-def check_all_instances(
-    config: Config, api_key: Optional[str] = None
-) -> Dict[str, InstanceMetrics]:
-    """Check health of all instances across all regions.
+def create_region_sessions(config: Config) -> Dict[str, requests.Session]:
+    """Create one pooled HTTP session per region.
+
+    Args:
+        config: Configuration object
+
+    Returns:
+        Dictionary mapping region names to HTTP sessions
+    """
+    sessions: Dict[str, requests.Session] = {}
+    for region_config in config.regions:
+        pool_size = max(
+            1,
+            min(len(region_config.instances), config.routing.max_concurrent_checks),
+        )
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        sessions[region_config.name] = session
+    return sessions
+
+
+def close_region_sessions(sessions: Dict[str, requests.Session]) -> None:
+    """Close pooled HTTP sessions.
+
+    Args:
+        sessions: Dictionary mapping region names to HTTP sessions
+    """
+    for session in sessions.values():
+        session.close()
+
+
+def close_sessions_when_done(
+    sessions: Dict[str, requests.Session], futures: List[Future]
+) -> None:
+    """Close pooled HTTP sessions once every check using them has finished.
+
+    Checks that overran the cycle deadline keep running in their worker
+    threads, so their sessions are closed by the last one to finish rather
+    than while they are still in use.
+
+    Args:
+        sessions: Dictionary mapping region names to HTTP sessions
+        futures: Health check futures submitted with these sessions
+    """
+    pending = [future for future in futures if not future.done()]
+    if not pending:
+        close_region_sessions(sessions)
+        return
+
+    lock = threading.Lock()
+    remaining = [len(pending)]
+
+    def on_done(_future: Future) -> None:
+        with lock:
+            remaining[0] -= 1
+            last = remaining[0] == 0
+        if last:
+            close_region_sessions(sessions)
+
+    for future in pending:
+        future.add_done_callback(on_done)
+
+
+def record_health_check(metrics: InstanceMetrics, result: HealthCheckResult) -> None:
+    """Record a health check result on instance metrics.
+
+    Args:
+        metrics: Instance metrics to update
+        result: Health check result to record
+    """
+    metrics.health_checks.append(result)
+
+    if result.success:
+        metrics.consecutive_failures = 0
+        metrics.last_healthy_time = result.timestamp
+    else:
+        metrics.consecutive_failures += 1
+
+
+def run_health_check_cycle(
+    config: Config,
+    api_key: Optional[str] = None,
+    sessions: Optional[Dict[str, requests.Session]] = None,
+    all_metrics: Optional[Dict[str, InstanceMetrics]] = None,
+    in_flight: Optional[List[Future]] = None,
+) -> Tuple[Dict[str, InstanceMetrics], CycleTiming]:
+    """Check all instances concurrently within a cycle deadline.
+
+    Checks run on a thread pool capped at routing.max_concurrent_checks,
+    sharing one pooled HTTP session per region. Checks still running when
+    the cycle deadline expires are recorded as unknown, so cycle wall time
+    is bounded by the slowest instance or the deadline, whichever is lower.
 
     Args:
         config: Configuration object
         api_key: Optional API key for health checks
+        sessions: Optional region sessions to reuse; created for this
+            cycle if omitted and closed once its last check finishes
+        all_metrics: Optional existing metrics to update in place
+        in_flight: Optional list that receives the checks still running
+            after the deadline, so the caller can keep reused sessions
+            open until they finish
 
     Returns:
-        Dictionary mapping instance URLs to their metrics
+        Tuple of (instance metrics by URL, cycle timing)
     """
-    all_metrics: Dict[str, InstanceMetrics] = {}
+    if all_metrics is None:
+        all_metrics = {}
 
+    targets: List[Tuple[RegionConfig, str]] = []
     for region_config in config.regions:
         for instance_url in region_config.instances:
             if instance_url not in all_metrics:
                 all_metrics[instance_url] = InstanceMetrics(
                     instance_url=instance_url, region=region_config.name
                 )
+            targets.append((region_config, instance_url))
 
-            logger.info(f"Checking instance: {instance_url} in region {region_config.name}")
-            result = perform_health_check(
-                instance_url,
-                region_config,
-                region_config.health_check_timeout,
-                api_key,
-            )
+    started_at = datetime.now()
+    start_time = time.perf_counter()
+    if not targets:
+        return all_metrics, CycleTiming(
+            started_at=started_at, wall_time_ms=0.0, checks_completed=0, checks_timed_out=0
+        )
 
-            metrics = all_metrics[instance_url]
-            metrics.health_checks.append(result)
+    owns_sessions = sessions is None
+    if owns_sessions:
+        sessions = create_region_sessions(config)
 
-            if result.success:
-                metrics.consecutive_failures = 0
-                metrics.last_healthy_time = result.timestamp
-            else:
-                metrics.consecutive_failures += 1
+    deadline = config.routing.cycle_deadline_seconds
+    if deadline is None:
+        deadline = float(config.routing.health_check_interval_seconds)
 
-            logger.info(
-                f"Instance {instance_url}: {result.status.value}, "
-                f"response_time={result.response_time_ms:.2f}ms"
+    executor = ThreadPoolExecutor(
+        max_workers=min(config.routing.max_concurrent_checks, len(targets)),
+        thread_name_prefix="health-check",
+    )
+    futures: List[Future] = []
+    try:
+        for region_config, instance_url in targets:
+            futures.append(
+                executor.submit(
+                    perform_health_check,
+                    instance_url,
+                    region_config,
+                    region_config.health_check_timeout,
+                    api_key,
+                    sessions.get(region_config.name),
+                )
             )
+        wait(futures, timeout=deadline)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+        if owns_sessions:
+            close_sessions_when_done(sessions, futures)
+
+    checks_completed = 0
+    checks_timed_out = 0
+    slowest_instance = None
+    slowest_response_time_ms = 0.0
+
+    for (region_config, instance_url), future in zip(targets, futures):
+        if future.done() and not future.cancelled():
+            result = future.result()
+            checks_completed += 1
+        else:
+            future.cancel()
+            checks_timed_out += 1
+            result = HealthCheckResult(
+                instance_url=instance_url,
+                region=region_config.name,
+                status=InstanceStatus.UNKNOWN,
+                response_time_ms=deadline * 1000,
+                timestamp=datetime.now(),
+                success=False,
+                error_message="Cycle deadline exceeded",
+            )
+
+        record_health_check(all_metrics[instance_url], result)
+
+        if result.response_time_ms > slowest_response_time_ms:
+            slowest_instance = instance_url
+            slowest_response_time_ms = result.response_time_ms
+
+        logger.info(
+            f"Instance {instance_url} in region {region_config.name}: "
+            f"{result.status.value}, response_time={result.response_time_ms:.2f}ms"
+        )
 
+    if in_flight is not None:
+        in_flight.extend(future for future in futures if not future.done())
+
+    timing = CycleTiming(
+        started_at=started_at,
+        wall_time_ms=(time.perf_counter() - start_time) * 1000,
+        checks_completed=checks_completed,
+        checks_timed_out=checks_timed_out,
+        slowest_instance=slowest_instance,
+        slowest_response_time_ms=slowest_response_time_ms,
+    )
+    logger.info(
+        f"Health check cycle finished in {timing.wall_time_ms:.2f}ms: "
+        f"{checks_completed} completed, {checks_timed_out} timed out, "
+        f"slowest={slowest_instance} ({slowest_response_time_ms:.2f}ms)"
+    )
+
+    return all_metrics, timing
+
+
+def check_all_instances(
+    config: Config,
+    api_key: Optional[str] = None,
+    sessions: Optional[Dict[str, requests.Session]] = None,
+) -> Dict[str, InstanceMetrics]:
+    """Check health of all instances across all regions.
+
+    Args:
+        config: Configuration object
+        api_key: Optional API key for health checks
+        sessions: Optional region sessions to reuse
+
+    Returns:
+        Dictionary mapping instance URLs to their metrics
+    """
+    all_metrics, _ = run_health_check_cycle(config, api_key, sessions)
     return all_metrics
 
 
@@ -472,7 +704,7 @@ def save_metrics(
 
     metrics_data = {}
     for instance_url, metrics in all_metrics.items():
-        recent_checks = metrics.health_checks[-100:]
+        recent_checks = list(metrics.health_checks)[-100:]
         metrics_data[instance_url] = {
             "region": metrics.region,
             "current_status": metrics.current_status.value,
@@ -561,6 +793,287 @@ def load_routing_state(state_file: Path) -> Optional[RoutingState]:
         return None
 
 
+def metrics_buffer_size(config: Config) -> int:
+    """Number of health checks to retain per instance.
+
+    Args:
+        config: Configuration object
+
+    Returns:
+        Ring buffer capacity covering metrics_retention_hours
+    """
+    retention_seconds = config.routing.metrics_retention_hours * 3600
+    interval = max(1, config.routing.health_check_interval_seconds)
+    return max(1, math.ceil(retention_seconds / interval))
+
+
+class MetricsLog:
+    """Append-only newline-delimited log of health check results.
+
+    Each cycle appends one compact JSON line per check. Every
+    ``compaction_cycles`` appends the log is rewritten without records older
+    than the retention window.
+    """
+
+    def __init__(self, path: Path, retention_hours: int, compaction_cycles: int):
+        """Initialize metrics log.
+
+        Args:
+            path: Path to the log file
+            retention_hours: Hours of records to keep on compaction
+            compaction_cycles: Appends between compactions
+        """
+        self.path = path
+        self.retention_hours = retention_hours
+        self.compaction_cycles = max(1, compaction_cycles)
+        self._appends_since_compaction = 0
+
+    @staticmethod
+    def _encode(result: HealthCheckResult) -> str:
+        """Encode a health check result as a compact JSON line."""
+        return json.dumps(
+            {
+                "timestamp": result.timestamp.isoformat(),
+                "instance_url": result.instance_url,
+                "region": result.region,
+                "status": result.status.value,
+                "response_time_ms": round(result.response_time_ms, 3),
+                "success": result.success,
+                "error_message": result.error_message,
+            },
+            separators=(",", ":"),
+        )
+
+    @staticmethod
+    def _decode(line: str) -> HealthCheckResult:
+        """Decode a JSON line into a health check result."""
+        record = json.loads(line)
+        return HealthCheckResult(
+            instance_url=record["instance_url"],
+            region=record["region"],
+            status=InstanceStatus(record["status"]),
+            response_time_ms=record["response_time_ms"],
+            timestamp=datetime.fromisoformat(record["timestamp"]),
+            success=record["success"],
+            error_message=record.get("error_message"),
+        )
+
+    def append(self, results: List[HealthCheckResult]) -> None:
+        """Append health check results and compact when due.
+
+        Args:
+            results: Health check results from one cycle
+        """
+        if not results:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("\n".join(self._encode(result) for result in results))
+                f.write("\n")
+        except OSError as e:
+            logger.error(f"Failed to append metrics: {e}")
+            return
+
+        self._appends_since_compaction += 1
+        if self._appends_since_compaction >= self.compaction_cycles:
+            self.compact()
+
+    def load(self) -> List[HealthCheckResult]:
+        """Load records within the retention window.
+
+        Returns:
+            Health check results in file order
+        """
+        if not self.path.exists():
+            return []
+
+        cutoff = datetime.now() - timedelta(hours=self.retention_hours)
+        results = []
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    result = self._decode(line)
+                except (ValueError, KeyError) as e:
+                    logger.warning(f"Skipping malformed metrics record: {e}")
+                    continue
+                if result.timestamp >= cutoff:
+                    results.append(result)
+        return results
+
+    def compact(self) -> None:
+        """Rewrite the log keeping only records within the retention window."""
+        self._appends_since_compaction = 0
+        results = self.load()
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for result in results:
+                    f.write(self._encode(result))
+                    f.write("\n")
+            os.replace(tmp_path, self.path)
+            logger.debug(f"Compacted metrics log to {len(results)} records")
+        except OSError as e:
+            logger.error(f"Failed to compact metrics log: {e}")
+
+
+class UptimeMonitor:
+    """Long-lived monitor that keeps instance metrics across cycles.
+
+    Metrics live in per-instance ring buffers sized to the retention window,
+    so consecutive failures and degradation windows span cycles. The
+    configuration is reloaded only when the file changes, and check results
+    are appended to a MetricsLog instead of rewriting a metrics document.
+    HTTP sessions are reused across cycles; sessions replaced by a reload
+    or released by close() stay open until checks still using them finish.
+    """
+
+    def __init__(self, config_path: Path, api_key: Optional[str] = None):
+        """Initialize uptime monitor.
+
+        Args:
+            config_path: Path to configuration file
+            api_key: Optional API key for health checks
+        """
+        self.config_path = config_path
+        self.api_key = api_key
+        self.config: Optional[Config] = None
+        self.all_metrics: Dict[str, InstanceMetrics] = {}
+        self.routing_state: Optional[RoutingState] = None
+        self.sessions: Dict[str, requests.Session] = {}
+        self._in_flight: List[Future] = []
+        self.metrics_log: Optional[MetricsLog] = None
+        self._config_mtime: Optional[int] = None
+
+        self.reload_config_if_changed()
+        self.routing_state = load_routing_state(Path(self.config.routing_state_file))
+        self._restore_metrics()
+
+    def reload_config_if_changed(self) -> bool:
+        """Reload configuration when the file modification time changes.
+
+        Returns:
+            True if the configuration was (re)loaded
+        """
+        mtime = self.config_path.stat().st_mtime_ns
+        if self.config is not None and mtime == self._config_mtime:
+            return False
+
+        config = load_config(self.config_path)
+        self._config_mtime = mtime
+        self.config = config
+
+        self._release_sessions()
+        self.sessions = create_region_sessions(config)
+        self.metrics_log = MetricsLog(
+            Path(config.metrics_log_file),
+            config.routing.metrics_retention_hours,
+            config.routing.metrics_compaction_cycles,
+        )
+        self._sync_metrics()
+        return True
+
+    def _release_sessions(self) -> None:
+        """Close the current sessions once checks still using them finish."""
+        close_sessions_when_done(self.sessions, self._in_flight)
+        self.sessions = {}
+        self._in_flight = []
+
+    def _sync_metrics(self) -> None:
+        """Align metric buffers with the configured instances and retention."""
+        capacity = metrics_buffer_size(self.config)
+        configured = {}
+        for region_config in self.config.regions:
+            for instance_url in region_config.instances:
+                configured.setdefault(instance_url, region_config.name)
+
+        for instance_url in list(self.all_metrics):
+            if instance_url not in configured:
+                del self.all_metrics[instance_url]
+
+        for instance_url, region in configured.items():
+            metrics = self.all_metrics.get(instance_url)
+            if metrics is None:
+                self.all_metrics[instance_url] = InstanceMetrics(
+                    instance_url=instance_url,
+                    region=region,
+                    health_checks=deque(maxlen=capacity),
+                )
+                continue
+            metrics.region = region
+            if metrics.health_checks.maxlen != capacity:
+                metrics.health_checks = deque(metrics.health_checks, maxlen=capacity)
+
+    def _restore_metrics(self) -> None:
+        """Replay the metrics log into the ring buffers."""
+        restored = 0
+        for result in self.metrics_log.load():
+            metrics = self.all_metrics.get(result.instance_url)
+            if metrics is not None:
+                record_health_check(metrics, result)
+                restored += 1
+        if restored:
+            logger.info(f"Restored {restored} health checks from {self.metrics_log.path}")
+
+    def run_cycle(self) -> CycleTiming:
+        """Run one health check and routing cycle.
+
+        Returns:
+            Timing of the health check cycle
+        """
+        self.reload_config_if_changed()
+        config = self.config
+
+        self._in_flight = [future for future in self._in_flight if not future.done()]
+        _, timing = run_health_check_cycle(
+            config, self.api_key, self.sessions, self.all_metrics, self._in_flight
+        )
+
+        healthy_instances = select_healthy_instances(self.all_metrics, config)
+        logger.info(f"Found {len(healthy_instances)} healthy instances")
+
+        self.routing_state = update_routing_state(
+            healthy_instances, config, self.routing_state
+        )
+
+        self.metrics_log.append([
+            metrics.health_checks[-1]
+            for metrics in self.all_metrics.values()
+            if metrics.health_checks
+        ])
+        save_routing_state(self.routing_state, Path(config.routing_state_file))
+
+        logger.info(
+            f"Active instances: {self.routing_state.active_instances}, "
+            f"Backup instances: {self.routing_state.backup_instances}"
+        )
+        return timing
+
+    def run(self) -> None:
+        """Run cycles until interrupted, keeping a fixed cycle cadence."""
+        logger.info(
+            f"Starting monitoring loop with "
+            f"{self.config.routing.health_check_interval_seconds}s interval. "
+            "Press Ctrl+C to stop."
+        )
+        while True:
+            started = time.monotonic()
+            self.run_cycle()
+            elapsed = time.monotonic() - started
+            time.sleep(
+                max(0.0, self.config.routing.health_check_interval_seconds - elapsed)
+            )
+
+    def close(self) -> None:
+        """Compact the metrics log and release HTTP sessions."""
+        if self.metrics_log is not None:
+            self.metrics_log.compact()
+        self._release_sessions()
+
+
 def monitor_and_route(config_path: Path, api_key: Optional[str] = None) -> None:
     """Monitor instances and update routing configuration.
 
@@ -604,23 +1117,17 @@ def run_monitoring_loop(config_path: Path, api_key: Optional[str] = None) -> Non
         config_path: Path to configuration file
         api_key: Optional API key for health checks
     """
-    config = load_config(config_path)
-    interval = config.routing.health_check_interval_seconds
-
-    logger.info(
-        f"Starting monitoring loop with {interval}s interval. "
-        "Press Ctrl+C to stop."
-    )
+    monitor = UptimeMonitor(config_path, api_key)
 
     try:
-        while True:
-            monitor_and_route(config_path, api_key)
-            time.sleep(interval)
+        monitor.run()
     except KeyboardInterrupt:
         logger.info("Monitoring loop stopped by user")
     except Exception as e:
         logger.error(f"Error in monitoring loop: {e}")
         raise
+    finally:
+        monitor.close()
 
 
 def main() -> None:
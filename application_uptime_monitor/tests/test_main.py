@@ -0,0 +1,309 @@
+"""Tests for application uptime monitoring."""
+
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+import yaml
+
+from application_uptime_monitor.src import main
+from application_uptime_monitor.src.main import (
+    Config,
+    HealthCheckResult,
+    InstanceStatus,
+    MetricsLog,
+    RegionConfig,
+    RoutingConfig,
+    UptimeMonitor,
+    run_health_check_cycle,
+)
+
+
+class StubSession:
+    """Session stand-in that answers health checks after a per-URL delay."""
+
+    def __init__(self, delays=None, status_codes=None):
+        self.delays = delays or {}
+        self.status_codes = status_codes or {}
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.closed = False
+        self.used_after_close = False
+
+    def get(self, url, timeout=None, headers=None):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delays.get(url, 0.05))
+            if self.closed:
+                self.used_after_close = True
+            return Mock(status_code=self.status_codes.get(url, 200))
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+    def close(self):
+        self.closed = True
+
+
+def make_config(instances, max_concurrent_checks=20, deadline=None):
+    """Build a single-region configuration."""
+    return Config(
+        regions=[RegionConfig(name="us-east", instances=instances)],
+        routing=RoutingConfig(
+            max_concurrent_checks=max_concurrent_checks,
+            cycle_deadline_seconds=deadline,
+        ),
+    )
+
+
+def test_cycle_caps_concurrent_checks():
+    """Test that no more than max_concurrent_checks run at once."""
+    instances = [f"http://app-{i}" for i in range(8)]
+    session = StubSession()
+    config = make_config(instances, max_concurrent_checks=3)
+
+    all_metrics, timing = run_health_check_cycle(
+        config, sessions={"us-east": session}
+    )
+
+    assert session.max_in_flight == 3
+    assert timing.checks_completed == 8
+    assert timing.checks_timed_out == 0
+    assert all(
+        metrics.health_checks[-1].status == InstanceStatus.HEALTHY
+        for metrics in all_metrics.values()
+    )
+    assert not session.closed
+
+
+def test_cycle_deadline_records_unknown():
+    """Test that checks past the deadline are recorded as unknown."""
+    session = StubSession(
+        delays={"http://slow/health": 1.0},
+        status_codes={"http://down/health": 503},
+    )
+    config = make_config(
+        ["http://fast", "http://down", "http://slow"], deadline=0.3
+    )
+
+    started = time.perf_counter()
+    all_metrics, timing = run_health_check_cycle(
+        config, sessions={"us-east": session}
+    )
+
+    assert time.perf_counter() - started < 0.9
+    assert timing.checks_completed == 2
+    assert timing.checks_timed_out == 1
+    assert timing.slowest_instance == "http://slow"
+
+    slow = all_metrics["http://slow"]
+    assert slow.health_checks[-1].status == InstanceStatus.UNKNOWN
+    assert slow.health_checks[-1].error_message == "Cycle deadline exceeded"
+    assert slow.consecutive_failures == 1
+    assert all_metrics["http://down"].health_checks[-1].status == (
+        InstanceStatus.UNHEALTHY
+    )
+    assert all_metrics["http://fast"].consecutive_failures == 0
+
+
+def test_cycle_closes_owned_sessions_after_stragglers(monkeypatch):
+    """Test that owned sessions stay open until overrunning checks finish."""
+    session = StubSession(delays={"http://slow/health": 0.5})
+    monkeypatch.setattr(
+        main, "create_region_sessions", lambda config: {"us-east": session}
+    )
+    config = make_config(["http://fast", "http://slow"], deadline=0.1)
+
+    _, timing = run_health_check_cycle(config)
+
+    assert timing.checks_timed_out == 1
+    assert not session.closed
+
+    for _ in range(50):
+        if session.closed:
+            break
+        time.sleep(0.05)
+    assert session.closed
+    assert not session.used_after_close
+
+
+def test_cycle_closes_owned_sessions_on_error(monkeypatch):
+    """Test that owned sessions are closed when submitting checks fails."""
+    session = StubSession()
+    monkeypatch.setattr(
+        main, "create_region_sessions", lambda config: {"us-east": session}
+    )
+
+    def broken_submit(self, *args, **kwargs):
+        raise RuntimeError("executor unavailable")
+
+    monkeypatch.setattr(main.ThreadPoolExecutor, "submit", broken_submit)
+
+    with pytest.raises(RuntimeError):
+        run_health_check_cycle(make_config(["http://fast"]))
+
+    assert session.closed
+
+
+def make_result(instance_url, timestamp, success=True):
+    """Build a health check result."""
+    return HealthCheckResult(
+        instance_url=instance_url,
+        region="us-east",
+        status=InstanceStatus.HEALTHY if success else InstanceStatus.UNHEALTHY,
+        response_time_ms=12.5,
+        timestamp=timestamp,
+        success=success,
+        error_message=None if success else "HTTP 503",
+    )
+
+
+def write_config(tmp_path, instances, interval_seconds=600, retention_hours=1):
+    """Write a monitor configuration file under tmp_path."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        yaml.safe_dump(
+            {
+                "regions": [{"name": "us-east", "instances": instances}],
+                "routing": {
+                    "health_check_interval_seconds": interval_seconds,
+                    "metrics_retention_hours": retention_hours,
+                },
+                "metrics_log_file": str(tmp_path / "metrics.jsonl"),
+                "routing_state_file": str(tmp_path / "routing_state.json"),
+            }
+        )
+    )
+    return config_path
+
+
+@pytest.fixture
+def stub_session(monkeypatch):
+    """Route every monitor session to one stub session."""
+    session = StubSession(
+        delays={"http://up/health": 0.0, "http://down/health": 0.0},
+        status_codes={"http://down/health": 503},
+    )
+    monkeypatch.setattr(
+        main,
+        "create_region_sessions",
+        lambda config: {region.name: session for region in config.regions},
+    )
+    return session
+
+
+def test_metrics_log_append_compact_reload(tmp_path):
+    """Test that compaction drops expired records and reload round-trips."""
+    log = MetricsLog(tmp_path / "metrics.jsonl", retention_hours=1, compaction_cycles=2)
+    now = datetime.now()
+    expired = make_result("http://up", now - timedelta(hours=2))
+    recent = [
+        make_result("http://up", now - timedelta(minutes=5)),
+        make_result("http://down", now, success=False),
+    ]
+
+    log.append([expired, recent[0]])
+    assert len(log.path.read_text().splitlines()) == 2
+
+    log.append([recent[1]])
+    assert len(log.path.read_text().splitlines()) == 2
+    assert not log.path.with_name("metrics.jsonl.tmp").exists()
+
+    reloaded = MetricsLog(log.path, retention_hours=1, compaction_cycles=2).load()
+    assert reloaded == recent
+
+
+def test_uptime_monitor_ring_buffer_capacity(tmp_path, stub_session):
+    """Test that metric buffers hold only the retention window of checks."""
+    config_path = write_config(
+        tmp_path, ["http://up"], interval_seconds=600, retention_hours=1
+    )
+    monitor = UptimeMonitor(config_path)
+
+    for _ in range(9):
+        monitor.run_cycle()
+
+    checks = monitor.all_metrics["http://up"].health_checks
+    assert checks.maxlen == 6
+    assert len(checks) == 6
+    monitor.close()
+
+
+def test_uptime_monitor_reloads_config_only_on_change(tmp_path, stub_session):
+    """Test that configuration is reloaded only when the file changes."""
+    config_path = write_config(tmp_path, ["http://up"])
+    monitor = UptimeMonitor(config_path)
+    config = monitor.config
+
+    assert monitor.reload_config_if_changed() is False
+    assert monitor.config is config
+
+    write_config(tmp_path, ["http://up", "http://down"])
+    mtime = config_path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(config_path, ns=(mtime, mtime))
+
+    assert monitor.reload_config_if_changed() is True
+    assert set(monitor.all_metrics) == {"http://up", "http://down"}
+    assert monitor.reload_config_if_changed() is False
+    monitor.close()
+
+
+def test_consecutive_failures_survive_cycles_and_restart(tmp_path, stub_session):
+    """Test that consecutive failures accumulate across cycles and restarts."""
+    config_path = write_config(tmp_path, ["http://up", "http://down"])
+    monitor = UptimeMonitor(config_path)
+    for _ in range(3):
+        monitor.run_cycle()
+
+    assert monitor.all_metrics["http://down"].consecutive_failures == 3
+    assert monitor.all_metrics["http://up"].consecutive_failures == 0
+    monitor.close()
+
+    restarted = UptimeMonitor(config_path)
+    assert restarted.all_metrics["http://down"].consecutive_failures == 3
+    assert len(restarted.all_metrics["http://down"].health_checks) == 3
+
+    restarted.run_cycle()
+    assert restarted.all_metrics["http://down"].consecutive_failures == 4
+    assert restarted.all_metrics["http://up"].last_healthy_time is not None
+    restarted.close()
+
+
+def test_uptime_monitor_reload_keeps_sessions_for_stragglers(tmp_path, monkeypatch):
+    """Test that a reload closes old sessions only after overrunning checks finish."""
+    sessions = []
+
+    def create_sessions(config):
+        session = StubSession(delays={"http://slow/health": 0.5})
+        sessions.append(session)
+        return {region.name: session for region in config.regions}
+
+    monkeypatch.setattr(main, "create_region_sessions", create_sessions)
+    config_path = write_config(tmp_path, ["http://fast", "http://slow"])
+    monitor = UptimeMonitor(config_path)
+    monitor.config.routing.cycle_deadline_seconds = 0.1
+
+    timing = monitor.run_cycle()
+    assert timing.checks_timed_out == 1
+
+    write_config(tmp_path, ["http://fast"])
+    mtime = config_path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(config_path, ns=(mtime, mtime))
+    assert monitor.reload_config_if_changed() is True
+
+    old_session = sessions[0]
+    assert monitor.sessions["us-east"] is sessions[1]
+    assert not old_session.closed
+    for _ in range(50):
+        if old_session.closed:
+            break
+        time.sleep(0.05)
+    assert old_session.closed
+    assert not old_session.used_after_close
+    monitor.close()
@@ -1,7 +1,7 @@
 """Database models and operations for conversion monitoring."""
 
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from sqlalchemy import (
     Column,
@@ -12,9 +12,11 @@ from sqlalchemy import (
     String,
     Text,
     create_engine,
+    insert,
+    update,
 )
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship, sessionmaker
+from sqlalchemy.orm import joinedload, relationship, sessionmaker
 
 Base = declarative_base()
 
@@ -66,7 +68,7 @@ class Event(Base):
     page_url = Column(String(500))
     page_title = Column(String(500))
     timestamp = Column(DateTime, nullable=False)
-    metadata = Column(Text)
+    event_metadata = Column("metadata", Text)
 
     session = relationship("Session", back_populates="events")
 
@@ -331,7 +333,7 @@ class DatabaseManager:
         finally:
             session.close()
 
-    def get_session(self, session_id: str) -> Optional[Session]:
+    def get_user_session(self, session_id: str) -> Optional[Session]:
         """Get session by session ID.
 
         Args:
@@ -416,9 +418,10 @@ class DatabaseManager:
                 page_url=page_url,
                 page_title=page_title,
                 timestamp=timestamp,
-                metadata=metadata,
+                event_metadata=metadata,
             )
             session.add(event)
+            session.flush()
 
             db_session = session.query(Session).filter(Session.id == session_id).first()
             if db_session:
@@ -426,7 +429,6 @@ class DatabaseManager:
                     session.query(Event)
                     .filter(Event.session_id == session_id)
                     .count()
-                    + 1
                 )
 
             session.commit()
@@ -435,6 +437,133 @@ class DatabaseManager:
         finally:
             session.close()
 
+    def bulk_add_events(
+        self,
+        website_id: int,
+        events: List[Dict[str, Any]],
+        conversions: Optional[Dict[str, int]] = None,
+    ) -> int:
+        """Add a batch of events in a single transaction.
+
+        Sessions referenced by the events are resolved with one lookup, missing
+        sessions are created from their first event, events are inserted with a
+        single executemany and session page views are incremented in bulk.
+
+        Args:
+            website_id: Website ID.
+            events: Event dictionaries with session_id (session identifier),
+                event_type and timestamp, and optional user_id, event_name,
+                page_url, page_title and metadata (JSON string).
+            conversions: Optional mapping of session identifier to the
+                conversion goal ID reached within this batch.
+
+        Returns:
+            Number of events added.
+        """
+        if not events:
+            return 0
+
+        session = self.get_session()
+        try:
+            identifiers = list(dict.fromkeys(event["session_id"] for event in events))
+            known = self._lookup_sessions(session, identifiers)
+
+            first_events = {}
+            for event in events:
+                if event["session_id"] not in known:
+                    first_events.setdefault(event["session_id"], event)
+
+            if first_events:
+                session.execute(
+                    insert(Session),
+                    [
+                        {
+                            "website_id": website_id,
+                            "session_id": identifier,
+                            "user_id": event.get("user_id"),
+                            "started_at": event["timestamp"],
+                            "page_views": 0,
+                            "converted": "false",
+                        }
+                        for identifier, event in first_events.items()
+                    ],
+                )
+                known.update(self._lookup_sessions(session, list(first_events)))
+
+            session.execute(
+                insert(Event),
+                [
+                    {
+                        "session_id": known[event["session_id"]][0],
+                        "event_type": event["event_type"],
+                        "event_name": event.get("event_name"),
+                        "page_url": event.get("page_url"),
+                        "page_title": event.get("page_title"),
+                        "timestamp": event["timestamp"],
+                        "event_metadata": event.get("metadata"),
+                    }
+                    for event in events
+                ],
+            )
+
+            added_views: Dict[str, int] = {}
+            for event in events:
+                added_views[event["session_id"]] = added_views.get(event["session_id"], 0) + 1
+
+            session.execute(
+                update(Session),
+                [
+                    {"id": known[identifier][0], "page_views": known[identifier][1] + count}
+                    for identifier, count in added_views.items()
+                ],
+            )
+
+            if conversions:
+                session.execute(
+                    update(Session),
+                    [
+                        {
+                            "id": known[identifier][0],
+                            "converted": "true",
+                            "conversion_goal_id": goal_id,
+                        }
+                        for identifier, goal_id in conversions.items()
+                        if identifier in known
+                    ],
+                )
+
+            session.commit()
+            return len(events)
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def _lookup_sessions(
+        self, session, identifiers: List[str], batch_size: int = 500
+    ) -> Dict[str, tuple]:
+        """Look up session primary keys and page views by session identifier.
+
+        Args:
+            session: Open database session.
+            identifiers: Session identifiers to look up.
+            batch_size: Maximum number of identifiers per IN clause.
+
+        Returns:
+            Dictionary mapping session identifier to (id, page_views).
+        """
+        found = {}
+        for start in range(0, len(identifiers), batch_size):
+            rows = (
+                session.query(Session.session_id, Session.id, Session.page_views)
+                .filter(Session.session_id.in_(identifiers[start:start + batch_size]))
+                .all()
+            )
+            for identifier, pk, page_views in rows:
+                found[identifier] = (pk, page_views or 0)
+        return found
+
     def get_session_events(
         self, session_id: int, limit: Optional[int] = None
     ) -> List[Event]:
@@ -460,6 +589,50 @@ class DatabaseManager:
         finally:
             session.close()
 
+    def iter_website_events(
+        self,
+        website_id: int,
+        hours: Optional[int] = None,
+        conversion_goal_id: Optional[int] = None,
+        batch_size: int = 10000,
+    ) -> Iterator[tuple]:
+        """Stream events for a website's sessions in a single query.
+
+        Rows are ordered by session and then by timestamp, so all events of
+        a session are yielded contiguously and in journey order.
+
+        Args:
+            website_id: Website ID.
+            hours: Optional number of hours to look back by session start.
+            conversion_goal_id: Optional conversion goal ID to filter sessions by.
+            batch_size: Number of rows fetched per round trip.
+
+        Yields:
+            Tuples of (session_id, event_type, page_url) where session_id is
+            the session primary key.
+        """
+        session = self.get_session()
+        try:
+            query = (
+                session.query(Event.session_id, Event.event_type, Event.page_url)
+                .join(Session, Event.session_id == Session.id)
+                .filter(Session.website_id == website_id)
+            )
+
+            if hours:
+                cutoff = datetime.utcnow() - timedelta(hours=hours)
+                query = query.filter(Session.started_at >= cutoff)
+
+            if conversion_goal_id:
+                query = query.filter(Session.conversion_goal_id == conversion_goal_id)
+
+            query = query.order_by(Event.session_id, Event.timestamp, Event.id)
+
+            for row in query.yield_per(batch_size):
+                yield tuple(row)
+        finally:
+            session.close()
+
     def get_recent_sessions(
         self,
         website_id: Optional[int] = None,
@@ -676,11 +849,17 @@ class DatabaseManager:
             limit: Maximum number of points to return.
 
         Returns:
-            List of DropOffPoint objects ordered by dropoff_rate descending.
+            List of DropOffPoint objects ordered by dropoff_rate descending,
+            with their journey step loaded so it is usable after the
+            session closes.
         """
         session = self.get_session()
         try:
-            query = session.query(DropOffPoint).order_by(DropOffPoint.dropoff_rate.desc())
+            query = (
+                session.query(DropOffPoint)
+                .options(joinedload(DropOffPoint.journey_step))
+                .order_by(DropOffPoint.dropoff_rate.desc())
+            )
             if website_id:
                 query = query.filter(DropOffPoint.website_id == website_id)
             if limit:
@@ -1,6 +1,9 @@
 """Identify drop-off points in user journeys."""
 
-from typing import Dict, List, Optional
+from collections import Counter
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, Iterable, List, Optional
 
 from src.database import DatabaseManager
 
@@ -18,29 +21,39 @@ class DropOffIdentifier:
         self.db_manager = db_manager
         self.config = config
         self.min_dropoff_rate = config.get("min_dropoff_rate", 0.1)
+        self.window_hours = config.get("window_hours")
 
     def identify_dropoffs(
-        self, website_id: int, conversion_goal_id: Optional[int] = None
+        self,
+        website_id: int,
+        conversion_goal_id: Optional[int] = None,
+        hours: Optional[int] = None,
     ) -> List[Dict[str, any]]:
         """Identify drop-off points in user journeys.
 
+        Events for every session in the window are streamed in a single query
+        ordered by session, so each session is evaluated exactly once.
+
         Args:
             website_id: Website ID.
             conversion_goal_id: Optional conversion goal ID to filter by.
+            hours: Optional number of hours to look back. Defaults to the
+                window_hours setting, or all sessions if unset.
 
         Returns:
             List of drop-off point dictionaries.
         """
         journey_steps = self.db_manager.get_journey_steps(website_id)
-        sessions = self.db_manager.get_recent_sessions(website_id=website_id, limit=1000)
-
-        if conversion_goal_id:
-            sessions = [s for s in sessions if s.conversion_goal_id == conversion_goal_id]
+        events = self.db_manager.iter_website_events(
+            website_id,
+            hours=hours or self.window_hours,
+            conversion_goal_id=conversion_goal_id,
+        )
 
         if not journey_steps:
-            dropoffs = self._identify_dropoffs_from_events(website_id, sessions)
+            dropoffs = self._identify_dropoffs_from_events(website_id, events)
         else:
-            dropoffs = self._identify_dropoffs_from_steps(website_id, journey_steps, sessions)
+            dropoffs = self._identify_dropoffs_from_steps(website_id, journey_steps, events)
 
         for dropoff in dropoffs:
             if dropoff["dropoff_rate"] >= self.min_dropoff_rate:
@@ -54,79 +67,94 @@ class DropOffIdentifier:
 
         return dropoffs
 
+    @staticmethod
+    def _matches_step(step, event_type: Optional[str], page_url: Optional[str]) -> bool:
+        """Check whether an event reaches a journey step.
+
+        Args:
+            step: Journey step object.
+            event_type: Event type.
+            page_url: Event page URL.
+
+        Returns:
+            True if the event reaches the step.
+        """
+        if step.page_url and page_url:
+            return step.page_url in page_url
+        if step.event_type and event_type:
+            return step.event_type == event_type
+        return False
+
     def _identify_dropoffs_from_steps(
-        self, website_id: int, journey_steps: List, sessions: List
+        self, website_id: int, journey_steps: List, events: Iterable[tuple]
     ) -> List[Dict[str, any]]:
         """Identify drop-offs using defined journey steps.
 
+        Each session is reduced to a bitmask of the steps it reached, and
+        entered/exited counts for every step are derived from the mask
+        histogram in one go.
+
         Args:
             website_id: Website ID.
             journey_steps: List of journey step objects.
-            sessions: List of session objects.
+            events: Iterable of (session_id, event_type, page_url) rows
+                grouped by session.
 
         Returns:
             List of drop-off dictionaries.
         """
-        dropoffs = []
+        step_count = len(journey_steps)
+        all_steps = (1 << step_count) - 1
+        event_masks: Dict[tuple, int] = {}
+        session_masks: Counter = Counter()
+
+        for _, session_events in groupby(events, key=itemgetter(0)):
+            mask = 0
+            for _, event_type, page_url in session_events:
+                key = (event_type, page_url)
+                event_mask = event_masks.get(key)
+                if event_mask is None:
+                    event_mask = 0
+                    for i, step in enumerate(journey_steps):
+                        if self._matches_step(step, event_type, page_url):
+                            event_mask |= 1 << i
+                    event_masks[key] = event_mask
+                mask |= event_mask
+                if mask == all_steps:
+                    break
+            session_masks[mask] += 1
+
+        sessions_reached = [0] * step_count
+        sessions_exited = [0] * step_count
+        for mask, count in session_masks.items():
+            for i in range(step_count):
+                if mask & (1 << i):
+                    sessions_reached[i] += count
+                    if i < step_count - 1 and not mask & (1 << (i + 1)):
+                        sessions_exited[i] += count
 
+        dropoffs = []
         for i, step in enumerate(journey_steps):
-            sessions_reached = 0
-            sessions_exited = 0
-
-            for session in sessions:
-                events = self.db_manager.get_session_events(session.id)
-                reached_step = False
-
-                for event in events:
-                    if step.page_url and event.page_url:
-                        if step.page_url in event.page_url:
-                            reached_step = True
-                            break
-                    elif step.event_type and event.event_type:
-                        if step.event_type == event.event_type:
-                            reached_step = True
-                            break
-
-                if reached_step:
-                    sessions_reached += 1
-
-                    if i < len(journey_steps) - 1:
-                        next_step = journey_steps[i + 1]
-                        reached_next = False
-
-                        for event in events:
-                            if next_step.page_url and event.page_url:
-                                if next_step.page_url in event.page_url:
-                                    reached_next = True
-                                    break
-                            elif next_step.event_type and event.event_type:
-                                if next_step.event_type == event.event_type:
-                                    reached_next = True
-                                    break
-
-                        if not reached_next:
-                            sessions_exited += 1
-
-            if sessions_reached > 0:
-                dropoff_rate = sessions_exited / sessions_reached
+            if sessions_reached[i] > 0:
                 dropoffs.append({
                     "journey_step_id": step.id,
                     "step_name": step.step_name,
-                    "dropoff_rate": dropoff_rate,
-                    "sessions_entered": sessions_reached,
-                    "sessions_exited": sessions_exited,
+                    "dropoff_rate": sessions_exited[i] / sessions_reached[i],
+                    "sessions_entered": sessions_reached[i],
+                    "sessions_exited": sessions_exited[i],
                 })
 
         return dropoffs
 
     def _identify_dropoffs_from_events(
-        self, website_id: int, sessions: List
+        self, website_id: int, events: Iterable[tuple]
     ) -> List[Dict[str, any]]:
         """Identify drop-offs by analyzing event patterns.
 
         Args:
             website_id: Website ID.
-            sessions: List of session objects.
+            events: Iterable of (session_id, event_type, page_url) rows
+                grouped by session and ordered by timestamp.
 
         Returns:
             List of drop-off dictionaries.
@@ -134,23 +162,22 @@ class DropOffIdentifier:
         dropoffs = []
 
         page_visits = {}
-        for session in sessions:
-            events = self.db_manager.get_session_events(session.id)
+        for _, session_events in groupby(events, key=itemgetter(0)):
             pages_visited = set()
+            last_page_url = None
 
-            for event in events:
-                if event.page_url:
-                    pages_visited.add(event.page_url)
+            for _, _, page_url in session_events:
+                if page_url:
+                    pages_visited.add(page_url)
+                last_page_url = page_url
 
             for page_url in pages_visited:
                 if page_url not in page_visits:
                     page_visits[page_url] = {"entered": 0, "exited": 0}
                 page_visits[page_url]["entered"] += 1
 
-            if len(events) > 0:
-                last_event = events[-1]
-                if last_event.page_url:
-                    page_visits[last_event.page_url]["exited"] += 1
+            if last_page_url:
+                page_visits[last_page_url]["exited"] += 1
 
         for page_url, stats in page_visits.items():
             if stats["entered"] > 0:
@@ -1,10 +1,18 @@
 """Process user events and sessions."""
 
+import csv
+import json
+import logging
+import time
 from datetime import datetime
-from typing import Dict, List, Optional
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
 
 from src.database import DatabaseManager
 
+logger = logging.getLogger(__name__)
+
 
 class EventProcessor:
     """Process user events and sessions."""
@@ -18,6 +26,7 @@ class EventProcessor:
         """
         self.db_manager = db_manager
         self.config = config
+        self.bulk_chunk_size = config.get("bulk_chunk_size", 5000)
 
     def process_event(
         self,
@@ -47,7 +56,7 @@ class EventProcessor:
         Returns:
             Dictionary with event processing results.
         """
-        session = self.db_manager.get_session(session_id)
+        session = self.db_manager.get_user_session(session_id)
 
         if not session:
             session = self.db_manager.add_session(
@@ -59,8 +68,6 @@ class EventProcessor:
 
         metadata_str = None
         if metadata:
-            import json
-
             metadata_str = json.dumps(metadata)
 
         event = self.db_manager.add_event(
@@ -89,24 +96,37 @@ class EventProcessor:
             event: Event object.
         """
         goals = self.db_manager.get_website_goals(session.website_id)
+        goal = self._match_goal(goals, event.page_url, event.event_name)
+
+        if goal:
+            self.db_manager.update_session(
+                session.session_id,
+                converted="true",
+                conversion_goal_id=goal.id,
+            )
+
+    @staticmethod
+    def _match_goal(
+        goals: List, page_url: Optional[str], event_name: Optional[str]
+    ) -> Optional[Any]:
+        """Find the first conversion goal reached by an event.
 
+        Args:
+            goals: List of ConversionGoal objects.
+            page_url: Event page URL.
+            event_name: Event name.
+
+        Returns:
+            Matching ConversionGoal object or None.
+        """
         for goal in goals:
-            if goal.target_url and event.page_url:
-                if goal.target_url in event.page_url:
-                    self.db_manager.update_session(
-                        session.session_id,
-                        converted="true",
-                        conversion_goal_id=goal.id,
-                    )
-                    break
-            elif goal.target_event and event.event_name:
-                if goal.target_event == event.event_name:
-                    self.db_manager.update_session(
-                        session.session_id,
-                        converted="true",
-                        conversion_goal_id=goal.id,
-                    )
-                    break
+            if goal.target_url and page_url:
+                if goal.target_url in page_url:
+                    return goal
+            elif goal.target_event and event_name:
+                if goal.target_event == event_name:
+                    return goal
+        return None
 
     def end_session(
         self, session_id: str, ended_at: Optional[datetime] = None
@@ -128,28 +148,48 @@ class EventProcessor:
         return {"success": True, "session_id": session_id}
 
     def import_events_from_file(
-        self, website_id: int, file_path: str, file_format: str = "json"
+        self,
+        website_id: int,
+        file_path: str,
+        file_format: str = "json",
+        bulk: bool = False,
+        chunk_size: Optional[int] = None,
     ) -> Dict[str, any]:
         """Import events from file.
 
         Args:
             website_id: Website ID.
             file_path: Path to events file.
-            file_format: File format (json or csv).
+            file_format: File format (json, jsonl or csv).
+            bulk: Stream the file in chunks and insert each chunk in a single
+                transaction instead of processing events one by one.
+            chunk_size: Number of events per chunk in bulk mode.
+                Defaults to the bulk_chunk_size setting.
 
         Returns:
             Dictionary with import results.
         """
-        from pathlib import Path
-
         file_path_obj = Path(file_path)
         if not file_path_obj.exists():
             raise FileNotFoundError(f"Events file not found: {file_path}")
 
+        if bulk:
+            result = self._bulk_import_events(
+                website_id,
+                self._iter_event_records(file_path_obj, file_format),
+                chunk_size or self.bulk_chunk_size,
+            )
+            result["file_path"] = file_path
+            return result
+
         imported_count = 0
 
         if file_format.lower() == "json":
             imported_count = self._import_events_from_json(website_id, file_path_obj)
+        elif file_format.lower() == "jsonl":
+            imported_count = self._import_events_from_records(
+                website_id, self._iter_event_records(file_path_obj, "jsonl")
+            )
         else:
             imported_count = self._import_events_from_csv(website_id, file_path_obj)
 
@@ -159,6 +199,171 @@ class EventProcessor:
             "file_path": file_path,
         }
 
+    def _import_events_from_records(
+        self, website_id: int, records: Iterator[Dict]
+    ) -> int:
+        """Import events one by one from raw records.
+
+        Args:
+            website_id: Website ID.
+            records: Iterator of raw event dictionaries.
+
+        Returns:
+            Number of events imported.
+        """
+        imported_count = 0
+        for record in records:
+            event = self._parse_event_record(record)
+            if event is None:
+                continue
+            try:
+                result = self.process_event(website_id=website_id, **event)
+                if result.get("success"):
+                    imported_count += 1
+            except Exception:
+                continue
+
+        return imported_count
+
+    def _bulk_import_events(
+        self, website_id: int, records: Iterator[Dict], chunk_size: int
+    ) -> Dict[str, any]:
+        """Import events in chunks with one transaction per chunk.
+
+        Conversion goals are loaded once and matched in memory; sessions,
+        events, page views and conversion flags are written per chunk by
+        DatabaseManager.bulk_add_events.
+
+        Args:
+            website_id: Website ID.
+            records: Iterator of raw event dictionaries.
+            chunk_size: Number of events per chunk.
+
+        Returns:
+            Dictionary with import counts, elapsed time and throughput.
+        """
+        goals = self.db_manager.get_website_goals(website_id)
+        started = time.perf_counter()
+        imported_count = 0
+        skipped_count = 0
+        chunk_count = 0
+
+        while True:
+            chunk = list(islice(records, chunk_size))
+            if not chunk:
+                break
+
+            events = []
+            conversions = {}
+            for record in chunk:
+                event = self._parse_event_record(record)
+                if event is None:
+                    skipped_count += 1
+                    continue
+
+                if event["metadata"] is not None and not isinstance(event["metadata"], str):
+                    event["metadata"] = json.dumps(event["metadata"])
+
+                goal = self._match_goal(goals, event["page_url"], event["event_name"])
+                if goal:
+                    conversions[event["session_id"]] = goal.id
+                events.append(event)
+
+            imported_count += self.db_manager.bulk_add_events(
+                website_id, events, conversions
+            )
+            chunk_count += 1
+            logger.debug(
+                f"Imported chunk {chunk_count} ({len(events)} events)",
+                extra={"website_id": website_id, "chunk": chunk_count},
+            )
+
+        elapsed_seconds = time.perf_counter() - started
+        events_per_second = imported_count / elapsed_seconds if elapsed_seconds > 0 else 0.0
+
+        logger.info(
+            f"Bulk imported {imported_count} events in {elapsed_seconds:.2f}s "
+            f"({events_per_second:.0f} events/sec)",
+            extra={
+                "website_id": website_id,
+                "imported_count": imported_count,
+                "skipped_count": skipped_count,
+            },
+        )
+
+        return {
+            "success": True,
+            "imported_count": imported_count,
+            "skipped_count": skipped_count,
+            "chunk_count": chunk_count,
+            "elapsed_seconds": elapsed_seconds,
+            "events_per_second": events_per_second,
+        }
+
+    def _iter_event_records(self, file_path: Path, file_format: str) -> Iterator[Dict]:
+        """Iterate raw event records from a file.
+
+        CSV and JSON Lines files are streamed row by row; JSON documents are
+        loaded whole.
+
+        Args:
+            file_path: Path to events file.
+            file_format: File format (json, jsonl or csv).
+
+        Yields:
+            Raw event dictionaries.
+        """
+        file_format = file_format.lower()
+
+        with open(file_path, "r", encoding="utf-8") as f:
+            if file_format == "json":
+                data = json.load(f)
+                if isinstance(data, list):
+                    yield from data
+                elif isinstance(data, dict) and "events" in data:
+                    yield from data["events"]
+                else:
+                    yield data
+            elif file_format == "jsonl":
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+            else:
+                yield from csv.DictReader(f)
+
+    @staticmethod
+    def _parse_event_record(record: Dict) -> Optional[Dict[str, Any]]:
+        """Normalize a raw event record.
+
+        Args:
+            record: Raw event dictionary from a JSON or CSV source.
+
+        Returns:
+            Event dictionary matching process_event arguments, or None if
+            the record is invalid.
+        """
+        try:
+            timestamp_str = record.get("timestamp", "")
+            timestamp = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
+        except (AttributeError, TypeError, ValueError):
+            return None
+
+        return {
+            "session_id": record.get("session_id", ""),
+            "event_type": record.get("event_type") or "pageview",
+            "timestamp": timestamp,
+            "event_name": record.get("event_name") or None,
+            "page_url": record.get("page_url") or None,
+            "page_title": record.get("page_title") or None,
+            "user_id": record.get("user_id") or None,
+            "metadata": record.get("metadata") or None,
+        }
+
     def _import_events_from_json(
         self, website_id: int, file_path: Path
     ) -> int:
@@ -171,8 +376,6 @@ class EventProcessor:
         Returns:
             Number of events imported.
         """
-        import json
-
         with open(file_path, "r", encoding="utf-8") as f:
             data = json.load(f)
 
@@ -219,8 +422,6 @@ class EventProcessor:
         Returns:
             Number of events imported.
         """
-        import csv
-
         imported_count = 0
 
         with open(file_path, "r", encoding="utf-8") as f:
@@ -136,6 +136,8 @@ def import_events(
     website_id: int,
     file_path: Path,
     file_format: str = "json",
+    bulk: bool = False,
+    chunk_size: Optional[int] = None,
 ) -> dict:
     """Import events from file.
 
@@ -144,7 +146,9 @@ def import_events(
         settings: Application settings object.
         website_id: Website ID.
         file_path: Path to events file.
-        file_format: File format (json or csv).
+        file_format: File format (json, jsonl or csv).
+        bulk: Use chunked bulk inserts instead of per-event processing.
+        chunk_size: Number of events per chunk in bulk mode.
 
     Returns:
         Dictionary with import results.
@@ -157,7 +161,11 @@ def import_events(
     logger.info(f"Importing events from {file_format} file: {file_path}")
 
     result = event_processor.import_events_from_file(
-        website_id=website_id, file_path=str(file_path), file_format=file_format
+        website_id=website_id,
+        file_path=str(file_path),
+        file_format=file_format,
+        bulk=bulk,
+        chunk_size=chunk_size,
     )
 
     logger.info(f"Imported {result['imported_count']} events")
@@ -247,6 +255,7 @@ def identify_dropoffs(
     settings: object,
     website_id: int,
     conversion_goal_id: Optional[int] = None,
+    hours: Optional[int] = None,
 ) -> dict:
     """Identify drop-off points.
 
@@ -255,6 +264,7 @@ def identify_dropoffs(
         settings: Application settings object.
         website_id: Website ID.
         conversion_goal_id: Optional conversion goal ID.
+        hours: Optional number of hours to analyze.
 
     Returns:
         Dictionary with drop-off identification results.
@@ -267,7 +277,7 @@ def identify_dropoffs(
     logger.info("Identifying drop-off points", extra={"website_id": website_id, "conversion_goal_id": conversion_goal_id})
 
     dropoffs = identifier.identify_dropoffs(
-        website_id=website_id, conversion_goal_id=conversion_goal_id
+        website_id=website_id, conversion_goal_id=conversion_goal_id, hours=hours
     )
 
     logger.info(f"Identified {len(dropoffs)} drop-off points")
@@ -431,10 +441,20 @@ def main() -> None:
     )
     parser.add_argument(
         "--format",
-        choices=["json", "csv"],
+        choices=["json", "jsonl", "csv"],
         default="json",
         help="File format for import (default: json)",
     )
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="Import events in chunked bulk transactions",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        help="Number of events per chunk for bulk import",
+    )
     parser.add_argument(
         "--config",
         type=Path,
@@ -503,9 +523,14 @@ def main() -> None:
                 website_id=int(website_id),
                 file_path=Path(file_path),
                 file_format=args.format,
+                bulk=args.bulk,
+                chunk_size=args.chunk_size,
             )
             print(f"\nEvent import completed:")
             print(f"Imported events: {result['imported_count']}")
+            if args.bulk:
+                print(f"Skipped events: {result['skipped_count']}")
+                print(f"Throughput: {result['events_per_second']:.0f} events/sec")
             print(f"File: {result['file_path']}")
 
         if args.monitor:
@@ -537,6 +562,7 @@ def main() -> None:
                 settings=settings,
                 website_id=args.identify_dropoffs,
                 conversion_goal_id=args.conversion_goal_id,
+                hours=args.hours,
             )
             print(f"\nDrop-off identification completed:")
             print(f"Drop-off points identified: {result['dropoff_points_identified']}")
@@ -118,6 +118,19 @@ def test_optimization_recommender_generate_recommendations(db_manager, sample_co
     assert len(recommendations) > 0
 
 
+def test_optimization_recommender_names_dropoff_step(db_manager, sample_config):
+    """Test that drop-off recommendations name their journey step."""
+    db_manager.create_tables()
+    website = db_manager.add_website("example.com")
+    step = db_manager.add_journey_step(website.id, "Checkout", 3, page_url="/checkout")
+    db_manager.add_dropoff_point(website.id, 0.6, 100, 60, journey_step_id=step.id)
+
+    recommender = OptimizationRecommender(db_manager, sample_config["recommendations"])
+    recommendations = recommender.generate_recommendations(website.id)
+
+    assert "Optimize Checkout to Reduce Drop-offs" in [r["title"] for r in recommendations]
+
+
 def test_event_processor_process_event(db_manager, sample_config):
     """Test processing event."""
     db_manager.create_tables()
@@ -192,3 +205,99 @@ def test_conversion_monitor_get_trends(db_manager, sample_config):
     
     assert "average_rate" in trends
     assert "trend" in trends
+
+
+def test_event_processor_bulk_import_csv(db_manager, sample_config, tmp_path):
+    """Test bulk importing events from CSV file."""
+    db_manager.create_tables()
+    website = db_manager.add_website("example.com")
+    db_manager.add_conversion_goal(
+        website.id, "Purchase", "purchase", target_url="/checkout/complete"
+    )
+
+    events_file = tmp_path / "events.csv"
+    events_file.write_text(
+        "session_id,event_type,timestamp,page_url,page_title,user_id\n"
+        "session1,pageview,2024-01-01T10:00:00Z,/home,Home,user1\n"
+        "session1,pageview,2024-01-01T10:01:00Z,/checkout/complete,Done,user1\n"
+        "session2,pageview,2024-01-01T10:02:00Z,/home,Home,user2\n"
+        "session2,pageview,not-a-timestamp,/products,Products,user2\n"
+        "session3,pageview,2024-01-01T10:03:00Z,/home,Home,user3\n"
+    )
+
+    processor = EventProcessor(db_manager, sample_config["events"])
+    result = processor.import_events_from_file(
+        website.id, str(events_file), file_format="csv", bulk=True, chunk_size=2
+    )
+
+    assert result["imported_count"] == 4
+    assert result["skipped_count"] == 1
+    assert result["chunk_count"] == 3
+    assert result["events_per_second"] > 0
+
+    session1 = db_manager.get_user_session("session1")
+    assert session1.page_views == 2
+    assert session1.converted == "true"
+    assert db_manager.get_user_session("session2").converted == "false"
+    assert len(db_manager.get_session_events(session1.id)) == 2
+
+
+def test_event_processor_bulk_import_appends_to_existing_session(
+    db_manager, sample_config, tmp_path
+):
+    """Test bulk import reuses existing sessions and increments page views."""
+    db_manager.create_tables()
+    website = db_manager.add_website("example.com")
+    processor = EventProcessor(db_manager, sample_config["events"])
+    processor.process_event(
+        website_id=website.id,
+        session_id="session1",
+        event_type="pageview",
+        timestamp=datetime.utcnow(),
+        page_url="/home",
+    )
+
+    events_file = tmp_path / "events.jsonl"
+    events_file.write_text(
+        '{"session_id": "session1", "event_type": "pageview", '
+        '"timestamp": "2024-01-01T10:00:00", "page_url": "/products", '
+        '"metadata": {"ref": "ad"}}\n'
+    )
+
+    result = processor.import_events_from_file(
+        website.id, str(events_file), file_format="jsonl", bulk=True
+    )
+
+    assert result["imported_count"] == 1
+    assert db_manager.get_user_session("session1").page_views == 2
+
+
+def test_dropoff_identifier_identify_dropoffs_from_steps(db_manager, sample_config):
+    """Test computing funnel drop-offs for every journey step at once."""
+    db_manager.create_tables()
+    website = db_manager.add_website("example.com")
+    db_manager.add_journey_step(website.id, "Home", 1, page_url="/home")
+    db_manager.add_journey_step(website.id, "Products", 2, page_url="/products")
+    db_manager.add_journey_step(website.id, "Checkout", 3, event_type="form_submit")
+
+    for i in range(10):
+        session = db_manager.add_session(website.id, f"session{i}", datetime.utcnow())
+        db_manager.add_event(session.id, "pageview", datetime.utcnow(), page_url="/home")
+        if i < 6:
+            db_manager.add_event(
+                session.id, "pageview", datetime.utcnow(), page_url="/products/1"
+            )
+        if i < 3:
+            db_manager.add_event(session.id, "form_submit", datetime.utcnow())
+
+    identifier = DropOffIdentifier(db_manager, sample_config["dropoff_detection"])
+    dropoffs = identifier.identify_dropoffs(website.id)
+
+    by_step = {d["step_name"]: d for d in dropoffs}
+    assert by_step["Home"]["sessions_entered"] == 10
+    assert by_step["Home"]["sessions_exited"] == 4
+    assert by_step["Products"]["sessions_entered"] == 6
+    assert by_step["Products"]["sessions_exited"] == 3
+    assert by_step["Products"]["dropoff_rate"] == 0.5
+    assert by_step["Checkout"]["sessions_entered"] == 3
+    assert by_step["Checkout"]["sessions_exited"] == 0
@@ -0,0 +1,224 @@
+"""Benchmark load+analyze time and peak RSS for engagement analysis.
+
+Generates synthetic engagement and purchase files, then measures loading
+the files and computing per-customer metrics, segments and segment
+summaries through the record-based path (dataclass lists scanned once per
+customer) and the columnar path (typed DataFrames grouped by customer).
+Each measurement runs in a fresh subprocess so peak RSS is reported per
+run.
+
+Run from the repository root:
+
+    python -m customer_engagement_monitor.benchmarks.load_analyze
+"""
+
+import argparse
+import json
+import logging
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from customer_engagement_monitor.src.main import (
+    CustomerMetrics,
+    EngagementDataConfig,
+    LTVConfig,
+    PurchaseDataConfig,
+    SegmentationConfig,
+    TouchpointType,
+    assign_segment,
+    calculate_customer_metrics_frame,
+    calculate_engagement_score,
+    calculate_ltv,
+    load_engagement_data,
+    load_engagement_frame,
+    load_purchase_data,
+    load_purchase_frame,
+    summarize_segments_frame,
+)
+
+TOUCHPOINTS = np.array([touchpoint.value for touchpoint in TouchpointType])
+
+
+def generate_data(directory: Path, rows: int, seed: int = 7) -> None:
+    """Write synthetic engagement.csv (rows rows) and purchases.csv."""
+    rng = np.random.default_rng(seed)
+    customer_count = max(rows // 20, 1)
+    purchase_count = max(rows // 4, 1)
+    now = np.datetime64(datetime.now().replace(microsecond=0))
+
+    scores = rng.random(rows).round(3)
+    scores[rng.random(rows) < 0.5] = np.nan
+    pd.DataFrame(
+        {
+            "customer_id": np.char.add(
+                "cust_", rng.integers(0, customer_count, rows).astype(str)
+            ),
+            "touchpoint": rng.choice(TOUCHPOINTS, rows),
+            "timestamp": now
+            - rng.integers(3600, 400 * 86400, rows).astype("timedelta64[s]"),
+            "engagement_score": scores,
+        }
+    ).to_csv(directory / "engagement.csv", index=False)
+
+    pd.DataFrame(
+        {
+            "customer_id": np.char.add(
+                "cust_",
+                rng.integers(0, int(customer_count * 1.1) + 1, purchase_count).astype(
+                    str
+                ),
+            ),
+            "purchase_date": now
+            - rng.integers(3600, 500 * 86400, purchase_count).astype(
+                "timedelta64[s]"
+            ),
+            "amount": rng.uniform(5, 400, purchase_count).round(2),
+        }
+    ).to_csv(directory / "purchases.csv", index=False)
+
+
+def _configs(directory: Path):
+    """Build data configurations for the generated files."""
+    engagement_config = EngagementDataConfig(
+        file_path=str(directory / "engagement.csv"),
+        engagement_score_column="engagement_score",
+    )
+    purchase_config = PurchaseDataConfig(file_path=str(directory / "purchases.csv"))
+    return engagement_config, purchase_config
+
+
+def analyze_records(
+    directory: Path, ltv_config: LTVConfig, segmentation: SegmentationConfig
+) -> List[CustomerMetrics]:
+    """Load records and compute per-customer metrics one customer at a time."""
+    engagement_config, purchase_config = _configs(directory)
+    engagements = load_engagement_data(engagement_config, directory)
+    purchases = load_purchase_data(purchase_config, directory)
+
+    customer_ids = {e.customer_id for e in engagements}
+    customer_ids.update(p.customer_id for p in purchases)
+
+    metrics_list = []
+    now = datetime.now()
+    for customer_id in customer_ids:
+        ltv, total_revenue, purchase_count = calculate_ltv(
+            purchases, customer_id, ltv_config
+        )
+        engagement_score, touchpoint_counts, last_engagement = (
+            calculate_engagement_score(engagements, customer_id)
+        )
+        metrics = CustomerMetrics(
+            customer_id=customer_id,
+            lifetime_value=ltv,
+            total_revenue=total_revenue,
+            purchase_count=purchase_count,
+            engagement_score=engagement_score,
+            touchpoint_count=touchpoint_counts,
+            last_engagement_date=last_engagement,
+            days_since_last_engagement=(
+                (now - last_engagement).days if last_engagement else None
+            ),
+        )
+        metrics.segment = assign_segment(metrics, segmentation)
+        metrics_list.append(metrics)
+    return metrics_list
+
+
+def measure(mode: str, directory: Path) -> Dict[str, float]:
+    """Load and analyze the generated data once in this process."""
+    engagement_config, purchase_config = _configs(directory)
+    ltv_config = LTVConfig()
+    segmentation = SegmentationConfig()
+
+    start = time.perf_counter()
+    if mode == "records":
+        customers = len(analyze_records(directory, ltv_config, segmentation))
+    else:
+        engagements = load_engagement_frame(engagement_config, directory)
+        purchases = load_purchase_frame(purchase_config, directory)
+        metrics = calculate_customer_metrics_frame(
+            engagements, purchases, ltv_config, segmentation
+        )
+        summarize_segments_frame(metrics)
+        customers = len(metrics)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "seconds": elapsed,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "customers": customers,
+    }
+
+
+def _measure_in_subprocess(mode: str, directory: Path) -> Dict[str, float]:
+    """Run measure() in a fresh interpreter and return its result."""
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "customer_engagement_monitor.benchmarks.load_analyze",
+            "--measure",
+            mode,
+            str(directory),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    """Run the benchmark across row counts."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rows",
+        type=int,
+        nargs="+",
+        default=[100_000, 1_000_000, 10_000_000],
+        help="Engagement row counts to benchmark",
+    )
+    parser.add_argument(
+        "--max-record-rows",
+        type=int,
+        default=100_000,
+        help="Skip the record-based path above this many rows",
+    )
+    parser.add_argument(
+        "--measure", nargs=2, metavar=("MODE", "DIR"), help=argparse.SUPPRESS
+    )
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    if args.measure:
+        mode, directory = args.measure
+        print(json.dumps(measure(mode, Path(directory))))
+        return
+
+    print(f"{'rows':>10} {'path':>9} {'seconds':>9} {'peak RSS MB':>12}")
+    for rows in args.rows:
+        with tempfile.TemporaryDirectory() as tmp:
+            directory = Path(tmp)
+            generate_data(directory, rows)
+            modes: List[str] = ["columnar"]
+            if rows <= args.max_record_rows:
+                modes.insert(0, "records")
+            for mode in modes:
+                result = _measure_in_subprocess(mode, directory)
+                print(
+                    f"{rows:>10} {mode:>9} {result['seconds']:>9.2f} "
+                    f"{result['peak_rss_mb']:>12.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
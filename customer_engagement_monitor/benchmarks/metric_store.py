@@ -0,0 +1,145 @@
+"""Benchmark a daily metric store update against a full recompute.
+
+Writes synthetic engagement and purchase history as daily files, builds the
+metric store from them, then adds one more day of data and times:
+
+- full: loading every file and recomputing metrics from scratch
+- incremental: loading the store, folding in only the new day's files and
+  computing metrics from the aggregates
+
+Run from the repository root:
+
+    python -m customer_engagement_monitor.benchmarks.metric_store
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from customer_engagement_monitor.src.main import (
+    Config,
+    EngagementDataConfig,
+    PurchaseDataConfig,
+    TouchpointType,
+    calculate_customer_metrics_frame,
+    load_engagement_frame,
+    load_purchase_frame,
+    update_customer_metric_store,
+)
+
+TOUCHPOINTS = np.array([touchpoint.value for touchpoint in TouchpointType])
+
+
+def write_day(
+    directory: Path,
+    day: datetime,
+    rows: int,
+    customer_count: int,
+    rng: np.random.Generator,
+) -> None:
+    """Write one day of engagement rows and a quarter as many purchases."""
+    start = np.datetime64(day.replace(hour=0, minute=0, second=0, microsecond=0))
+    name = f"{day:%Y-%m-%d}.csv"
+
+    scores = rng.random(rows).round(3)
+    scores[rng.random(rows) < 0.5] = np.nan
+    pd.DataFrame(
+        {
+            "customer_id": np.char.add(
+                "cust_", rng.integers(0, customer_count, rows).astype(str)
+            ),
+            "touchpoint": rng.choice(TOUCHPOINTS, rows),
+            "timestamp": start + rng.integers(0, 86400, rows).astype("timedelta64[s]"),
+            "engagement_score": scores,
+        }
+    ).to_csv(directory / "engagement" / name, index=False)
+
+    purchases = max(rows // 4, 1)
+    pd.DataFrame(
+        {
+            "customer_id": np.char.add(
+                "cust_", rng.integers(0, customer_count, purchases).astype(str)
+            ),
+            "purchase_date": start
+            + rng.integers(0, 86400, purchases).astype("timedelta64[s]"),
+            "amount": rng.uniform(5, 400, purchases).round(2),
+        }
+    ).to_csv(directory / "purchases" / name, index=False)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=10_000_000,
+        help="Historical engagement rows",
+    )
+    parser.add_argument(
+        "--days", type=int, default=100, help="Daily files the history is split into"
+    )
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    rng = np.random.default_rng(7)
+    rows_per_day = max(args.rows // args.days, 1)
+    customer_count = max(args.rows // 20, 1)
+    now = datetime.now()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        (directory / "engagement").mkdir()
+        (directory / "purchases").mkdir()
+        for offset in range(args.days, 0, -1):
+            write_day(
+                directory, now - timedelta(days=offset), rows_per_day, customer_count, rng
+            )
+
+        config = Config(
+            engagement_data=EngagementDataConfig(
+                file_path="engagement/*.csv",
+                engagement_score_column="engagement_score",
+            ),
+            purchase_data=PurchaseDataConfig(file_path="purchases/*.csv"),
+            metric_store={"enabled": True, "store_file": "store/metrics.npz"},
+        )
+
+        start = time.perf_counter()
+        update_customer_metric_store(config, directory, now)
+        build_seconds = time.perf_counter() - start
+
+        write_day(directory, now, rows_per_day, customer_count, rng)
+
+        start = time.perf_counter()
+        calculate_customer_metrics_frame(
+            load_engagement_frame(config.engagement_data, directory),
+            load_purchase_frame(config.purchase_data, directory),
+            config.ltv,
+            config.segmentation,
+            now,
+        )
+        full_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        store = update_customer_metric_store(config, directory, now)
+        store.metrics(config.ltv, config.segmentation, now)
+        incremental_seconds = time.perf_counter() - start
+
+    print(
+        f"history: {rows_per_day * args.days} engagement rows in {args.days} files, "
+        f"{len(store)} customers"
+    )
+    print(f"store build: {build_seconds:.2f}s")
+    print(f"full recompute after one new day: {full_seconds:.2f}s")
+    print(f"incremental update after one new day: {incremental_seconds:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
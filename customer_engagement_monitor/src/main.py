@@ -4,17 +4,22 @@ Monitors customer engagement across all touchpoints, calculates lifetime value,
 identifies high-value segments, and generates engagement strategy recommendations.
 """
 
+import argparse
+import glob
 import json
 import logging
+import os
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
+import numpy as np
 import pandas as pd
 import yaml
+from pandas.api.types import union_categoricals
 from pydantic import BaseModel, Field, field_validator
 from pydantic_settings import BaseSettings
 
@@ -47,6 +52,17 @@ class SegmentTier(str, Enum):
     LOST = "lost"
 
 
+TOUCHPOINT_WEIGHTS: Dict[TouchpointType, float] = {
+    TouchpointType.PURCHASE: 5.0,
+    TouchpointType.REVIEW: 4.0,
+    TouchpointType.SUPPORT: 3.0,
+    TouchpointType.WEB: 2.0,
+    TouchpointType.MOBILE: 2.0,
+    TouchpointType.EMAIL: 1.5,
+    TouchpointType.SOCIAL: 1.0,
+}
+
+
 class EngagementDataConfig(BaseModel):
     """Configuration for engagement data source."""
 
@@ -124,6 +140,19 @@ class StrategyConfig(BaseModel):
     )
 
 
+class MetricStoreConfig(BaseModel):
+    """Configuration for the incremental per-customer metric store."""
+
+    enabled: bool = Field(
+        default=False,
+        description="Update persisted per-customer aggregates from new files only",
+    )
+    store_file: str = Field(
+        default="data/customer_metric_store.npz",
+        description="Path to the persisted metric store",
+    )
+
+
 class Config(BaseModel):
     """Main configuration model."""
 
@@ -144,6 +173,10 @@ class Config(BaseModel):
         default_factory=StrategyConfig,
         description="Strategy generation settings",
     )
+    metric_store: MetricStoreConfig = Field(
+        default_factory=MetricStoreConfig,
+        description="Incremental metric store settings",
+    )
     output_file: str = Field(
         default="logs/engagement_analysis.json",
         description="Path to save analysis results",
@@ -247,85 +280,322 @@ def load_config(config_path: Path) -> Config:
         raise
 
 
-def load_engagement_data(
-    config: EngagementDataConfig, project_root: Path
-) -> List[EngagementRecord]:
-    """Load engagement data from file.
+def _resolve_data_path(file_path: str, project_root: Path) -> Path:
+    """Resolve a data file path relative to the project root."""
+    data_path = Path(file_path)
+    if not data_path.is_absolute():
+        data_path = project_root / data_path
+    return data_path
+
+
+def _read_data_frame(
+    data_path: Path, file_format: str, category_columns: List[str]
+) -> pd.DataFrame:
+    """Read a CSV or JSON data file into a DataFrame.
+
+    Args:
+        data_path: Path to the data file
+        file_format: File format (csv or json)
+        category_columns: Columns to read as string categoricals
+
+    Raises:
+        ValueError: If the format is unsupported
+    """
+    if file_format.lower() == "csv":
+        df = pd.read_csv(
+            data_path,
+            dtype={column: pd.CategoricalDtype() for column in category_columns},
+        )
+        for column in category_columns:
+            if column in df.columns:
+                df[column] = df[column].cat.rename_categories(
+                    df[column].cat.categories.astype(str)
+                )
+        return df
+    if file_format.lower() == "json":
+        df = pd.read_json(data_path)
+        for column in category_columns:
+            if column in df.columns:
+                df[column] = (
+                    df[column]
+                    .where(df[column].isna(), df[column].astype(str))
+                    .astype("category")
+                )
+        return df
+    raise ValueError(f"Unsupported format: {file_format}")
+
+
+def _data_paths(file_path: str, project_root: Path) -> List[Path]:
+    """Resolve a data file path or glob pattern relative to the project root.
+
+    A plain path is returned as is; a pattern returns the matching files
+    sorted by name.
+    """
+    data_path = _resolve_data_path(file_path, project_root)
+    if not glob.has_magic(str(data_path)):
+        return [data_path]
+    return sorted(Path(match) for match in glob.glob(str(data_path)))
+
+
+def _read_data_frames(
+    data_paths: List[Path],
+    file_format: str,
+    category_columns: List[str],
+    label: str,
+) -> Optional[pd.DataFrame]:
+    """Read and concatenate data files, skipping empty ones.
+
+    Categorical columns keep a categorical dtype over the union of the
+    files' categories.
+
+    Args:
+        data_paths: Data files to read
+        file_format: File format (csv or json)
+        category_columns: Columns to read as string categoricals
+        label: Data set name for log messages
+
+    Returns:
+        Concatenated DataFrame, or None if every file is empty
+
+    Raises:
+        FileNotFoundError: If a data file does not exist
+        ValueError: If the format is unsupported
+    """
+    frames = []
+    for data_path in data_paths:
+        if not data_path.exists():
+            raise FileNotFoundError(f"{label} data file not found: {data_path}")
+        try:
+            frames.append(_read_data_frame(data_path, file_format, category_columns))
+        except pd.errors.EmptyDataError:
+            logger.warning(f"{label} data file is empty: {data_path}")
+
+    if not frames:
+        return None
+    if len(frames) == 1:
+        return frames[0]
+
+    for column in category_columns:
+        present = [frame[column] for frame in frames if column in frame.columns]
+        if not present:
+            continue
+        categories = union_categoricals(present).categories
+        for frame in frames:
+            if column in frame.columns:
+                frame[column] = frame[column].cat.set_categories(categories)
+    return pd.concat(frames, ignore_index=True)
+
+
+def load_engagement_frame(
+    config: EngagementDataConfig,
+    project_root: Path,
+    data_paths: Optional[List[Path]] = None,
+) -> pd.DataFrame:
+    """Load engagement data into a typed DataFrame.
+
+    config.file_path may be a glob pattern, in which case all matching
+    files are loaded. Rows with an unknown touchpoint type are dropped.
 
     Args:
         config: Engagement data configuration
         project_root: Project root directory
+        data_paths: Files to load instead of those matching config.file_path
 
     Returns:
-        List of EngagementRecord objects
+        DataFrame with customer_id and touchpoint (categorical), timestamp
+        and engagement_score columns
 
     Raises:
         FileNotFoundError: If data file does not exist
         ValueError: If data format is invalid
     """
-    data_path = Path(config.file_path)
-    if not data_path.is_absolute():
-        data_path = project_root / data_path
-
-    if not data_path.exists():
-        raise FileNotFoundError(f"Engagement data file not found: {data_path}")
+    if data_paths is None:
+        data_paths = _data_paths(config.file_path, project_root)
+        if not data_paths:
+            raise FileNotFoundError(
+                f"No engagement data files match: {config.file_path}"
+            )
 
-    engagements = []
+    touchpoint_values = pd.Index([touchpoint.value for touchpoint in TouchpointType])
 
     try:
-        if config.format.lower() == "csv":
-            df = pd.read_csv(data_path)
-        elif config.format.lower() == "json":
-            df = pd.read_json(data_path)
-        else:
-            raise ValueError(f"Unsupported format: {config.format}")
-
-        required_columns = [
-            config.customer_id_column,
-            config.touchpoint_column,
-            config.timestamp_column,
-        ]
-        missing = [col for col in required_columns if col not in df.columns]
-        if missing:
-            raise ValueError(f"Missing required columns: {missing}")
-
-        df[config.timestamp_column] = pd.to_datetime(df[config.timestamp_column])
-
-        for _, row in df.iterrows():
-            touchpoint_str = str(row[config.touchpoint_column]).lower()
-            try:
-                touchpoint = TouchpointType(touchpoint_str)
-            except ValueError:
-                logger.warning(f"Unknown touchpoint type: {touchpoint_str}")
-                continue
+        df = _read_data_frames(
+            data_paths,
+            config.format,
+            [config.customer_id_column, config.touchpoint_column],
+            "Engagement",
+        )
+    except Exception as e:
+        logger.error(f"Failed to load engagement data: {e}")
+        raise
 
-            engagement = EngagementRecord(
-                customer_id=str(row[config.customer_id_column]),
-                touchpoint=touchpoint,
-                timestamp=row[config.timestamp_column],
+    if df is None:
+        return pd.DataFrame(
+            {
+                "customer_id": pd.Categorical([]),
+                "touchpoint": pd.Categorical([], categories=touchpoint_values),
+                "timestamp": pd.to_datetime(pd.Series([], dtype=object)),
+                "engagement_score": pd.Series([], dtype="Float64"),
+            }
+        )
+
+    required_columns = [
+        config.customer_id_column,
+        config.touchpoint_column,
+        config.timestamp_column,
+    ]
+    missing = [col for col in required_columns if col not in df.columns]
+    if missing:
+        raise ValueError(f"Missing required columns: {missing}")
+
+    raw_touchpoint = df[config.touchpoint_column]
+    if not isinstance(raw_touchpoint.dtype, pd.CategoricalDtype):
+        raw_touchpoint = raw_touchpoint.astype(str).astype("category")
+    lowered = raw_touchpoint.cat.categories.astype(str).str.lower()
+    category_codes = np.append(touchpoint_values.get_indexer(lowered), -1)
+    raw_codes = raw_touchpoint.cat.codes.to_numpy()
+    touchpoint_codes = category_codes[raw_codes]
+
+    known = touchpoint_codes >= 0
+    if not known.all():
+        unknown = pd.Series(
+            np.append(lowered, "nan")[raw_codes[~known]]
+        ).value_counts()
+        for touchpoint_str, count in unknown.items():
+            logger.warning(
+                f"Unknown touchpoint type: {touchpoint_str} ({count} rows skipped)"
             )
 
-            if (
-                config.engagement_score_column
-                and config.engagement_score_column in df.columns
-            ):
-                if pd.notna(row[config.engagement_score_column]):
-                    engagement.engagement_score = float(
-                        row[config.engagement_score_column]
-                    )
+    score = (
+        df[config.engagement_score_column].astype("Float64")
+        if config.engagement_score_column
+        and config.engagement_score_column in df.columns
+        else pd.Series(pd.NA, index=df.index, dtype="Float64")
+    )
+    customer_id = df[config.customer_id_column]
+    if not isinstance(customer_id.dtype, pd.CategoricalDtype):
+        customer_id = customer_id.astype(str).astype("category")
+
+    frame = pd.DataFrame(
+        {
+            "customer_id": customer_id,
+            "touchpoint": pd.Categorical.from_codes(
+                touchpoint_codes, categories=touchpoint_values
+            ),
+            "timestamp": pd.to_datetime(df[config.timestamp_column]),
+            "engagement_score": score,
+        }
+    )[known].reset_index(drop=True)
+
+    logger.info(f"Loaded {len(frame)} engagement records")
+    return frame
+
+
+def load_purchase_frame(
+    config: PurchaseDataConfig,
+    project_root: Path,
+    data_paths: Optional[List[Path]] = None,
+) -> pd.DataFrame:
+    """Load purchase data into a typed DataFrame.
+
+    config.file_path may be a glob pattern, in which case all matching
+    files are loaded.
 
-            engagements.append(engagement)
+    Args:
+        config: Purchase data configuration
+        project_root: Project root directory
+        data_paths: Files to load instead of those matching config.file_path
 
-        logger.info(f"Loaded {len(engagements)} engagement records")
-        return engagements
+    Returns:
+        DataFrame with customer_id (categorical), purchase_date and amount
+        columns
 
-    except pd.errors.EmptyDataError:
-        logger.warning(f"Engagement data file is empty: {data_path}")
-        return []
+    Raises:
+        FileNotFoundError: If data file does not exist
+        ValueError: If data format is invalid
+    """
+    if data_paths is None:
+        data_paths = _data_paths(config.file_path, project_root)
+        if not data_paths:
+            raise FileNotFoundError(
+                f"No purchase data files match: {config.file_path}"
+            )
+
+    try:
+        df = _read_data_frames(
+            data_paths, config.format, [config.customer_id_column], "Purchase"
+        )
     except Exception as e:
-        logger.error(f"Failed to load engagement data: {e}")
+        logger.error(f"Failed to load purchase data: {e}")
         raise
 
+    if df is None:
+        return pd.DataFrame(
+            {
+                "customer_id": pd.Categorical([]),
+                "purchase_date": pd.to_datetime(pd.Series([], dtype=object)),
+                "amount": pd.Series([], dtype="float64"),
+            }
+        )
+
+    required_columns = [
+        config.customer_id_column,
+        config.purchase_date_column,
+        config.amount_column,
+    ]
+    missing = [col for col in required_columns if col not in df.columns]
+    if missing:
+        raise ValueError(f"Missing required columns: {missing}")
+
+    customer_id = df[config.customer_id_column]
+    if not isinstance(customer_id.dtype, pd.CategoricalDtype):
+        customer_id = customer_id.astype(str).astype("category")
+
+    frame = pd.DataFrame(
+        {
+            "customer_id": customer_id,
+            "purchase_date": pd.to_datetime(df[config.purchase_date_column]),
+            "amount": df[config.amount_column].astype("float64"),
+        }
+    )
+
+    logger.info(f"Loaded {len(frame)} purchase records")
+    return frame
+
+
+def load_engagement_data(
+    config: EngagementDataConfig, project_root: Path
+) -> List[EngagementRecord]:
+    """Load engagement data from file.
+
+    Args:
+        config: Engagement data configuration
+        project_root: Project root directory
+
+    Returns:
+        List of EngagementRecord objects
+
+    Raises:
+        FileNotFoundError: If data file does not exist
+        ValueError: If data format is invalid
+    """
+    frame = load_engagement_frame(config, project_root)
+    scores = frame["engagement_score"]
+    return [
+        EngagementRecord(
+            customer_id=customer_id,
+            touchpoint=TouchpointType(touchpoint),
+            timestamp=timestamp,
+            engagement_score=engagement_score,
+        )
+        for customer_id, touchpoint, timestamp, engagement_score in zip(
+            frame["customer_id"].astype(str).tolist(),
+            frame["touchpoint"].tolist(),
+            frame["timestamp"].tolist(),
+            scores.astype(object).where(scores.notna(), None).tolist(),
+        )
+    ]
+
 
 def load_purchase_data(
     config: PurchaseDataConfig, project_root: Path
@@ -343,53 +613,19 @@ def load_purchase_data(
         FileNotFoundError: If data file does not exist
         ValueError: If data format is invalid
     """
-    data_path = Path(config.file_path)
-    if not data_path.is_absolute():
-        data_path = project_root / data_path
-
-    if not data_path.exists():
-        raise FileNotFoundError(f"Purchase data file not found: {data_path}")
-
-    purchases = []
-
-    try:
-        if config.format.lower() == "csv":
-            df = pd.read_csv(data_path)
-        elif config.format.lower() == "json":
-            df = pd.read_json(data_path)
-        else:
-            raise ValueError(f"Unsupported format: {config.format}")
-
-        required_columns = [
-            config.customer_id_column,
-            config.purchase_date_column,
-            config.amount_column,
-        ]
-        missing = [col for col in required_columns if col not in df.columns]
-        if missing:
-            raise ValueError(f"Missing required columns: {missing}")
-
-        df[config.purchase_date_column] = pd.to_datetime(
-            df[config.purchase_date_column]
-        )
-
-        for _, row in df.iterrows():
-            purchase = PurchaseRecord(
-                customer_id=str(row[config.customer_id_column]),
-                purchase_date=row[config.purchase_date_column],
-                amount=float(row[config.amount_column]),
-            )
-            purchases.append(purchase)
-
-        logger.info(f"Loaded {len(purchases)} purchase records")
-        return purchases
-
-    except pd.errors.EmptyDataError:
-        logger.warning(f"Purchase data file is empty: {data_path}")
-        return []
-    except Exception as e:
-        logger.error(f"Failed to load purchase data: {e}")
-        raise
+    frame = load_purchase_frame(config, project_root)
+    return [
+        PurchaseRecord(
+            customer_id=customer_id,
+            purchase_date=purchase_date,
+            amount=amount,
+        )
+        for customer_id, purchase_date, amount in zip(
+            frame["customer_id"].astype(str).tolist(),
+            frame["purchase_date"].tolist(),
+            frame["amount"].tolist(),
+        )
+    ]
 
 
 def calculate_ltv(
@@ -465,15 +701,7 @@ def calculate_engagement_score(
     score_count = 0
     last_engagement = None
 
-    touchpoint_weights = {
-        TouchpointType.PURCHASE: 5.0,
-        TouchpointType.REVIEW: 4.0,
-        TouchpointType.SUPPORT: 3.0,
-        TouchpointType.WEB: 2.0,
-        TouchpointType.MOBILE: 2.0,
-        TouchpointType.EMAIL: 1.5,
-        TouchpointType.SOCIAL: 1.0,
-    }
+    touchpoint_weights = TOUCHPOINT_WEIGHTS
 
     for engagement in customer_engagements:
         touchpoint_counts[engagement.touchpoint] += 1
@@ -582,123 +810,784 @@ def generate_segment_strategies(
     return strategies[:5]
 
 
-def process_engagement_analysis(config_path: Path) -> EngagementAnalysis:
-    """Process engagement data and generate analysis.
+def _customer_positions(customer_id: pd.Series, customer_ids: pd.Index) -> np.ndarray:
+    """Return each row's position in customer_ids, or -1 where it is absent.
+
+    Lookups are done once per category rather than once per row.
+    """
+    series = customer_id.astype("category")
+    positions = customer_ids.get_indexer(series.cat.categories.astype(str))
+    return np.append(positions, -1)[series.cat.codes.to_numpy()]
+
+
+def _engagement_row_scores(engagements: pd.DataFrame) -> np.ndarray:
+    """Return each engagement's score, falling back to its touchpoint weight."""
+    touchpoint_weights = np.array(
+        [
+            TOUCHPOINT_WEIGHTS.get(TouchpointType(value), 1.0)
+            for value in engagements["touchpoint"].cat.categories
+        ],
+        dtype=np.float64,
+    )
+    scores = engagements["engagement_score"].to_numpy(
+        dtype=np.float64, na_value=np.nan
+    )
+    return np.where(
+        np.isnan(scores),
+        np.append(touchpoint_weights, 1.0)[engagements["touchpoint"].cat.codes],
+        scores,
+    )
+
+
+def _aggregate_engagements(
+    engagements: pd.DataFrame, positions: np.ndarray, customer_count: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Aggregate engagement rows per customer.
 
     Args:
-        config_path: Path to configuration file
+        engagements: Engagement DataFrame from load_engagement_frame
+        positions: Each row's customer position (-1 rows are ignored)
+        customer_count: Number of customers to aggregate for
 
     Returns:
-        Complete engagement analysis
+        Tuple of (score sums, score counts, last engagement as
+        datetime64[ns], customers x touchpoint type count matrix)
+    """
+    known = positions >= 0
+    positions = positions[known]
 
-    Raises:
-        FileNotFoundError: If config or data files are missing
-        ValueError: If configuration is invalid
+    score_sum = np.bincount(
+        positions,
+        weights=_engagement_row_scores(engagements)[known],
+        minlength=customer_count,
+    )
+    score_count = np.bincount(positions, minlength=customer_count)
+
+    last_engagement = np.full(customer_count, np.iinfo(np.int64).min, dtype=np.int64)
+    np.maximum.at(
+        last_engagement,
+        positions,
+        engagements["timestamp"]
+        .to_numpy(dtype="datetime64[ns]")[known]
+        .view(np.int64),
+    )
+
+    touchpoint_types = len(TouchpointType)
+    touchpoint_codes = engagements["touchpoint"].cat.codes.to_numpy()[known]
+    touchpoint_counts = np.bincount(
+        positions * touchpoint_types + touchpoint_codes,
+        minlength=customer_count * touchpoint_types,
+    ).reshape(customer_count, touchpoint_types)
+
+    return (
+        score_sum,
+        score_count.astype(np.int64),
+        last_engagement.view("datetime64[ns]"),
+        touchpoint_counts.astype(np.int64),
+    )
+
+
+def _customer_metrics_from_aggregates(
+    customer_ids: pd.Index,
+    total_revenue: np.ndarray,
+    purchase_count: np.ndarray,
+    score_sum: np.ndarray,
+    score_count: np.ndarray,
+    last_engagement: np.ndarray,
+    touchpoint_counts: np.ndarray,
+    ltv_config: LTVConfig,
+    segmentation_config: SegmentationConfig,
+    now: datetime,
+) -> pd.DataFrame:
+    """Derive LTV, engagement score and segment from per-customer aggregates.
+
+    Args:
+        customer_ids: Customer IDs, one per aggregate row
+        total_revenue: Revenue within the lookback window
+        purchase_count: Purchases within the lookback window
+        score_sum: Sum of per-engagement scores
+        score_count: Number of engagements
+        last_engagement: Latest engagement timestamp (NaT if none)
+        touchpoint_counts: Customers x touchpoint type count matrix
+        ltv_config: LTV configuration
+        segmentation_config: Segmentation configuration
+        now: Reference time for recency
+
+    Returns:
+        Customer metrics DataFrame as returned by
+        calculate_customer_metrics_frame
     """
-    config = load_config(config_path)
-    project_root = config_path.parent
+    with np.errstate(invalid="ignore", divide="ignore"):
+        avg_order_value = total_revenue / purchase_count
+        purchase_frequency = purchase_count / ltv_config.lookback_months
+        customer_value = avg_order_value * purchase_frequency
+        ltv = customer_value * (ltv_config.average_customer_lifespan_years * 12)
+        mean_score = score_sum / score_count
+    discount_factor = 1.0 / (
+        (1.0 + ltv_config.discount_rate) ** ltv_config.average_customer_lifespan_years
+    )
+    lifetime_value = np.where(purchase_count > 0, ltv * discount_factor, 0.0)
 
-    engagements = load_engagement_data(config.engagement_data, project_root)
-    purchases = load_purchase_data(config.purchase_data, project_root)
+    max_possible_score = sum(TOUCHPOINT_WEIGHTS.values()) / len(TOUCHPOINT_WEIGHTS)
+    engagement_score = np.minimum(
+        1.0, np.where(score_count > 0, mean_score, 0.0) / max_possible_score
+    )
+    last_engagement = pd.Series(last_engagement, index=customer_ids)
+    days_since = (pd.Timestamp(now) - last_engagement).dt.days.astype("Int64")
 
-    if not engagements and not purchases:
-        logger.warning("No engagement or purchase data available")
-        return EngagementAnalysis(
-            total_customers=0,
-            customer_metrics=[],
-            segment_analyses=[],
-            overall_metrics={},
-            generated_at=datetime.now(),
-        )
+    high_ltv = lifetime_value >= segmentation_config.ltv_threshold_high
+    medium_ltv = lifetime_value >= segmentation_config.ltv_threshold_medium
+    high_engagement = (
+        engagement_score >= segmentation_config.engagement_threshold_high
+    )
+    days = days_since.to_numpy(dtype=np.float64, na_value=np.nan)
+    recently_seen = ~np.isnan(days) & (days != 0)
+    segment_values = [segment.value for segment in SegmentTier]
+    segment_codes = np.select(
+        [
+            high_ltv & high_engagement,
+            high_ltv,
+            medium_ltv & high_engagement,
+            medium_ltv,
+            recently_seen & (days > segmentation_config.recency_threshold_days),
+            recently_seen,
+        ],
+        [
+            segment_values.index(SegmentTier.CHAMPION.value),
+            segment_values.index(SegmentTier.LOYAL.value),
+            segment_values.index(SegmentTier.LOYAL.value),
+            segment_values.index(SegmentTier.POTENTIAL.value),
+            segment_values.index(SegmentTier.LOST.value),
+            segment_values.index(SegmentTier.AT_RISK.value),
+        ],
+        segment_values.index(SegmentTier.POTENTIAL.value),
+    )
 
-    all_customer_ids = set()
-    if engagements:
-        all_customer_ids.update(e.customer_id for e in engagements)
-    if purchases:
-        all_customer_ids.update(p.customer_id for p in purchases)
+    metrics = pd.DataFrame(
+        {
+            "lifetime_value": lifetime_value,
+            "total_revenue": np.where(purchase_count > 0, total_revenue, 0.0),
+            "purchase_count": purchase_count,
+            "engagement_score": engagement_score,
+            "last_engagement_date": last_engagement.to_numpy(),
+            "days_since_last_engagement": days_since.array,
+            "segment": pd.Categorical.from_codes(
+                segment_codes, categories=segment_values
+            ),
+        },
+        index=customer_ids,
+    )
+    for code, touchpoint in enumerate(TouchpointType):
+        metrics[f"touchpoints_{touchpoint.value}"] = touchpoint_counts[:, code]
 
-    customer_metrics_list = []
+    logger.info(f"Calculated metrics for {len(metrics)} customers")
+    return metrics
 
-    for customer_id in all_customer_ids:
-        ltv, total_revenue, purchase_count = calculate_ltv(
-            purchases, customer_id, config.ltv
-        )
 
-        engagement_score, touchpoint_counts, last_engagement = (
-            calculate_engagement_score(engagements, customer_id)
+def calculate_customer_metrics_frame(
+    engagements: pd.DataFrame,
+    purchases: pd.DataFrame,
+    ltv_config: LTVConfig,
+    segmentation_config: SegmentationConfig,
+    now: Optional[datetime] = None,
+) -> pd.DataFrame:
+    """Calculate metrics and segments for every customer on columns.
+
+    Columnar equivalent of calculate_ltv, calculate_engagement_score and
+    assign_segment applied per customer: each input is grouped by customer
+    once instead of being scanned once per customer.
+
+    Args:
+        engagements: Engagement DataFrame from load_engagement_frame
+        purchases: Purchase DataFrame from load_purchase_frame
+        ltv_config: LTV configuration
+        segmentation_config: Segmentation configuration
+        now: Reference time for lookback and recency (defaults to now)
+
+    Returns:
+        DataFrame indexed by customer_id with lifetime_value,
+        total_revenue, purchase_count, engagement_score,
+        last_engagement_date, days_since_last_engagement, segment and one
+        touchpoints_<type> count column per touchpoint type
+    """
+    now = now or datetime.now()
+    customer_ids = pd.Index(
+        np.concatenate(
+            [
+                np.asarray(engagements["customer_id"].dropna().unique(), dtype=str),
+                np.asarray(purchases["customer_id"].dropna().unique(), dtype=str),
+            ]
+        ),
+        name="customer_id",
+    ).unique()
+
+    cutoff_date = now - timedelta(days=ltv_config.lookback_months * 30)
+    recent = purchases[purchases["purchase_date"] >= cutoff_date]
+    positions = _customer_positions(recent["customer_id"], customer_ids)
+    known = positions >= 0
+    total_revenue = np.bincount(
+        positions[known],
+        weights=recent["amount"].to_numpy(dtype=np.float64)[known],
+        minlength=len(customer_ids),
+    )
+    purchase_count = np.bincount(
+        positions[known], minlength=len(customer_ids)
+    ).astype(np.int64)
+
+    score_sum, score_count, last_engagement, touchpoint_counts = (
+        _aggregate_engagements(
+            engagements,
+            _customer_positions(engagements["customer_id"], customer_ids),
+            len(customer_ids),
         )
+    )
+
+    return _customer_metrics_from_aggregates(
+        customer_ids,
+        total_revenue,
+        purchase_count,
+        score_sum,
+        score_count,
+        last_engagement,
+        touchpoint_counts,
+        ltv_config,
+        segmentation_config,
+        now,
+    )
 
-        days_since_last_engagement = None
-        if last_engagement:
-            days_since_last_engagement = (
-                datetime.now() - last_engagement
-            ).days
 
-        metrics = CustomerMetrics(
+def customer_metrics_from_frame(metrics: pd.DataFrame) -> List[CustomerMetrics]:
+    """Convert a customer metrics DataFrame into CustomerMetrics records.
+
+    Args:
+        metrics: DataFrame from calculate_customer_metrics_frame
+
+    Returns:
+        List of CustomerMetrics objects in frame order
+    """
+    touchpoints = list(TouchpointType)
+    counts = metrics[
+        [f"touchpoints_{touchpoint.value}" for touchpoint in touchpoints]
+    ]
+    last_engagement = metrics["last_engagement_date"]
+    days_since = metrics["days_since_last_engagement"]
+    return [
+        CustomerMetrics(
             customer_id=customer_id,
-            lifetime_value=ltv,
+            lifetime_value=lifetime_value,
             total_revenue=total_revenue,
             purchase_count=purchase_count,
             engagement_score=engagement_score,
-            touchpoint_count=touchpoint_counts,
-            last_engagement_date=last_engagement,
+            touchpoint_count={
+                touchpoint: count
+                for touchpoint, count in zip(touchpoints, row_counts)
+                if count
+            },
+            last_engagement_date=last_engagement_date,
             days_since_last_engagement=days_since_last_engagement,
+            segment=SegmentTier(segment),
+        )
+        for (
+            customer_id,
+            lifetime_value,
+            total_revenue,
+            purchase_count,
+            engagement_score,
+            row_counts,
+            last_engagement_date,
+            days_since_last_engagement,
+            segment,
+        ) in zip(
+            metrics.index.tolist(),
+            metrics["lifetime_value"].tolist(),
+            metrics["total_revenue"].tolist(),
+            metrics["purchase_count"].tolist(),
+            metrics["engagement_score"].tolist(),
+            counts.to_numpy().tolist(),
+            last_engagement.astype(object).where(last_engagement.notna(), None).tolist(),
+            days_since.astype(object).where(days_since.notna(), None).tolist(),
+            metrics["segment"].tolist(),
         )
+    ]
 
-        metrics.segment = assign_segment(metrics, config.segmentation)
-        customer_metrics_list.append(metrics)
 
-    segment_analyses = []
-    for segment in SegmentTier:
-        segment_customers = [
-            m for m in customer_metrics_list if m.segment == segment
-        ]
+def summarize_segments_frame(
+    metrics: pd.DataFrame,
+) -> Tuple[List[SegmentAnalysis], Dict[str, float]]:
+    """Build segment analyses and overall metrics from customer metrics.
 
-        if not segment_customers:
-            continue
+    Args:
+        metrics: DataFrame from calculate_customer_metrics_frame
 
-        avg_ltv = (
-            sum(m.lifetime_value for m in segment_customers)
-            / len(segment_customers)
-        )
-        avg_engagement = (
-            sum(m.engagement_score for m in segment_customers)
-            / len(segment_customers)
-        )
-        total_revenue = sum(m.total_revenue for m in segment_customers)
+    Returns:
+        Tuple of (segment analyses in SegmentTier order, overall metrics)
+    """
+    by_segment = metrics.groupby("segment", observed=True).agg(
+        customer_count=("lifetime_value", "size"),
+        avg_ltv=("lifetime_value", "mean"),
+        avg_engagement_score=("engagement_score", "mean"),
+        total_revenue=("total_revenue", "sum"),
+    )
 
+    segment_analyses = []
+    for segment in SegmentTier:
+        if segment.value not in by_segment.index:
+            continue
+        row = by_segment.loc[segment.value]
         segment_analysis = SegmentAnalysis(
             segment=segment,
-            customer_count=len(segment_customers),
-            avg_ltv=avg_ltv,
-            avg_engagement_score=avg_engagement,
-            total_revenue=total_revenue,
+            customer_count=int(row["customer_count"]),
+            avg_ltv=float(row["avg_ltv"]),
+            avg_engagement_score=float(row["avg_engagement_score"]),
+            total_revenue=float(row["total_revenue"]),
             recommendations=[],
         )
-
         segment_analysis.recommendations = generate_segment_strategies(
             segment, segment_analysis
         )
-
         segment_analyses.append(segment_analysis)
 
     overall_metrics = {
-        "total_customers": len(customer_metrics_list),
-        "avg_ltv": (
-            sum(m.lifetime_value for m in customer_metrics_list)
-            / len(customer_metrics_list)
-            if customer_metrics_list
-            else 0.0
-        ),
+        "total_customers": len(metrics),
+        "avg_ltv": float(metrics["lifetime_value"].mean()) if len(metrics) else 0.0,
         "avg_engagement_score": (
-            sum(m.engagement_score for m in customer_metrics_list)
-            / len(customer_metrics_list)
-            if customer_metrics_list
-            else 0.0
+            float(metrics["engagement_score"].mean()) if len(metrics) else 0.0
         ),
-        "total_revenue": sum(m.total_revenue for m in customer_metrics_list),
+        "total_revenue": float(metrics["total_revenue"].sum()),
     }
 
+    return segment_analyses, overall_metrics
+
+
+class CustomerMetricStore:
+    """Persisted per-customer aggregates, updated from new data files only.
+
+    Engagement aggregates (score sum and count, touchpoint counts, last
+    engagement) are all-time totals, so new rows are simply added in.
+    Purchases are kept as revenue and order count per (customer, day)
+    bucket, stored as sorted packed int64 keys, so the lookback window can
+    be applied again on every run; buckets older than the window are
+    pruned. The window is applied in whole days. Customers are mapped to
+    integer codes in order of first appearance.
+
+    The store also records each ingested data file with its size and
+    modification time. Data files are treated as immutable once ingested.
+    """
+
+    _KEY_SHIFT = 32
+    _DAY_MASK = (1 << 32) - 1
+    _DAY_OFFSET = 1 << 31
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self.customer_ids: List[str] = []
+        self.score_sum = np.zeros(0)
+        self.score_count = np.zeros(0, dtype=np.int64)
+        self.last_engagement = np.zeros(0, dtype="datetime64[ns]")
+        self.touchpoint_counts = np.zeros((0, len(TouchpointType)), dtype=np.int64)
+        self.revenue_keys = np.zeros(0, dtype=np.int64)
+        self.revenue_amounts = np.zeros(0)
+        self.revenue_counts = np.zeros(0, dtype=np.int64)
+        self.ingested_files: Dict[str, Tuple[int, int]] = {}
+        self.lookback_days: Optional[int] = None
+        self._customer_index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Return the number of customers in the store."""
+        return len(self.customer_ids)
+
+    def _customer_codes(self, customer_id: pd.Series) -> np.ndarray:
+        """Return each row's customer code, adding unseen customers.
+
+        Missing customer IDs map to -1.
+        """
+        series = customer_id.astype("category")
+        categories = series.cat.categories.astype(str)
+        category_codes = np.empty(len(categories) + 1, dtype=np.int64)
+        category_codes[-1] = -1
+        for position, value in enumerate(categories):
+            code = self._customer_index.get(value)
+            if code is None:
+                code = len(self.customer_ids)
+                self._customer_index[value] = code
+                self.customer_ids.append(value)
+            category_codes[position] = code
+
+        added = len(self.customer_ids) - len(self.score_sum)
+        if added:
+            self.score_sum = np.concatenate([self.score_sum, np.zeros(added)])
+            self.score_count = np.concatenate(
+                [self.score_count, np.zeros(added, dtype=np.int64)]
+            )
+            self.last_engagement = np.concatenate(
+                [
+                    self.last_engagement,
+                    np.full(added, np.datetime64("NaT"), dtype="datetime64[ns]"),
+                ]
+            )
+            self.touchpoint_counts = np.concatenate(
+                [
+                    self.touchpoint_counts,
+                    np.zeros((added, len(TouchpointType)), dtype=np.int64),
+                ]
+            )
+
+        return category_codes[series.cat.codes.to_numpy()]
+
+    def _day_numbers(self, keys: np.ndarray) -> np.ndarray:
+        """Unpack days since the epoch from revenue bucket keys."""
+        return (keys & self._DAY_MASK) - self._DAY_OFFSET
+
+    def add_engagements(self, engagements: pd.DataFrame) -> None:
+        """Fold engagement rows into the per-customer aggregates.
+
+        Args:
+            engagements: Engagement DataFrame from load_engagement_frame
+        """
+        positions = self._customer_codes(engagements["customer_id"])
+        score_sum, score_count, last_engagement, touchpoint_counts = (
+            _aggregate_engagements(engagements, positions, len(self.customer_ids))
+        )
+        self.score_sum += score_sum
+        self.score_count += score_count
+        self.last_engagement = np.maximum(
+            self.last_engagement.view(np.int64), last_engagement.view(np.int64)
+        ).view("datetime64[ns]")
+        self.touchpoint_counts += touchpoint_counts
+
+    def add_purchases(self, purchases: pd.DataFrame) -> None:
+        """Fold purchase rows into the daily revenue buckets.
+
+        Args:
+            purchases: Purchase DataFrame from load_purchase_frame
+        """
+        codes = self._customer_codes(purchases["customer_id"])
+        purchase_dates = purchases["purchase_date"].to_numpy(dtype="datetime64[D]")
+        known = (codes >= 0) & ~np.isnat(purchase_dates)
+        days = purchase_dates[known].astype(np.int64)
+        keys = (codes[known] << self._KEY_SHIFT) | (days + self._DAY_OFFSET)
+
+        all_keys, inverse = np.unique(
+            np.concatenate([self.revenue_keys, keys]), return_inverse=True
+        )
+        self.revenue_amounts = np.bincount(
+            inverse,
+            weights=np.concatenate(
+                [
+                    self.revenue_amounts,
+                    purchases["amount"].to_numpy(dtype=np.float64)[known],
+                ]
+            ),
+            minlength=len(all_keys),
+        )
+        self.revenue_counts = np.bincount(
+            inverse,
+            weights=np.concatenate(
+                [self.revenue_counts, np.ones(len(keys), dtype=np.int64)]
+            ),
+            minlength=len(all_keys),
+        ).astype(np.int64)
+        self.revenue_keys = all_keys
+
+    def prune(self, cutoff_date: datetime) -> None:
+        """Drop revenue buckets for days before cutoff_date.
+
+        Args:
+            cutoff_date: Start of the oldest day to keep
+        """
+        cutoff_day = np.datetime64(cutoff_date, "D").astype(np.int64)
+        keep = self._day_numbers(self.revenue_keys) >= cutoff_day
+        self.revenue_keys = self.revenue_keys[keep]
+        self.revenue_amounts = self.revenue_amounts[keep]
+        self.revenue_counts = self.revenue_counts[keep]
+
+    def _file_key(self, data_path: Path, project_root: Path) -> str:
+        """Return the key a data file is recorded under."""
+        try:
+            return data_path.relative_to(project_root).as_posix()
+        except ValueError:
+            return str(data_path)
+
+    def new_files(self, data_paths: List[Path], project_root: Path) -> List[Path]:
+        """Return the data files that have not been ingested yet.
+
+        Previously ingested files that have changed since are not re-read;
+        a warning is logged instead.
+
+        Args:
+            data_paths: Candidate data files
+            project_root: Project root directory
+
+        Returns:
+            Data files to ingest
+        """
+        new_paths = []
+        for data_path in data_paths:
+            recorded = self.ingested_files.get(self._file_key(data_path, project_root))
+            if recorded is None:
+                new_paths.append(data_path)
+                continue
+            stat = data_path.stat() if data_path.exists() else None
+            if stat is None or recorded != (stat.st_size, stat.st_mtime_ns):
+                logger.warning(
+                    f"Data file changed since it was ingested and is not re-read: "
+                    f"{data_path} (rebuild the metric store to include changes)"
+                )
+        return new_paths
+
+    def mark_ingested(self, data_paths: List[Path], project_root: Path) -> None:
+        """Record data files as ingested.
+
+        Args:
+            data_paths: Ingested data files
+            project_root: Project root directory
+        """
+        for data_path in data_paths:
+            stat = data_path.stat()
+            self.ingested_files[self._file_key(data_path, project_root)] = (
+                stat.st_size,
+                stat.st_mtime_ns,
+            )
+
+    def metrics(
+        self,
+        ltv_config: LTVConfig,
+        segmentation_config: SegmentationConfig,
+        now: Optional[datetime] = None,
+    ) -> pd.DataFrame:
+        """Calculate metrics and segments for every customer from aggregates.
+
+        Args:
+            ltv_config: LTV configuration
+            segmentation_config: Segmentation configuration
+            now: Reference time for lookback and recency (defaults to now)
+
+        Returns:
+            Customer metrics DataFrame as returned by
+            calculate_customer_metrics_frame
+        """
+        now = now or datetime.now()
+        cutoff_day = np.datetime64(
+            now - timedelta(days=ltv_config.lookback_months * 30), "D"
+        ).astype(np.int64)
+        in_window = self._day_numbers(self.revenue_keys) >= cutoff_day
+        customers = self.revenue_keys[in_window] >> self._KEY_SHIFT
+
+        total_revenue = np.bincount(
+            customers,
+            weights=self.revenue_amounts[in_window],
+            minlength=len(self.customer_ids),
+        )
+        purchase_count = np.bincount(
+            customers,
+            weights=self.revenue_counts[in_window],
+            minlength=len(self.customer_ids),
+        ).astype(np.int64)
+
+        return _customer_metrics_from_aggregates(
+            pd.Index(self.customer_ids, dtype=object, name="customer_id"),
+            total_revenue,
+            purchase_count,
+            self.score_sum,
+            self.score_count,
+            self.last_engagement,
+            self.touchpoint_counts,
+            ltv_config,
+            segmentation_config,
+            now,
+        )
+
+    def save(self, path: Path) -> None:
+        """Persist the store to a NumPy archive.
+
+        Args:
+            path: Output file path
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(path.name + ".tmp")
+        file_stats = np.array(list(self.ingested_files.values()), dtype=np.int64)
+        with open(temp_path, "wb") as f:
+            np.savez(
+                f,
+                customer_ids=np.array(self.customer_ids, dtype=str),
+                score_sum=self.score_sum,
+                score_count=self.score_count,
+                last_engagement=self.last_engagement.view(np.int64),
+                touchpoint_counts=self.touchpoint_counts,
+                revenue_keys=self.revenue_keys,
+                revenue_amounts=self.revenue_amounts,
+                revenue_counts=self.revenue_counts,
+                ingested_files=np.array(list(self.ingested_files), dtype=str),
+                file_stats=file_stats.reshape(-1, 2),
+                lookback_days=np.array(
+                    -1 if self.lookback_days is None else self.lookback_days
+                ),
+            )
+        os.replace(temp_path, path)
+        logger.info(
+            f"Metric store saved to {path} ({len(self.customer_ids)} customers, "
+            f"{len(self.revenue_keys)} revenue buckets)"
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "CustomerMetricStore":
+        """Load a persisted store.
+
+        Args:
+            path: Store file path
+
+        Returns:
+            Loaded metric store
+
+        Raises:
+            FileNotFoundError: If the store file does not exist
+        """
+        if not path.exists():
+            raise FileNotFoundError(f"Metric store not found: {path}")
+
+        store = cls()
+        with np.load(path, allow_pickle=False) as data:
+            store.customer_ids = data["customer_ids"].tolist()
+            store.score_sum = data["score_sum"]
+            store.score_count = data["score_count"]
+            store.last_engagement = data["last_engagement"].view("datetime64[ns]")
+            store.touchpoint_counts = data["touchpoint_counts"]
+            store.revenue_keys = data["revenue_keys"]
+            store.revenue_amounts = data["revenue_amounts"]
+            store.revenue_counts = data["revenue_counts"]
+            store.ingested_files = {
+                name: (int(size), int(mtime))
+                for name, (size, mtime) in zip(
+                    data["ingested_files"].tolist(), data["file_stats"].tolist()
+                )
+            }
+            lookback_days = int(data["lookback_days"])
+            store.lookback_days = None if lookback_days < 0 else lookback_days
+
+        store._customer_index = {
+            customer_id: code for code, customer_id in enumerate(store.customer_ids)
+        }
+        logger.info(f"Loaded metric store with {len(store.customer_ids)} customers")
+        return store
+
+
+def update_customer_metric_store(
+    config: Config,
+    project_root: Path,
+    now: Optional[datetime] = None,
+    rebuild: bool = False,
+) -> CustomerMetricStore:
+    """Fold data files not yet ingested into the persisted metric store.
+
+    Args:
+        config: Application configuration
+        project_root: Project root directory
+        now: Reference time for pruning old revenue buckets (defaults to now)
+        rebuild: Discard the persisted store and ingest every data file
+
+    Returns:
+        Updated metric store
+
+    Raises:
+        FileNotFoundError: If a data file does not exist
+        ValueError: If data format is invalid
+    """
+    now = now or datetime.now()
+    store_path = _resolve_data_path(config.metric_store.store_file, project_root)
+    lookback_days = config.ltv.lookback_months * 30
+
+    if store_path.exists() and not rebuild:
+        store = CustomerMetricStore.load(store_path)
+        if store.lookback_days is not None and store.lookback_days < lookback_days:
+            logger.warning(
+                f"Metric store only keeps {store.lookback_days} days of purchases; "
+                f"rebuild it to apply a {lookback_days}-day lookback"
+            )
+            lookback_days = store.lookback_days
+    else:
+        store = CustomerMetricStore()
+
+    engagement_files = store.new_files(
+        _data_paths(config.engagement_data.file_path, project_root), project_root
+    )
+    if engagement_files:
+        store.add_engagements(
+            load_engagement_frame(config.engagement_data, project_root, engagement_files)
+        )
+        store.mark_ingested(engagement_files, project_root)
+
+    purchase_files = store.new_files(
+        _data_paths(config.purchase_data.file_path, project_root), project_root
+    )
+    if purchase_files:
+        store.add_purchases(
+            load_purchase_frame(config.purchase_data, project_root, purchase_files)
+        )
+        store.mark_ingested(purchase_files, project_root)
+
+    store.prune(now - timedelta(days=lookback_days))
+    store.lookback_days = lookback_days
+    store.save(store_path)
+
+    logger.info(
+        f"Ingested {len(engagement_files)} engagement and {len(purchase_files)} "
+        f"purchase files into the metric store"
+    )
+    return store
+
+
+def process_engagement_analysis(
+    config_path: Path, rebuild_store: bool = False
+) -> EngagementAnalysis:
+    """Process engagement data and generate analysis.
+
+    With the metric store enabled, only data files not yet ingested are
+    read, and metrics are computed from the stored aggregates.
+
+    Args:
+        config_path: Path to configuration file
+        rebuild_store: Rebuild the metric store from every data file
+
+    Returns:
+        Complete engagement analysis
+
+    Raises:
+        FileNotFoundError: If config or data files are missing
+        ValueError: If configuration is invalid
+    """
+    config = load_config(config_path)
+    project_root = config_path.parent
+
+    if config.metric_store.enabled:
+        now = datetime.now()
+        store = update_customer_metric_store(
+            config, project_root, now, rebuild=rebuild_store
+        )
+        has_data = len(store) > 0
+    else:
+        engagements = load_engagement_frame(config.engagement_data, project_root)
+        purchases = load_purchase_frame(config.purchase_data, project_root)
+        has_data = not (engagements.empty and purchases.empty)
+
+    if not has_data:
+        logger.warning("No engagement or purchase data available")
+        return EngagementAnalysis(
+            total_customers=0,
+            customer_metrics=[],
+            segment_analyses=[],
+            overall_metrics={},
+            generated_at=datetime.now(),
+        )
+
+    if config.metric_store.enabled:
+        metrics_frame = store.metrics(config.ltv, config.segmentation, now)
+    else:
+        metrics_frame = calculate_customer_metrics_frame(
+            engagements, purchases, config.ltv, config.segmentation
+        )
+    customer_metrics_list = customer_metrics_from_frame(metrics_frame)
+    segment_analyses, overall_metrics = summarize_segments_frame(metrics_frame)
+
     analysis = EngagementAnalysis(
         total_customers=len(customer_metrics_list),
         customer_metrics=customer_metrics_list,
@@ -811,6 +1700,14 @@ def write_markdown_report(
 
 def main() -> None:
     """Main entry point for the customer engagement monitor."""
+    parser = argparse.ArgumentParser(description="Customer engagement monitor")
+    parser.add_argument(
+        "--rebuild-store",
+        action="store_true",
+        help="Rebuild the metric store from every data file",
+    )
+    args = parser.parse_args()
+
     settings = AppSettings()
     config_path = Path(settings.config_path)
 
@@ -820,7 +1717,9 @@ def main() -> None:
 
     try:
         logger.info("Starting customer engagement analysis")
-        analysis = process_engagement_analysis(config_path)
+        analysis = process_engagement_analysis(
+            config_path, rebuild_store=args.rebuild_store
+        )
         logger.info(
             f"Analysis complete. Analyzed {analysis.total_customers} customers "
             f"across {len(analysis.segment_analyses)} segments."
@@ -2,19 +2,31 @@
 
 from datetime import datetime, timedelta
 
+import pandas as pd
 import pytest
 
 from customer_engagement_monitor.src.main import (
+    Config,
+    CustomerMetricStore,
+    EngagementDataConfig,
     EngagementRecord,
     LTVConfig,
+    PurchaseDataConfig,
     PurchaseRecord,
     SegmentationConfig,
     SegmentTier,
     TouchpointType,
+    calculate_customer_metrics_frame,
     calculate_engagement_score,
     calculate_ltv,
     assign_segment,
+    customer_metrics_from_frame,
     generate_segment_strategies,
+    load_engagement_data,
+    load_engagement_frame,
+    load_purchase_data,
+    load_purchase_frame,
+    update_customer_metric_store,
 )
 
 
@@ -228,3 +240,130 @@ def test_engagement_score_normalization():
 
     assert score <= 1.0
     assert score > 0
+
+
+def test_customer_metrics_frame_matches_records(tmp_path):
+    """Test columnar customer metrics match the per-customer functions."""
+    now = datetime.now()
+    pd.DataFrame(
+        {
+            "customer_id": ["cust_001", "cust_001", "cust_002", "cust_003"],
+            "touchpoint": ["PURCHASE", "email", "web", "carrier_pigeon"],
+            "timestamp": [
+                (now - timedelta(days=days)).isoformat() for days in (2, 10, 120, 1)
+            ],
+            "score": [None, 2.5, None, None],
+        }
+    ).to_csv(tmp_path / "engagements.csv", index=False)
+    pd.DataFrame(
+        {
+            "customer_id": ["cust_001", "cust_001", "cust_004"],
+            "purchase_date": [
+                (now - timedelta(days=days)).isoformat() for days in (5, 40, 3)
+            ],
+            "amount": [150.0, 80.0, 20.0],
+        }
+    ).to_csv(tmp_path / "purchases.csv", index=False)
+    engagement_config = EngagementDataConfig(
+        file_path="engagements.csv", engagement_score_column="score"
+    )
+    purchase_config = PurchaseDataConfig(file_path="purchases.csv")
+    ltv_config = LTVConfig()
+    segmentation_config = SegmentationConfig()
+
+    engagement_frame = load_engagement_frame(engagement_config, tmp_path)
+    purchase_frame = load_purchase_frame(purchase_config, tmp_path)
+    assert isinstance(engagement_frame["customer_id"].dtype, pd.CategoricalDtype)
+    assert len(engagement_frame) == 3
+
+    metrics = customer_metrics_from_frame(
+        calculate_customer_metrics_frame(
+            engagement_frame, purchase_frame, ltv_config, segmentation_config, now
+        )
+    )
+
+    engagements = load_engagement_data(engagement_config, tmp_path)
+    purchases = load_purchase_data(purchase_config, tmp_path)
+    assert {m.customer_id for m in metrics} == {
+        "cust_001",
+        "cust_002",
+        "cust_004",
+    }
+    for customer in metrics:
+        ltv, total_revenue, purchase_count = calculate_ltv(
+            purchases, customer.customer_id, ltv_config
+        )
+        score, touchpoint_counts, last_engagement = calculate_engagement_score(
+            engagements, customer.customer_id
+        )
+        assert customer.lifetime_value == pytest.approx(ltv)
+        assert customer.total_revenue == pytest.approx(total_revenue)
+        assert customer.purchase_count == purchase_count
+        assert customer.engagement_score == pytest.approx(score)
+        assert customer.touchpoint_count == touchpoint_counts
+        assert customer.last_engagement_date == last_engagement
+        assert customer.segment == assign_segment(customer, segmentation_config)
+
+
+def test_metric_store_incremental_update_matches_full_recompute(tmp_path):
+    """Test the metric store only reads new files and matches a full run."""
+    now = datetime.now().replace(hour=12, minute=0, second=0, microsecond=0)
+    (tmp_path / "engagement").mkdir()
+    (tmp_path / "purchases").mkdir()
+
+    def write_day(day, engagements, purchases):
+        pd.DataFrame(
+            engagements, columns=["customer_id", "touchpoint", "timestamp", "score"]
+        ).to_csv(tmp_path / "engagement" / f"{day}.csv", index=False)
+        pd.DataFrame(
+            purchases, columns=["customer_id", "purchase_date", "amount"]
+        ).to_csv(tmp_path / "purchases" / f"{day}.csv", index=False)
+
+    write_day(
+        "day1",
+        [
+            ["cust_001", "purchase", (now - timedelta(days=30)).isoformat(), None],
+            ["cust_002", "email", (now - timedelta(days=200)).isoformat(), 3.0],
+        ],
+        [
+            ["cust_001", (now - timedelta(days=30)).isoformat(), 400.0],
+            ["cust_003", (now - timedelta(days=500)).isoformat(), 900.0],
+        ],
+    )
+    config = Config(
+        engagement_data=EngagementDataConfig(
+            file_path="engagement/*.csv", engagement_score_column="score"
+        ),
+        purchase_data=PurchaseDataConfig(file_path="purchases/*.csv"),
+        metric_store={"enabled": True, "store_file": "store/metrics.npz"},
+    )
+
+    update_customer_metric_store(config, tmp_path, now)
+    write_day(
+        "day2",
+        [["cust_001", "review", (now - timedelta(days=1)).isoformat(), None]],
+        [["cust_001", (now - timedelta(days=1)).isoformat(), 700.0]],
+    )
+    store = update_customer_metric_store(config, tmp_path, now)
+
+    assert sorted(store.ingested_files) == [
+        "engagement/day1.csv",
+        "engagement/day2.csv",
+        "purchases/day1.csv",
+        "purchases/day2.csv",
+    ]
+    reloaded = CustomerMetricStore.load(tmp_path / "store" / "metrics.npz")
+    assert reloaded.customer_ids == store.customer_ids
+
+    expected = calculate_customer_metrics_frame(
+        load_engagement_frame(config.engagement_data, tmp_path),
+        load_purchase_frame(config.purchase_data, tmp_path),
+        config.ltv,
+        config.segmentation,
+        now,
+    )
+    actual = reloaded.metrics(config.ltv, config.segmentation, now)
+
+    pd.testing.assert_frame_equal(
+        actual.sort_index(), expected.sort_index(), check_index_type=False
+    )
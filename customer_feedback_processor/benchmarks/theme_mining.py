@@ -0,0 +1,140 @@
+"""Benchmark streamed theme mining against the in-memory keyword map.
+
+Writes a synthetic CSV feedback export, then runs one of:
+
+- previous: load every source into FeedbackItem lists and map each keyword
+  to a copy of every feedback text mentioning it
+- streaming: build_theme_index with the configured worker pool, then fetch
+  the sample texts for significant themes
+
+Each mode reports wall time and peak RSS, so run the modes separately.
+
+Run from the repository root:
+
+    python -m customer_feedback_processor.benchmarks.theme_mining --mode streaming
+"""
+
+import argparse
+import logging
+import resource
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+from customer_feedback_processor.src.main import (
+    Config,
+    ThemeConfig,
+    build_theme_index,
+    extract_keywords,
+    fetch_feedback_texts,
+    load_all_feedback,
+)
+
+PHRASES = np.array(
+    [
+        "battery life is terrible",
+        "the dark mode toggle resets",
+        "sync is slow on large projects",
+        "login screen crashes after update",
+        "export to pdf loses formatting",
+        "search results are not relevant",
+        "notifications arrive late",
+        "pricing page is confusing",
+    ]
+)
+
+
+def write_export(path: Path, rows: int, vocabulary: int) -> None:
+    """Write rows of feedback mixing common phrases with a long-tail vocabulary."""
+    rng = np.random.default_rng(7)
+    words = np.char.add("term", np.arange(vocabulary).astype(str))
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("feedback_text\n")
+        for start in range(0, rows, 10_000):
+            count = min(10_000, rows - start)
+            tails = [" ".join(rng.choice(words, 8)) for _ in range(count)]
+            texts = np.char.add(
+                np.char.add(rng.choice(PHRASES, count), " "), np.array(tails)
+            )
+            f.writelines(f"{text}\n" for text in texts)
+
+
+def previous_themes(config: Config) -> int:
+    """Previous implementation: every keyword keeps copies of its texts."""
+    items = load_all_feedback(config)
+    stop_words = set(word.lower() for word in config.theme.stop_words)
+    keyword_to_feedback: Dict[str, List[str]] = {}
+    for item in items:
+        for keyword in extract_keywords(
+            item.text, stop_words, config.theme.min_keyword_length
+        ):
+            keyword_to_feedback.setdefault(keyword, []).append(item.text)
+    return sum(
+        1
+        for texts in keyword_to_feedback.values()
+        if len(texts) >= config.theme.min_occurrences
+    )
+
+
+def streaming_themes(config: Config) -> int:
+    """Streamed index plus a second pass for sample texts."""
+    index = build_theme_index(config)
+    significant = index.significant_themes(config.theme)
+    texts = fetch_feedback_texts(
+        config, (item_id for _, _, sample_ids in significant for item_id in sample_ids)
+    )
+    return len(index.themes(config.theme, texts))
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--mode", choices=["previous", "streaming"], default="streaming"
+    )
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Feedback rows")
+    parser.add_argument(
+        "--vocabulary", type=int, default=50_000, help="Long-tail vocabulary size"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Tokeniser processes"
+    )
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "feedback.csv"
+        write_export(path, args.rows, args.vocabulary)
+        config = Config(
+            sources=[
+                {
+                    "name": "export",
+                    "path": str(path),
+                    "format": "csv",
+                    "text_column": "feedback_text",
+                }
+            ],
+            theme=ThemeConfig(min_occurrences=50),
+            streaming={"max_workers": args.workers},
+        )
+        baseline_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+        start = time.perf_counter()
+        if args.mode == "previous":
+            themes = previous_themes(config)
+        else:
+            themes = streaming_themes(config)
+        elapsed = time.perf_counter() - start
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(
+        f"{args.mode}: {args.rows} rows, {themes} themes in {elapsed:.2f}s, "
+        f"peak RSS {peak_rss:.0f} MB (before mining {baseline_rss:.0f} MB)"
+    )
+
+
+if __name__ == "__main__":
+    main()
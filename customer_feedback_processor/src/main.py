@@ -4,14 +4,30 @@ Automatically processes customer feedback from multiple channels, aggregates
 insights, identifies common themes, and generates product roadmap recommendations.
 """
 
+import heapq
 import json
 import logging
+import os
 import re
-from collections import Counter
+from array import array
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
+import numpy as np
 import pandas as pd
 import yaml
 from pydantic import BaseModel, Field, field_validator
@@ -105,6 +121,20 @@ class ThemeConfig(BaseModel):
         ],
         description="Stop words to exclude from theme analysis",
     )
+    include_phrases: bool = Field(
+        default=True, description="Also report adjacent keyword pairs as themes"
+    )
+    sample_size: int = Field(
+        default=5, description="Sample feedback items kept per theme"
+    )
+
+    @field_validator("sample_size")
+    @classmethod
+    def validate_sample_size(cls, v: int) -> int:
+        """Validate sample size is positive."""
+        if v < 1:
+            raise ValueError("sample_size must be at least 1")
+        return v
 
 
 class RoadmapConfig(BaseModel):
@@ -123,6 +153,34 @@ class RoadmapConfig(BaseModel):
     )
 
 
+class StreamingConfig(BaseModel):
+    """Configuration for streamed, parallel theme mining."""
+
+    chunk_size: int = Field(
+        default=20_000, description="Feedback items tokenised per worker task"
+    )
+    max_workers: Optional[int] = Field(
+        default=None,
+        description="Tokeniser processes (None uses every core, 1 runs in-process)",
+    )
+
+    @field_validator("chunk_size")
+    @classmethod
+    def validate_chunk_size(cls, v: int) -> int:
+        """Validate chunk size is positive."""
+        if v < 1:
+            raise ValueError("chunk_size must be at least 1")
+        return v
+
+    @field_validator("max_workers")
+    @classmethod
+    def validate_max_workers(cls, v: Optional[int]) -> Optional[int]:
+        """Validate worker count."""
+        if v is not None and v < 1:
+            raise ValueError("max_workers must be at least 1")
+        return v
+
+
 class Config(BaseModel):
     """Main configuration model."""
 
@@ -135,6 +193,9 @@ class Config(BaseModel):
     roadmap: RoadmapConfig = Field(
         default_factory=RoadmapConfig, description="Roadmap generation settings"
     )
+    streaming: StreamingConfig = Field(
+        default_factory=StreamingConfig, description="Streaming and parallelism"
+    )
     output_path: str = Field(
         default="logs/feedback_analysis.md",
         description="Path for output report",
@@ -440,6 +501,414 @@ def extract_keywords(text: str, stop_words: Set[str], min_length: int) -> List[s
     return keywords
 
 
+_WORD_PATTERN = re.compile(r"\b[a-z]+\b")
+_SAMPLE_MULTIPLIER = 2654435761
+
+
+def _sample_priority(item_id: int) -> int:
+    """Pseudo-random but deterministic priority used for bottom-k sampling."""
+    return (item_id * _SAMPLE_MULTIPLIER) & 0xFFFFFFFF
+
+
+def _source_path(source_config: FeedbackSourceConfig) -> Path:
+    """Return the source file path, raising if it does not exist."""
+    source_path = Path(source_config.path)
+    if not source_path.exists():
+        raise FileNotFoundError(
+            f"{source_config.format.upper()} file not found: {source_path}"
+        )
+    return source_path
+
+
+def _clean_texts(values: pd.Series, null_token: str) -> List[str]:
+    """Strip feedback texts and drop empty or null entries."""
+    texts = values.dropna().astype(str).str.strip()
+    keep = (texts != "") & (texts.str.lower() != null_token)
+    return texts[keep].tolist()
+
+
+def iter_feedback_texts(
+    source_config: FeedbackSourceConfig, chunk_size: int
+) -> Iterator[List[str]]:
+    """Stream feedback texts from one source in chunks.
+
+    CSV and text sources are read incrementally. JSON sources must be a
+    single array, so they are parsed whole and then chunked.
+
+    Args:
+        source_config: Source definition
+        chunk_size: Maximum texts per yielded chunk
+
+    Yields:
+        Lists of cleaned feedback texts
+
+    Raises:
+        FileNotFoundError: If the source file does not exist
+        ValueError: If the source is misconfigured or malformed
+    """
+    source_path = _source_path(source_config)
+
+    if source_config.format in ("csv", "json") and not source_config.text_column:
+        raise ValueError(
+            f"text_column required for {source_config.format.upper()} source: "
+            f"{source_config.name}"
+        )
+
+    if source_config.format == "csv":
+        try:
+            header = pd.read_csv(source_path, nrows=0)
+        except pd.errors.EmptyDataError:
+            logger.warning(f"CSV file is empty: {source_path}")
+            return
+        if source_config.text_column not in header.columns:
+            raise ValueError(
+                f"Required column '{source_config.text_column}' not found in CSV file"
+            )
+        for frame in pd.read_csv(
+            source_path,
+            usecols=[source_config.text_column],
+            dtype=str,
+            chunksize=chunk_size,
+        ):
+            texts = _clean_texts(frame[source_config.text_column], "nan")
+            if texts:
+                yield texts
+    elif source_config.format == "json":
+        items = load_json_feedback(source_path, source_config.text_column, [], "")
+        for start in range(0, len(items), chunk_size):
+            yield [item.text for item in items[start : start + chunk_size]]
+    else:
+        texts = []
+        with open(source_path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    texts.append(line)
+                    if len(texts) >= chunk_size:
+                        yield texts
+                        texts = []
+        if texts:
+            yield texts
+
+
+_ThemeTask = Tuple[int, List[str], FrozenSet[str], int, bool, int]
+_ChunkIndex = Tuple[
+    Dict[str, List[int]],
+    Dict[Tuple[str, str], int],
+    Dict[Tuple[str, str], List[int]],
+]
+
+
+def _index_chunk(task: _ThemeTask) -> _ChunkIndex:
+    """Tokenise one chunk of feedback into keyword postings and phrase counts.
+
+    Runs in a worker process, so it only takes and returns plain data.
+
+    Args:
+        task: First item id, texts, stop words, minimum keyword length,
+            whether to count phrases, and phrase sample size
+
+    Returns:
+        Keyword postings, phrase document counts and phrase sample ids
+    """
+    first_id, texts, stop_words, min_length, include_phrases, sample_size = task
+    postings: Dict[str, List[int]] = {}
+    pair_counts: Dict[Tuple[str, str], int] = {}
+    pair_samples: Dict[Tuple[str, str], List[int]] = {}
+
+    for item_id, text in enumerate(texts, first_id):
+        words = _WORD_PATTERN.findall(text.lower())
+        is_keyword = [len(w) >= min_length and w not in stop_words for w in words]
+
+        seen: Set[str] = set()
+        for word, keep in zip(words, is_keyword):
+            if keep and word not in seen:
+                seen.add(word)
+                postings.setdefault(word, []).append(item_id)
+
+        if not include_phrases:
+            continue
+        seen_pairs: Set[Tuple[str, str]] = set()
+        for i in range(len(words) - 1):
+            if not (is_keyword[i] and is_keyword[i + 1]):
+                continue
+            pair = (words[i], words[i + 1])
+            if pair in seen_pairs:
+                continue
+            seen_pairs.add(pair)
+            pair_counts[pair] = pair_counts.get(pair, 0) + 1
+            samples = pair_samples.setdefault(pair, [])
+            if len(samples) < sample_size:
+                samples.append(item_id)
+            else:
+                worst = max(samples, key=_sample_priority)
+                if _sample_priority(item_id) < _sample_priority(worst):
+                    samples[samples.index(worst)] = item_id
+
+    return postings, pair_counts, pair_samples
+
+
+def _map_bounded(
+    function: Callable, tasks: Iterable, max_workers: Optional[int]
+) -> Iterator:
+    """Map tasks over a process pool, keeping only a few chunks in flight.
+
+    Results are yielded in task order. With one worker the tasks run in the
+    calling process.
+    """
+    workers = max_workers or os.cpu_count() or 1
+    if workers == 1:
+        yield from map(function, tasks)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: Deque = deque()
+        for task in tasks:
+            pending.append(executor.submit(function, task))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+class ThemeIndex:
+    """Keyword posting lists and phrase co-occurrence counts for feedback.
+
+    Feedback items are identified by consecutive integer ids in load order.
+    The index keeps one array of item ids per keyword and a sparse count of
+    adjacent keyword pairs, never the feedback texts themselves, so memory
+    grows with the vocabulary rather than with the text volume.
+    """
+
+    def __init__(self, sample_size: int = 5) -> None:
+        """Create an empty index.
+
+        Args:
+            sample_size: Sample feedback ids kept per theme
+        """
+        self.sample_size = sample_size
+        self.item_count = 0
+        self.source_counts: Dict[str, int] = {}
+        self.vocabulary: Dict[str, int] = {}
+        self.terms: List[str] = []
+        self.postings: List[array] = []
+        self.pair_counts: Counter = Counter()
+        self.pair_samples: Dict[Tuple[int, int], List[int]] = {}
+
+    def _term_id(self, word: str) -> int:
+        """Return the id of a keyword, adding it to the vocabulary if new."""
+        term_id = self.vocabulary.get(word)
+        if term_id is None:
+            term_id = len(self.terms)
+            self.vocabulary[word] = term_id
+            self.terms.append(word)
+            self.postings.append(array("I"))
+        return term_id
+
+    def add_chunk(
+        self,
+        source: str,
+        item_count: int,
+        chunk: _ChunkIndex,
+    ) -> None:
+        """Merge the output of _index_chunk for the next item_count items.
+
+        Args:
+            source: Source name the items came from
+            item_count: Number of feedback items in the chunk
+            chunk: Postings, phrase counts and phrase samples
+        """
+        postings, pair_counts, pair_samples = chunk
+        for word, item_ids in postings.items():
+            self.postings[self._term_id(word)].extend(item_ids)
+
+        for (first, second), count in pair_counts.items():
+            pair = (self._term_id(first), self._term_id(second))
+            self.pair_counts[pair] += count
+            samples = self.pair_samples.get(pair, []) + pair_samples[(first, second)]
+            self.pair_samples[pair] = heapq.nsmallest(
+                self.sample_size, samples, key=_sample_priority
+            )
+
+        self.item_count += item_count
+        self.source_counts[source] = self.source_counts.get(source, 0) + item_count
+
+    def keyword_frequency(self, keyword: str) -> int:
+        """Number of feedback items mentioning a keyword."""
+        term_id = self.vocabulary.get(keyword)
+        return len(self.postings[term_id]) if term_id is not None else 0
+
+    def items(self, keyword: str) -> np.ndarray:
+        """Ids of the feedback items mentioning a keyword."""
+        term_id = self.vocabulary.get(keyword)
+        if term_id is None:
+            return np.empty(0, dtype=np.uint32)
+        return np.frombuffer(self.postings[term_id], dtype=np.uint32)
+
+    def _keyword_samples(self, term_id: int) -> List[int]:
+        """Bottom-k sample of a keyword's posting list."""
+        item_ids = np.frombuffer(self.postings[term_id], dtype=np.uint32)
+        if len(item_ids) <= self.sample_size:
+            return item_ids.tolist()
+        priorities = (item_ids.astype(np.uint64) * _SAMPLE_MULTIPLIER) & 0xFFFFFFFF
+        keep = np.argpartition(priorities, self.sample_size)[: self.sample_size]
+        return item_ids[keep].tolist()
+
+    def significant_themes(
+        self, config: ThemeConfig
+    ) -> List[Tuple[List[str], int, List[int]]]:
+        """Keyword and phrase themes meeting min_occurrences.
+
+        Args:
+            config: Theme identification configuration
+
+        Returns:
+            (keywords, frequency, sample item ids) tuples, most frequent first
+        """
+        candidates = [
+            ([self.terms[term_id]], len(item_ids), term_id)
+            for term_id, item_ids in enumerate(self.postings)
+            if len(item_ids) >= config.min_occurrences
+        ]
+        themes = [
+            (keywords, frequency, sorted(self._keyword_samples(term_id)))
+            for keywords, frequency, term_id in candidates
+        ]
+        if config.include_phrases:
+            themes.extend(
+                (
+                    [self.terms[first], self.terms[second]],
+                    count,
+                    sorted(self.pair_samples[(first, second)]),
+                )
+                for (first, second), count in self.pair_counts.items()
+                if count >= config.min_occurrences
+            )
+        themes.sort(key=lambda x: x[1], reverse=True)
+        return themes
+
+    def themes(
+        self,
+        config: ThemeConfig,
+        texts: Dict[int, str],
+        significant: Optional[List[Tuple[List[str], int, List[int]]]] = None,
+    ) -> List[Theme]:
+        """Build Theme objects, filling samples from fetched texts.
+
+        Args:
+            config: Theme identification configuration
+            texts: Feedback texts keyed by item id
+            significant: Output of significant_themes, if already computed
+
+        Returns:
+            List of identified themes sorted by frequency
+        """
+        if not self.item_count:
+            return []
+        if significant is None:
+            significant = self.significant_themes(config)
+        return [
+            Theme(
+                keywords=keywords,
+                frequency=frequency,
+                percentage=(frequency / self.item_count) * 100,
+                sample_feedback=[texts[i] for i in sample_ids if i in texts],
+            )
+            for keywords, frequency, sample_ids in significant
+        ]
+
+
+def _theme_tasks(
+    texts_by_chunk: Iterable[Tuple[str, List[str]]],
+    config: ThemeConfig,
+    first_id: int = 0,
+) -> Iterator[_ThemeTask]:
+    """Turn (source, texts) chunks into _index_chunk tasks with item ids."""
+    stop_words = frozenset(word.lower() for word in config.stop_words)
+    for _, texts in texts_by_chunk:
+        yield (
+            first_id,
+            texts,
+            stop_words,
+            config.min_keyword_length,
+            config.include_phrases,
+            config.sample_size,
+        )
+        first_id += len(texts)
+
+
+def _iter_source_chunks(config: Config) -> Iterator[Tuple[str, List[str]]]:
+    """Stream (source name, texts) chunks across all configured sources."""
+    for source_config in config.sources:
+        logger.info(f"Streaming feedback from source: {source_config.name}")
+        for texts in iter_feedback_texts(source_config, config.streaming.chunk_size):
+            yield source_config.name, texts
+
+
+def build_theme_index(config: Config) -> ThemeIndex:
+    """Stream every source through a tokeniser pool into a ThemeIndex.
+
+    Args:
+        config: Configuration object with source definitions
+
+    Returns:
+        Populated theme index
+
+    Raises:
+        FileNotFoundError: If any source file is missing
+        ValueError: If source configuration is invalid
+    """
+    index = ThemeIndex(config.theme.sample_size)
+    chunk_sources: Deque[Tuple[str, int]] = deque()
+
+    def chunks() -> Iterator[Tuple[str, List[str]]]:
+        for source, texts in _iter_source_chunks(config):
+            chunk_sources.append((source, len(texts)))
+            yield source, texts
+
+    for chunk in _map_bounded(
+        _index_chunk,
+        _theme_tasks(chunks(), config.theme),
+        config.streaming.max_workers,
+    ):
+        source, item_count = chunk_sources.popleft()
+        index.add_chunk(source, item_count, chunk)
+
+    logger.info(
+        f"Indexed {index.item_count} feedback items: {len(index.terms)} keywords, "
+        f"{len(index.pair_counts)} phrases"
+    )
+    return index
+
+
+def fetch_feedback_texts(config: Config, item_ids: Iterable[int]) -> Dict[int, str]:
+    """Re-stream the sources and return the texts for the given item ids.
+
+    Args:
+        config: Configuration object with source definitions
+        item_ids: Feedback item ids as assigned by build_theme_index
+
+    Returns:
+        Texts keyed by item id
+    """
+    wanted = sorted(set(item_ids))
+    texts: Dict[int, str] = {}
+    if not wanted:
+        return texts
+
+    first_id = 0
+    position = 0
+    for _, chunk in _iter_source_chunks(config):
+        last_id = first_id + len(chunk)
+        while position < len(wanted) and wanted[position] < last_id:
+            texts[wanted[position]] = chunk[wanted[position] - first_id]
+            position += 1
+        if position == len(wanted):
+            break
+        first_id = last_id
+    return texts
+
+
 def identify_themes(
     feedback_items: List[FeedbackItem], config: ThemeConfig
 ) -> List[Theme]:
@@ -455,36 +924,12 @@ def identify_themes(
     if not feedback_items:
         return []
 
-    stop_words_set = set(word.lower() for word in config.stop_words)
-    keyword_to_feedback: Dict[str, List[str]] = {}
-
-    for item in feedback_items:
-        keywords = extract_keywords(
-            item.text, stop_words_set, config.min_keyword_length
-        )
-        for keyword in keywords:
-            if keyword not in keyword_to_feedback:
-                keyword_to_feedback[keyword] = []
-            keyword_to_feedback[keyword].append(item.text)
-
-    total_count = len(feedback_items)
-    themes = []
-
-    for keyword, feedback_samples in keyword_to_feedback.items():
-        frequency = len(feedback_samples)
-        if frequency >= config.min_occurrences:
-            percentage = (frequency / total_count) * 100
-            sample_feedback = feedback_samples[:5]
-            themes.append(
-                Theme(
-                    keywords=[keyword],
-                    frequency=frequency,
-                    percentage=percentage,
-                    sample_feedback=sample_feedback,
-                )
-            )
+    texts = [item.text for item in feedback_items]
+    index = ThemeIndex(config.sample_size)
+    for task in _theme_tasks([("", texts)], config):
+        index.add_chunk("", len(texts), _index_chunk(task))
 
-    themes.sort(key=lambda x: x.frequency, reverse=True)
+    themes = index.themes(config, dict(enumerate(texts)))
     logger.info(f"Identified {len(themes)} themes from feedback")
     return themes
 
@@ -615,9 +1060,9 @@ def process_feedback(config_path: Path) -> FeedbackAnalysis:
         ValueError: If configuration or data is invalid
     """
     config = load_config(config_path)
-    feedback_items = load_all_feedback(config)
+    index = build_theme_index(config)
 
-    if not feedback_items:
+    if not index.item_count:
         logger.warning("No feedback items loaded. Check source configurations.")
         return FeedbackAnalysis(
             total_feedback_count=0,
@@ -626,15 +1071,19 @@ def process_feedback(config_path: Path) -> FeedbackAnalysis:
             recommendations=[],
         )
 
-    sources_summary = Counter(item.source for item in feedback_items)
-    themes = identify_themes(feedback_items, config.theme)
+    significant = index.significant_themes(config.theme)
+    texts = fetch_feedback_texts(
+        config, (item_id for _, _, sample_ids in significant for item_id in sample_ids)
+    )
+    themes = index.themes(config.theme, texts, significant)
+    logger.info(f"Identified {len(themes)} themes from feedback")
     recommendations = generate_roadmap_recommendations(
-        themes, config.roadmap, len(feedback_items)
+        themes, config.roadmap, index.item_count
     )
 
     analysis = FeedbackAnalysis(
-        total_feedback_count=len(feedback_items),
-        sources_summary=dict(sources_summary),
+        total_feedback_count=index.item_count,
+        sources_summary=dict(index.source_counts),
         themes=themes,
         recommendations=recommendations,
     )
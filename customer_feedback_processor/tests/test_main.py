@@ -0,0 +1,157 @@
+"""Tests for customer feedback processing."""
+
+import json
+from collections import Counter
+
+import pytest
+
+from customer_feedback_processor.src.main import (
+    Config,
+    FeedbackSourceConfig,
+    StreamingConfig,
+    ThemeConfig,
+    build_theme_index,
+    extract_keywords,
+    fetch_feedback_texts,
+    load_all_feedback,
+)
+
+TOPICS = [
+    "export",
+    "dashboard",
+    "login",
+    "billing",
+    "search",
+    "mobile",
+    "slow",
+    "crash",
+]
+
+
+def make_text(i):
+    """Build a deterministic feedback text with repeated keywords."""
+    first = TOPICS[i % len(TOPICS)]
+    second = TOPICS[(i * 3 + 1) % len(TOPICS)]
+    return f"The {first} page is {second} and {first} {second} again #{i}"
+
+
+@pytest.fixture
+def feedback_sources(tmp_path):
+    """Write csv, txt and json sources with known texts in load order."""
+    texts = [make_text(i) for i in range(90)]
+
+    csv_path = tmp_path / "tickets.csv"
+    csv_lines = ["ticket_id,feedback_text"]
+    csv_lines += [f'{i},"{text}"' for i, text in enumerate(texts[:30])]
+    csv_path.write_text("\n".join(csv_lines) + "\n")
+
+    txt_path = tmp_path / "survey.txt"
+    txt_path.write_text("# survey export\n" + "\n".join(texts[30:60]) + "\n")
+
+    json_path = tmp_path / "reviews.json"
+    json_path.write_text(json.dumps([{"review_text": text} for text in texts[60:]]))
+
+    sources = [
+        FeedbackSourceConfig(
+            name="tickets", path=str(csv_path), format="csv", text_column="feedback_text"
+        ),
+        FeedbackSourceConfig(name="survey", path=str(txt_path), format="txt"),
+        FeedbackSourceConfig(
+            name="reviews", path=str(json_path), format="json", text_column="review_text"
+        ),
+    ]
+    return sources, texts
+
+
+def make_config(sources, chunk_size=7, max_workers=1, sample_size=3):
+    """Build a configuration over the given sources."""
+    return Config(
+        sources=sources,
+        theme=ThemeConfig(min_occurrences=2, sample_size=sample_size),
+        streaming=StreamingConfig(chunk_size=chunk_size, max_workers=max_workers),
+    )
+
+
+def test_keyword_frequencies_match_document_counts(feedback_sources):
+    """Test that keyword frequencies count documents, not occurrences."""
+    sources, _ = feedback_sources
+    config = make_config(sources)
+    index = build_theme_index(config)
+
+    stop_words = {word.lower() for word in config.theme.stop_words}
+    expected = Counter()
+    for item in load_all_feedback(config):
+        expected.update(
+            set(extract_keywords(item.text, stop_words, config.theme.min_keyword_length))
+        )
+
+    assert index.item_count == 90
+    assert index.source_counts == {"tickets": 30, "survey": 30, "reviews": 30}
+    assert {term: index.keyword_frequency(term) for term in index.terms} == dict(expected)
+    assert index.keyword_frequency("missing") == 0
+
+
+def test_phrase_counts_count_adjacent_keyword_pairs(feedback_sources):
+    """Test that phrase counts are per document and skip stop-word gaps."""
+    sources, texts = feedback_sources
+    index = build_theme_index(make_config(sources))
+
+    expected = Counter()
+    for i, _ in enumerate(texts):
+        first = TOPICS[i % len(TOPICS)]
+        second = TOPICS[(i * 3 + 1) % len(TOPICS)]
+        pairs = {(first, "page"), (first, second), (second, "again")}
+        expected.update(pairs)
+
+    counts = {
+        (index.terms[first], index.terms[second]): count
+        for (first, second), count in index.pair_counts.items()
+    }
+    assert counts == dict(expected)
+    assert ("page", "dashboard") not in counts
+
+
+def test_samples_stable_across_worker_counts(feedback_sources):
+    """Test that bottom-k samples do not depend on chunking or workers."""
+    sources, _ = feedback_sources
+    serial = build_theme_index(make_config(sources, chunk_size=90, max_workers=1))
+    parallel = build_theme_index(make_config(sources, chunk_size=4, max_workers=2))
+
+    theme = ThemeConfig(min_occurrences=2, sample_size=3)
+    serial_themes = serial.significant_themes(theme)
+    parallel_themes = parallel.significant_themes(theme)
+
+    assert serial_themes
+    assert sorted(map(repr, serial_themes)) == sorted(map(repr, parallel_themes))
+    assert all(len(samples) <= 3 for _, _, samples in serial_themes)
+
+
+def test_fetch_feedback_texts_maps_ids_across_sources(feedback_sources):
+    """Test that item ids map back to texts across csv, txt and json."""
+    sources, texts = feedback_sources
+    config = make_config(sources)
+
+    wanted = [0, 6, 7, 29, 30, 59, 60, 89, 7]
+    fetched = fetch_feedback_texts(config, wanted)
+
+    assert fetched == {i: texts[i] for i in set(wanted)}
+    assert fetch_feedback_texts(config, []) == {}
+
+
+def test_themes_fill_samples_from_fetched_texts(feedback_sources):
+    """Test that every sample text mentions its theme keywords."""
+    sources, _ = feedback_sources
+    config = make_config(sources)
+    index = build_theme_index(config)
+
+    significant = index.significant_themes(config.theme)
+    texts = fetch_feedback_texts(
+        config, (item_id for _, _, sample_ids in significant for item_id in sample_ids)
+    )
+    themes = index.themes(config.theme, texts, significant)
+
+    assert themes == index.themes(config.theme, texts)
+    for theme in themes:
+        assert theme.sample_feedback
+        for sample in theme.sample_feedback:
+            assert " ".join(theme.keywords) in sample.lower()
@@ -0,0 +1,106 @@
+"""Benchmark batch quality checks against per-record checks.
+
+Uses the quality checks from config.yaml and times:
+
+- per-record: run_quality_checks once per record, the only way to cover a
+  dataset before batch mode, one stored result per check per record
+- batch (DataFrame): run_batch_quality_checks over an in-memory frame
+- batch (CSV): the same over a CSV file streamed in chunks
+
+Run from the data-pipeline-monitor directory:
+
+    python -m benchmarks.batch_validation
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import yaml
+
+from src.data_quality_checker import DataQualityChecker
+from src.database import DatabaseManager
+
+
+def build_frame(rows: int, seed: int = 7) -> pd.DataFrame:
+    """Build pipeline output rows with a few percent of bad values."""
+    rng = np.random.default_rng(seed)
+    ids = np.arange(rows, dtype=float)
+    ids[rng.random(rows) < 0.01] = np.nan
+    values = rng.uniform(-50, 1050, rows).round(2)
+    statuses = rng.choice(
+        ["active", "inactive", "pending", "unknown"], rows, p=[0.5, 0.3, 0.18, 0.02]
+    )
+    seconds = rng.integers(0, 86400 * 30, rows).astype("timedelta64[s]")
+    return pd.DataFrame(
+        {
+            "id": ids,
+            "timestamp": np.datetime64("2024-01-01") + seconds,
+            "value": values,
+            "status": statuses,
+            "payload": np.char.add("row-", np.arange(rows).astype(str)),
+        }
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rows", type=int, default=2_000_000, help="Rows validated in batch"
+    )
+    parser.add_argument(
+        "--records", type=int, default=2_000, help="Records checked one at a time"
+    )
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    with open(Path(__file__).parent.parent / "config.yaml", encoding="utf-8") as f:
+        config = yaml.safe_load(f)["quality_checks"]
+
+    frame = build_frame(args.rows)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = DatabaseManager(f"sqlite:///{Path(tmp) / 'monitor.db'}")
+        db_manager.create_tables()
+        pipeline_id = db_manager.add_pipeline("bench").id
+        checker = DataQualityChecker(db_manager, config)
+
+        records = frame.head(args.records).to_dict("records")
+        start = time.perf_counter()
+        for record in records:
+            checker.run_quality_checks(pipeline_id, record)
+        record_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = checker.run_batch_quality_checks(pipeline_id, frame)
+        frame_seconds = time.perf_counter() - start
+
+        csv_path = Path(tmp) / "output.csv"
+        frame.to_csv(csv_path, index=False)
+        start = time.perf_counter()
+        checker.run_batch_quality_checks(pipeline_id, csv_path)
+        csv_seconds = time.perf_counter() - start
+
+    print(
+        f"per-record: {args.records} records in {record_seconds:.2f}s, "
+        f"{args.records / record_seconds:,.0f} rows/sec"
+    )
+    print(
+        f"batch (DataFrame): {args.rows} rows in {frame_seconds:.2f}s, "
+        f"{args.rows / frame_seconds:,.0f} rows/sec"
+    )
+    print(
+        f"batch (CSV, streamed): {args.rows} rows in {csv_seconds:.2f}s, "
+        f"{args.rows / csv_seconds:,.0f} rows/sec"
+    )
+    for result in results:
+        print(f"  {result['check_name']}: {result['result_value']:.2%} ({result['status']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""Benchmark fleet health evaluation against the per-pipeline loop.
+
+Fills a SQLite database with --pipelines active pipelines and --runs runs
+each, spread over the last --hours hours, and times:
+
+- per-pipeline: the previous monitor_all_pipelines, which loaded every
+  run of each pipeline in the window and updated each pipeline's health
+  in its own transaction
+- grouped: one (pipeline_id, status) aggregate over pipeline_runs and one
+  bulk UPDATE
+- run stats: the same, reading whole minutes and hours from
+  pipeline_run_stats
+
+Run from the data-pipeline-monitor directory:
+
+    python -m benchmarks.fleet_health
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+from src.database import DatabaseManager, Pipeline, PipelineRun
+from src.pipeline_monitor import PipelineMonitor
+
+
+def build_database(db_manager: DatabaseManager, pipelines: int, runs: int, hours: int) -> None:
+    """Insert pipelines and their runs directly, then rebuild run stats."""
+    rng = np.random.default_rng(7)
+    now = datetime.utcnow()
+    session = db_manager.get_session()
+    try:
+        session.bulk_insert_mappings(
+            Pipeline,
+            [{"id": i + 1, "name": f"pipeline-{i}", "status": "active"} for i in range(pipelines)],
+        )
+        failure_rates = rng.uniform(0.0, 0.6, pipelines)
+        for pipeline_index in range(pipelines):
+            offsets = rng.uniform(0, hours * 3600 - 60, runs)
+            durations = rng.uniform(5, 600, runs)
+            failed = rng.random(runs) < failure_rates[pipeline_index]
+            session.bulk_insert_mappings(
+                PipelineRun,
+                [
+                    {
+                        "pipeline_id": pipeline_index + 1,
+                        "run_id": f"{pipeline_index}-{i}",
+                        "status": "failed" if failed[i] else "success",
+                        "start_time": now - timedelta(seconds=float(offsets[i])),
+                        "duration_seconds": float(durations[i]),
+                        "records_processed": 1000,
+                        "records_failed": int(failed[i]) * 10,
+                    }
+                    for i in range(runs)
+                ],
+            )
+        session.commit()
+    finally:
+        session.close()
+    db_manager.rebuild_run_stats()
+
+
+def per_pipeline_health(monitor: PipelineMonitor, hours: int) -> list:
+    """Evaluate health one pipeline at a time, as monitoring did before."""
+    db_manager = monitor.db_manager
+    cutoff_time = datetime.utcnow() - timedelta(hours=hours)
+    health_statuses = []
+
+    for pipeline in db_manager.get_all_pipelines(status="active"):
+        session = db_manager.get_session()
+        try:
+            runs = (
+                session.query(PipelineRun)
+                .filter(
+                    PipelineRun.pipeline_id == pipeline.id,
+                    PipelineRun.start_time >= cutoff_time,
+                )
+                .all()
+            )
+            successful_runs = len([r for r in runs if r.status == "success"])
+            success_rate = successful_runs / len(runs) if runs else 0.0
+        finally:
+            session.close()
+
+        if success_rate >= monitor.degraded_threshold:
+            health_status = "healthy"
+        elif success_rate >= monitor.unhealthy_threshold:
+            health_status = "degraded"
+        else:
+            health_status = "unhealthy"
+        db_manager.update_pipeline_health(pipeline.id, health_status)
+        health_statuses.append(health_status)
+
+    return health_statuses
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pipelines", type=int, default=2000, help="Active pipelines")
+    parser.add_argument("--runs", type=int, default=100, help="Runs per pipeline")
+    parser.add_argument("--hours", type=int, default=24, help="Health window in hours")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = DatabaseManager(f"sqlite:///{Path(tmp) / 'monitor.db'}")
+        db_manager.create_tables()
+        build_database(db_manager, args.pipelines, args.runs, args.hours)
+        monitor = PipelineMonitor(db_manager, {})
+
+        start = time.perf_counter()
+        legacy = per_pipeline_health(monitor, args.hours)
+        legacy_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        grouped = monitor.monitor_all_pipelines(hours=args.hours)
+        grouped_seconds = time.perf_counter() - start
+
+        monitor.use_run_stats = True
+        start = time.perf_counter()
+        rolled = monitor.monitor_all_pipelines(hours=args.hours)
+        rolled_seconds = time.perf_counter() - start
+
+    assert [h["health_status"] for h in grouped] == legacy
+    assert [(h["health_status"], h["total_runs"]) for h in rolled] == [
+        (h["health_status"], h["total_runs"]) for h in grouped
+    ]
+
+    print(
+        f"{args.pipelines} pipelines x {args.runs} runs over {args.hours}h "
+        f"({args.pipelines * args.runs} runs)"
+    )
+    print(f"per-pipeline: {legacy_seconds:.2f}s")
+    print(f"grouped: {grouped_seconds:.2f}s")
+    print(f"run stats: {rolled_seconds:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,134 @@
 """Check data quality in pipelines."""
 
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+import pandas as pd
 
 from src.database import DatabaseManager
 
+BatchData = Union[pd.DataFrame, str, Path, Iterable[pd.DataFrame]]
+
+
+def _plain_value(value: any) -> any:
+    """Convert a pandas or numpy cell value to a plain Python value."""
+    if value is None or (np.isscalar(value) and pd.isna(value)):
+        return None
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _pattern_text(series: pd.Series) -> pd.Series:
+    """Render a column as strings for pattern rules.
+
+    Integer columns with NULLs are read as float64, so whole numbers are
+    written without a trailing ".0", as str() writes the original ints.
+    """
+    text = series.astype("string")
+    if pd.api.types.is_float_dtype(series.dtype):
+        whole = series.notna() & np.isfinite(series) & (series % 1 == 0)
+        text[whole] = series[whole].map(lambda value: str(int(value)))
+    return text
+
+
+def compile_validation_rule(rule: Dict) -> Callable[[pd.Series], pd.Series]:
+    """Compile a validation rule into a vectorized column predicate.
+
+    Mirrors DataQualityChecker._validate_field for a whole column; NULL
+    values fail every rule type except unknown ones.
+
+    Args:
+        rule: Validation rule.
+
+    Returns:
+        Function mapping a column to a boolean mask of valid rows.
+    """
+    rule_type = rule.get("type")
+
+    if rule_type == "not_null":
+        return lambda series: series.notna()
+    elif rule_type == "range":
+        min_val = rule.get("min")
+        max_val = rule.get("max")
+
+        def in_range(series: pd.Series) -> pd.Series:
+            values = pd.to_numeric(series, errors="coerce")
+            mask = values.notna()
+            if min_val is not None:
+                mask &= values >= min_val
+            if max_val is not None:
+                mask &= values <= max_val
+            return mask
+
+        return in_range
+    elif rule_type == "pattern":
+        pattern = rule.get("pattern", "")
+        return lambda series: _pattern_text(series).str.match(pattern, na=False).astype(bool)
+    elif rule_type == "enum":
+        allowed_values = rule.get("values", [])
+        return lambda series: series.isin(allowed_values) & series.notna()
+
+    return lambda series: pd.Series(True, index=series.index)
+
+
+class CompiledRule:
+    """A column predicate with running pass counts over streamed chunks."""
+
+    def __init__(self, field: str, predicate: Callable[[pd.Series], pd.Series]):
+        """Initialize compiled rule.
+
+        Args:
+            field: Column the rule applies to.
+            predicate: Function returning a boolean mask of valid rows.
+        """
+        self.field = field
+        self.predicate = predicate
+        self.rows = 0
+        self.failed = 0
+        self.failing_samples: List[Dict[str, any]] = []
+
+    def update(self, frame: pd.DataFrame, row_offset: int, sample_size: int) -> None:
+        """Evaluate the rule on one chunk.
+
+        Args:
+            frame: Chunk of rows.
+            row_offset: Position of the chunk's first row in the dataset.
+            sample_size: Maximum failing rows to keep as samples.
+        """
+        if self.field in frame.columns:
+            series = frame[self.field]
+            failed = ~self.predicate(series).to_numpy(dtype=bool)
+        else:
+            series = None
+            failed = np.ones(len(frame), dtype=bool)
+
+        failed_count = int(failed.sum())
+        self.rows += len(frame)
+        self.failed += failed_count
+
+        remaining = sample_size - len(self.failing_samples)
+        if failed_count and remaining > 0:
+            for position in np.flatnonzero(failed)[:remaining]:
+                self.failing_samples.append(
+                    {
+                        "row": row_offset + int(position),
+                        "value": None
+                        if series is None
+                        else _plain_value(series.iloc[position]),
+                    }
+                )
+
+    def result(self) -> Dict[str, any]:
+        """Pass rate, failure count and failing-row samples for the rule."""
+        return {
+            "pass_rate": 1.0 - self.failed / self.rows if self.rows else 0.0,
+            "failed_rows": self.failed,
+            "failing_samples": self.failing_samples,
+        }
+
 
 class DataQualityChecker:
     """Check data quality in pipelines."""
@@ -63,7 +187,6 @@ class DataQualityChecker:
             Check result dictionary or None.
         """
         check_type = check_config.get("type", "generic")
-        threshold = check_config.get("threshold", 0.0)
 
         if check_type == "completeness":
             result_value = self._check_completeness(data_sample, check_config)
@@ -76,6 +199,29 @@ class DataQualityChecker:
         else:
             result_value = 1.0
 
+        result = self._build_result(check_name, check_config, result_value)
+        quality_check = self.db_manager.add_quality_check(
+            pipeline_id=pipeline_id, **result
+        )
+
+        return {"id": quality_check.id, **result}
+
+    def _build_result(
+        self, check_name: str, check_config: Dict, result_value: float
+    ) -> Dict[str, any]:
+        """Derive status, severity and message for a check result.
+
+        Args:
+            check_name: Check name.
+            check_config: Check configuration.
+            result_value: Check result value.
+
+        Returns:
+            Dictionary with add_quality_check's fields except pipeline_id.
+        """
+        check_type = check_config.get("type", "generic")
+        threshold = check_config.get("threshold", 0.0)
+
         status = "passed" if result_value >= threshold else "failed"
         severity = self._determine_severity(result_value, threshold, check_config)
 
@@ -83,19 +229,7 @@ class DataQualityChecker:
             result=result_value, threshold=threshold
         )
 
-        quality_check = self.db_manager.add_quality_check(
-            pipeline_id=pipeline_id,
-            check_name=check_name,
-            check_type=check_type,
-            status=status,
-            severity=severity,
-            result_value=result_value,
-            threshold_value=threshold,
-            message=message,
-        )
-
         return {
-            "id": quality_check.id,
             "check_name": check_name,
             "check_type": check_type,
             "status": status,
@@ -105,6 +239,152 @@ class DataQualityChecker:
             "message": message,
         }
 
+    def run_batch_quality_checks(
+        self,
+        pipeline_id: int,
+        data: BatchData,
+        chunk_size: Optional[int] = None,
+    ) -> List[Dict[str, any]]:
+        """Run quality checks over every row of a dataset.
+
+        Completeness and validity rules are compiled into column
+        predicates and evaluated one chunk at a time, so files larger than
+        memory can be validated. A check's result value is the mean pass
+        rate of its rules, which for a single row equals what
+        run_quality_checks reports, null cells included: they count as
+        missing for completeness and fail validity rules. All results are
+        stored in one bulk insert.
+
+        Args:
+            pipeline_id: Pipeline ID.
+            data: DataFrame, Arrow Table or RecordBatch, path to a CSV or
+                Parquet file, or an iterable of DataFrame chunks.
+            chunk_size: Rows per chunk when reading files or Arrow tables.
+
+        Returns:
+            List of quality check result dictionaries, each with
+            rows_checked and per-rule pass rates and failing-row samples.
+        """
+        batch_config = self.config.get("batch", {})
+        chunk_size = chunk_size or batch_config.get("chunk_size", 100000)
+        sample_size = batch_config.get("failing_row_samples", 5)
+
+        compiled = {
+            check_name: self._compile_check(check_config)
+            for check_name, check_config in self.quality_checks.items()
+        }
+        columns = sorted(
+            {rule.field for rules in compiled.values() for rule in rules.values()}
+        )
+
+        rows_checked = 0
+        for frame in self._iter_frames(data, chunk_size, columns):
+            for rules in compiled.values():
+                for rule in rules.values():
+                    rule.update(frame, rows_checked, sample_size)
+            rows_checked += len(frame)
+
+        check_results = []
+        records = []
+        for check_name, check_config in self.quality_checks.items():
+            rules = compiled[check_name]
+            rule_results = {field: rule.result() for field, rule in rules.items()}
+
+            if rows_checked == 0:
+                result_value = 0.5
+            elif rules:
+                result_value = sum(
+                    result["pass_rate"] for result in rule_results.values()
+                ) / len(rule_results)
+            else:
+                result_value = 1.0
+
+            result = self._build_result(check_name, check_config, result_value)
+            records.append({"pipeline_id": pipeline_id, **result})
+            check_results.append(
+                {**result, "rows_checked": rows_checked, "rule_results": rule_results}
+            )
+
+        check_ids = self.db_manager.add_quality_checks(records)
+        return [
+            {"id": check_id, **result}
+            for check_id, result in zip(check_ids, check_results)
+        ]
+
+    def _compile_check(self, check_config: Dict) -> Dict[str, CompiledRule]:
+        """Compile a check's rules into column predicates keyed by field.
+
+        Args:
+            check_config: Check configuration.
+
+        Returns:
+            Dictionary mapping field name to CompiledRule. Check types
+            without row-level rules compile to no rules.
+        """
+        check_type = check_config.get("type", "generic")
+
+        if check_type == "completeness":
+            return {
+                field: CompiledRule(field, lambda series: series.notna())
+                for field in check_config.get("required_fields", [])
+            }
+        elif check_type == "validity":
+            return {
+                field: CompiledRule(field, compile_validation_rule(rule))
+                for field, rule in check_config.get("validation_rules", {}).items()
+            }
+
+        return {}
+
+    def _iter_frames(
+        self, data: BatchData, chunk_size: int, columns: List[str]
+    ) -> Iterator[pd.DataFrame]:
+        """Yield a dataset as DataFrame chunks, reading only needed columns.
+
+        Args:
+            data: Dataset accepted by run_batch_quality_checks.
+            chunk_size: Rows per chunk for files and Arrow tables.
+            columns: Columns referenced by the compiled rules.
+
+        Yields:
+            DataFrame chunks in row order.
+
+        Raises:
+            ImportError: If a Parquet file is given and pyarrow is missing.
+        """
+        if isinstance(data, pd.DataFrame):
+            yield data
+        elif isinstance(data, (str, Path)):
+            path = Path(data)
+            if path.suffix.lower() in (".parquet", ".pq"):
+                try:
+                    import pyarrow.parquet as pq
+                except ImportError as e:
+                    raise ImportError(
+                        "pyarrow is required to validate Parquet files"
+                    ) from e
+
+                parquet_file = pq.ParquetFile(path)
+                available = [c for c in columns if c in parquet_file.schema_arrow.names]
+                for batch in parquet_file.iter_batches(
+                    batch_size=chunk_size, columns=available or None
+                ):
+                    yield batch.to_pandas()
+            else:
+                wanted = set(columns)
+                yield from pd.read_csv(
+                    path,
+                    chunksize=chunk_size,
+                    usecols=(lambda column: column in wanted) if wanted else None,
+                )
+        elif hasattr(data, "to_batches"):
+            for batch in data.to_batches(max_chunksize=chunk_size):
+                yield batch.to_pandas()
+        elif hasattr(data, "to_pandas"):
+            yield data.to_pandas()
+        else:
+            yield from data
+
     def _check_completeness(
         self, data_sample: Optional[Dict], check_config: Dict
     ) -> float:
@@ -115,7 +395,8 @@ class DataQualityChecker:
             check_config: Check configuration.
 
         Returns:
-            Completeness score (0.0 to 1.0).
+            Completeness score (0.0 to 1.0). A field set to None or NaN
+            counts as missing.
         """
         if not data_sample:
             return 0.5
@@ -124,7 +405,11 @@ class DataQualityChecker:
         if not required_fields:
             return 1.0
 
-        present_fields = sum(1 for field in required_fields if field in data_sample)
+        present_fields = sum(
+            1
+            for field in required_fields
+            if _plain_value(data_sample.get(field)) is not None
+        )
         completeness = present_fields / len(required_fields) if required_fields else 1.0
 
         return completeness
@@ -162,6 +447,9 @@ class DataQualityChecker:
     def _validate_field(self, value: any, rule: Dict) -> bool:
         """Validate a field value against a rule.
 
+        None and NaN fail every rule type except unknown ones, as in
+        compile_validation_rule.
+
         Args:
             value: Field value.
             rule: Validation rule.
@@ -171,8 +459,12 @@ class DataQualityChecker:
         """
         rule_type = rule.get("type")
 
+        if rule_type in ("not_null", "range", "pattern", "enum"):
+            if _plain_value(value) is None:
+                return False
+
         if rule_type == "not_null":
-            return value is not None
+            return True
         elif rule_type == "range":
             min_val = rule.get("min")
             max_val = rule.get("max")
@@ -1,17 +1,22 @@
 """Database models and operations for data pipeline monitoring."""
 
-from datetime import datetime
-from typing import List, Optional
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
 
 from sqlalchemy import (
     Column,
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    UniqueConstraint,
     create_engine,
+    func,
+    update,
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker
@@ -57,6 +62,71 @@ class PipelineRun(Base):
 
     pipeline = relationship("Pipeline", back_populates="runs")
 
+    __table_args__ = (
+        Index("ix_pipeline_runs_pipeline_start", "pipeline_id", "start_time"),
+        Index("ix_pipeline_runs_start", "start_time"),
+    )
+
+
+RUN_STATS_BUCKET_MINUTES = (1, 60)
+RUN_TOTAL_FIELDS = (
+    "run_count",
+    "duration_seconds",
+    "records_processed",
+    "records_failed",
+)
+
+
+def bucket_start(timestamp: datetime, bucket_minutes: int) -> datetime:
+    """Truncate a timestamp to the start of its minute or hour bucket.
+
+    Args:
+        timestamp: Timestamp to truncate.
+        bucket_minutes: Bucket width, one of RUN_STATS_BUCKET_MINUTES.
+
+    Returns:
+        Start of the bucket containing timestamp.
+    """
+    timestamp = timestamp.replace(second=0, microsecond=0)
+    if bucket_minutes >= 60:
+        timestamp = timestamp.replace(minute=0)
+    return timestamp
+
+
+def _bucket_end(since: datetime, bucket_minutes: int) -> datetime:
+    """First bucket boundary at or after since."""
+    start = bucket_start(since, bucket_minutes)
+    if start < since:
+        start += timedelta(minutes=bucket_minutes)
+    return start
+
+
+class PipelineRunStats(Base):
+    """Run totals per pipeline, status and minute or hour bucket."""
+
+    __tablename__ = "pipeline_run_stats"
+
+    id = Column(Integer, primary_key=True)
+    pipeline_id = Column(Integer, ForeignKey("pipelines.id"), nullable=False)
+    bucket_minutes = Column(Integer, nullable=False)
+    bucket_start = Column(DateTime, nullable=False)
+    status = Column(String(20), nullable=False)
+    run_count = Column(Integer, nullable=False, default=0)
+    duration_seconds = Column(Float, nullable=False, default=0.0)
+    records_processed = Column(Integer, nullable=False, default=0)
+    records_failed = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "pipeline_id",
+            "bucket_minutes",
+            "bucket_start",
+            "status",
+            name="uq_pipeline_run_stats_bucket",
+        ),
+        Index("ix_pipeline_run_stats_bucket", "bucket_minutes", "bucket_start"),
+    )
+
 
 class QualityCheck(Base):
     """Data quality check result."""
@@ -76,6 +146,11 @@ class QualityCheck(Base):
 
     pipeline = relationship("Pipeline", back_populates="quality_checks")
 
+    __table_args__ = (
+        Index("ix_quality_checks_pipeline_checked", "pipeline_id", "checked_at"),
+        Index("ix_quality_checks_checked", "checked_at"),
+    )
+
 
 class Failure(Base):
     """Pipeline failure record."""
@@ -161,8 +236,16 @@ class DatabaseManager:
         self.SessionLocal = sessionmaker(bind=self.engine)
 
     def create_tables(self) -> None:
-        """Create all database tables."""
+        """Create all database tables.
+
+        Indexes added to pipeline_runs and quality_checks after a database
+        was first created are also created, since create_all skips tables
+        that already exist.
+        """
         Base.metadata.create_all(self.engine)
+        for table in (PipelineRun.__table__, QualityCheck.__table__):
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
 
     def get_session(self):
         """Get database session.
@@ -297,12 +380,228 @@ class DatabaseManager:
                 metadata=metadata,
             )
             session.add(pipeline_run)
+            self._bump_run_stats(session, pipeline_run)
             session.commit()
             session.refresh(pipeline_run)
             return pipeline_run
         finally:
             session.close()
 
+    def _bump_run_stats(self, session, pipeline_run: PipelineRun) -> None:
+        """Add a run to its minute and hour buckets in the caller's transaction."""
+        starts = {
+            bucket_minutes: bucket_start(pipeline_run.start_time, bucket_minutes)
+            for bucket_minutes in RUN_STATS_BUCKET_MINUTES
+        }
+        existing = {
+            stats.bucket_minutes: stats
+            for stats in session.query(PipelineRunStats).filter(
+                PipelineRunStats.pipeline_id == pipeline_run.pipeline_id,
+                PipelineRunStats.status == pipeline_run.status,
+                PipelineRunStats.bucket_start.in_(set(starts.values())),
+                PipelineRunStats.bucket_minutes.in_(RUN_STATS_BUCKET_MINUTES),
+            )
+            if starts[stats.bucket_minutes] == stats.bucket_start
+        }
+
+        for bucket_minutes, start in starts.items():
+            stats = existing.get(bucket_minutes)
+            if stats is None:
+                stats = PipelineRunStats(
+                    pipeline_id=pipeline_run.pipeline_id,
+                    bucket_minutes=bucket_minutes,
+                    bucket_start=start,
+                    status=pipeline_run.status,
+                    run_count=0,
+                    duration_seconds=0.0,
+                    records_processed=0,
+                    records_failed=0,
+                )
+                session.add(stats)
+            stats.run_count += 1
+            stats.duration_seconds += pipeline_run.duration_seconds or 0.0
+            stats.records_processed += pipeline_run.records_processed or 0
+            stats.records_failed += pipeline_run.records_failed or 0
+
+    def rebuild_run_stats(self, batch_size: int = 10000) -> int:
+        """Recompute the run stats table from pipeline_runs.
+
+        Needed once for databases that already held runs before run stats
+        were introduced, or after runs are inserted outside add_pipeline_run.
+
+        Args:
+            batch_size: Rows fetched per round trip while scanning pipeline_runs.
+
+        Returns:
+            Number of run stats rows written.
+        """
+        session = self.get_session()
+        try:
+            totals: Dict[tuple, List[float]] = defaultdict(lambda: [0, 0.0, 0, 0])
+            rows = session.query(
+                PipelineRun.pipeline_id,
+                PipelineRun.status,
+                PipelineRun.start_time,
+                PipelineRun.duration_seconds,
+                PipelineRun.records_processed,
+                PipelineRun.records_failed,
+            ).yield_per(batch_size)
+            for row in rows:
+                for bucket_minutes in RUN_STATS_BUCKET_MINUTES:
+                    key = (
+                        row.pipeline_id,
+                        bucket_minutes,
+                        bucket_start(row.start_time, bucket_minutes),
+                        row.status,
+                    )
+                    total = totals[key]
+                    total[0] += 1
+                    total[1] += row.duration_seconds or 0.0
+                    total[2] += row.records_processed or 0
+                    total[3] += row.records_failed or 0
+
+            session.query(PipelineRunStats).delete()
+            session.bulk_insert_mappings(
+                PipelineRunStats,
+                [
+                    {
+                        "pipeline_id": pipeline_id,
+                        "bucket_minutes": bucket_minutes,
+                        "bucket_start": start,
+                        "status": status,
+                        **dict(zip(RUN_TOTAL_FIELDS, total)),
+                    }
+                    for (pipeline_id, bucket_minutes, start, status), total in totals.items()
+                ],
+            )
+            session.commit()
+            return len(totals)
+        finally:
+            session.close()
+
+    def summarize_pipeline_runs(
+        self,
+        since: datetime,
+        pipeline_ids: Optional[Iterable[int]] = None,
+        use_run_stats: bool = False,
+    ) -> Dict[int, Dict[str, Dict[str, float]]]:
+        """Aggregate runs started at or after a time per pipeline and status.
+
+        One grouped query covers every pipeline. With use_run_stats, whole
+        minutes and hours of the window are read from pipeline_run_stats
+        and only the partial first minute from pipeline_runs; the totals
+        are the same either way.
+
+        Args:
+            since: Start of the window.
+            pipeline_ids: Pipelines to include, or None for all.
+            use_run_stats: Read whole buckets from the run stats table.
+
+        Returns:
+            Mapping of pipeline ID to status to totals (run_count,
+            duration_seconds, records_processed, records_failed).
+        """
+        pipeline_ids = list(pipeline_ids) if pipeline_ids is not None else None
+        if pipeline_ids is not None and not pipeline_ids:
+            return {}
+
+        summary: Dict[int, Dict[str, Dict[str, float]]] = defaultdict(
+            lambda: defaultdict(lambda: dict.fromkeys(RUN_TOTAL_FIELDS, 0))
+        )
+        session = self.get_session()
+        try:
+            ranges = [(PipelineRun, None, since, None)]
+            if use_run_stats:
+                minute_end = _bucket_end(since, 1)
+                hour_end = max(minute_end, _bucket_end(since, 60))
+                ranges = [
+                    (PipelineRun, None, since, minute_end),
+                    (PipelineRunStats, 1, minute_end, hour_end),
+                    (PipelineRunStats, 60, hour_end, None),
+                ]
+
+            for model, bucket_minutes, start, end in ranges:
+                for row in self._grouped_run_totals(
+                    session, model, bucket_minutes, start, end, pipeline_ids
+                ):
+                    totals = summary[row.pipeline_id][row.status]
+                    for field in RUN_TOTAL_FIELDS:
+                        totals[field] += getattr(row, field) or 0
+
+            return {
+                pipeline_id: {status: dict(totals) for status, totals in statuses.items()}
+                for pipeline_id, statuses in summary.items()
+            }
+        finally:
+            session.close()
+
+    def _grouped_run_totals(
+        self,
+        session,
+        model,
+        bucket_minutes: Optional[int],
+        start: datetime,
+        end: Optional[datetime],
+        pipeline_ids: Optional[List[int]],
+    ):
+        """Run totals grouped by (pipeline_id, status) over [start, end)."""
+        if model is PipelineRun:
+            time_column = PipelineRun.start_time
+            columns = [
+                func.count(PipelineRun.id).label("run_count"),
+                func.sum(PipelineRun.duration_seconds).label("duration_seconds"),
+                func.sum(PipelineRun.records_processed).label("records_processed"),
+                func.sum(PipelineRun.records_failed).label("records_failed"),
+            ]
+        else:
+            time_column = PipelineRunStats.bucket_start
+            columns = [
+                func.sum(getattr(PipelineRunStats, field)).label(field)
+                for field in RUN_TOTAL_FIELDS
+            ]
+
+        query = session.query(model.pipeline_id, model.status, *columns).filter(
+            time_column >= start
+        )
+        if end is not None:
+            if end <= start:
+                return []
+            query = query.filter(time_column < end)
+        if bucket_minutes is not None:
+            query = query.filter(PipelineRunStats.bucket_minutes == bucket_minutes)
+        if pipeline_ids is not None:
+            query = query.filter(model.pipeline_id.in_(pipeline_ids))
+        return query.group_by(model.pipeline_id, model.status).all()
+
+    def summarize_quality_checks(
+        self, since: datetime, pipeline_ids: Optional[Iterable[int]] = None
+    ) -> Dict[int, Dict[str, int]]:
+        """Count quality checks at or after a time per pipeline and status.
+
+        Args:
+            since: Start of the window.
+            pipeline_ids: Pipelines to include, or None for all.
+
+        Returns:
+            Mapping of pipeline ID to status to check count.
+        """
+        session = self.get_session()
+        try:
+            query = session.query(
+                QualityCheck.pipeline_id, QualityCheck.status, func.count(QualityCheck.id)
+            ).filter(QualityCheck.checked_at >= since)
+            if pipeline_ids is not None:
+                query = query.filter(QualityCheck.pipeline_id.in_(list(pipeline_ids)))
+
+            summary: Dict[int, Dict[str, int]] = defaultdict(dict)
+            for pipeline_id, status, count in query.group_by(
+                QualityCheck.pipeline_id, QualityCheck.status
+            ):
+                summary[pipeline_id][status] = count
+            return dict(summary)
+        finally:
+            session.close()
+
     def get_recent_runs(
         self, pipeline_id: Optional[int] = None, limit: Optional[int] = None
     ) -> List[PipelineRun]:
@@ -371,6 +670,26 @@ class DatabaseManager:
         finally:
             session.close()
 
+    def add_quality_checks(self, checks: List[dict]) -> List[int]:
+        """Add several quality check results in one bulk insert.
+
+        Args:
+            checks: Dictionaries with add_quality_check's keyword arguments.
+
+        Returns:
+            IDs of the created QualityCheck rows, in input order.
+        """
+        session = self.get_session()
+        try:
+            quality_checks = [QualityCheck(**check) for check in checks]
+            session.add_all(quality_checks)
+            session.flush()
+            check_ids = [quality_check.id for quality_check in quality_checks]
+            session.commit()
+            return check_ids
+        finally:
+            session.close()
+
     def add_failure(
         self,
         pipeline_id: int,
@@ -572,6 +891,29 @@ class DatabaseManager:
         finally:
             session.close()
 
+    def update_pipeline_healths(self, health_statuses: Dict[int, str]) -> None:
+        """Update several pipelines' health status in one bulk UPDATE.
+
+        Args:
+            health_statuses: Mapping of pipeline ID to health status.
+        """
+        if not health_statuses:
+            return
+
+        now = datetime.utcnow()
+        session = self.get_session()
+        try:
+            session.execute(
+                update(Pipeline),
+                [
+                    {"id": pipeline_id, "health_status": health_status, "updated_at": now}
+                    for pipeline_id, health_status in health_statuses.items()
+                ],
+            )
+            session.commit()
+        finally:
+            session.close()
+
     def add_health_metric(
         self,
         pipeline_id: int,
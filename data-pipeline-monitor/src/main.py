@@ -53,6 +53,7 @@ def monitor_pipelines(
     config: dict,
     settings: object,
     pipeline_id: Optional[int] = None,
+    hours: int = 1,
 ) -> dict:
     """Monitor pipeline health.
 
@@ -60,6 +61,7 @@ def monitor_pipelines(
         config: Configuration dictionary.
         settings: Application settings object.
         pipeline_id: Optional pipeline ID to filter by.
+        hours: Number of hours to analyze.
 
     Returns:
         Dictionary with monitoring results.
@@ -73,7 +75,7 @@ def monitor_pipelines(
 
     if pipeline_id:
         logger.info(f"Monitoring pipeline {pipeline_id}")
-        health = monitor.check_pipeline_health(pipeline_id)
+        health = monitor.check_pipeline_health(pipeline_id, hours=hours)
         return {
             "success": True,
             "pipelines_checked": 1,
@@ -81,7 +83,7 @@ def monitor_pipelines(
         }
     else:
         logger.info("Monitoring all pipelines")
-        health_statuses = monitor.monitor_all_pipelines()
+        health_statuses = monitor.monitor_all_pipelines(hours=hours)
         return {
             "success": True,
             "pipelines_checked": len(health_statuses),
@@ -89,6 +91,30 @@ def monitor_pipelines(
         }
 
 
+def rebuild_run_stats(settings: object) -> dict:
+    """Rebuild the per-pipeline run stats table from recorded runs.
+
+    Args:
+        settings: Application settings object.
+
+    Returns:
+        Dictionary with rebuild results.
+    """
+    logger = logging.getLogger(__name__)
+
+    db_manager = DatabaseManager(settings.database.url)
+    db_manager.create_tables()
+
+    logger.info("Rebuilding pipeline run stats")
+    rows_written = db_manager.rebuild_run_stats()
+    logger.info(f"Wrote {rows_written} run stats rows")
+
+    return {
+        "success": True,
+        "rows_written": rows_written,
+    }
+
+
 def detect_failures(
     config: dict,
     settings: object,
@@ -128,6 +154,7 @@ def check_quality(
     config: dict,
     settings: object,
     pipeline_id: int,
+    data_path: Optional[Path] = None,
 ) -> dict:
     """Check data quality.
 
@@ -135,6 +162,7 @@ def check_quality(
         config: Configuration dictionary.
         settings: Application settings object.
         pipeline_id: Pipeline ID.
+        data_path: Optional CSV or Parquet file whose rows are all validated.
 
     Returns:
         Dictionary with quality check results.
@@ -148,7 +176,10 @@ def check_quality(
 
     logger.info(f"Running quality checks for pipeline {pipeline_id}")
 
-    check_results = quality_checker.run_quality_checks(pipeline_id)
+    if data_path:
+        check_results = quality_checker.run_batch_quality_checks(pipeline_id, data_path)
+    else:
+        check_results = quality_checker.run_quality_checks(pipeline_id)
 
     logger.info(f"Completed {len(check_results)} quality checks")
 
@@ -294,6 +325,11 @@ def main() -> None:
         action="store_true",
         help="Monitor pipeline health",
     )
+    parser.add_argument(
+        "--rebuild-run-stats",
+        action="store_true",
+        help="Rebuild the run stats table read when monitoring.use_run_stats is on",
+    )
     parser.add_argument(
         "--detect-failures",
         action="store_true",
@@ -305,6 +341,12 @@ def main() -> None:
         metavar="PIPELINE_ID",
         help="Check data quality for pipeline",
     )
+    parser.add_argument(
+        "--data",
+        type=Path,
+        metavar="PATH",
+        help="CSV or Parquet file to validate in full with --check-quality",
+    )
     parser.add_argument(
         "--remediate",
         type=int,
@@ -352,6 +394,7 @@ def main() -> None:
 
     if not any([
         args.monitor,
+        args.rebuild_run_stats,
         args.detect_failures,
         args.check_quality,
         args.remediate,
@@ -374,11 +417,17 @@ def main() -> None:
     logger = logging.getLogger(__name__)
 
     try:
+        if args.rebuild_run_stats:
+            result = rebuild_run_stats(settings=settings)
+            print("\nRun stats rebuilt:")
+            print(f"Rows written: {result['rows_written']}")
+
         if args.monitor:
             result = monitor_pipelines(
                 config=config,
                 settings=settings,
                 pipeline_id=args.pipeline_id,
+                hours=args.hours,
             )
             print(f"\nPipeline monitoring completed:")
             print(f"Pipelines checked: {result['pipelines_checked']}")
@@ -400,9 +449,16 @@ def main() -> None:
                 config=config,
                 settings=settings,
                 pipeline_id=args.check_quality,
+                data_path=args.data,
             )
             print(f"\nQuality checks completed:")
             print(f"Checks run: {result['checks_run']}")
+            for check in result["check_results"]:
+                if "rows_checked" in check:
+                    print(
+                        f"  {check['check_name']}: {check['result_value']:.2%} "
+                        f"over {check['rows_checked']} rows ({check['status']})"
+                    )
 
         if args.remediate:
             result = trigger_remediation(
@@ -21,6 +21,7 @@ class PipelineMonitor:
         self.health_check_interval = config.get("health_check_interval_minutes", 5)
         self.degraded_threshold = config.get("degraded_threshold", 0.8)
         self.unhealthy_threshold = config.get("unhealthy_threshold", 0.5)
+        self.use_run_stats = config.get("use_run_stats", False)
 
     def check_pipeline_health(
         self, pipeline_id: int, hours: int = 1
@@ -35,83 +36,101 @@ class PipelineMonitor:
             Dictionary with health status and metrics.
         """
         cutoff_time = datetime.utcnow() - timedelta(hours=hours)
-        session = self.db_manager.get_session()
-
-        try:
-            from src.database import PipelineRun
-
-            runs = (
-                session.query(PipelineRun)
-                .filter(
-                    PipelineRun.pipeline_id == pipeline_id,
-                    PipelineRun.start_time >= cutoff_time,
-                )
-                .all()
-            )
+        summary = self.db_manager.summarize_pipeline_runs(
+            cutoff_time, [pipeline_id], use_run_stats=self.use_run_stats
+        )
+        health = self._health_from_totals(pipeline_id, summary.get(pipeline_id, {}))
 
-            if not runs:
-                return {
-                    "pipeline_id": pipeline_id,
-                    "health_status": "unknown",
-                    "success_rate": 0.0,
-                    "total_runs": 0,
-                    "successful_runs": 0,
-                    "failed_runs": 0,
-                }
-
-            total_runs = len(runs)
-            successful_runs = len([r for r in runs if r.status == "success"])
-            failed_runs = total_runs - successful_runs
-            success_rate = successful_runs / total_runs if total_runs > 0 else 0.0
-
-            if success_rate >= self.degraded_threshold:
-                health_status = "healthy"
-            elif success_rate >= self.unhealthy_threshold:
-                health_status = "degraded"
-            else:
-                health_status = "unhealthy"
-
-            self.db_manager.update_pipeline_health(pipeline_id, health_status)
-
-            avg_duration = (
-                sum(r.duration_seconds for r in runs if r.duration_seconds) / total_runs
-                if total_runs > 0
-                else 0.0
-            )
+        if health["total_runs"]:
+            self.db_manager.update_pipeline_health(pipeline_id, health["health_status"])
 
-            total_records = sum(r.records_processed for r in runs)
-            total_failed_records = sum(r.records_failed for r in runs)
+        return health
 
-            return {
-                "pipeline_id": pipeline_id,
-                "health_status": health_status,
-                "success_rate": success_rate,
-                "total_runs": total_runs,
-                "successful_runs": successful_runs,
-                "failed_runs": failed_runs,
-                "average_duration_seconds": avg_duration,
-                "total_records_processed": total_records,
-                "total_records_failed": total_failed_records,
-            }
-        finally:
-            session.close()
-
-    def monitor_all_pipelines(self) -> List[Dict[str, any]]:
+    def monitor_all_pipelines(self, hours: int = 1) -> List[Dict[str, any]]:
         """Monitor all active pipelines.
 
+        Run totals for the whole fleet come from one grouped query, and the
+        changed health statuses are written in one bulk UPDATE.
+
+        Args:
+            hours: Number of hours to analyze.
+
         Returns:
             List of health status dictionaries.
         """
         pipelines = self.db_manager.get_all_pipelines(status="active")
-        health_statuses = []
+        cutoff_time = datetime.utcnow() - timedelta(hours=hours)
+        summary = self.db_manager.summarize_pipeline_runs(
+            cutoff_time,
+            [pipeline.id for pipeline in pipelines],
+            use_run_stats=self.use_run_stats,
+        )
 
+        health_statuses = []
+        updates = {}
         for pipeline in pipelines:
-            health = self.check_pipeline_health(pipeline.id)
+            health = self._health_from_totals(pipeline.id, summary.get(pipeline.id, {}))
             health["pipeline_name"] = pipeline.name
             health_statuses.append(health)
+            if health["total_runs"]:
+                updates[pipeline.id] = health["health_status"]
 
+        self.db_manager.update_pipeline_healths(updates)
         return health_statuses
 
+    def _health_from_totals(
+        self, pipeline_id: int, totals_by_status: Dict[str, Dict[str, float]]
+    ) -> Dict[str, any]:
+        """Build a health dictionary from per-status run totals.
+
+        Args:
+            pipeline_id: Pipeline ID.
+            totals_by_status: Run totals keyed by run status.
+
+        Returns:
+            Dictionary with health status and metrics.
+        """
+        total_runs = sum(t["run_count"] for t in totals_by_status.values())
+        if not total_runs:
+            return {
+                "pipeline_id": pipeline_id,
+                "health_status": "unknown",
+                "success_rate": 0.0,
+                "total_runs": 0,
+                "successful_runs": 0,
+                "failed_runs": 0,
+            }
+
+        successful_runs = totals_by_status.get("success", {}).get("run_count", 0)
+        failed_runs = total_runs - successful_runs
+        success_rate = successful_runs / total_runs
+
+        if success_rate >= self.degraded_threshold:
+            health_status = "healthy"
+        elif success_rate >= self.unhealthy_threshold:
+            health_status = "degraded"
+        else:
+            health_status = "unhealthy"
+
+        return {
+            "pipeline_id": pipeline_id,
+            "health_status": health_status,
+            "success_rate": success_rate,
+            "total_runs": total_runs,
+            "successful_runs": successful_runs,
+            "failed_runs": failed_runs,
+            "average_duration_seconds": sum(
+                t["duration_seconds"] for t in totals_by_status.values()
+            )
+            / total_runs,
+            "total_records_processed": sum(
+                t["records_processed"] for t in totals_by_status.values()
+            ),
+            "total_records_failed": sum(
+                t["records_failed"] for t in totals_by_status.values()
+            ),
+        }
+
     def get_pipeline_metrics(
         self, pipeline_id: int, hours: int = 24
     ) -> Dict[str, any]:
@@ -125,49 +144,32 @@ class PipelineMonitor:
             Dictionary with pipeline metrics.
         """
         cutoff_time = datetime.utcnow() - timedelta(hours=hours)
-        session = self.db_manager.get_session()
-
-        try:
-            from src.database import PipelineRun, QualityCheck
-
-            runs = (
-                session.query(PipelineRun)
-                .filter(
-                    PipelineRun.pipeline_id == pipeline_id,
-                    PipelineRun.start_time >= cutoff_time,
-                )
-                .all()
-            )
-
-            quality_checks = (
-                session.query(QualityCheck)
-                .filter(
-                    QualityCheck.pipeline_id == pipeline_id,
-                    QualityCheck.checked_at >= cutoff_time,
-                )
-                .all()
-            )
-
-            total_runs = len(runs)
-            successful_runs = len([r for r in runs if r.status == "success"])
-            failed_runs = total_runs - successful_runs
-
-            passed_checks = len([c for c in quality_checks if c.status == "passed"])
-            failed_checks = len([c for c in quality_checks if c.status == "failed"])
-
-            return {
-                "pipeline_id": pipeline_id,
-                "time_period_hours": hours,
-                "total_runs": total_runs,
-                "successful_runs": successful_runs,
-                "failed_runs": failed_runs,
-                "success_rate": successful_runs / total_runs if total_runs > 0 else 0.0,
-                "total_quality_checks": len(quality_checks),
-                "passed_checks": passed_checks,
-                "failed_checks": failed_checks,
-                "quality_pass_rate": (
-                    passed_checks / len(quality_checks) if quality_checks else 0.0
-                ),
-            }
-        finally:
-            session.close()
+        runs = self.db_manager.summarize_pipeline_runs(
+            cutoff_time, [pipeline_id], use_run_stats=self.use_run_stats
+        ).get(pipeline_id, {})
+        checks = self.db_manager.summarize_quality_checks(cutoff_time, [pipeline_id]).get(
+            pipeline_id, {}
+        )
+
+        total_runs = sum(t["run_count"] for t in runs.values())
+        successful_runs = runs.get("success", {}).get("run_count", 0)
+        failed_runs = total_runs - successful_runs
+
+        total_checks = sum(checks.values())
+        passed_checks = checks.get("passed", 0)
+        failed_checks = checks.get("failed", 0)
+
+        return {
+            "pipeline_id": pipeline_id,
+            "time_period_hours": hours,
+            "total_runs": total_runs,
+            "successful_runs": successful_runs,
+            "failed_runs": failed_runs,
+            "success_rate": successful_runs / total_runs if total_runs > 0 else 0.0,
+            "total_quality_checks": total_checks,
+            "passed_checks": passed_checks,
+            "failed_checks": failed_checks,
+            "quality_pass_rate": (
+                passed_checks / total_checks if total_checks else 0.0
+            ),
+        }
@@ -1,5 +1,6 @@
 """Unit tests for data pipeline monitoring system."""
 
+import pandas as pd
 import pytest
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
@@ -110,6 +111,63 @@ def test_pipeline_monitor_check_health(db_manager, sample_config):
     assert "success_rate" in health
 
 
+def test_pipeline_monitor_all_pipelines_matches_run_stats(db_manager, sample_config):
+    """Test fleet health from grouped totals, with and without run stats."""
+    db_manager.create_tables()
+    pipelines = [db_manager.add_pipeline(f"Pipeline {i}") for i in range(3)]
+    idle = db_manager.add_pipeline("Idle Pipeline")
+
+    now = datetime.utcnow()
+    outcomes = [
+        ["success"] * 9 + ["failed"],
+        ["success"] * 6 + ["failed"] * 4,
+        ["success"] + ["failed"] * 4,
+    ]
+    for pipeline, statuses in zip(pipelines, outcomes):
+        for index, status in enumerate(statuses):
+            start_time = now - timedelta(minutes=6 * index + 3, seconds=index)
+            db_manager.add_pipeline_run(
+                pipeline.id,
+                f"{pipeline.id}-{index}",
+                status,
+                start_time,
+                start_time + timedelta(seconds=30 + index),
+                records_processed=100,
+                records_failed=index,
+            )
+    db_manager.add_pipeline_run(
+        pipelines[0].id, "old", "failed", now - timedelta(hours=5), now - timedelta(hours=5)
+    )
+
+    monitor = PipelineMonitor(db_manager, sample_config["monitoring"])
+    health = monitor.monitor_all_pipelines(hours=1)
+
+    assert [h["pipeline_name"] for h in health] == [p.name for p in pipelines + [idle]]
+    assert [h["health_status"] for h in health] == [
+        "healthy",
+        "degraded",
+        "unhealthy",
+        "unknown",
+    ]
+    assert health[0]["total_runs"] == 10
+    assert health[1]["total_records_failed"] == sum(range(10))
+    assert health[1]["average_duration_seconds"] == pytest.approx(34.5)
+    assert [db_manager.get_pipeline(p.id).health_status for p in pipelines] == [
+        "healthy",
+        "degraded",
+        "unhealthy",
+    ]
+
+    monitor.use_run_stats = True
+    assert monitor.monitor_all_pipelines(hours=1) == health
+    assert monitor.check_pipeline_health(pipelines[1].id) == {
+        key: value for key, value in health[1].items() if key != "pipeline_name"
+    }
+
+    assert db_manager.rebuild_run_stats() > 0
+    assert monitor.monitor_all_pipelines(hours=1) == health
+
+
 def test_failure_detector_detect_failures(db_manager, sample_config):
     """Test detecting failures."""
     db_manager.create_tables()
@@ -148,6 +206,139 @@ def test_data_quality_checker_run_checks(db_manager, sample_config):
     assert all("status" in result for result in results)
 
 
+def test_data_quality_checker_run_batch_checks(db_manager, tmp_path):
+    """Test batch quality checks over a chunked CSV file."""
+    db_manager.create_tables()
+    pipeline = db_manager.add_pipeline("Test Pipeline")
+    config = {
+        "quality_checks": {
+            "completeness": {
+                "type": "completeness",
+                "threshold": 0.95,
+                "required_fields": ["id", "value"],
+            },
+            "validity": {
+                "type": "validity",
+                "threshold": 0.9,
+                "validation_rules": {
+                    "value": {"type": "range", "min": 0, "max": 1000},
+                    "status": {"type": "enum", "values": ["active", "pending"]},
+                },
+            },
+        },
+        "batch": {"failing_row_samples": 2},
+    }
+    csv_path = tmp_path / "output.csv"
+    csv_path.write_text(
+        "id,value,status,unused\n"
+        "1,10,active,x\n"
+        "2,,pending,x\n"
+        "3,5000,active,x\n"
+        "4,20,bogus,x\n"
+        "5,-1,active,x\n"
+    )
+
+    checker = DataQualityChecker(db_manager, config)
+    results = checker.run_batch_quality_checks(pipeline.id, csv_path, chunk_size=2)
+    completeness, validity = results
+
+    assert completeness["rows_checked"] == 5
+    assert completeness["result_value"] == pytest.approx((1.0 + 0.8) / 2)
+    assert validity["rule_results"]["value"]["failed_rows"] == 3
+    assert validity["rule_results"]["value"]["failing_samples"] == [
+        {"row": 1, "value": None},
+        {"row": 2, "value": 5000.0},
+    ]
+    assert validity["rule_results"]["status"]["pass_rate"] == pytest.approx(0.8)
+    assert validity["status"] == "failed"
+
+    single = checker.run_batch_quality_checks(
+        pipeline.id, [pd.DataFrame([{"id": 1, "value": 2000, "status": "active"}])]
+    )
+    record = checker.run_quality_checks(
+        pipeline.id, {"id": 1, "value": 2000, "status": "active"}
+    )
+    assert [r["result_value"] for r in single] == [r["result_value"] for r in record]
+
+    session = db_manager.get_session()
+    try:
+        assert session.query(QualityCheck).count() == 6
+    finally:
+        session.close()
+
+
+def test_data_quality_checker_batch_matches_records_with_none(db_manager):
+    """Test that None values score the same per record and in batch."""
+    db_manager.create_tables()
+    pipeline = db_manager.add_pipeline("Test Pipeline")
+    config = {
+        "quality_checks": {
+            "completeness": {
+                "type": "completeness",
+                "required_fields": ["id", "value"],
+            },
+            "validity": {
+                "type": "validity",
+                "validation_rules": {
+                    "code": {"type": "pattern", "pattern": ".*"},
+                    "value": {"type": "range", "min": 0},
+                    "status": {"type": "enum", "values": ["active", None]},
+                },
+            },
+        },
+    }
+    checker = DataQualityChecker(db_manager, config)
+    records = [
+        {"id": 1, "value": None, "code": None, "status": None},
+        {"id": None, "value": 5, "code": "A1", "status": "active"},
+        {"id": 2, "value": float("nan"), "code": "B2", "status": "active"},
+    ]
+
+    for record in records:
+        single = checker.run_batch_quality_checks(pipeline.id, pd.DataFrame([record]))
+        per_record = checker.run_quality_checks(pipeline.id, record)
+        assert [r["result_value"] for r in single] == pytest.approx(
+            [r["result_value"] for r in per_record]
+        )
+
+    completeness, validity = checker.run_quality_checks(pipeline.id, records[0])
+    assert completeness["result_value"] == pytest.approx(0.5)
+    assert validity["result_value"] == 0.0
+
+
+def test_data_quality_checker_pattern_ignores_chunk_dtype(db_manager, tmp_path):
+    """Test that integer columns with blanks match patterns in every chunking."""
+    db_manager.create_tables()
+    pipeline = db_manager.add_pipeline("Test Pipeline")
+    rule = {"type": "pattern", "pattern": r"^\d+$"}
+    config = {
+        "quality_checks": {
+            "validity": {
+                "type": "validity",
+                "validation_rules": {"order_id": rule},
+            },
+        },
+    }
+    csv_path = tmp_path / "orders.csv"
+    csv_path.write_text("order_id,amount\n5,10\n,20\n7,30\n8,40\n")
+    checker = DataQualityChecker(db_manager, config)
+
+    per_record = [
+        checker.run_quality_checks(pipeline.id, {"order_id": value})[0]["result_value"]
+        for value in (5, None, 7, 8)
+    ]
+    for chunk_size in (1, 2, 10):
+        (validity,) = checker.run_batch_quality_checks(
+            pipeline.id, csv_path, chunk_size=chunk_size
+        )
+        assert validity["result_value"] == pytest.approx(
+            sum(per_record) / len(per_record)
+        )
+        assert validity["rule_results"]["order_id"]["failing_samples"] == [
+            {"row": 1, "value": None}
+        ]
+
+
 def test_remediation_workflow_trigger(db_manager, sample_config):
     """Test triggering remediation workflow."""
     db_manager.create_tables()
@@ -0,0 +1,102 @@
+"""Benchmark sampled and incremental quality checks against a full scan.
+
+Builds a SQLite table, configures completeness on every column, uniqueness
+on two columns and range rules on every numeric column, then times:
+
+- full: one fused profiling scan over the whole table
+- sample: the same query over a random sample of about --sample-rows rows
+- incremental: after a baseline run, appending --new-rows rows and profiling
+  only rows past the id watermark, merged into the running totals
+
+Run from the data-quality-monitor directory:
+
+    python -m benchmarks.incremental_checks
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.table_profiling import build_table
+from src.database_connector import DatabaseConnector
+from src.table_profiler import TableProfiler
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Table rows")
+    parser.add_argument("--columns", type=int, default=20, help="Table columns")
+    parser.add_argument(
+        "--sample-rows", type=int, default=50_000, help="Rows sampled per run"
+    )
+    parser.add_argument(
+        "--new-rows", type=int, default=10_000, help="Rows appended before the incremental run"
+    )
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        connector = DatabaseConnector(
+            "bench", f"sqlite:///{Path(tmp) / 'wide.db'}", "sqlite"
+        )
+        connector.connect()
+        text_columns, int_columns = build_table(connector, args.rows, args.columns)
+
+        checks = [
+            {"type": "completeness", "columns": text_columns + int_columns},
+            {"type": "uniqueness", "columns": text_columns[:2]},
+            {
+                "type": "accuracy",
+                "columns": [{"name": name, "min": 0, "max": 999} for name in int_columns],
+            },
+        ]
+        profiler = TableProfiler(connector)
+        plan = profiler.plan_for_checks(
+            "wide", checks, {"accuracy": {"check_pattern_matching": False}}
+        )
+
+        _, state = profiler.incremental_profile("wide", plan, "id")
+
+        names = ", ".join(text_columns + int_columns)
+        with connector.engine.begin() as conn:
+            conn.exec_driver_sql(
+                f"INSERT INTO wide ({names}) SELECT {names} FROM wide "
+                f"LIMIT {args.new_rows}"
+            )
+
+        start = time.perf_counter()
+        full = profiler.profile("wide", plan)
+        full_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        sample = profiler.sample_profile("wide", plan, args.sample_rows)
+        sample_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        incremental, state = profiler.incremental_profile("wide", plan, "id", state)
+        incremental_seconds = time.perf_counter() - start
+
+        connector.disconnect()
+
+    assert incremental.metrics == full.metrics
+    column = int_columns[0]
+    interval = sample.summary()["intervals"][f"{column}.null_rate"]
+    print(f"table: {full.row_count} rows x {args.columns} columns")
+    print(f"full: {full_seconds:.2f}s, {column} null rate {full.null_count(column) / full.row_count:.4f}")
+    print(
+        f"sample: {sample_seconds:.2f}s over {sample.row_count} rows, "
+        f"{column} null rate {interval['rate']:.4f} "
+        f"(95% CI {interval['lower']:.4f}-{interval['upper']:.4f})"
+    )
+    print(
+        f"incremental: {incremental_seconds:.2f}s over {incremental.rows_scanned} new rows, "
+        "totals match the full scan"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Benchmark concurrent table checks across several databases.
+
+Creates --databases SQLite files with --tables tables each, sized from a
+few thousand to --max-rows rows, and runs run_quality_checks over all of
+them with one worker (the previous sequential walk) and with --workers
+workers.
+
+Local SQLite queries are CPU-bound in this process, so concurrency only
+pays off with more than one core. --server-seconds adds a fixed delay to
+every query, standing in for time a remote PostgreSQL or MySQL server
+spends executing it while the client thread waits.
+
+Run from the data-quality-monitor directory:
+
+    python -m benchmarks.parallel_checks
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from src.database_connector import DatabaseConnector
+from src.main import run_quality_checks
+
+
+def build_database(path: Path, tables: int, max_rows: int, rng: np.random.Generator) -> list[dict]:
+    """Create tables of geometrically increasing size and return their configs."""
+    connector = DatabaseConnector("build", f"sqlite:///{path}", "sqlite")
+    connector.connect()
+    table_configs = []
+
+    with connector.engine.begin() as conn:
+        for index in range(tables):
+            rows = max(1000, int(max_rows / 2 ** (tables - 1 - index)))
+            name = f"t{index}"
+            conn.exec_driver_sql(
+                f"CREATE TABLE {name} (id INTEGER PRIMARY KEY, email TEXT, amount INTEGER)"
+            )
+            emails = np.char.add("user", rng.integers(0, rows, rows).astype(str)).astype(object)
+            emails[rng.random(rows) < 0.02] = None
+            amounts = rng.integers(-5, 1000, rows).tolist()
+            conn.exec_driver_sql(
+                f"INSERT INTO {name} (email, amount) VALUES (?, ?)",
+                list(zip(emails, amounts)),
+            )
+            table_configs.append(
+                {
+                    "name": name,
+                    "checks": [
+                        {"type": "completeness", "columns": ["email", "amount"]},
+                        {"type": "uniqueness", "columns": ["email"]},
+                        {"type": "accuracy", "columns": [{"name": "amount", "min": 0}]},
+                    ],
+                }
+            )
+
+    connector.disconnect()
+    return table_configs
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--databases", type=int, default=4, help="Databases")
+    parser.add_argument("--tables", type=int, default=6, help="Tables per database")
+    parser.add_argument(
+        "--max-rows", type=int, default=200_000, help="Rows in each database's largest table"
+    )
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent workers")
+    parser.add_argument(
+        "--server-seconds",
+        type=float,
+        default=0.5,
+        help="Simulated server time added to every query",
+    )
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    rng = np.random.default_rng(7)
+
+    if args.server_seconds:
+        fetch = DatabaseConnector._fetch
+
+        def remote_fetch(self, connection, query):
+            time.sleep(args.server_seconds)
+            return fetch(self, connection, query)
+
+        DatabaseConnector._fetch = remote_fetch
+
+    with tempfile.TemporaryDirectory() as tmp:
+        jobs = []
+        for index in range(args.databases):
+            path = Path(tmp) / f"db{index}.db"
+            table_configs = build_database(path, args.tables, args.max_rows, rng)
+            jobs.append(
+                (
+                    {"name": f"db{index}", "type": "sqlite", "connection_string": f"sqlite:///{path}"},
+                    table_configs,
+                )
+            )
+        quality_config = {"incremental": {"state_file": str(Path(tmp) / "state.json")}}
+
+        timings = {}
+        for workers in (1, args.workers):
+            start = time.perf_counter()
+            scorecards, _ = run_quality_checks(
+                jobs, quality_config, {"max_workers": workers}
+            )
+            timings[workers] = time.perf_counter() - start
+
+    slowest = max(
+        result["duration_seconds"]
+        for scorecard in scorecards
+        for result in scorecard.table_results.values()
+    )
+    print(
+        f"{args.databases} databases x {args.tables} tables, largest {args.max_rows} rows, "
+        f"{args.server_seconds}s simulated server time per query"
+    )
+    print(f"sequential (1 worker): {timings[1]:.2f}s")
+    print(f"concurrent ({args.workers} workers): {timings[args.workers]:.2f}s")
+    print(f"slowest single table: {slowest:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
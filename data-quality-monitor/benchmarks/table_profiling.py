@@ -0,0 +1,139 @@
+"""Benchmark single-scan table profiling against per-column quality queries.
+
+Builds a wide SQLite table, configures completeness on every column,
+uniqueness on two columns and range rules on every numeric column, then
+times the checkers:
+
+- per-column: the previous path, one or two COUNT(*) queries per column and
+  rule plus a row count per checker
+- fused: one aggregate query from TableProfiler, passed to the checkers
+
+A final line times the fused query with regex pattern rules added on every
+text column, which the per-column path cannot run on SQLite.
+
+Run from the data-quality-monitor directory:
+
+    python -m benchmarks.table_profiling
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from src.database_connector import DatabaseConnector
+from src.quality_checks import AccuracyChecker, CompletenessChecker, UniquenessChecker
+from src.table_profiler import TableProfiler
+
+
+def build_table(connector: DatabaseConnector, rows: int, columns: int) -> tuple:
+    """Create a wide table with nulls, blanks and out-of-range values."""
+    rng = np.random.default_rng(7)
+    text_columns = [f"t{i}" for i in range(columns // 2)]
+    int_columns = [f"n{i}" for i in range(columns - len(text_columns))]
+
+    definitions = ", ".join(
+        ["id INTEGER PRIMARY KEY"]
+        + [f"{name} TEXT" for name in text_columns]
+        + [f"{name} INTEGER" for name in int_columns]
+    )
+    names = text_columns + int_columns
+    placeholders = ", ".join("?" for _ in names)
+
+    with connector.engine.begin() as conn:
+        conn.exec_driver_sql(f"CREATE TABLE wide ({definitions})")
+        for start in range(0, rows, 50_000):
+            count = min(50_000, rows - start)
+            data = []
+            for name in text_columns:
+                values = np.char.add("user", rng.integers(0, rows, count).astype(str))
+                values = values.astype(object)
+                values[rng.random(count) < 0.02] = None
+                values[rng.random(count) < 0.01] = " "
+                data.append(values)
+            for name in int_columns:
+                values = rng.integers(-5, 1000, count).astype(object)
+                values[rng.random(count) < 0.02] = None
+                data.append(values)
+            conn.exec_driver_sql(
+                f"INSERT INTO wide ({', '.join(names)}) VALUES ({placeholders})",
+                [tuple(row) for row in zip(*data)],
+            )
+
+    return text_columns, int_columns
+
+
+def run_checks(connector: DatabaseConnector, checks: list[dict], profile=None) -> list:
+    """Run the completeness, uniqueness and accuracy checkers for the table."""
+    completeness = CompletenessChecker(connector, {})
+    uniqueness = UniquenessChecker(connector, {})
+    accuracy = AccuracyChecker(connector, {"check_pattern_matching": False})
+    return [
+        completeness.check_table("wide", checks[0]["columns"], profile),
+        uniqueness.check_table("wide", checks[1]["columns"], profile),
+        accuracy.check_table("wide", checks[2]["columns"], profile),
+    ]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000, help="Table rows")
+    parser.add_argument("--columns", type=int, default=60, help="Table columns")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        connector = DatabaseConnector(
+            "bench", f"sqlite:///{Path(tmp) / 'wide.db'}", "sqlite"
+        )
+        connector.connect()
+        text_columns, int_columns = build_table(connector, args.rows, args.columns)
+
+        checks = [
+            {"type": "completeness", "columns": text_columns + int_columns},
+            {"type": "uniqueness", "columns": text_columns[:2]},
+            {
+                "type": "accuracy",
+                "columns": [{"name": name, "min": 0, "max": 999} for name in int_columns],
+            },
+        ]
+        quality_config = {"accuracy": {"check_pattern_matching": False}}
+
+        start = time.perf_counter()
+        per_column = run_checks(connector, checks)
+        per_column_seconds = time.perf_counter() - start
+
+        profiler = TableProfiler(connector)
+        start = time.perf_counter()
+        plan = profiler.plan_for_checks("wide", checks, quality_config)
+        profile = profiler.profile("wide", plan)
+        fused = run_checks(connector, checks, profile)
+        fused_seconds = time.perf_counter() - start
+
+        for old, new in zip(per_column[:1] + per_column[2:], fused[:1] + fused[2:]):
+            assert old.score == new.score
+
+        checks[2]["columns"] += [
+            {"name": name, "pattern": "^user[0-9]+$"} for name in text_columns
+        ]
+        start = time.perf_counter()
+        plan = profiler.plan_for_checks("wide", checks, {})
+        profiler.profile("wide", plan)
+        pattern_seconds = time.perf_counter() - start
+
+        connector.disconnect()
+
+    scans = 2 * len(checks[0]["columns"]) + 2 + len(int_columns) + 3
+    print(f"table: {args.rows} rows x {args.columns} columns")
+    print(f"per-column: {per_column_seconds:.2f}s ({scans} queries)")
+    print(f"fused: {fused_seconds:.2f}s (1 query)")
+    print(f"fused with {len(text_columns)} pattern rules: {pattern_seconds:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
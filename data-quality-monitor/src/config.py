@@ -17,6 +17,18 @@ class DatabaseConfig(BaseModel):
     type: str = Field(..., description="Database type (postgresql, mysql, sqlite)")
     connection_string: str = Field(..., description="Database connection string")
     enabled: bool = Field(default=True, description="Whether database is enabled")
+    pool_size: int = Field(
+        default=5, ge=1, description="Connections kept open in the pool"
+    )
+    max_overflow: int = Field(
+        default=10, ge=0, description="Extra connections allowed beyond pool_size"
+    )
+    max_connections: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Tables checked at once on this database "
+        "(default: execution.max_connections_per_database)",
+    )
 
 
 class CompletenessConfig(BaseModel):
@@ -101,6 +113,26 @@ class TimelinessConfig(BaseModel):
     )
 
 
+class SamplingConfig(BaseModel):
+    """Sampled quality check configuration."""
+
+    sample_rows: int = Field(
+        default=100000, ge=1, description="Approximate rows sampled per table"
+    )
+    confidence_level: float = Field(
+        default=0.95, gt=0.0, lt=1.0, description="Confidence level for rate intervals"
+    )
+
+
+class IncrementalConfig(BaseModel):
+    """Incremental quality check configuration."""
+
+    state_file: str = Field(
+        default="state/quality_state.json",
+        description="File holding each table's watermark and running totals",
+    )
+
+
 class QualityChecksConfig(BaseModel):
     """Quality checks configuration."""
 
@@ -119,6 +151,31 @@ class QualityChecksConfig(BaseModel):
     timeliness: TimelinessConfig = Field(
         default_factory=TimelinessConfig, description="Timeliness checks"
     )
+    fused_profiling: bool = Field(
+        default=True,
+        description="Gather each table's completeness, uniqueness and accuracy "
+        "counts in one aggregate query",
+    )
+    sampling: SamplingConfig = Field(
+        default_factory=SamplingConfig, description="Sampled checks"
+    )
+    incremental: IncrementalConfig = Field(
+        default_factory=IncrementalConfig, description="Incremental checks"
+    )
+
+
+class ExecutionConfig(BaseModel):
+    """Concurrent check execution configuration."""
+
+    max_workers: int = Field(
+        default=8, ge=1, description="Tables checked at once across all databases"
+    )
+    max_connections_per_database: int = Field(
+        default=4, ge=1, description="Tables checked at once on one database"
+    )
+    query_timeout_seconds: Optional[float] = Field(
+        default=None, gt=0, description="Cancel queries running longer than this"
+    )
 
 
 class ReportingConfig(BaseModel):
@@ -1,25 +1,52 @@
 """Database connection management for multiple database types."""
 
 import logging
-from typing import Optional
+import re
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
 
-from sqlalchemy import create_engine, inspect
-from sqlalchemy.engine import Engine
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.exc import SQLAlchemyError
 
 logger = logging.getLogger(__name__)
 
 
+def _sqlite_regexp(pattern: str, value) -> Optional[bool]:
+    """REGEXP operator for SQLite, which has none built in."""
+    if pattern is None or value is None:
+        return None
+    return re.search(pattern, str(value)) is not None
+
+
+def _register_sqlite_functions(dbapi_connection, connection_record) -> None:
+    """Register Python functions on each new SQLite connection."""
+    dbapi_connection.create_function("regexp", 2, _sqlite_regexp)
+
+
 class DatabaseConnector:
     """Manages connections to multiple databases."""
 
-    def __init__(self, name: str, connection_string: str, db_type: str = "postgresql"):
+    def __init__(
+        self,
+        name: str,
+        connection_string: str,
+        db_type: str = "postgresql",
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        query_timeout: Optional[float] = None,
+    ):
         """Initialize database connector.
 
         Args:
             name: Database identifier.
             connection_string: SQLAlchemy connection string.
             db_type: Database type (postgresql, mysql, sqlite).
+            pool_size: Connections kept open in the engine's pool.
+            max_overflow: Extra connections allowed beyond pool_size.
+            query_timeout: Seconds after which a query is cancelled, or None
+                for no limit.
 
         Raises:
             ValueError: If database type is not supported.
@@ -27,6 +54,9 @@ class DatabaseConnector:
         self.name = name
         self.connection_string = connection_string
         self.db_type = db_type.lower()
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.query_timeout = query_timeout
         self.engine: Optional[Engine] = None
 
         if self.db_type not in ["postgresql", "mysql", "sqlite"]:
@@ -39,17 +69,57 @@ class DatabaseConnector:
             True if connection successful, False otherwise.
         """
         try:
+            pool_options = {}
+            if self.db_type != "sqlite":
+                pool_options = {
+                    "pool_size": self.pool_size,
+                    "max_overflow": self.max_overflow,
+                }
             self.engine = create_engine(
-                self.connection_string, pool_pre_ping=True, echo=False
+                self.connection_string, pool_pre_ping=True, echo=False, **pool_options
             )
+            if self.db_type == "sqlite":
+                event.listen(self.engine, "connect", _register_sqlite_functions)
+            elif self.query_timeout:
+                event.listen(self.engine, "connect", self._set_statement_timeout)
             with self.engine.connect() as conn:
-                conn.execute("SELECT 1")
+                conn.execute(text("SELECT 1"))
             logger.info(f"Connected to database: {self.name}")
             return True
         except SQLAlchemyError as e:
             logger.error(f"Failed to connect to database {self.name}: {e}")
             return False
 
+    def _set_statement_timeout(self, dbapi_connection, connection_record) -> None:
+        """Limit statement run time on each new PostgreSQL or MySQL connection."""
+        milliseconds = int(self.query_timeout * 1000)
+        if self.db_type == "postgresql":
+            statement = f"SET statement_timeout = {milliseconds}"
+        else:
+            statement = f"SET SESSION max_execution_time = {milliseconds}"
+
+        cursor = dbapi_connection.cursor()
+        cursor.execute(statement)
+        cursor.close()
+        dbapi_connection.commit()
+
+    @contextmanager
+    def _sqlite_deadline(self, connection: Connection) -> Iterator[None]:
+        """Interrupt a SQLite query that runs past query_timeout."""
+        if self.db_type != "sqlite" or not self.query_timeout:
+            yield
+            return
+
+        raw_connection = connection.connection.driver_connection
+        deadline = time.monotonic() + self.query_timeout
+        raw_connection.set_progress_handler(
+            lambda: int(time.monotonic() > deadline), 10000
+        )
+        try:
+            yield
+        finally:
+            raw_connection.set_progress_handler(None, 0)
+
     def disconnect(self) -> None:
         """Close database connection."""
         if self.engine:
@@ -140,11 +210,31 @@ class DatabaseConnector:
             )
             return []
 
-    def execute_query(self, query: str) -> list[dict]:
+    @contextmanager
+    def connection(self) -> Iterator[Connection]:
+        """Check out one pooled connection for several queries.
+
+        Yields:
+            SQLAlchemy connection, returned to the pool on exit.
+
+        Raises:
+            RuntimeError: If not connected to database.
+        """
+        if not self.engine:
+            raise RuntimeError(f"Not connected to database: {self.name}")
+
+        with self.engine.connect() as conn:
+            yield conn
+
+    def execute_query(
+        self, query: str, connection: Optional[Connection] = None
+    ) -> list[dict]:
         """Execute a SQL query and return results.
 
         Args:
             query: SQL query string.
+            connection: Connection from connection() to run on. If None, a
+                connection is checked out of the pool for this query.
 
         Returns:
             List of dictionaries representing query results.
@@ -157,14 +247,22 @@ class DatabaseConnector:
             raise RuntimeError(f"Not connected to database: {self.name}")
 
         try:
+            if connection is not None:
+                return self._fetch(connection, query)
+
             with self.engine.connect() as conn:
-                result = conn.execute(query)
-                columns = result.keys()
-                return [dict(zip(columns, row)) for row in result]
+                return self._fetch(conn, query)
         except SQLAlchemyError as e:
             logger.error(f"Query execution failed on {self.name}: {e}")
             raise
 
+    def _fetch(self, connection: Connection, query: str) -> list[dict]:
+        """Run a query within the timeout and return rows as dictionaries."""
+        with self._sqlite_deadline(connection):
+            result = connection.execute(text(query))
+            columns = result.keys()
+            return [dict(zip(columns, row)) for row in result]
+
     def get_row_count(self, table_name: str) -> int:
         """Get total row count for a table.
 
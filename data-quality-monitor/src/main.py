@@ -10,12 +10,15 @@ import sys
 from pathlib import Path
 from typing import Optional
 
-from src.config import get_settings, load_config
+from src.config import load_config
 from src.database_connector import DatabaseConnector
 from src.integrity_validator import IntegrityValidator
+from src.profile_state import ProfileStateStore
 from src.quality_checks import AccuracyChecker, CompletenessChecker, UniquenessChecker
 from src.remediation_planner import RemediationPlanner
+from src.scheduler import QualityCheckScheduler, TableTask
 from src.scorecard_generator import Scorecard, ScorecardGenerator
+from src.table_profiler import TableProfiler
 
 
 def setup_logging(log_config: dict) -> None:
@@ -47,120 +50,303 @@ def setup_logging(log_config: dict) -> None:
     root_logger.addHandler(console_handler)
 
 
-def process_database_quality(
-    db_config: dict,
-    table_configs: list[dict],
+class DatabaseRun:
+    """Connector, checkers and scorecard shared by one database's table checks."""
+
+    def __init__(self, db_config: dict, quality_config: dict, execution_config: dict):
+        """Initialize database run.
+
+        Args:
+            db_config: Database configuration.
+            quality_config: Quality checks configuration.
+            execution_config: Execution configuration.
+        """
+        self.db_config = db_config
+        self.name = db_config["name"]
+        self.max_connections = db_config.get(
+            "max_connections", execution_config.get("max_connections_per_database", 4)
+        )
+        self.connector = DatabaseConnector(
+            name=self.name,
+            connection_string=db_config["connection_string"],
+            db_type=db_config["type"],
+            pool_size=db_config.get("pool_size", 5),
+            max_overflow=db_config.get("max_overflow", 10),
+            query_timeout=execution_config.get("query_timeout_seconds"),
+        )
+        self.scorecard = Scorecard(database_name=self.name)
+        self.completeness_checker = CompletenessChecker(
+            self.connector, quality_config.get("completeness", {})
+        )
+        self.uniqueness_checker = UniquenessChecker(
+            self.connector, quality_config.get("uniqueness", {})
+        )
+        self.accuracy_checker = AccuracyChecker(
+            self.connector, quality_config.get("accuracy", {})
+        )
+        self.integrity_validator = IntegrityValidator(
+            self.connector, quality_config.get("consistency", {})
+        )
+        self.remediation_planner = RemediationPlanner()
+        self.profiler = TableProfiler(self.connector)
+
+
+def check_table(
+    run: DatabaseRun,
+    table_config: dict,
     quality_config: dict,
-    reporting_config: dict,
-    settings: object,
-) -> Scorecard:
-    """Process data quality monitoring for a database.
+    state_store: ProfileStateStore,
+) -> dict:
+    """Run one table's configured checks.
+
+    Shared state is only read, except that an incremental table replaces
+    its own entry in state_store. Each table has its own key, so tables can
+    be checked concurrently; the caller adds the returned results to the
+    scorecard and saves state_store.
 
     Args:
-        db_config: Database configuration.
-        table_configs: List of table configurations to check.
+        run: Database run the table belongs to.
+        table_config: Table configuration with name and checks.
         quality_config: Quality checks configuration.
-        reporting_config: Reporting configuration.
-        settings: Application settings.
+        state_store: Running totals for incremental tables.
 
     Returns:
-        Scorecard with quality results.
+        Dictionary with results, integrity_issues, remediation_plans and
+        profile summary (None for full scans).
     """
     logger = logging.getLogger(__name__)
+    table_name = table_config["name"]
+    logger.info(f"Processing table: {run.name}.{table_name}")
+
+    table_checks = table_config.get("checks", [])
+    results = []
+    integrity_issues = []
+    remediation_plans = {}
+    profiler = run.profiler
+    sampling_config = quality_config.get("sampling", {})
+
+    mode = table_config.get("mode", "full")
+    profile = None
+    if quality_config.get("fused_profiling", True) or mode != "full":
+        plan = profiler.plan_for_checks(table_name, table_checks, quality_config)
+        if mode == "sample":
+            profile = profiler.sample_profile(
+                table_name,
+                plan,
+                table_config.get("sample_rows", sampling_config.get("sample_rows", 100000)),
+            )
+        elif mode == "incremental":
+            profile, state = profiler.incremental_profile(
+                table_name,
+                plan,
+                table_config["watermark_column"],
+                state_store.get(run.name, table_name),
+            )
+            if state is not None:
+                state_store.set(run.name, table_name, state)
+        elif not plan.is_empty():
+            profile = profiler.profile(table_name, plan)
+
+        if mode != "full" and profile is None:
+            logger.warning(
+                f"{mode.capitalize()} profiling failed for {table_name}, "
+                "running full per-column checks"
+            )
+
+    for check_config in table_checks:
+        check_type = check_config.get("type")
+
+        if check_type == "completeness" and quality_config.get(
+            "completeness", {}
+        ).get("enabled", True):
+            columns = check_config.get("columns")
+            result = run.completeness_checker.check_table(table_name, columns, profile)
+            results.append(result)
+
+        elif check_type == "uniqueness" and quality_config.get(
+            "uniqueness", {}
+        ).get("enabled", True):
+            columns = check_config.get("columns")
+            result = run.uniqueness_checker.check_table(table_name, columns, profile)
+            results.append(result)
+
+        elif check_type == "accuracy" and quality_config.get(
+            "accuracy", {}
+        ).get("enabled", True):
+            column_checks = check_config.get("columns", [])
+            result = run.accuracy_checker.check_table(
+                table_name, column_checks, profile
+            )
+            results.append(result)
+
+        elif check_type == "consistency" and quality_config.get(
+            "consistency", {}
+        ).get("enabled", True):
+            fk_config = check_config.get("foreign_keys", [])
+            issues = run.integrity_validator.validate_foreign_keys(table_name, fk_config)
+            integrity_issues.extend(issues)
+
+            for issue in issues:
+                remediation_plans[f"{table_name}_{issue.issue_type}"] = (
+                    run.remediation_planner.create_plan_from_integrity_issue(issue)
+                )
+
+    for result in results:
+        if not result.passed:
+            remediation_plans[f"{table_name}_{result.check_type}"] = (
+                run.remediation_planner.create_plan_from_quality_result(result)
+            )
+
+    confidence_level = sampling_config.get("confidence_level", 0.95)
+    return {
+        "results": results,
+        "integrity_issues": integrity_issues,
+        "remediation_plans": remediation_plans,
+        "profile": profile.summary(confidence_level)
+        if profile and profile.mode != "full"
+        else None,
+    }
+
+
+def run_quality_checks(
+    database_jobs: list[tuple[dict, list[dict]]],
+    quality_config: dict,
+    execution_config: Optional[dict] = None,
+) -> tuple[list[Scorecard], dict[str, Exception]]:
+    """Check every table of every database concurrently.
+
+    Tables from all databases share one worker pool, largest first, with
+    at most max_connections_per_database tables of a database in flight at
+    once. Wall time approaches that of the slowest table instead of the sum
+    over all tables.
+
+    Args:
+        database_jobs: Pairs of database configuration and its table configs.
+        quality_config: Quality checks configuration.
+        execution_config: Execution configuration (workers, connection
+            limits, query timeout).
 
-    connector = DatabaseConnector(
-        name=db_config["name"],
-        connection_string=db_config["connection_string"],
-        db_type=db_config["type"],
+    Returns:
+        Tuple of (scorecards in database order, errors by database name for
+        databases that could not be checked).
+    """
+    logger = logging.getLogger(__name__)
+    execution_config = execution_config or {}
+    state_store = ProfileStateStore(
+        Path(quality_config.get("incremental", {}).get("state_file", "state/quality_state.json"))
     )
 
-    if not connector.connect():
-        logger.error(f"Failed to connect to database: {db_config['name']}")
-        raise ConnectionError(f"Failed to connect to database: {db_config['name']}")
+    runs: list[DatabaseRun] = []
+    errors: dict[str, Exception] = {}
+    tasks: list[TableTask] = []
 
-    try:
-        scorecard = Scorecard(database_name=db_config["name"])
+    for db_config, table_configs in database_jobs:
+        try:
+            run = DatabaseRun(db_config, quality_config, execution_config)
+        except ValueError as e:
+            logger.error(f"Invalid database configuration {db_config['name']}: {e}")
+            errors[db_config["name"]] = e
+            continue
 
-        completeness_checker = CompletenessChecker(
-            connector, quality_config.get("completeness", {})
-        )
-        uniqueness_checker = UniquenessChecker(
-            connector, quality_config.get("uniqueness", {})
+        if not run.connector.connect():
+            logger.error(f"Failed to connect to database: {run.name}")
+            errors[run.name] = ConnectionError(f"Failed to connect to database: {run.name}")
+            continue
+
+        runs.append(run)
+        estimates = run.profiler.estimate_row_counts(
+            [table_config["name"] for table_config in table_configs]
         )
-        accuracy_checker = AccuracyChecker(
-            connector, quality_config.get("accuracy", {})
+        for table_config in table_configs:
+            tasks.append(
+                TableTask(run.name, table_config, estimates.get(table_config["name"], 0))
+            )
+
+    try:
+        runs_by_name = {run.name: run for run in runs}
+        scheduler = QualityCheckScheduler(
+            max_workers=execution_config.get("max_workers", 8),
+            database_limits={run.name: run.max_connections for run in runs},
         )
-        integrity_validator = IntegrityValidator(
-            connector, quality_config.get("consistency", {})
+        scheduler.run(
+            tasks,
+            lambda task: check_table(
+                runs_by_name[task.database_name],
+                task.table_config,
+                quality_config,
+                state_store,
+            ),
         )
-        remediation_planner = RemediationPlanner()
 
-        for table_config in table_configs:
-            table_name = table_config["name"]
-            logger.info(f"Processing table: {table_name}")
-
-            table_checks = table_config.get("checks", [])
-            results = []
-
-            for check_config in table_checks:
-                check_type = check_config.get("type")
-
-                if check_type == "completeness" and quality_config.get(
-                    "completeness", {}
-                ).get("enabled", True):
-                    columns = check_config.get("columns")
-                    result = completeness_checker.check_table(table_name, columns)
-                    results.append(result)
-
-                elif check_type == "uniqueness" and quality_config.get(
-                    "uniqueness", {}
-                ).get("enabled", True):
-                    columns = check_config.get("columns")
-                    result = uniqueness_checker.check_table(table_name, columns)
-                    results.append(result)
-
-                elif check_type == "accuracy" and quality_config.get(
-                    "accuracy", {}
-                ).get("enabled", True):
-                    column_checks = check_config.get("columns", [])
-                    result = accuracy_checker.check_table(table_name, column_checks)
-                    results.append(result)
-
-                elif check_type == "consistency" and quality_config.get(
-                    "consistency", {}
-                ).get("enabled", True):
-                    fk_config = check_config.get("foreign_keys", [])
-                    integrity_issues = integrity_validator.validate_foreign_keys(
-                        table_name, fk_config
-                    )
-                    scorecard.add_integrity_issues(integrity_issues)
-
-                    for issue in integrity_issues:
-                        plan = remediation_planner.create_plan_from_integrity_issue(
-                            issue
-                        )
-                        scorecard.remediation_plans[f"{table_name}_{issue.issue_type}"] = (
-                            plan
-                        )
-
-            scorecard.add_table_result(table_name, results)
-
-            for result in results:
-                if not result.passed:
-                    plan = remediation_planner.create_plan_from_quality_result(result)
-                    scorecard.remediation_plans[f"{table_name}_{result.check_type}"] = plan
-
-        scorecard.calculate_overall_score()
-
-        logger.info(
-            f"Completed quality monitoring for {db_config['name']}: "
-            f"Overall score: {scorecard.overall_score:.2%}"
-        )
+        for task in tasks:
+            if task.error is not None:
+                continue
+
+            scorecard = runs_by_name[task.database_name].scorecard
+            scorecard.add_table_result(
+                task.table_name,
+                task.result["results"],
+                task.result["profile"],
+                duration_seconds=task.duration_seconds,
+            )
+            scorecard.add_integrity_issues(task.result["integrity_issues"])
+            scorecard.remediation_plans.update(task.result["remediation_plans"])
+            logger.info(
+                f"Checked {task.database_name}.{task.table_name} "
+                f"in {task.duration_seconds:.2f}s"
+            )
+
+        if any(
+            table_config.get("mode") == "incremental"
+            for _, table_configs in database_jobs
+            for table_config in table_configs
+        ):
+            state_store.save()
+
+        for run in runs:
+            run.scorecard.calculate_overall_score()
+            logger.info(
+                f"Completed quality monitoring for {run.name}: "
+                f"Overall score: {run.scorecard.overall_score:.2%}"
+            )
 
-        return scorecard
+        return [run.scorecard for run in runs], errors
 
     finally:
-        connector.disconnect()
+        for run in runs:
+            run.connector.disconnect()
+
+
+def process_database_quality(
+    db_config: dict,
+    table_configs: list[dict],
+    quality_config: dict,
+    reporting_config: dict,
+    settings: object,
+    execution_config: Optional[dict] = None,
+) -> Scorecard:
+    """Process data quality monitoring for a database.
+
+    Args:
+        db_config: Database configuration.
+        table_configs: List of table configurations to check.
+        quality_config: Quality checks configuration.
+        reporting_config: Reporting configuration.
+        settings: Application settings.
+        execution_config: Execution configuration.
+
+    Returns:
+        Scorecard with quality results.
+
+    Raises:
+        ConnectionError: If the database cannot be reached.
+    """
+    scorecards, errors = run_quality_checks(
+        [(db_config, table_configs)], quality_config, execution_config
+    )
+    if errors:
+        raise errors[db_config["name"]]
+    return scorecards[0]
 
 
 def main() -> None:
@@ -185,7 +371,6 @@ def main() -> None:
 
     try:
         config = load_config(args.config) if args.config else load_config()
-        settings = get_settings()
     except Exception as e:
         print(f"Configuration error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -206,7 +391,7 @@ def main() -> None:
         template_path=reporting_config.get("scorecard_template"),
     )
 
-    scorecards = []
+    database_jobs = []
 
     for db_config in databases:
         if not db_config.get("enabled", True):
@@ -223,12 +408,17 @@ def main() -> None:
             logger.warning(f"No tables configured for database: {db_config['name']}")
             continue
 
-        try:
-            scorecard = process_database_quality(
-                db_config, db_tables, quality_config, reporting_config, settings
-            )
-            scorecards.append(scorecard)
+        database_jobs.append((db_config, db_tables))
 
+    scorecards, errors = run_quality_checks(
+        database_jobs, quality_config, config.get("execution", {})
+    )
+
+    for db_name, error in errors.items():
+        print(f"Error processing database {db_name}: {error}", file=sys.stderr)
+
+    for scorecard in scorecards:
+        try:
             output_formats = reporting_config.get("output_format", ["html", "json"])
 
             if "json" in output_formats:
@@ -252,8 +442,11 @@ def main() -> None:
             print(f"Reports generated in: {output_dir}")
 
         except Exception as e:
-            logger.error(f"Error processing database {db_config['name']}: {e}")
-            print(f"Error processing database {db_config['name']}: {e}", file=sys.stderr)
+            logger.error(f"Error reporting database {scorecard.database_name}: {e}")
+            print(
+                f"Error reporting database {scorecard.database_name}: {e}",
+                file=sys.stderr,
+            )
             continue
 
     if not scorecards:
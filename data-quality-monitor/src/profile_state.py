@@ -0,0 +1,61 @@
+"""Persists running totals for incremental quality checks."""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ProfileStateStore:
+    """Stores each table's watermark and running metric totals in a JSON file."""
+
+    def __init__(self, state_file: Path):
+        """Initialize state store.
+
+        Args:
+            state_file: Path to the JSON state file.
+        """
+        self.state_file = Path(state_file)
+        self.states: dict[str, dict] = {}
+
+        if self.state_file.exists():
+            try:
+                with open(self.state_file, "r", encoding="utf-8") as f:
+                    self.states = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(
+                    f"Could not read profile state {self.state_file}, starting fresh: {e}"
+                )
+
+    def get(self, database_name: str, table_name: str) -> Optional[dict]:
+        """Return the stored state for a table, if any.
+
+        Args:
+            database_name: Name of the database.
+            table_name: Name of the table.
+
+        Returns:
+            State dictionary or None.
+        """
+        return self.states.get(f"{database_name}/{table_name}")
+
+    def set(self, database_name: str, table_name: str, state: dict) -> None:
+        """Replace the stored state for a table.
+
+        Args:
+            database_name: Name of the database.
+            table_name: Name of the table.
+            state: State dictionary returned by the profiler.
+        """
+        self.states[f"{database_name}/{table_name}"] = state
+
+    def save(self) -> None:
+        """Write all states to the state file atomically."""
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_file.with_suffix(self.state_file.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.states, f, indent=2)
+        os.replace(tmp_path, self.state_file)
@@ -8,10 +8,20 @@ import pandas as pd
 from sqlalchemy import text
 
 from src.database_connector import DatabaseConnector
+from src.table_profiler import TableProfile
 
 logger = logging.getLogger(__name__)
 
 
+def _row_count(
+    connector: DatabaseConnector, table_name: str, profile: Optional[TableProfile]
+) -> int:
+    """Row count from a profile, or a COUNT(*) query without one."""
+    if profile is not None:
+        return profile.row_count
+    return connector.get_row_count(table_name)
+
+
 class QualityCheckResult:
     """Result of a quality check."""
 
@@ -60,19 +70,24 @@ class CompletenessChecker:
         self.threshold = config.get("threshold", 0.95)
 
     def check_table(
-        self, table_name: str, columns: Optional[list[str]] = None
+        self,
+        table_name: str,
+        columns: Optional[list[str]] = None,
+        profile: Optional[TableProfile] = None,
     ) -> QualityCheckResult:
         """Check completeness for a table.
 
         Args:
             table_name: Name of the table to check.
             columns: List of columns to check. If None, checks all columns.
+            profile: Counts from a single profiling scan. Columns missing
+                from it are queried individually.
 
         Returns:
             QualityCheckResult with completeness metrics.
         """
         issues = []
-        total_rows = self.connector.get_row_count(table_name)
+        total_rows = _row_count(self.connector, table_name, profile)
 
         if total_rows == 0:
             return QualityCheckResult(
@@ -95,6 +110,7 @@ class CompletenessChecker:
         for column in columns:
             try:
                 if self.config.get("check_null_percentage", True):
+                    null_count = profile.null_count(column) if profile else None
                     null_query = (
                         f'SELECT COUNT(*) as null_count FROM "{table_name}" '
                         f'WHERE "{column}" IS NULL'
@@ -105,8 +121,9 @@ class CompletenessChecker:
                             f"WHERE `{column}` IS NULL"
                         )
 
-                    result = self.connector.execute_query(null_query)
-                    null_count = result[0]["null_count"] if result else 0
+                    if null_count is None:
+                        result = self.connector.execute_query(null_query)
+                        null_count = result[0]["null_count"] if result else 0
                     null_percentage = null_count / total_rows if total_rows > 0 else 0
 
                     if null_percentage > (1 - self.threshold):
@@ -122,6 +139,7 @@ class CompletenessChecker:
                     null_counts[column] = null_percentage
 
                 if self.config.get("check_empty_strings", True):
+                    empty_count = profile.empty_count(column) if profile else None
                     empty_query = (
                         f'SELECT COUNT(*) as empty_count FROM "{table_name}" '
                         f'WHERE "{column}" = \'\' OR TRIM("{column}") = \'\''
@@ -132,8 +150,9 @@ class CompletenessChecker:
                             f"WHERE `{column}` = '' OR TRIM(`{column}`) = ''"
                         )
 
-                    result = self.connector.execute_query(empty_query)
-                    empty_count = result[0]["empty_count"] if result else 0
+                    if empty_count is None:
+                        result = self.connector.execute_query(empty_query)
+                        empty_count = result[0]["empty_count"] if result else 0
                     empty_percentage = empty_count / total_rows if total_rows > 0 else 0
 
                     if empty_percentage > (1 - self.threshold):
@@ -192,19 +211,26 @@ class UniquenessChecker:
         self.threshold = config.get("threshold", 0.98)
 
     def check_table(
-        self, table_name: str, columns: Optional[list[str]] = None
+        self,
+        table_name: str,
+        columns: Optional[list[str]] = None,
+        profile: Optional[TableProfile] = None,
     ) -> QualityCheckResult:
         """Check uniqueness for a table.
 
         Args:
             table_name: Name of the table to check.
             columns: List of columns to check. If None, checks primary keys.
+            profile: Counts from a single profiling scan; columns missing
+                from it are queried individually. Either way, duplicates
+                are non-NULL rows repeating an earlier value (COUNT - COUNT
+                DISTINCT).
 
         Returns:
             QualityCheckResult with uniqueness metrics.
         """
         issues = []
-        total_rows = self.connector.get_row_count(table_name)
+        total_rows = _row_count(self.connector, table_name, profile)
 
         if total_rows == 0:
             return QualityCheckResult(
@@ -228,18 +254,20 @@ class UniquenessChecker:
         for column in columns:
             try:
                 if self.config.get("check_duplicate_records", True):
+                    duplicate_count = profile.duplicate_count(column) if profile else None
                     duplicate_query = (
-                        f'SELECT "{column}", COUNT(*) as count FROM "{table_name}" '
-                        f'GROUP BY "{column}" HAVING COUNT(*) > 1'
+                        f'SELECT COUNT("{column}") - COUNT(DISTINCT "{column}") '
+                        f'as duplicate_count FROM "{table_name}"'
                     )
                     if self.connector.db_type == "mysql":
                         duplicate_query = (
-                            f"SELECT `{column}`, COUNT(*) as count FROM `{table_name}` "
-                            f"GROUP BY `{column}` HAVING COUNT(*) > 1"
+                            f"SELECT COUNT(`{column}`) - COUNT(DISTINCT `{column}`) "
+                            f"as duplicate_count FROM `{table_name}`"
                         )
 
-                    result = self.connector.execute_query(duplicate_query)
-                    duplicate_count = len(result)
+                    if duplicate_count is None:
+                        result = self.connector.execute_query(duplicate_query)
+                        duplicate_count = result[0]["duplicate_count"] if result else 0
                     duplicate_percentage = (
                         duplicate_count / total_rows if total_rows > 0 else 0
                     )
@@ -295,19 +323,26 @@ class AccuracyChecker:
         self.threshold = config.get("threshold", 0.85)
 
     def check_table(
-        self, table_name: str, column_checks: Optional[list[dict]] = None
+        self,
+        table_name: str,
+        column_checks: Optional[list[dict]] = None,
+        profile: Optional[TableProfile] = None,
     ) -> QualityCheckResult:
         """Check accuracy for a table.
 
         Args:
             table_name: Name of the table to check.
             column_checks: List of column-specific checks with patterns, ranges, etc.
+                Patterns are regular expressions that may match anywhere in
+                a value; anchor them with ^ and $ to require a full match.
+            profile: Counts from a single profiling scan. Rules missing from
+                it are queried individually.
 
         Returns:
             QualityCheckResult with accuracy metrics.
         """
         issues = []
-        total_rows = self.connector.get_row_count(table_name)
+        total_rows = _row_count(self.connector, table_name, profile)
 
         if total_rows == 0 or not column_checks:
             return QualityCheckResult(
@@ -328,20 +363,32 @@ class AccuracyChecker:
             try:
                 if "pattern" in check and self.config.get("check_pattern_matching", True):
                     pattern = check["pattern"]
+                    invalid_count = (
+                        profile.pattern_invalid_count(column_name, pattern)
+                        if profile
+                        else None
+                    )
                     invalid_query = (
                         f'SELECT COUNT(*) as invalid_count FROM "{table_name}" '
                         f'WHERE "{column_name}" IS NOT NULL '
-                        f'AND "{column_name}" NOT SIMILAR TO \'{pattern}\''
+                        f'AND "{column_name}" NOT REGEXP \'{pattern}\''
                     )
-                    if self.connector.db_type == "mysql":
+                    if self.connector.db_type == "postgresql":
+                        invalid_query = (
+                            f'SELECT COUNT(*) as invalid_count FROM "{table_name}" '
+                            f'WHERE "{column_name}" IS NOT NULL '
+                            f'AND CAST("{column_name}" AS TEXT) !~ \'{pattern}\''
+                        )
+                    elif self.connector.db_type == "mysql":
                         invalid_query = (
                             f"SELECT COUNT(*) as invalid_count FROM `{table_name}` "
                             f"WHERE `{column_name}` IS NOT NULL "
                             f"AND `{column_name}` NOT REGEXP '{pattern}'"
                         )
 
-                    result = self.connector.execute_query(invalid_query)
-                    invalid_count = result[0]["invalid_count"] if result else 0
+                    if invalid_count is None:
+                        result = self.connector.execute_query(invalid_query)
+                        invalid_count = result[0]["invalid_count"] if result else 0
                     invalid_percentage = invalid_count / total_rows if total_rows > 0 else 0
 
                     if invalid_percentage > (1 - self.threshold):
@@ -370,6 +417,9 @@ class AccuracyChecker:
                         conditions.append(f'"{column_name}" {op} {max_val}')
 
                     if conditions:
+                        invalid_count = (
+                            profile.range_invalid_count(check) if profile else None
+                        )
                         invalid_query = (
                             f'SELECT COUNT(*) as invalid_count FROM "{table_name}" '
                             f'WHERE "{column_name}" IS NOT NULL '
@@ -389,8 +439,9 @@ class AccuracyChecker:
                                 f"AND NOT ({') AND ('.join(conditions_mysql)})"
                             )
 
-                        result = self.connector.execute_query(invalid_query)
-                        invalid_count = result[0]["invalid_count"] if result else 0
+                        if invalid_count is None:
+                            result = self.connector.execute_query(invalid_query)
+                            invalid_count = result[0]["invalid_count"] if result else 0
                         invalid_percentage = (
                             invalid_count / total_rows if total_rows > 0 else 0
                         )
@@ -0,0 +1,99 @@
+"""Runs table checks concurrently across databases."""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TableTask:
+    """One table's checks, queued on its database's connection budget."""
+
+    def __init__(self, database_name: str, table_config: dict, estimated_rows: int = 0):
+        """Initialize table task.
+
+        Args:
+            database_name: Name of the database holding the table.
+            table_config: Table configuration with name and checks.
+            estimated_rows: Approximate table size, used for ordering.
+        """
+        self.database_name = database_name
+        self.table_config = table_config
+        self.estimated_rows = estimated_rows
+        self.result: Any = None
+        self.error: Optional[Exception] = None
+        self.duration_seconds: float = 0.0
+
+    @property
+    def table_name(self) -> str:
+        """Name of the table."""
+        return self.table_config["name"]
+
+
+class QualityCheckScheduler:
+    """Runs table tasks largest first under global and per-database limits.
+
+    A task is only handed to a worker once its database has a free
+    connection slot, so workers never sit blocked waiting for a busy
+    database while another database has work ready.
+    """
+
+    def __init__(self, max_workers: int = 8, database_limits: Optional[dict] = None):
+        """Initialize scheduler.
+
+        Args:
+            max_workers: Maximum number of tables checked at once.
+            database_limits: Maximum concurrent tables per database name.
+                Databases not listed are limited only by max_workers.
+        """
+        self.max_workers = max(1, max_workers)
+        self.database_limits = database_limits or {}
+
+    def run(self, tasks: list[TableTask], run_task: Callable[[TableTask], Any]) -> list[TableTask]:
+        """Run every task and record its result, error and duration.
+
+        Args:
+            tasks: Tasks to run.
+            run_task: Function called with each task in a worker thread.
+
+        Returns:
+            The tasks, with result or error and duration_seconds filled in.
+        """
+        pending = sorted(tasks, key=lambda task: task.estimated_rows, reverse=True)
+        running: dict[Future, TableTask] = {}
+        active = {task.database_name: 0 for task in tasks}
+
+        def timed(task: TableTask) -> Any:
+            start = time.perf_counter()
+            try:
+                return run_task(task)
+            finally:
+                task.duration_seconds = time.perf_counter() - start
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending or running:
+                for task in list(pending):
+                    if len(running) >= self.max_workers:
+                        break
+                    limit = self.database_limits.get(task.database_name)
+                    if limit is not None and active[task.database_name] >= max(1, limit):
+                        continue
+                    pending.remove(task)
+                    active[task.database_name] += 1
+                    running[executor.submit(timed, task)] = task
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = running.pop(future)
+                    active[task.database_name] -= 1
+                    try:
+                        task.result = future.result()
+                    except Exception as e:
+                        logger.error(
+                            f"Checks failed for {task.database_name}.{task.table_name}: {e}"
+                        )
+                        task.error = e
+
+        return tasks
@@ -34,13 +34,20 @@ class Scorecard:
         self.remediation_plans: dict[str, RemediationPlan] = {}
 
     def add_table_result(
-        self, table_name: str, results: list[QualityCheckResult]
+        self,
+        table_name: str,
+        results: list[QualityCheckResult],
+        profile: Optional[dict] = None,
+        duration_seconds: Optional[float] = None,
     ) -> None:
         """Add quality check results for a table.
 
         Args:
             table_name: Name of the table.
             results: List of QualityCheckResult objects.
+            profile: How the counts were gathered when not a full scan, e.g.
+                sample size and confidence intervals or the watermark reached.
+            duration_seconds: Wall time spent checking the table.
         """
         scores = {}
         passed_checks = 0
@@ -64,6 +71,10 @@ class Scorecard:
             "passed_checks": passed_checks,
             "total_checks": total_checks,
         }
+        if profile:
+            self.table_results[table_name]["profile"] = profile
+        if duration_seconds is not None:
+            self.table_results[table_name]["duration_seconds"] = duration_seconds
 
     def add_integrity_issues(self, issues: list[IntegrityIssue]) -> None:
         """Add integrity issues to scorecard.
@@ -243,6 +254,8 @@ class ScorecardGenerator:
                         "Average Score": result["average_score"],
                         "Passed Checks": result["passed_checks"],
                         "Total Checks": result["total_checks"],
+                        "Profile Mode": result.get("profile", {}).get("mode", "full"),
+                        "Seconds": result.get("duration_seconds"),
                     }
                 )
             pd.DataFrame(table_scores).to_excel(
@@ -298,6 +311,7 @@ class ScorecardGenerator:
                     <th>Average Score</th>
                     <th>Passed Checks</th>
                     <th>Total Checks</th>
+                    <th>Seconds</th>
                 </tr>
         """
 
@@ -308,6 +322,7 @@ class ScorecardGenerator:
                     <td>{result['average_score']:.2%}</td>
                     <td>{result['passed_checks']}</td>
                     <td>{result['total_checks']}</td>
+                    <td>{result.get('duration_seconds', 0.0):.2f}</td>
                 </tr>
             """
 
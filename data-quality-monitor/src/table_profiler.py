@@ -0,0 +1,630 @@
+"""Single-scan table profiling for data quality checks."""
+
+import json
+import logging
+from decimal import Decimal
+from statistics import NormalDist
+from typing import Optional
+
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.database_connector import DatabaseConnector
+
+logger = logging.getLogger(__name__)
+
+
+class ProfilePlan:
+    """Column metrics to gather for one table."""
+
+    def __init__(self):
+        """Initialize an empty profile plan."""
+        self.null_columns: list[str] = []
+        self.empty_columns: list[str] = []
+        self.distinct_columns: list[str] = []
+        self.patterns: list[tuple[str, str]] = []
+        self.ranges: list[dict] = []
+
+    def is_empty(self) -> bool:
+        """Whether the plan requests no column metrics."""
+        return not (
+            self.null_columns
+            or self.empty_columns
+            or self.distinct_columns
+            or self.patterns
+            or self.ranges
+        )
+
+
+RATE_NAMES = {
+    "null": "null_rate",
+    "empty": "empty_rate",
+    "duplicates": "duplicate_rate",
+    "pattern": "pattern_invalid_rate",
+    "range": "range_invalid_rate",
+}
+
+
+def wilson_interval(count: int, total: int, confidence_level: float) -> tuple[float, float]:
+    """Wilson score interval for a proportion.
+
+    Args:
+        count: Number of matching rows in the sample.
+        total: Sample size.
+        confidence_level: Confidence level, e.g. 0.95.
+
+    Returns:
+        Tuple of (lower, upper) bounds.
+    """
+    if total <= 0:
+        return 0.0, 1.0
+
+    z = NormalDist().inv_cdf((1 + confidence_level) / 2)
+    p = count / total
+    denominator = 1 + z * z / total
+    center = (p + z * z / (2 * total)) / denominator
+    margin = z * ((p * (1 - p) / total + z * z / (4 * total * total)) ** 0.5) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+def _encode_key(key: tuple) -> str:
+    """Serialize a metric key for the state file."""
+    return json.dumps(list(key))
+
+
+def _decode_key(key: str) -> tuple:
+    """Parse a metric key from the state file."""
+    return tuple(json.loads(key))
+
+
+def _watermark_value(value):
+    """Normalize a watermark read from the database for storage and SQL."""
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, (int, float)):
+        return value
+    return str(value)
+
+
+def _range_key(check: dict) -> tuple:
+    """Metric key for a range rule."""
+    return (
+        "range",
+        check["name"],
+        check.get("min"),
+        check.get("max"),
+        check.get("min_inclusive", True),
+        check.get("max_inclusive", True),
+    )
+
+
+class TableProfile:
+    """Aggregate counts gathered for a table in one scan."""
+
+    def __init__(
+        self, table_name: str, row_count: int, metrics: dict, mode: str = "full"
+    ):
+        """Initialize table profile.
+
+        Args:
+            table_name: Name of the profiled table.
+            row_count: Number of rows the counts cover (the sample size in
+                sample mode, the running total in incremental mode).
+            metrics: Mapping of metric key to count.
+            mode: How the counts were gathered: full, sample or incremental.
+        """
+        self.table_name = table_name
+        self.row_count = row_count
+        self.metrics = metrics
+        self.mode = mode
+        self.rows_scanned = row_count
+        self.estimated_rows: Optional[int] = None
+        self.watermark_column: Optional[str] = None
+        self.watermark = None
+
+    def null_count(self, column: str) -> Optional[int]:
+        """Number of NULL values in a column, if profiled."""
+        return self.metrics.get(("null", column))
+
+    def empty_count(self, column: str) -> Optional[int]:
+        """Number of empty or whitespace-only values in a column, if profiled."""
+        return self.metrics.get(("empty", column))
+
+    def duplicate_count(self, column: str) -> Optional[int]:
+        """Number of non-NULL rows repeating an earlier value, if profiled."""
+        return self.metrics.get(("duplicates", column))
+
+    def pattern_invalid_count(self, column: str, pattern: str) -> Optional[int]:
+        """Number of non-NULL values not matching a pattern, if profiled."""
+        return self.metrics.get(("pattern", column, pattern))
+
+    def range_invalid_count(self, check: dict) -> Optional[int]:
+        """Number of non-NULL values outside a range rule, if profiled."""
+        return self.metrics.get(_range_key(check))
+
+    def confidence_intervals(self, confidence_level: float) -> dict[str, dict]:
+        """Estimated rates with Wilson intervals for every profiled metric.
+
+        Args:
+            confidence_level: Confidence level, e.g. 0.95.
+
+        Returns:
+            Mapping of "column.metric_rate" to rate, lower and upper bound.
+        """
+        intervals = {}
+        for key, count in self.metrics.items():
+            name = f"{key[1]}.{RATE_NAMES[key[0]]}"
+            if name in intervals:
+                name = f"{name}[{len([n for n in intervals if n.startswith(name)])}]"
+            lower, upper = wilson_interval(count, self.row_count, confidence_level)
+            intervals[name] = {
+                "rate": count / self.row_count if self.row_count else 0.0,
+                "lower": lower,
+                "upper": upper,
+            }
+        return intervals
+
+    def summary(self, confidence_level: float = 0.95) -> dict:
+        """Describe how the profile was gathered, for the scorecard.
+
+        Args:
+            confidence_level: Confidence level for sample intervals.
+
+        Returns:
+            Dictionary with mode, row counts and mode-specific details.
+        """
+        summary = {
+            "mode": self.mode,
+            "row_count": self.row_count,
+            "rows_scanned": self.rows_scanned,
+        }
+        if self.mode == "sample":
+            summary["estimated_rows"] = self.estimated_rows
+            summary["confidence_level"] = confidence_level
+            summary["intervals"] = self.confidence_intervals(confidence_level)
+        elif self.mode == "incremental":
+            summary["watermark_column"] = self.watermark_column
+            summary["watermark"] = self.watermark
+        return summary
+
+
+class TableProfiler:
+    """Compiles a table's quality checks into one aggregate query."""
+
+    def __init__(self, connector: DatabaseConnector):
+        """Initialize table profiler.
+
+        Args:
+            connector: Database connector instance.
+        """
+        self.connector = connector
+        self.db_type = connector.db_type
+
+    def plan_for_checks(
+        self, table_name: str, table_checks: list[dict], quality_config: dict
+    ) -> ProfilePlan:
+        """Collect the metrics a table's configured checks will need.
+
+        Column defaults mirror the checkers: completeness covers every
+        column and uniqueness falls back to the primary key (or the first
+        column) when no columns are configured.
+
+        Args:
+            table_name: Name of the table.
+            table_checks: Check configurations for the table.
+            quality_config: Quality checks configuration.
+
+        Returns:
+            ProfilePlan for the table.
+        """
+        plan = ProfilePlan()
+        column_info = None
+
+        def table_columns() -> list[dict]:
+            nonlocal column_info
+            if column_info is None:
+                column_info = self.connector.get_table_columns(table_name)
+            return column_info
+
+        for check_config in table_checks:
+            check_type = check_config.get("type")
+            type_config = quality_config.get(check_type, {})
+            if not type_config.get("enabled", True):
+                continue
+
+            if check_type == "completeness":
+                columns = check_config.get("columns") or [
+                    col["name"] for col in table_columns()
+                ]
+                if type_config.get("check_null_percentage", True):
+                    plan.null_columns.extend(columns)
+                if type_config.get("check_empty_strings", True):
+                    plan.empty_columns.extend(columns)
+
+            elif check_type == "uniqueness":
+                if not type_config.get("check_duplicate_records", True):
+                    continue
+                columns = check_config.get("columns")
+                if not columns:
+                    info = table_columns()
+                    columns = [col["name"] for col in info if col["primary_key"]]
+                    columns = columns or [col["name"] for col in info[:1]]
+                plan.distinct_columns.extend(columns)
+
+            elif check_type == "accuracy":
+                for check in check_config.get("columns", []):
+                    if not check.get("name"):
+                        continue
+                    if "pattern" in check and type_config.get(
+                        "check_pattern_matching", True
+                    ):
+                        plan.patterns.append((check["name"], check["pattern"]))
+                    if check.get("min") is not None or check.get("max") is not None:
+                        plan.ranges.append(check)
+
+        return plan
+
+    def build_query(
+        self,
+        table_name: str,
+        plan: ProfilePlan,
+        source: Optional[str] = None,
+        where: Optional[str] = None,
+    ) -> tuple[str, list[tuple]]:
+        """Render the aggregate query for a plan.
+
+        Args:
+            table_name: Name of the table.
+            plan: Metrics to gather.
+            source: FROM clause to use instead of the table, e.g. a sample.
+            where: Row filter, e.g. a watermark range.
+
+        Returns:
+            Tuple of (SQL query, metric keys in select-list order after the
+            leading row count).
+        """
+        expressions: dict[tuple, str] = {}
+
+        for column in plan.null_columns:
+            quoted = self._quote(column)
+            expressions[("null", column)] = self._count_where(f"{quoted} IS NULL")
+
+        for column in plan.empty_columns:
+            text = self._as_text(self._quote(column))
+            expressions[("empty", column)] = self._count_where(f"TRIM({text}) = ''")
+
+        for column in plan.distinct_columns:
+            quoted = self._quote(column)
+            expressions[("non_null", column)] = f"COUNT({quoted})"
+            expressions[("distinct", column)] = f"COUNT(DISTINCT {quoted})"
+
+        for column, pattern in plan.patterns:
+            quoted = self._quote(column)
+            expressions[("pattern", column, pattern)] = self._count_where(
+                f"{quoted} IS NOT NULL AND NOT ({self._regex_match(quoted, pattern)})"
+            )
+
+        for check in plan.ranges:
+            quoted = self._quote(check["name"])
+            conditions = []
+            if check.get("min") is not None:
+                op = ">=" if check.get("min_inclusive", True) else ">"
+                conditions.append(f"{quoted} {op} {self._literal(check['min'])}")
+            if check.get("max") is not None:
+                op = "<=" if check.get("max_inclusive", True) else "<"
+                conditions.append(f"{quoted} {op} {self._literal(check['max'])}")
+            expressions[_range_key(check)] = self._count_where(
+                f"{quoted} IS NOT NULL AND NOT ({' AND '.join(conditions)})"
+            )
+
+        keys = list(expressions)
+        select_list = ["COUNT(*) AS row_count"] + [
+            f"{expressions[key]} AS m{i}" for i, key in enumerate(keys)
+        ]
+        query = (
+            f"SELECT {', '.join(select_list)} "
+            f"FROM {source or self._quote(table_name)}"
+        )
+        if where:
+            query += f" WHERE {where}"
+        return query, keys
+
+    def profile(
+        self,
+        table_name: str,
+        plan: ProfilePlan,
+        source: Optional[str] = None,
+        where: Optional[str] = None,
+        connection: Optional[Connection] = None,
+    ) -> Optional[TableProfile]:
+        """Gather every planned metric for a table in one scan.
+
+        Args:
+            table_name: Name of the table.
+            plan: Metrics to gather.
+            source: FROM clause to use instead of the table.
+            where: Row filter.
+            connection: Pooled connection to run on.
+
+        Returns:
+            TableProfile, or None if the query failed and checks should
+            fall back to per-column queries.
+        """
+        query, keys = self.build_query(table_name, plan, source, where)
+
+        try:
+            result = self.connector.execute_query(query, connection)
+        except SQLAlchemyError as e:
+            logger.warning(f"Profiling query failed for {table_name}, falling back: {e}")
+            return None
+
+        row = result[0] if result else {}
+        metrics = {key: int(row.get(f"m{i}") or 0) for i, key in enumerate(keys)}
+        for column in dict.fromkeys(plan.distinct_columns):
+            metrics[("duplicates", column)] = metrics.pop(
+                ("non_null", column)
+            ) - metrics.pop(("distinct", column))
+        return TableProfile(table_name, int(row.get("row_count") or 0), metrics)
+
+    def sample_profile(
+        self, table_name: str, plan: ProfilePlan, sample_rows: int
+    ) -> Optional[TableProfile]:
+        """Estimate every planned metric from a random sample of rows.
+
+        Tables no larger than sample_rows are profiled in full. Duplicate
+        counts only see repeats inside the sample, so the duplicate rate is
+        a lower bound on the table's.
+
+        Args:
+            table_name: Name of the table.
+            plan: Metrics to gather.
+            sample_rows: Approximate number of rows to sample.
+
+        Returns:
+            TableProfile in sample mode (or full mode for small tables), or
+            None if the query failed.
+        """
+        estimated_rows = self.estimate_row_count(table_name)
+        if estimated_rows <= sample_rows:
+            return self.profile(table_name, plan)
+
+        fraction = sample_rows / estimated_rows
+        profile = self.profile(
+            table_name, plan, source=self._sample_source(table_name, fraction)
+        )
+        if profile is not None and profile.row_count == 0:
+            logger.warning(
+                f"Sample of {table_name} returned no rows, profiling the full table"
+            )
+            return self.profile(table_name, plan)
+
+        if profile is not None:
+            profile.mode = "sample"
+            profile.estimated_rows = estimated_rows
+        return profile
+
+    def incremental_profile(
+        self,
+        table_name: str,
+        plan: ProfilePlan,
+        watermark_column: str,
+        state: Optional[dict] = None,
+    ) -> tuple[Optional[TableProfile], Optional[dict]]:
+        """Profile only rows past the stored watermark and merge running totals.
+
+        The new high watermark is read first and used as an upper bound, so
+        rows written during the run are left for the next one. A new row
+        counts as a duplicate if its value repeats within the batch or
+        already exists at or below the previous watermark. With a timestamp
+        watermark such as updated_at, updated rows are counted again, so
+        totals describe row versions rather than rows.
+
+        Args:
+            table_name: Name of the table.
+            plan: Metrics to gather.
+            watermark_column: Monotonically increasing column, e.g. an id.
+            state: Running totals returned by the previous run, or None.
+
+        Returns:
+            Tuple of (TableProfile over the running totals, new state), or
+            (None, state) if the profiling query failed.
+        """
+        signature = json.dumps(vars(plan), sort_keys=True, default=str)
+        if state and state.get("plan") != signature:
+            logger.info(f"Checks for {table_name} changed, restarting running totals")
+            state = None
+
+        totals = state or {"plan": signature, "watermark": None, "row_count": 0, "metrics": {}}
+        last = totals["watermark"]
+        column = self._quote(watermark_column)
+        table = self._quote(table_name)
+        rows_scanned = 0
+
+        with self.connector.connection() as conn:
+            result = self.connector.execute_query(
+                f"SELECT MAX({column}) AS watermark FROM {table}", conn
+            )
+            high = result[0]["watermark"] if result else None
+            high = _watermark_value(high) if high is not None else last
+
+            if high is not None and high != last:
+                where = f"{column} <= {self._literal(high)}"
+                if last is not None:
+                    where = f"{column} > {self._literal(last)} AND {where}"
+
+                batch = self.profile(table_name, plan, where=where, connection=conn)
+                if batch is None:
+                    return None, state
+
+                if last is not None:
+                    for unique_column in dict.fromkeys(plan.distinct_columns):
+                        batch.metrics[("duplicates", unique_column)] += self._seen_values(
+                            table_name, unique_column, watermark_column, last, high, conn
+                        )
+
+                rows_scanned = batch.row_count
+                totals["row_count"] += batch.row_count
+                for key, count in batch.metrics.items():
+                    encoded = _encode_key(key)
+                    totals["metrics"][encoded] = totals["metrics"].get(encoded, 0) + count
+                totals["watermark"] = high
+
+        metrics = {_decode_key(key): count for key, count in totals["metrics"].items()}
+        profile = TableProfile(table_name, totals["row_count"], metrics, mode="incremental")
+        profile.rows_scanned = rows_scanned
+        profile.watermark_column = watermark_column
+        profile.watermark = totals["watermark"]
+        return profile, totals
+
+    def estimate_row_count(self, table_name: str) -> int:
+        """Estimate a table's row count from catalog statistics.
+
+        Uses pg_class.reltuples on PostgreSQL, information_schema on MySQL
+        and MAX(rowid) on SQLite, falling back to COUNT(*) when no estimate
+        is available.
+
+        Args:
+            table_name: Name of the table.
+
+        Returns:
+            Estimated number of rows.
+        """
+        literal = self._literal(table_name)
+        if self.db_type == "postgresql":
+            query = (
+                "SELECT reltuples AS estimate FROM pg_class "
+                f"WHERE oid = to_regclass({self._literal(self._quote(table_name))})"
+            )
+        elif self.db_type == "mysql":
+            query = (
+                "SELECT TABLE_ROWS AS estimate FROM information_schema.TABLES "
+                f"WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = {literal}"
+            )
+        else:
+            query = f"SELECT MAX(rowid) AS estimate FROM {self._quote(table_name)}"
+
+        try:
+            result = self.connector.execute_query(query)
+            estimate = result[0]["estimate"] if result else None
+        except SQLAlchemyError:
+            estimate = None
+
+        if estimate is None or estimate <= 0:
+            return self.connector.get_row_count(table_name)
+        return int(estimate)
+
+    def estimate_row_counts(self, table_names: list[str]) -> dict[str, int]:
+        """Estimate several tables' row counts with one catalog query.
+
+        Used to order tables for scheduling, so tables without an estimate
+        get 0 rather than a COUNT(*).
+
+        Args:
+            table_names: Names of the tables.
+
+        Returns:
+            Mapping of table name to estimated rows.
+        """
+        if not table_names:
+            return {}
+
+        names = ", ".join(self._literal(name) for name in table_names)
+        if self.db_type == "postgresql":
+            query = (
+                "SELECT c.relname AS table_name, c.reltuples AS estimate "
+                "FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace "
+                f"WHERE n.nspname = current_schema() AND c.relname IN ({names})"
+            )
+        elif self.db_type == "mysql":
+            query = (
+                "SELECT TABLE_NAME AS table_name, TABLE_ROWS AS estimate "
+                "FROM information_schema.TABLES "
+                f"WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME IN ({names})"
+            )
+        else:
+            query = " UNION ALL ".join(
+                f"SELECT {self._literal(name)} AS table_name, MAX(rowid) AS estimate "
+                f"FROM {self._quote(name)}"
+                for name in table_names
+            )
+
+        estimates = dict.fromkeys(table_names, 0)
+        try:
+            for row in self.connector.execute_query(query):
+                estimates[row["table_name"]] = max(0, int(row["estimate"] or 0))
+        except SQLAlchemyError as e:
+            logger.warning(f"Could not estimate table sizes on {self.connector.name}: {e}")
+        return estimates
+
+    def _sample_source(self, table_name: str, fraction: float) -> str:
+        """FROM clause selecting roughly fraction of a table's rows at random."""
+        table = self._quote(table_name)
+        if self.db_type == "postgresql":
+            return f"{table} TABLESAMPLE BERNOULLI ({fraction * 100:.6f})"
+        if self.db_type == "mysql":
+            return f"(SELECT * FROM {table} WHERE RAND() < {fraction:.9f}) AS sampled"
+        threshold = max(1, int(fraction * 1_000_000))
+        return (
+            f"(SELECT * FROM {table} "
+            f"WHERE (ABS(RANDOM()) % 1000000) < {threshold}) AS sampled"
+        )
+
+    def _seen_values(
+        self,
+        table_name: str,
+        column: str,
+        watermark_column: str,
+        low,
+        high,
+        connection: Connection,
+    ) -> int:
+        """Count distinct new values that already occur at or below the old watermark."""
+        table = self._quote(table_name)
+        value = self._quote(column)
+        watermark = self._quote(watermark_column)
+        query = (
+            f"SELECT COUNT(DISTINCT n.{value}) AS seen FROM {table} n "
+            f"WHERE n.{watermark} > {self._literal(low)} "
+            f"AND n.{watermark} <= {self._literal(high)} "
+            f"AND n.{value} IN (SELECT o.{value} FROM {table} o "
+            f"WHERE o.{watermark} <= {self._literal(low)})"
+        )
+        result = self.connector.execute_query(query, connection)
+        return int(result[0]["seen"] or 0) if result else 0
+
+    def _quote(self, identifier: str) -> str:
+        """Quote an identifier for the connector's dialect."""
+        if self.db_type == "mysql":
+            return "`" + identifier.replace("`", "``") + "`"
+        return '"' + identifier.replace('"', '""') + '"'
+
+    def _literal(self, value) -> str:
+        """Render a range bound or pattern as a SQL literal."""
+        if isinstance(value, bool):
+            return str(int(value))
+        if isinstance(value, (int, float)):
+            return repr(value)
+        value = str(value).replace("'", "''")
+        if self.db_type == "mysql":
+            value = value.replace("\\", "\\\\")
+        return f"'{value}'"
+
+    def _as_text(self, expression: str) -> str:
+        """Cast an expression to text so string checks work on any column type."""
+        if self.db_type == "postgresql":
+            return f"CAST({expression} AS TEXT)"
+        if self.db_type == "mysql":
+            return f"CAST({expression} AS CHAR)"
+        return expression
+
+    def _regex_match(self, expression: str, pattern: str) -> str:
+        """Render a regular expression match for the connector's dialect."""
+        text = self._as_text(expression)
+        if self.db_type == "postgresql":
+            return f"{text} ~ {self._literal(pattern)}"
+        return f"{text} REGEXP {self._literal(pattern)}"
+
+    @staticmethod
+    def _count_where(condition: str) -> str:
+        """Count rows matching a condition inside an aggregate select."""
+        return f"SUM(CASE WHEN {condition} THEN 1 ELSE 0 END)"
@@ -1,13 +1,20 @@
 """Unit tests for data quality monitoring automation."""
 
+import threading
+import time
+
 import pytest
+from sqlalchemy.exc import SQLAlchemyError
 from unittest.mock import MagicMock, patch
 
 from src.database_connector import DatabaseConnector
 from src.quality_checks import CompletenessChecker, UniquenessChecker, AccuracyChecker
 from src.integrity_validator import IntegrityValidator
+from src.profile_state import ProfileStateStore
 from src.scorecard_generator import Scorecard, ScorecardGenerator
 from src.remediation_planner import RemediationPlanner
+from src.scheduler import QualityCheckScheduler, TableTask
+from src.table_profiler import TableProfiler
 
 
 @pytest.fixture
@@ -81,7 +88,7 @@ class TestUniquenessChecker:
         config = {"threshold": 0.98, "check_duplicate_records": True}
         checker = UniquenessChecker(mock_connector, config)
         mock_connector.get_row_count.return_value = 100
-        mock_connector.execute_query.return_value = []
+        mock_connector.execute_query.return_value = [{"duplicate_count": 0}]
 
         result = checker.check_table("test_table", ["email"])
 
@@ -93,9 +100,7 @@ class TestUniquenessChecker:
         config = {"threshold": 0.98, "check_duplicate_records": True}
         checker = UniquenessChecker(mock_connector, config)
         mock_connector.get_row_count.return_value = 100
-        mock_connector.execute_query.return_value = [
-            {"email": "test@example.com", "count": 2}
-        ]
+        mock_connector.execute_query.return_value = [{"duplicate_count": 5}]
 
         result = checker.check_table("test_table", ["email"])
 
@@ -136,6 +141,228 @@ class TestAccuracyChecker:
         assert result.score <= 1.0
 
 
+class TestTableProfiler:
+    """Tests for TableProfiler class."""
+
+    def test_profile_matches_per_column_queries(self, tmp_path):
+        """Test that one profiling scan gives the same counts as per-column queries."""
+        connector = DatabaseConnector(
+            "local", f"sqlite:///{tmp_path / 'quality.db'}", "sqlite"
+        )
+        assert connector.connect()
+        with connector.engine.begin() as conn:
+            conn.exec_driver_sql(
+                "CREATE TABLE users (id INTEGER PRIMARY KEY, email TEXT, age INTEGER)"
+            )
+            conn.exec_driver_sql(
+                "INSERT INTO users (email, age) VALUES "
+                "('a@example.com', 30), ('a@example.com', 200), ('bad', NULL), "
+                "(NULL, -1), ('  ', 40)"
+            )
+
+        table_checks = [
+            {"type": "completeness", "columns": ["email", "age"]},
+            {"type": "uniqueness", "columns": ["email"]},
+            {
+                "type": "accuracy",
+                "columns": [
+                    {"name": "email", "pattern": "^[^@]+@[^@]+$"},
+                    {"name": "age", "min": 0, "max": 150},
+                ],
+            },
+        ]
+        profiler = TableProfiler(connector)
+        plan = profiler.plan_for_checks("users", table_checks, {})
+        profile = profiler.profile("users", plan)
+
+        assert profile.row_count == 5
+        assert profile.null_count("email") == 1
+        assert profile.empty_count("email") == 1
+        assert profile.duplicate_count("email") == 1
+        assert profile.pattern_invalid_count("email", "^[^@]+@[^@]+$") == 2
+        assert profile.range_invalid_count(table_checks[2]["columns"][1]) == 2
+
+        checker = CompletenessChecker(connector, {"threshold": 0.95})
+        fused = checker.check_table("users", ["email", "age"], profile)
+        per_column = checker.check_table("users", ["email", "age"])
+        assert fused.score == per_column.score
+        assert fused.issues == per_column.issues
+        connector.disconnect()
+
+    def test_fused_and_per_column_checks_agree(self, tmp_path):
+        """Test that uniqueness and pattern checks count alike on both paths."""
+        connector = DatabaseConnector(
+            "local", f"sqlite:///{tmp_path / 'quality.db'}", "sqlite"
+        )
+        assert connector.connect()
+        with connector.engine.begin() as conn:
+            conn.exec_driver_sql("CREATE TABLE users (id INTEGER PRIMARY KEY, email TEXT)")
+            conn.exec_driver_sql(
+                "INSERT INTO users (email) VALUES ('a@x.io'), ('a@x.io'), ('a@x.io'), "
+                "('b@x.io'), ('b@x.io'), ('c at x'), (NULL), ('d@x.io')"
+            )
+
+        column_checks = [{"name": "email", "pattern": "@x"}]
+        table_checks = [
+            {"type": "uniqueness", "columns": ["email"]},
+            {"type": "accuracy", "columns": column_checks},
+        ]
+        profiler = TableProfiler(connector)
+        profile = profiler.profile(
+            "users", profiler.plan_for_checks("users", table_checks, {})
+        )
+
+        uniqueness = UniquenessChecker(connector, {"threshold": 0.98})
+        fused = uniqueness.check_table("users", ["email"], profile)
+        per_column = uniqueness.check_table("users", ["email"])
+        assert fused.issues == per_column.issues
+        assert fused.issues[0]["duplicate_count"] == 3
+
+        accuracy = AccuracyChecker(connector, {"threshold": 0.98})
+        fused = accuracy.check_table("users", column_checks, profile)
+        per_column = accuracy.check_table("users", column_checks)
+        assert fused.issues == per_column.issues
+        assert fused.issues[0]["invalid_count"] == 1
+        connector.disconnect()
+
+    def test_postgresql_pattern_fallback_uses_regex(self, mock_connector):
+        """Test that PostgreSQL per-column patterns use ~ like the fused scan."""
+        checker = AccuracyChecker(mock_connector, {"threshold": 0.85})
+        mock_connector.execute_query.return_value = [{"invalid_count": 0}]
+
+        checker.check_table("users", [{"name": "email", "pattern": "@x"}])
+
+        query = mock_connector.execute_query.call_args[0][0]
+        assert "SIMILAR TO" not in query
+        assert 'CAST("email" AS TEXT) !~ \'@x\'' in query
+
+    def test_incremental_and_sampled_profiles(self, tmp_path):
+        """Test that incremental totals match a full scan and samples carry intervals."""
+        connector = DatabaseConnector(
+            "local", f"sqlite:///{tmp_path / 'quality.db'}", "sqlite"
+        )
+        assert connector.connect()
+        with connector.engine.begin() as conn:
+            conn.exec_driver_sql("CREATE TABLE users (id INTEGER PRIMARY KEY, email TEXT)")
+            conn.exec_driver_sql(
+                "INSERT INTO users (email) VALUES ('a@x.io'), ('b@x.io'), (NULL)"
+            )
+
+        table_checks = [
+            {"type": "completeness", "columns": ["email"]},
+            {"type": "uniqueness", "columns": ["email"]},
+        ]
+        profiler = TableProfiler(connector)
+        plan = profiler.plan_for_checks("users", table_checks, {})
+        store = ProfileStateStore(tmp_path / "state.json")
+
+        profile, state = profiler.incremental_profile("users", plan, "id", None)
+        store.set("local", "users", state)
+        store.save()
+        assert profile.rows_scanned == 3
+
+        with connector.engine.begin() as conn:
+            conn.exec_driver_sql(
+                "INSERT INTO users (email) VALUES ('a@x.io'), ('c@x.io'), ('c@x.io')"
+            )
+        store = ProfileStateStore(tmp_path / "state.json")
+        profile, state = profiler.incremental_profile(
+            "users", plan, "id", store.get("local", "users")
+        )
+        full = profiler.profile("users", plan)
+
+        assert profile.rows_scanned == 3
+        assert profile.watermark == 6
+        assert profile.row_count == full.row_count == 6
+        assert profile.null_count("email") == full.null_count("email") == 1
+        assert profile.duplicate_count("email") == full.duplicate_count("email") == 2
+
+        with connector.engine.begin() as conn:
+            conn.exec_driver_sql(
+                "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n "
+                "WHERE i < 20000) INSERT INTO users (email) "
+                "SELECT CASE WHEN i % 10 = 0 THEN NULL ELSE 'u' || i END FROM n"
+            )
+        sample = profiler.sample_profile("users", plan, 2000)
+        summary = sample.summary(0.95)
+        interval = summary["intervals"]["email.null_rate"]
+
+        assert summary["mode"] == "sample"
+        assert 0 < sample.row_count < 20006
+        assert interval["lower"] <= interval["rate"] <= interval["upper"]
+        assert 0.05 < interval["rate"] < 0.15
+        assert interval["upper"] - interval["lower"] < 0.1
+        connector.disconnect()
+
+
+    def test_postgresql_samples_rows_independently(self, mock_connector):
+        """Test that PostgreSQL samples rows, not pages, for the intervals."""
+        profiler = TableProfiler(mock_connector)
+
+        source = profiler._sample_source("users", 0.02)
+
+        assert source == '"users" TABLESAMPLE BERNOULLI (2.000000)'
+
+
+class TestQualityCheckScheduler:
+    """Tests for QualityCheckScheduler class."""
+
+    def test_run_orders_largest_first_within_limits(self):
+        """Test that tasks start largest first without exceeding connection limits."""
+        lock = threading.Lock()
+        started = []
+        in_flight = {"a": 0, "b": 0}
+        peaks = {"a": 0, "b": 0, "total": 0}
+
+        def run_task(task):
+            with lock:
+                started.append(task.table_name)
+                in_flight[task.database_name] += 1
+                peaks[task.database_name] = max(
+                    peaks[task.database_name], in_flight[task.database_name]
+                )
+                peaks["total"] = max(peaks["total"], sum(in_flight.values()))
+            time.sleep(0.02)
+            with lock:
+                in_flight[task.database_name] -= 1
+            if task.table_name == "broken":
+                raise RuntimeError("query timed out")
+            return task.estimated_rows
+
+        tasks = [
+            TableTask("a", {"name": f"a{rows}"}, rows) for rows in (10, 500, 30, 70)
+        ] + [
+            TableTask("b", {"name": f"b{rows}"}, rows) for rows in (400, 20)
+        ] + [TableTask("b", {"name": "broken"}, 5)]
+
+        scheduler = QualityCheckScheduler(max_workers=3, database_limits={"a": 2, "b": 1})
+        scheduler.run(tasks, run_task)
+
+        assert set(started[:3]) == {"a500", "b400", "a70"}
+        assert peaks["a"] <= 2 and peaks["b"] == 1 and peaks["total"] <= 3
+        assert all(task.duration_seconds > 0 for task in tasks)
+        assert [task.result for task in tasks[:6]] == [10, 500, 30, 70, 400, 20]
+        assert isinstance(tasks[6].error, RuntimeError)
+
+    def test_sqlite_query_timeout(self, tmp_path):
+        """Test that a query running past the timeout is cancelled."""
+        connector = DatabaseConnector(
+            "local", f"sqlite:///{tmp_path / 'quality.db'}", "sqlite", query_timeout=0.2
+        )
+        assert connector.connect()
+        slow_query = (
+            "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n) "
+            "SELECT COUNT(*) AS count FROM n"
+        )
+
+        start = time.monotonic()
+        with pytest.raises(SQLAlchemyError):
+            connector.execute_query(slow_query)
+        assert time.monotonic() - start < 5
+        assert connector.execute_query("SELECT 1 AS one") == [{"one": 1}]
+        connector.disconnect()
+
+
 class TestScorecard:
     """Tests for Scorecard class."""
 
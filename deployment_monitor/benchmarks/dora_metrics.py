@@ -0,0 +1,130 @@
+"""Benchmark per service and environment DORA metrics.
+
+Builds years of synthetic deployment history, then times:
+
+- records: calculate_quality_metrics over each service and environment's
+  deployment list, filtered from the full list
+- store: DeploymentStore.group_metrics for every pair at once, plus the
+  overall rolling daily series
+
+Run from the repository root:
+
+    python -m deployment_monitor.benchmarks.dora_metrics
+"""
+
+import argparse
+import logging
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from deployment_monitor.src.main import (
+    DeploymentRecord,
+    DeploymentStatus,
+    DeploymentStore,
+    MetricsConfig,
+    calculate_quality_metrics,
+)
+
+STATUSES = np.array(["success"] * 17 + ["failed", "rolled_back", "partial"])
+ENVIRONMENTS = np.array(["production", "staging", "development"])
+
+
+def build_frame(deployments: int, years: int, services: int, seed: int = 7):
+    """Build a deployment frame shaped like load_deployment_store's frame."""
+    rng = np.random.default_rng(seed)
+    now = np.datetime64(datetime.now(), "s")
+    frame = pd.DataFrame(
+        {
+            "deployment_id": np.char.add(
+                "dep_", np.arange(deployments).astype(str)
+            ),
+            "timestamp": now
+            - rng.integers(0, years * 365 * 86400, deployments).astype(
+                "timedelta64[s]"
+            ),
+            "status": rng.choice(STATUSES, deployments),
+            "service": np.char.add(
+                "service_", rng.integers(0, services, deployments).astype(str)
+            ),
+            "environment": rng.choice(ENVIRONMENTS, deployments),
+            "version": np.char.add(
+                "1.", rng.integers(0, 500, deployments).astype(str)
+            ),
+        }
+    )
+    for column in ("status", "service", "environment", "version"):
+        frame[column] = frame[column].astype("category")
+    return frame
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--deployments", type=int, default=1_000_000, help="Deployments in history"
+    )
+    parser.add_argument("--years", type=int, default=5, help="Years of history")
+    parser.add_argument("--services", type=int, default=50, help="Distinct services")
+    parser.add_argument(
+        "--record-deployments",
+        type=int,
+        default=100_000,
+        help="History size for the record-based baseline",
+    )
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    config = MetricsConfig()
+    frame = build_frame(args.deployments, args.years, args.services)
+
+    start = time.perf_counter()
+    store = DeploymentStore(frame)
+    build_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    group_metrics = store.group_metrics(config)
+    store.quality_metrics(config)
+    store.daily_series(config)
+    store_seconds = time.perf_counter() - start
+
+    sample = frame.iloc[: args.record_deployments]
+    records = [
+        DeploymentRecord(
+            deployment_id=row.deployment_id,
+            timestamp=row.timestamp.to_pydatetime(),
+            status=DeploymentStatus(row.status),
+            environment=row.environment,
+            service=row.service,
+            version=row.version,
+        )
+        for row in sample.itertuples(index=False)
+    ]
+    start = time.perf_counter()
+    for service, environment in group_metrics:
+        calculate_quality_metrics(
+            [
+                d
+                for d in records
+                if d.service == service and d.environment == environment
+            ],
+            config,
+        )
+    records_seconds = time.perf_counter() - start
+
+    print(
+        f"store: {args.deployments} deployments over {args.years} years, "
+        f"{len(group_metrics)} service/environment pairs"
+    )
+    print(f"  build (sort): {build_seconds:.2f}s")
+    print(f"  all pair metrics + daily series: {store_seconds:.2f}s")
+    print(
+        f"records: {args.record_deployments} deployments, "
+        f"{len(group_metrics)} pairs: {records_seconds:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import yaml
 from pydantic import BaseModel, Field, field_validator
@@ -60,6 +61,9 @@ class DeploymentDataConfig(BaseModel):
     environment_column: Optional[str] = Field(
         default=None, description="Column name for environment"
     )
+    service_column: Optional[str] = Field(
+        default=None, description="Column name for service or team"
+    )
     version_column: Optional[str] = Field(
         default=None, description="Column name for version"
     )
@@ -112,6 +116,10 @@ class ReportConfig(BaseModel):
         default="logs/deployment_metrics.md",
         description="Path for metrics report",
     )
+    daily_series_path: Optional[str] = Field(
+        default="logs/deployment_daily_metrics.csv",
+        description="Path for rolling daily metrics CSV (None to skip)",
+    )
 
 
 class Config(BaseModel):
@@ -147,6 +155,7 @@ class DeploymentRecord:
     timestamp: datetime
     status: DeploymentStatus
     environment: Optional[str] = None
+    service: Optional[str] = None
     version: Optional[str] = None
     duration_seconds: Optional[float] = None
     error_message: Optional[str] = None
@@ -190,6 +199,9 @@ class DeploymentAnalysis:
     environment_breakdown: Dict[str, Dict[str, int]]
     version_success_rates: Dict[str, float]
     generated_at: datetime
+    service_environment_metrics: Dict[Tuple[str, str], QualityMetrics] = field(
+        default_factory=dict
+    )
 
 
 def load_config(config_path: Path) -> Config:
@@ -284,6 +296,10 @@ def load_deployment_data(
                 if pd.notna(row[config.environment_column]):
                     deployment.environment = str(row[config.environment_column])
 
+            if config.service_column and config.service_column in df.columns:
+                if pd.notna(row[config.service_column]):
+                    deployment.service = str(row[config.service_column])
+
             if config.version_column and config.version_column in df.columns:
                 if pd.notna(row[config.version_column]):
                     deployment.version = str(row[config.version_column])
@@ -649,6 +665,646 @@ def generate_version_success_rates(
     return success_rates
 
 
+_STATUS_VALUES = pd.Index([status.value for status in DeploymentStatus])
+_SUCCESS = _STATUS_VALUES.get_loc(DeploymentStatus.SUCCESS.value)
+_FAILED = _STATUS_VALUES.get_loc(DeploymentStatus.FAILED.value)
+_ROLLED_BACK = _STATUS_VALUES.get_loc(DeploymentStatus.ROLLED_BACK.value)
+_NS_PER_DAY = 86_400 * 10**9
+_NS_PER_HOUR = 3_600 * 10**9
+
+
+def _label_codes(
+    values: pd.Series, missing: Optional[str]
+) -> Tuple[np.ndarray, List[str]]:
+    """Return integer codes and string labels for a column.
+
+    Categorical columns are mapped through their categories without
+    touching each row. Missing values, including every row of an all-null
+    column, get the label missing, or code -1 if missing is None.
+    """
+    if not isinstance(values.dtype, pd.CategoricalDtype):
+        values = values.astype("category")
+    codes = values.cat.codes.to_numpy(dtype=np.int64)
+    if len(values.cat.categories) == 0:
+        labels: List[str] = []
+    else:
+        labels, remap = np.unique(
+            values.cat.categories.astype(str).to_numpy(dtype=str), return_inverse=True
+        )
+        labels = labels.tolist()
+        codes = np.where(codes >= 0, remap[np.maximum(codes, 0)], -1)
+    if missing is not None and (codes < 0).any():
+        if missing not in labels:
+            labels.append(missing)
+        codes[codes < 0] = labels.index(missing)
+    return codes, labels
+
+
+class DeploymentStore:
+    """Deployments held as timestamp-sorted columns.
+
+    Windows are located by binary search on the sorted timestamps, and
+    quality metrics for every (service, environment) pair are computed
+    together from grouped counts, so an analysis costs a few array passes
+    however long the history is. Missing services and environments are
+    grouped as "unknown". Ties keep their input order, as with sorted().
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        """Build a store from a deployment DataFrame.
+
+        Args:
+            frame: DataFrame with deployment_id, timestamp and status columns
+                and optional service, environment and version columns, as
+                built by load_deployment_store
+        """
+        frame = frame.iloc[
+            np.argsort(
+                frame["timestamp"].to_numpy(dtype="datetime64[ns]"), kind="stable"
+            )
+        ]
+        self.timestamps = frame["timestamp"].to_numpy(dtype="datetime64[ns]")
+        status_codes, status_labels = _label_codes(frame["status"], None)
+        self.status = np.where(
+            status_codes >= 0,
+            _STATUS_VALUES.get_indexer(status_labels)[np.maximum(status_codes, 0)],
+            -1,
+        ).astype(np.int8)
+        self.deployment_ids = frame["deployment_id"].astype(str).to_numpy(dtype=object)
+
+        empty = pd.Series([None] * len(frame), index=frame.index, dtype=object)
+        self.service_codes, self.service_names = _label_codes(
+            frame.get("service", empty), "unknown"
+        )
+        self.environment_codes, self.environment_names = _label_codes(
+            frame.get("environment", empty), "unknown"
+        )
+        self.version_codes, self.version_names = _label_codes(
+            frame.get("version", empty), None
+        )
+
+    @classmethod
+    def from_records(cls, deployments: List[DeploymentRecord]) -> "DeploymentStore":
+        """Build a store from deployment records.
+
+        Args:
+            deployments: List of deployment records
+
+        Returns:
+            Deployment store
+        """
+        return cls(
+            pd.DataFrame(
+                {
+                    "deployment_id": [d.deployment_id for d in deployments],
+                    "timestamp": pd.to_datetime(
+                        pd.Series([d.timestamp for d in deployments], dtype=object)
+                    ),
+                    "status": [d.status.value for d in deployments],
+                    "service": pd.Series(
+                        [d.service for d in deployments], dtype=object
+                    ),
+                    "environment": pd.Series(
+                        [d.environment for d in deployments], dtype=object
+                    ),
+                    "version": pd.Series(
+                        [d.version for d in deployments], dtype=object
+                    ),
+                }
+            )
+        )
+
+    def __len__(self) -> int:
+        """Return the number of deployments in the store."""
+        return len(self.timestamps)
+
+    def window(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> slice:
+        """Return the slice of deployments with start <= timestamp < end.
+
+        Args:
+            start: Window start (inclusive); None for the first deployment
+            end: Window end (exclusive); None for the last deployment
+
+        Returns:
+            Slice into the store's columns
+        """
+        lo = 0 if start is None else self._position(start)
+        hi = len(self) if end is None else self._position(end)
+        return slice(lo, max(lo, hi))
+
+    def _position(self, moment: datetime) -> int:
+        """Return the index of the first deployment at or after moment."""
+        return int(
+            np.searchsorted(self.timestamps, np.datetime64(moment, "ns"), side="left")
+        )
+
+    def select(
+        self, service: Optional[str] = None, environment: Optional[str] = None
+    ) -> "DeploymentStore":
+        """Return the deployments of one service and/or environment.
+
+        Args:
+            service: Service name ("unknown" for deployments without one)
+            environment: Environment name ("unknown" for deployments
+                without one)
+
+        Returns:
+            Deployment store with the matching deployments, still sorted
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if service is not None:
+            mask &= self._label_mask(self.service_codes, self.service_names, service)
+        if environment is not None:
+            mask &= self._label_mask(
+                self.environment_codes, self.environment_names, environment
+            )
+
+        subset = object.__new__(DeploymentStore)
+        subset.timestamps = self.timestamps[mask]
+        subset.status = self.status[mask]
+        subset.deployment_ids = self.deployment_ids[mask]
+        subset.service_codes = self.service_codes[mask]
+        subset.service_names = self.service_names
+        subset.environment_codes = self.environment_codes[mask]
+        subset.environment_names = self.environment_names
+        subset.version_codes = self.version_codes[mask]
+        subset.version_names = self.version_names
+        return subset
+
+    @staticmethod
+    def _label_mask(codes: np.ndarray, names: List[str], label: str) -> np.ndarray:
+        """Return a mask of rows whose code maps to label."""
+        if label not in names:
+            return np.zeros(len(codes), dtype=bool)
+        return codes == names.index(label)
+
+    def _group_codes(self) -> Tuple[np.ndarray, List[Tuple[str, str]]]:
+        """Return each deployment's (service, environment) group code."""
+        environment_count = len(self.environment_names)
+        groups = [
+            (service, environment)
+            for service in self.service_names
+            for environment in self.environment_names
+        ]
+        return self.service_codes * environment_count + self.environment_codes, groups
+
+    def _frequencies(
+        self,
+        window: slice,
+        window_days: int,
+        groups: np.ndarray,
+        group_count: int,
+        now: datetime,
+    ) -> np.ndarray:
+        """Deployments per day per group, as calculate_deployment_frequency.
+
+        Only deployments in window and within window_days of now count; the
+        divisor is window_days or the days since the group's first counted
+        deployment, whichever is smaller.
+        """
+        lo = max(window.start, self._position(now - timedelta(days=window_days)))
+        hi = max(lo, window.stop)
+        counts = np.bincount(groups[lo:hi], minlength=group_count)
+
+        present, first = np.unique(groups[lo:hi], return_index=True)
+        days_since_first = np.floor_divide(
+            (np.datetime64(now, "ns") - self.timestamps[lo + first]).view(np.int64),
+            _NS_PER_DAY,
+        )
+        days_covered = np.zeros(group_count, dtype=np.int64)
+        days_covered[present] = np.minimum(window_days, days_since_first + 1)
+
+        frequencies = np.zeros(group_count)
+        covered = days_covered > 0
+        frequencies[covered] = counts[covered] / days_covered[covered]
+        return frequencies
+
+    def _quality_metrics(
+        self,
+        groups: np.ndarray,
+        group_count: int,
+        config: MetricsConfig,
+        now: datetime,
+    ) -> List[QualityMetrics]:
+        """Calculate quality metrics for every group in one pass per window."""
+        failed = (self.status == _FAILED) | (self.status == _ROLLED_BACK)
+        status_counts = np.bincount(
+            groups * len(_STATUS_VALUES) + self.status,
+            minlength=group_count * len(_STATUS_VALUES),
+        ).reshape(group_count, len(_STATUS_VALUES))
+        totals = status_counts.sum(axis=1)
+
+        frequencies = self._frequencies(
+            self.window(),
+            config.deployment_frequency_window_days,
+            groups,
+            group_count,
+            now,
+        )
+
+        cfr_window = self.window(
+            now - timedelta(days=config.change_failure_rate_window_days)
+        )
+        cfr_totals = np.bincount(groups[cfr_window], minlength=group_count)
+        cfr_failed = np.bincount(
+            groups[cfr_window], weights=failed[cfr_window], minlength=group_count
+        )
+
+        mttr_window = self.window(now - timedelta(days=config.mttr_window_days))
+        mttr_failed = np.bincount(
+            groups[mttr_window], weights=failed[mttr_window], minlength=group_count
+        )
+        order = np.argsort(groups[mttr_window], kind="stable")
+        pair_groups = groups[mttr_window][order]
+        pair_status = self.status[mttr_window][order]
+        pair_times = self.timestamps[mttr_window][order].view(np.int64)
+        recovered = (
+            (pair_groups[:-1] == pair_groups[1:])
+            & failed[mttr_window][order][:-1]
+            & (pair_status[1:] == _SUCCESS)
+        )
+        recovery_hours = np.bincount(
+            pair_groups[:-1][recovered],
+            weights=(pair_times[1:] - pair_times[:-1])[recovered] / _NS_PER_HOUR,
+            minlength=group_count,
+        )
+        recoveries = np.bincount(pair_groups[:-1][recovered], minlength=group_count)
+
+        metrics = []
+        for group in range(group_count):
+            total = int(totals[group])
+            successful = int(status_counts[group, _SUCCESS])
+            success_rate = successful / total if total > 0 else 0.0
+            mttr = None
+            if mttr_failed[group] >= 2 and recoveries[group] > 0:
+                mttr = float(recovery_hours[group] / recoveries[group])
+            metrics.append(
+                QualityMetrics(
+                    deployment_frequency=float(frequencies[group]),
+                    success_rate=success_rate,
+                    failure_rate=1.0 - success_rate,
+                    change_failure_rate=(
+                        float(cfr_failed[group] / cfr_totals[group])
+                        if cfr_totals[group] > 0
+                        else 0.0
+                    ),
+                    mean_time_to_recovery=mttr,
+                    deployment_count=total,
+                    successful_deployments=successful,
+                    failed_deployments=int(status_counts[group, _FAILED]),
+                    rolled_back_deployments=int(status_counts[group, _ROLLED_BACK]),
+                )
+            )
+        return metrics
+
+    def quality_metrics(
+        self, config: MetricsConfig, now: Optional[datetime] = None
+    ) -> QualityMetrics:
+        """Calculate release quality metrics over all deployments.
+
+        Args:
+            config: Metrics configuration
+            now: Reference time for the metric windows (defaults to now)
+
+        Returns:
+            QualityMetrics object, as returned by calculate_quality_metrics
+        """
+        groups = np.zeros(len(self), dtype=np.int64)
+        return self._quality_metrics(groups, 1, config, now or datetime.now())[0]
+
+    def group_metrics(
+        self, config: MetricsConfig, now: Optional[datetime] = None
+    ) -> Dict[Tuple[str, str], QualityMetrics]:
+        """Calculate release quality metrics for every service and environment.
+
+        Args:
+            config: Metrics configuration
+            now: Reference time for the metric windows (defaults to now)
+
+        Returns:
+            Dictionary mapping (service, environment) to QualityMetrics, for
+            pairs with at least one deployment
+        """
+        groups, labels = self._group_codes()
+        metrics = self._quality_metrics(
+            groups, len(labels), config, now or datetime.now()
+        )
+        return {
+            label: group_metrics
+            for label, group_metrics in zip(labels, metrics)
+            if group_metrics.deployment_count > 0
+        }
+
+    def regression_patterns(
+        self, config: RegressionConfig, now: Optional[datetime] = None
+    ) -> List[RegressionPattern]:
+        """Identify regression patterns, as identify_regression_patterns.
+
+        Args:
+            config: Regression detection configuration
+            now: Reference time for the comparison windows (defaults to now)
+
+        Returns:
+            List of identified regression patterns
+        """
+        now = now or datetime.now()
+        baseline_end = now - timedelta(days=config.comparison_window_days)
+        baseline = self.window(
+            baseline_end - timedelta(days=config.lookback_window_days), baseline_end
+        )
+        comparison = self.window(baseline_end)
+        if baseline.start == baseline.stop or comparison.start == comparison.stop:
+            return []
+
+        baseline_success_rate = float(np.mean(self.status[baseline] == _SUCCESS))
+        comparison_success_rate = float(np.mean(self.status[comparison] == _SUCCESS))
+        affected_deployments = self.deployment_ids[comparison].tolist()
+        patterns = []
+
+        success_rate_drop = baseline_success_rate - comparison_success_rate
+        if success_rate_drop >= config.success_rate_threshold:
+            severity = (
+                RegressionSeverity.CRITICAL
+                if comparison_success_rate <= (1.0 - config.failure_rate_threshold)
+                else RegressionSeverity.HIGH
+            )
+            patterns.append(
+                RegressionPattern(
+                    pattern_type="success_rate_decline",
+                    severity=severity,
+                    description=(
+                        f"Success rate dropped from {baseline_success_rate:.1%} "
+                        f"to {comparison_success_rate:.1%}"
+                    ),
+                    baseline_metric=baseline_success_rate,
+                    current_metric=comparison_success_rate,
+                    change_percentage=success_rate_drop * 100,
+                    affected_deployments=affected_deployments,
+                )
+            )
+
+        groups = np.zeros(len(self), dtype=np.int64)
+        baseline_frequency = self._frequencies(
+            baseline, config.lookback_window_days, groups, 1, now
+        )[0]
+        comparison_frequency = self._frequencies(
+            comparison, config.comparison_window_days, groups, 1, now
+        )[0]
+
+        if baseline_frequency > 0:
+            frequency_change = (
+                (comparison_frequency - baseline_frequency) / baseline_frequency
+            ) * 100
+
+            if frequency_change < -20:
+                patterns.append(
+                    RegressionPattern(
+                        pattern_type="deployment_frequency_decline",
+                        severity=RegressionSeverity.MEDIUM,
+                        description=(
+                            f"Deployment frequency decreased by "
+                            f"{abs(frequency_change):.1f}%"
+                        ),
+                        baseline_metric=float(baseline_frequency),
+                        current_metric=float(comparison_frequency),
+                        change_percentage=float(frequency_change),
+                        affected_deployments=affected_deployments,
+                    )
+                )
+
+        return patterns
+
+    def daily_series(
+        self, config: MetricsConfig, now: Optional[datetime] = None
+    ) -> pd.DataFrame:
+        """Calculate daily deployment counts and rolling quality metrics.
+
+        Rolling metrics cover the configured window ending on each day,
+        in whole days: deployment_frequency is deployments per day over
+        deployment_frequency_window_days, change_failure_rate is failed or
+        rolled back deployments over change_failure_rate_window_days, and
+        mttr_hours averages failure-to-success recoveries that started in
+        the last mttr_window_days. Recoveries pair consecutive deployments
+        across the whole history, not within each window.
+
+        Args:
+            config: Metrics configuration
+            now: Last day of the series (defaults to now)
+
+        Returns:
+            DataFrame indexed by date from the first deployment to now
+        """
+        if len(self) == 0:
+            return pd.DataFrame()
+
+        now = now or datetime.now()
+        days = self.timestamps.astype("datetime64[D]").view(np.int64)
+        first_day = int(days[0])
+        last_day = max(int(np.datetime64(now, "D").view(np.int64)), int(days[-1]))
+        day_count = last_day - first_day + 1
+        offsets = days - first_day
+        failed = (self.status == _FAILED) | (self.status == _ROLLED_BACK)
+
+        deployments = np.bincount(offsets, minlength=day_count)
+        successful = np.bincount(
+            offsets, weights=self.status == _SUCCESS, minlength=day_count
+        )
+        failures = np.bincount(offsets, weights=failed, minlength=day_count)
+
+        recovered = failed[:-1] & (self.status[1:] == _SUCCESS)
+        times = self.timestamps.view(np.int64)
+        recovery_hours = np.bincount(
+            offsets[:-1][recovered],
+            weights=(times[1:] - times[:-1])[recovered] / _NS_PER_HOUR,
+            minlength=day_count,
+        )
+        recoveries = np.bincount(offsets[:-1][recovered], minlength=day_count)
+
+        def rolling(values: np.ndarray, window_days: int) -> np.ndarray:
+            totals = np.cumsum(values, dtype=np.float64)
+            totals[window_days:] = totals[window_days:] - totals[:-window_days]
+            return totals
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rolling_deployments = rolling(
+                deployments, config.change_failure_rate_window_days
+            )
+            rolling_recoveries = rolling(recoveries, config.mttr_window_days)
+            series = pd.DataFrame(
+                {
+                    "deployments": deployments,
+                    "successful": successful.astype(np.int64),
+                    "failed": failures.astype(np.int64),
+                    "success_rate": successful / deployments,
+                    "deployment_frequency": rolling(
+                        deployments, config.deployment_frequency_window_days
+                    )
+                    / config.deployment_frequency_window_days,
+                    "change_failure_rate": rolling(
+                        failures, config.change_failure_rate_window_days
+                    )
+                    / rolling_deployments,
+                    "mttr_hours": rolling(recovery_hours, config.mttr_window_days)
+                    / rolling_recoveries,
+                },
+                index=pd.DatetimeIndex(
+                    (first_day + np.arange(day_count)).astype("datetime64[D]"),
+                    name="date",
+                ),
+            )
+        return series
+
+    def daily_counts(self) -> Dict[str, int]:
+        """Return deployment counts by day, as generate_daily_counts."""
+        days, counts = np.unique(
+            self.timestamps.astype("datetime64[D]"), return_counts=True
+        )
+        return {str(day): int(count) for day, count in zip(days, counts)}
+
+    def environment_breakdown(self) -> Dict[str, Dict[str, int]]:
+        """Return status counts by environment, as generate_environment_breakdown."""
+        counts = np.bincount(
+            self.environment_codes * len(_STATUS_VALUES) + self.status,
+            minlength=len(self.environment_names) * len(_STATUS_VALUES),
+        ).reshape(len(self.environment_names), len(_STATUS_VALUES))
+        return {
+            environment: {
+                status: int(count)
+                for status, count in zip(_STATUS_VALUES, counts[code])
+                if count > 0
+            }
+            for code, environment in enumerate(self.environment_names)
+            if counts[code].sum() > 0
+        }
+
+    def version_success_rates(self) -> Dict[str, float]:
+        """Return success rate by version, as generate_version_success_rates."""
+        has_version = self.version_codes >= 0
+        codes = self.version_codes[has_version]
+        totals = np.bincount(codes, minlength=len(self.version_names))
+        successful = np.bincount(
+            codes,
+            weights=self.status[has_version] == _SUCCESS,
+            minlength=len(self.version_names),
+        )
+        return {
+            version: float(successful[code] / totals[code])
+            for code, version in enumerate(self.version_names)
+            if totals[code] > 0
+        }
+
+
+def load_deployment_store(
+    config: DeploymentDataConfig, project_root: Path
+) -> DeploymentStore:
+    """Load deployment data from CSV or JSON file into a DeploymentStore.
+
+    Rows with an unknown status are dropped with a warning, as in
+    load_deployment_data.
+
+    Args:
+        config: Deployment data configuration
+        project_root: Project root directory
+
+    Returns:
+        Deployment store
+
+    Raises:
+        FileNotFoundError: If data file does not exist
+        ValueError: If data format is invalid
+    """
+    data_path = Path(config.file_path)
+    if not data_path.is_absolute():
+        data_path = project_root / data_path
+
+    if not data_path.exists():
+        raise FileNotFoundError(f"Deployment data file not found: {data_path}")
+
+    category_columns = [
+        column
+        for column in (
+            config.status_column,
+            config.service_column,
+            config.environment_column,
+            config.version_column,
+        )
+        if column
+    ]
+
+    try:
+        if config.format.lower() == "csv":
+            header = pd.read_csv(data_path, nrows=0).columns
+            df = pd.read_csv(
+                data_path,
+                dtype={
+                    column: "category"
+                    for column in category_columns
+                    if column in header
+                },
+            )
+        elif config.format.lower() == "json":
+            df = pd.read_json(data_path)
+        else:
+            raise ValueError(f"Unsupported format: {config.format}")
+    except pd.errors.EmptyDataError:
+        logger.warning(f"Deployment data file is empty: {data_path}")
+        df = pd.DataFrame(
+            columns=[
+                config.deployment_id_column,
+                config.timestamp_column,
+                config.status_column,
+            ]
+        )
+    except Exception as e:
+        logger.error(f"Failed to load deployment data: {e}")
+        raise
+
+    required_columns = [
+        config.deployment_id_column,
+        config.timestamp_column,
+        config.status_column,
+    ]
+    missing = [col for col in required_columns if col not in df.columns]
+    if missing:
+        raise ValueError(f"Missing required columns: {missing}")
+
+    status = df[config.status_column].astype("category")
+    lowered = status.cat.categories.astype(str).str.lower()
+    category_status = np.append(_STATUS_VALUES.get_indexer(lowered), -1)
+    status_codes = category_status[status.cat.codes.to_numpy(dtype=np.int64)]
+    known = status_codes >= 0
+    if not known.all():
+        unknown = pd.Series(
+            np.where(status.isna(), "nan", status.astype(str).str.lower())
+        )[~known]
+        for status_str, count in unknown.value_counts().items():
+            logger.warning(f"Unknown deployment status: {status_str} ({count} rows)")
+
+    def optional_column(column: Optional[str]) -> pd.Series:
+        if column and column in df.columns:
+            return df.loc[known, column]
+        return pd.Series(None, index=df.index[known], dtype=object)
+
+    store = DeploymentStore(
+        pd.DataFrame(
+            {
+                "deployment_id": df.loc[known, config.deployment_id_column],
+                "timestamp": pd.to_datetime(df.loc[known, config.timestamp_column]),
+                "status": pd.Categorical.from_codes(
+                    status_codes[known], categories=_STATUS_VALUES
+                ),
+                "service": optional_column(config.service_column),
+                "environment": optional_column(config.environment_column),
+                "version": optional_column(config.version_column),
+            }
+        )
+    )
+    logger.info(f"Loaded {len(store)} deployment records")
+    return store
+
+
 def write_markdown_report(
     analysis: DeploymentAnalysis, output_path: Path
 ) -> None:
@@ -708,6 +1364,31 @@ def write_markdown_report(
                 )
         f.write("\n")
 
+        f.write("## Service and Environment Breakdown\n\n")
+        if analysis.service_environment_metrics:
+            f.write(
+                "| Service | Environment | Deployments | Frequency/day | "
+                "Success Rate | Change Failure Rate | MTTR (hours) |\n"
+            )
+            f.write(
+                "|---------|-------------|-------------|---------------|"
+                "--------------|---------------------|--------------|\n"
+            )
+            for (service, env), group in sorted(
+                analysis.service_environment_metrics.items()
+            ):
+                mttr = (
+                    f"{group.mean_time_to_recovery:.2f}"
+                    if group.mean_time_to_recovery is not None
+                    else "N/A"
+                )
+                f.write(
+                    f"| {service} | {env} | {group.deployment_count} | "
+                    f"{group.deployment_frequency:.2f} | {group.success_rate:.1%} | "
+                    f"{group.change_failure_rate:.1%} | {mttr} |\n"
+                )
+        f.write("\n")
+
         f.write("## Version Success Rates\n\n")
         if analysis.version_success_rates:
             f.write("| Version | Success Rate |\n")
@@ -724,6 +1405,9 @@ def write_markdown_report(
 def process_deployments(config_path: Path) -> DeploymentAnalysis:
     """Process deployment data and generate analysis.
 
+    Deployments are loaded into a DeploymentStore, which computes overall
+    and per service and environment metrics and the rolling daily series.
+
     Args:
         config_path: Path to configuration file
 
@@ -737,9 +1421,9 @@ def process_deployments(config_path: Path) -> DeploymentAnalysis:
     config = load_config(config_path)
     project_root = config_path.parent
 
-    deployments = load_deployment_data(config.deployment_data, project_root)
+    store = load_deployment_store(config.deployment_data, project_root)
 
-    if not deployments:
+    if len(store) == 0:
         logger.warning("No deployment data available for analysis")
         return DeploymentAnalysis(
             quality_metrics=QualityMetrics(
@@ -755,23 +1439,27 @@ def process_deployments(config_path: Path) -> DeploymentAnalysis:
             generated_at=datetime.now(),
         )
 
-    quality_metrics = calculate_quality_metrics(deployments, config.metrics)
-    regression_patterns = identify_regression_patterns(
-        deployments, config.regression
-    )
-    daily_counts = generate_daily_counts(deployments)
-    environment_breakdown = generate_environment_breakdown(deployments)
-    version_success_rates = generate_version_success_rates(deployments)
-
+    now = datetime.now()
     analysis = DeploymentAnalysis(
-        quality_metrics=quality_metrics,
-        regression_patterns=regression_patterns,
-        daily_deployment_counts=daily_counts,
-        environment_breakdown=environment_breakdown,
-        version_success_rates=version_success_rates,
-        generated_at=datetime.now(),
+        quality_metrics=store.quality_metrics(config.metrics, now),
+        regression_patterns=store.regression_patterns(config.regression, now),
+        daily_deployment_counts=store.daily_counts(),
+        environment_breakdown=store.environment_breakdown(),
+        version_success_rates=store.version_success_rates(),
+        generated_at=now,
+        service_environment_metrics=store.group_metrics(config.metrics, now),
     )
 
+    if config.report.daily_series_path:
+        series_path = Path(config.report.daily_series_path)
+        if not series_path.is_absolute():
+            series_path = project_root / series_path
+        series_path.parent.mkdir(parents=True, exist_ok=True)
+        store.daily_series(config.metrics, now).to_csv(
+            series_path, date_format="%Y-%m-%d", float_format="%.4f"
+        )
+        logger.info(f"Daily metrics written to {series_path}")
+
     report_path = Path(config.report.output_path)
     if not report_path.is_absolute():
         report_path = project_root / report_path
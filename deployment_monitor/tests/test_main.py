@@ -1,12 +1,15 @@
 """Tests for deployment monitoring."""
 
+from dataclasses import asdict
 from datetime import datetime, timedelta
 
+import pandas as pd
 import pytest
 
 from deployment_monitor.src.main import (
     DeploymentRecord,
     DeploymentStatus,
+    DeploymentStore,
     MetricsConfig,
     QualityMetrics,
     RegressionConfig,
@@ -16,6 +19,7 @@ from deployment_monitor.src.main import (
     calculate_quality_metrics,
     calculate_success_rate,
     identify_regression_patterns,
+    process_deployments,
 )
 
 
@@ -229,3 +233,104 @@ def test_regression_severity_critical():
         p for p in patterns if p.severity == RegressionSeverity.CRITICAL
     ]
     assert len(critical_patterns) > 0
+
+
+def test_deployment_store_matches_record_metrics():
+    """Test store metrics match the record-based calculations per group."""
+    now = datetime.now()
+    statuses = [
+        DeploymentStatus.SUCCESS,
+        DeploymentStatus.FAILED,
+        DeploymentStatus.SUCCESS,
+        DeploymentStatus.ROLLED_BACK,
+        DeploymentStatus.SUCCESS,
+        DeploymentStatus.PARTIAL,
+    ]
+    deployments = [
+        DeploymentRecord(
+            deployment_id=f"dep_{i:03d}",
+            timestamp=now - timedelta(hours=7 * i + 1),
+            status=(
+                statuses[i % len(statuses)]
+                if i < 24 or i % 10 == 0
+                else DeploymentStatus.SUCCESS
+            ),
+            service=["api", "web"][i % 2],
+            environment=["production", "staging", None][i % 3],
+            version=f"1.{i % 4}",
+        )
+        for i in range(200)
+    ]
+    metrics_config = MetricsConfig()
+    store = DeploymentStore.from_records(deployments)
+
+    expected = calculate_quality_metrics(deployments, metrics_config)
+    assert asdict(store.quality_metrics(metrics_config, now)) == pytest.approx(
+        asdict(expected)
+    )
+
+    group_metrics = store.group_metrics(metrics_config, now)
+    assert len(group_metrics) == 6
+    for (service, environment), metrics in group_metrics.items():
+        group = [
+            d
+            for d in deployments
+            if d.service == service and (d.environment or "unknown") == environment
+        ]
+        assert asdict(metrics) == pytest.approx(
+            asdict(calculate_quality_metrics(group, metrics_config))
+        )
+        assert len(store.select(service, environment)) == len(group)
+
+    regression_config = RegressionConfig()
+    patterns = store.regression_patterns(regression_config, now)
+    expected_patterns = identify_regression_patterns(deployments, regression_config)
+    assert patterns
+    assert [
+        (p.pattern_type, p.severity, p.current_metric, set(p.affected_deployments))
+        for p in patterns
+    ] == [
+        (p.pattern_type, p.severity, p.current_metric, set(p.affected_deployments))
+        for p in expected_patterns
+    ]
+
+    series = store.daily_series(metrics_config, now)
+    assert series["deployments"].sum() == len(deployments)
+    assert series.index[-1] == pd.Timestamp(now.date())
+
+
+def test_process_deployments_without_service_or_version(tmp_path):
+    """Test data files without service and version columns."""
+    now = datetime.now()
+    rows = ["deployment_id,timestamp,status,environment"]
+    for i, status in enumerate(["success", "failed", "success", "rolled_back"]):
+        timestamp = (now - timedelta(hours=6 * i + 1)).isoformat()
+        rows.append(f"dep_{i:03d},{timestamp},{status},production")
+    (tmp_path / "deployments.csv").write_text("\n".join(rows) + "\n")
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        "deployment_data:\n"
+        "  file_path: deployments.csv\n"
+        "  environment_column: environment\n"
+        "  service_column: service\n"
+        "  version_column: version\n"
+    )
+
+    analysis = process_deployments(config_path)
+
+    assert analysis.quality_metrics.deployment_count == 4
+    assert analysis.version_success_rates == {}
+    assert set(analysis.service_environment_metrics) == {("unknown", "production")}
+    assert (tmp_path / "logs" / "deployment_metrics.md").exists()
+
+    records = [
+        DeploymentRecord(
+            deployment_id="dep_001",
+            timestamp=now - timedelta(hours=1),
+            status=DeploymentStatus.SUCCESS,
+        )
+    ]
+    store = DeploymentStore.from_records(records)
+    assert store.service_names == ["unknown"]
+    assert store.version_names == []
+    assert store.version_success_rates() == {}
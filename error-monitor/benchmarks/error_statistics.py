@@ -0,0 +1,152 @@
+"""Benchmark error statistics over a long window with and without rollups.
+
+Fills a SQLite database with synthetic errors spread over the window, then
+times get_error_statistics and calculate_error_rate three ways:
+
+- orm: the previous approach of loading every ErrorLog row in the window
+  and counting in Python, with a lazy category load per row
+- direct: SQL GROUP BY aggregates over error_logs
+- rollup: SQL aggregates over the minute, hour and day rollup table
+
+Run from the error-monitor directory:
+
+    python -m benchmarks.error_statistics
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+
+from src.database import DatabaseManager, ErrorCategory, ErrorLog
+from src.error_monitor import ErrorMonitor
+
+APPLICATIONS = ["checkout", "search", "billing", "auth"]
+ENVIRONMENTS = ["production", "staging"]
+SEVERITIES = ["low", "medium", "high", "critical"]
+ERROR_TYPES = [f"Error{i}" for i in range(30)]
+CATEGORIES = ["database", "network", "authentication", "validation", "application"]
+
+
+def fill_database(db_manager: DatabaseManager, rows: int, days: int) -> None:
+    """Bulk insert synthetic errors and build their rollups."""
+    rng = np.random.default_rng(7)
+    session = db_manager.get_session()
+    try:
+        session.add_all([ErrorCategory(name=name) for name in CATEGORIES])
+        session.commit()
+    finally:
+        session.close()
+
+    now = datetime.utcnow()
+    for start in range(0, rows, 100_000):
+        count = min(100_000, rows - start)
+        offsets = rng.integers(0, days * 86400, count)
+        apps = rng.integers(0, len(APPLICATIONS), count)
+        envs = rng.integers(0, len(ENVIRONMENTS), count)
+        severities = rng.integers(0, len(SEVERITIES), count)
+        types = rng.integers(0, len(ERROR_TYPES), count)
+        categories = rng.integers(1, len(CATEGORIES) + 1, count)
+
+        session = db_manager.get_session()
+        try:
+            session.bulk_insert_mappings(
+                ErrorLog,
+                [
+                    {
+                        "error_message": "Synthetic error",
+                        "error_type": ERROR_TYPES[types[i]],
+                        "application": APPLICATIONS[apps[i]],
+                        "environment": ENVIRONMENTS[envs[i]],
+                        "severity": SEVERITIES[severities[i]],
+                        "category_id": int(categories[i]),
+                        "timestamp": now - timedelta(seconds=int(offsets[i])),
+                    }
+                    for i in range(count)
+                ],
+            )
+            session.commit()
+        finally:
+            session.close()
+
+    db_manager.rebuild_error_rollups()
+
+
+def orm_statistics(db_manager: DatabaseManager, application: str, hours: int) -> Dict:
+    """Previous statistics: materialise every row in the window."""
+    cutoff_time = datetime.utcnow() - timedelta(hours=hours)
+    session = db_manager.get_session()
+    try:
+        errors = (
+            session.query(ErrorLog)
+            .filter(ErrorLog.timestamp >= cutoff_time)
+            .filter(ErrorLog.application == application)
+            .all()
+        )
+        severity_counts: Dict[str, int] = {}
+        category_counts: Dict[str, int] = {}
+        for error in errors:
+            severity_counts[error.severity] = severity_counts.get(error.severity, 0) + 1
+            if error.category:
+                name = error.category.name
+                category_counts[name] = category_counts.get(name, 0) + 1
+        return {"total_errors": len(errors), "category_breakdown": category_counts}
+    finally:
+        session.close()
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500_000, help="Stored errors")
+    parser.add_argument("--days", type=int, default=30, help="Days the errors span")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    # One spare hour so rows at the far edge do not age out between runs.
+    hours = args.days * 24 + 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = DatabaseManager(f"sqlite:///{Path(tmp) / 'errors.db'}")
+        db_manager.create_tables()
+
+        start = time.perf_counter()
+        fill_database(db_manager, args.rows, args.days)
+        print(
+            f"loaded {args.rows} errors over {args.days} days in "
+            f"{time.perf_counter() - start:.1f}s"
+        )
+
+        start = time.perf_counter()
+        expected = orm_statistics(db_manager, "checkout", hours)
+        print(
+            f"orm statistics: {time.perf_counter() - start:.3f}s "
+            f"({expected['total_errors']} errors)"
+        )
+
+        for use_rollups in (False, True):
+            monitor = ErrorMonitor(db_manager, {"use_rollups": use_rollups})
+            start = time.perf_counter()
+            stats = monitor.get_error_statistics("checkout", hours=hours)
+            stats_seconds = time.perf_counter() - start
+            assert stats["total_errors"] == expected["total_errors"]
+            assert stats["category_breakdown"] == expected["category_breakdown"]
+
+            start = time.perf_counter()
+            monitor.calculate_error_rate("checkout", "production", hours=hours)
+            rate_seconds = time.perf_counter() - start
+
+            label = "rollup" if use_rollups else "direct"
+            print(
+                f"{label} statistics: {stats_seconds:.3f}s, "
+                f"error rate: {rate_seconds:.3f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Benchmark full log parsing against checkpointed incremental tailing.
+
+Writes a synthetic application log, then times:
+
+- full: parse_log_file over the whole log, as every --parse run does
+- tail: tail_log_file after a block of new lines is appended to a log
+  that was already tailed up to its previous end
+
+Run from the error-monitor directory:
+
+    python -m benchmarks.log_tailing
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from src.log_parser import LogParser
+
+LINES = np.array(
+    [
+        "2024-01-01 10:00:00 INFO GET /api/orders 200 12ms",
+        "2024-01-01 10:00:00 DEBUG cache hit key=orders:42",
+        "2024-01-01 10:00:00 INFO worker heartbeat ok",
+        "2024-01-01 10:00:00 ERROR: Database connection failed ConnectionError",
+        "  at db.pool.acquire(pool.py:88)",
+        "Caused by: socket timeout after 30s",
+    ]
+)
+WEIGHTS = np.array([0.55, 0.3, 0.13, 0.01, 0.005, 0.005])
+
+
+def write_lines(path: Path, count: int, rng: np.random.Generator) -> None:
+    """Append count synthetic log lines."""
+    with open(path, "a") as f:
+        for start in range(0, count, 100_000):
+            batch = rng.choice(LINES, min(100_000, count - start), p=WEIGHTS)
+            f.write("\n".join(batch.tolist()) + "\n")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--lines", type=int, default=10_000_000, help="Lines in the existing log"
+    )
+    parser.add_argument(
+        "--new-lines", type=int, default=100_000, help="Lines appended before tailing"
+    )
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    rng = np.random.default_rng(7)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "app.log"
+        write_lines(path, args.lines, rng)
+        _, checkpoint = LogParser({}).tail_log_file(path)
+        write_lines(path, args.new_lines, rng)
+        size_mb = path.stat().st_size / 1_048_576
+
+        full_parser = LogParser({})
+        start = time.perf_counter()
+        errors = full_parser.parse_log_file(path)
+        full_seconds = time.perf_counter() - start
+
+        tail_parser = LogParser({})
+        start = time.perf_counter()
+        new_errors, _ = tail_parser.tail_log_file(path, checkpoint)
+        tail_seconds = time.perf_counter() - start
+
+    stats = full_parser.stats
+    print(
+        f"full: {size_mb:.0f} MB, {stats.lines} lines, {len(errors)} errors in "
+        f"{full_seconds:.2f}s ({stats.lines_per_second:,.0f} lines/sec, "
+        f"{stats.bytes_per_second / 1_048_576:,.0f} MB/sec)"
+    )
+    stats = tail_parser.stats
+    print(
+        f"tail: {stats.lines} new lines, {len(new_errors)} errors in "
+        f"{tail_seconds:.3f}s ({stats.lines_per_second:,.0f} lines/sec)"
+    )
+
+
+if __name__ == "__main__":
+    main()
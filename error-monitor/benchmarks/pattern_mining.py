@@ -0,0 +1,126 @@
+"""Benchmark template-mining pattern identification against signature grouping.
+
+Generates synthetic errors from a set of message templates with variable
+tokens (ids, hosts, user names), then times:
+
+- template: identify_patterns with the online template miner, which returns
+  each pattern's error ids directly
+- signature: the previous approach of grouping by an exact hash of the
+  normalized message, then re-hashing every error once per pattern to link
+  errors to their pattern as --analyze did
+
+Run from the error-monitor directory:
+
+    python -m benchmarks.pattern_mining
+"""
+
+import argparse
+import logging
+import time
+from typing import Dict, List
+
+import numpy as np
+
+from src.pattern_identifier import PatternIdentifier
+
+TEMPLATES = [
+    ("ConnectionError", "Connection to {host} refused on port {num}"),
+    ("TimeoutError", "Request to service {host} timed out after {num} ms"),
+    ("KeyError", "Cache miss for key {word} in region {region}"),
+    ("LookupError", "Lookup failed for user {word} in tenant {region}"),
+    ("ValueError", "Invalid payload for order {num} from client {word}"),
+    ("PermissionError", "Access denied for role {word} on resource {host}"),
+    ("OSError", "Disk usage at {num} percent on volume {region}"),
+    ("RuntimeError", "Batch worker {word} crashed while processing batch {num}"),
+]
+WORDS = np.array([f"w{chr(97 + i % 26)}{chr(97 + i // 26 % 26)}" for i in range(600)])
+HOSTS = np.array(
+    [f"api-{chr(97 + i % 26)}{chr(97 + i // 26 % 26)}.internal" for i in range(500)]
+)
+REGIONS = np.array(["east", "west", "north", "south", "central"])
+
+
+def build_errors(count: int, templates: int, seed: int = 7) -> List[Dict[str, any]]:
+    """Build error dictionaries shaped like analyze_errors input."""
+    rng = np.random.default_rng(seed)
+    template_ids = rng.integers(0, templates, count)
+    words = rng.choice(WORDS, count)
+    hosts = rng.choice(HOSTS, count)
+    regions = rng.choice(REGIONS, count)
+    nums = rng.integers(0, 100_000, count)
+
+    errors = []
+    for i in range(count):
+        base = template_ids[i] % len(TEMPLATES)
+        error_type, message = TEMPLATES[base]
+        variant = template_ids[i] // len(TEMPLATES)
+        errors.append(
+            {
+                "id": i,
+                "error_type": f"{error_type}{variant}" if variant else error_type,
+                "error_message": message.format(
+                    host=hosts[i], num=nums[i], word=words[i], region=regions[i]
+                ),
+            }
+        )
+    return errors
+
+
+def signature_patterns(identifier: PatternIdentifier, errors: List[Dict[str, any]]) -> int:
+    """Previous grouping plus the per-pattern re-hash used to link errors."""
+    groups: Dict[str, List[Dict[str, any]]] = {}
+    for error in errors:
+        groups.setdefault(identifier._create_error_signature(error), []).append(error)
+
+    patterns = [
+        signature
+        for signature, members in groups.items()
+        if len(members) >= identifier.min_frequency
+    ]
+    for signature in patterns:
+        [e for e in errors if identifier._create_error_signature(e) == signature]
+    return len(patterns)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--errors", type=int, default=200_000, help="Number of errors")
+    parser.add_argument(
+        "--templates", type=int, default=40, help="Distinct error templates"
+    )
+    parser.add_argument(
+        "--signature-errors",
+        type=int,
+        default=10_000,
+        help="Errors run through the signature-grouping baseline",
+    )
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    config = {"min_frequency": 3, "similarity_threshold": 0.8}
+
+    errors = build_errors(args.errors, args.templates)
+    identifier = PatternIdentifier(config)
+    start = time.perf_counter()
+    patterns = identifier.identify_patterns(errors)
+    elapsed = time.perf_counter() - start
+    print(
+        f"template: {args.errors} errors -> {len(identifier.miner)} templates, "
+        f"{len(patterns)} patterns in {elapsed:.2f}s, "
+        f"{args.errors / elapsed:,.0f} errors/sec"
+    )
+
+    errors = build_errors(args.signature_errors, args.templates)
+    identifier = PatternIdentifier(config)
+    start = time.perf_counter()
+    pattern_count = signature_patterns(identifier, errors)
+    elapsed = time.perf_counter() - start
+    print(
+        f"signature: {args.signature_errors} errors -> {pattern_count} patterns "
+        f"in {elapsed:.2f}s, {args.signature_errors / elapsed:,.0f} errors/sec"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,21 @@
 """Database models and operations for error monitoring."""
 
-from datetime import datetime
-from typing import List, Optional
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
 
 from sqlalchemy import (
     Column,
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     create_engine,
+    func,
+    null,
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker
@@ -46,6 +50,12 @@ class ErrorLog(Base):
     pattern = relationship("ErrorPattern", back_populates="errors")
     bug_report = relationship("BugReport", back_populates="errors")
 
+    __table_args__ = (
+        Index("ix_error_logs_timestamp", "timestamp"),
+        Index("ix_error_logs_app_timestamp", "application", "timestamp"),
+        Index("ix_error_logs_app_env_timestamp", "application", "environment", "timestamp"),
+    )
+
 
 class ErrorCategory(Base):
     """Error category classification."""
@@ -116,6 +126,86 @@ class ErrorRate(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
 
 
+class ErrorRollup(Base):
+    """Error counts per time bucket and dimension value.
+
+    Each error is counted once per dimension (severity, error type and
+    category) in a one-minute, one-hour and one-day bucket, so a long window
+    is answered mostly from daily rows, with hourly and minute rows only at
+    its leading edge.
+    """
+
+    __tablename__ = "error_rollups"
+
+    id = Column(Integer, primary_key=True)
+    bucket_start = Column(DateTime, nullable=False)
+    bucket_minutes = Column(Integer, nullable=False)
+    application = Column(String(100))
+    environment = Column(String(50))
+    dimension = Column(String(20), nullable=False)
+    value = Column(String(200))
+    category_id = Column(Integer, ForeignKey("error_categories.id"), nullable=True)
+    error_count = Column(Integer, default=0, nullable=False)
+
+    __table_args__ = (
+        Index(
+            "ix_error_rollups_lookup",
+            "dimension",
+            "bucket_minutes",
+            "application",
+            "bucket_start",
+        ),
+        Index("ix_error_rollups_bucket", "dimension", "bucket_minutes", "bucket_start"),
+    )
+
+
+ROLLUP_DIMENSIONS = ("severity", "error_type", "category_id")
+ROLLUP_BUCKET_MINUTES = (1, 60, 1440)
+
+
+def bucket_start(timestamp: datetime, bucket_minutes: int) -> datetime:
+    """Truncate a timestamp to the start of its minute, hour or day bucket.
+
+    Args:
+        timestamp: Timestamp to truncate.
+        bucket_minutes: Bucket width, one of ROLLUP_BUCKET_MINUTES.
+
+    Returns:
+        Start of the bucket containing timestamp.
+    """
+    timestamp = timestamp.replace(second=0, microsecond=0)
+    if bucket_minutes >= 60:
+        timestamp = timestamp.replace(minute=0)
+    if bucket_minutes >= 1440:
+        timestamp = timestamp.replace(hour=0)
+    return timestamp
+
+
+def _bucket_end(since: datetime, bucket_minutes: int) -> datetime:
+    """First bucket boundary at or after since."""
+    start = bucket_start(since, bucket_minutes)
+    if start < since:
+        start += timedelta(minutes=bucket_minutes)
+    return start
+
+
+def _rollup_keys(error_log: "ErrorLog", dimensions=ROLLUP_DIMENSIONS):
+    """Yield the rollup row keys an error is counted under."""
+    for bucket_minutes in ROLLUP_BUCKET_MINUTES:
+        start = bucket_start(error_log.timestamp, bucket_minutes)
+        for dimension in dimensions:
+            value = getattr(error_log, dimension)
+            yield {
+                "bucket_start": start,
+                "bucket_minutes": bucket_minutes,
+                "application": error_log.application,
+                "environment": error_log.environment,
+                "dimension": dimension,
+                "value": None if dimension == "category_id" else value,
+                "category_id": value if dimension == "category_id" else None,
+            }
+
+
 class DatabaseManager:
     """Database operations manager."""
 
@@ -129,8 +219,14 @@ class DatabaseManager:
         self.SessionLocal = sessionmaker(bind=self.engine)
 
     def create_tables(self) -> None:
-        """Create all database tables."""
+        """Create all database tables.
+
+        Indexes added to error_logs after a database was first created are
+        also created, since create_all skips tables that already exist.
+        """
         Base.metadata.create_all(self.engine)
+        for index in ErrorLog.__table__.indexes:
+            index.create(self.engine, checkfirst=True)
 
     def get_session(self):
         """Get database session.
@@ -153,8 +249,10 @@ class DatabaseManager:
         request_id: Optional[str] = None,
         ip_address: Optional[str] = None,
         user_agent: Optional[str] = None,
+        timestamp: Optional[datetime] = None,
+        category_id: Optional[int] = None,
     ) -> ErrorLog:
-        """Add a new error log entry.
+        """Add an error log entry and count it in the minute, hour and day rollups.
 
         Args:
             error_message: Error message text.
@@ -168,6 +266,8 @@ class DatabaseManager:
             request_id: Request identifier.
             ip_address: Client IP address.
             user_agent: User agent string.
+            timestamp: When the error occurred (default: now).
+            category_id: Error category ID.
 
         Returns:
             Created ErrorLog object.
@@ -175,6 +275,7 @@ class DatabaseManager:
         session = self.get_session()
         try:
             error_log = ErrorLog(
+                timestamp=timestamp or datetime.utcnow(),
                 error_message=error_message,
                 error_type=error_type,
                 stack_trace=stack_trace,
@@ -186,8 +287,10 @@ class DatabaseManager:
                 request_id=request_id,
                 ip_address=ip_address,
                 user_agent=user_agent,
+                category_id=category_id,
             )
             session.add(error_log)
+            self._bump_rollup(session, error_log, 1)
             session.commit()
             session.refresh(error_log)
             return error_log
@@ -258,8 +361,10 @@ class DatabaseManager:
         session = self.get_session()
         try:
             error_log = session.query(ErrorLog).filter(ErrorLog.id == error_id).first()
-            if error_log:
+            if error_log and error_log.category_id != category_id:
+                self._bump_rollup(session, error_log, -1, ("category_id",))
                 error_log.category_id = category_id
+                self._bump_rollup(session, error_log, 1, ("category_id",))
                 session.commit()
         finally:
             session.close()
@@ -477,3 +582,243 @@ class DatabaseManager:
             return query.all()
         finally:
             session.close()
+
+    def _bump_rollup(
+        self, session, error_log: ErrorLog, delta: int, dimensions=ROLLUP_DIMENSIONS
+    ) -> None:
+        """Add delta to the rollup rows an error is counted under.
+
+        Args:
+            session: Open database session; the caller commits.
+            error_log: Error whose buckets are updated.
+            delta: Count change (1 on insert, -1 when moving to a new value).
+            dimensions: Dimensions to update.
+        """
+        if error_log.timestamp is None:
+            return
+
+        keys = list(_rollup_keys(error_log, dimensions))
+        query = session.query(ErrorRollup).filter(
+            ErrorRollup.bucket_start.in_({key["bucket_start"] for key in keys}),
+            ErrorRollup.dimension.in_(dimensions),
+        )
+        for name in ("application", "environment"):
+            value = getattr(error_log, name)
+            column = getattr(ErrorRollup, name)
+            query = query.filter(column.is_(None) if value is None else column == value)
+
+        existing = {
+            (
+                rollup.bucket_start,
+                rollup.bucket_minutes,
+                rollup.dimension,
+                rollup.value,
+                rollup.category_id,
+            ): rollup
+            for rollup in query
+        }
+        for key in keys:
+            rollup = existing.get(
+                (
+                    key["bucket_start"],
+                    key["bucket_minutes"],
+                    key["dimension"],
+                    key["value"],
+                    key["category_id"],
+                )
+            )
+            if rollup:
+                rollup.error_count += delta
+            else:
+                session.add(ErrorRollup(error_count=delta, **key))
+
+    def rebuild_error_rollups(self, batch_size: int = 10000) -> int:
+        """Recompute the rollup table from error_logs.
+
+        Needed once for databases that already held errors before rollups
+        were introduced, or after errors are inserted outside add_error_log.
+
+        Args:
+            batch_size: Rows fetched per round trip while scanning error_logs.
+
+        Returns:
+            Number of rollup rows written.
+        """
+        session = self.get_session()
+        try:
+            counts: Counter = Counter()
+            rows = session.query(
+                ErrorLog.timestamp,
+                ErrorLog.application,
+                ErrorLog.environment,
+                *[getattr(ErrorLog, name) for name in ROLLUP_DIMENSIONS],
+            ).yield_per(batch_size)
+            for row in rows:
+                if row.timestamp is None:
+                    continue
+                for key in _rollup_keys(row):
+                    counts[tuple(key.items())] += 1
+
+            session.query(ErrorRollup).delete()
+            session.bulk_insert_mappings(
+                ErrorRollup,
+                [dict(key, error_count=count) for key, count in counts.items()],
+            )
+            session.commit()
+            return len(counts)
+        finally:
+            session.close()
+
+    def count_errors(
+        self,
+        since: datetime,
+        application: Optional[str] = None,
+        environment: Optional[str] = None,
+        use_rollups: bool = False,
+    ) -> int:
+        """Count errors at or after a time with SQL aggregates.
+
+        Args:
+            since: Start of the window.
+            application: Filter by application.
+            environment: Filter by environment.
+            use_rollups: Answer whole minutes, hours and days from the rollup table.
+
+        Returns:
+            Number of errors.
+        """
+        return sum(
+            self._aggregate_errors(since, None, application, environment, use_rollups).values()
+        )
+
+    def error_breakdown(
+        self,
+        group_by: str,
+        since: datetime,
+        application: Optional[str] = None,
+        environment: Optional[str] = None,
+        use_rollups: bool = False,
+    ) -> Dict[str, int]:
+        """Count errors per severity, category or error type with GROUP BY.
+
+        Args:
+            group_by: One of "severity", "category" or "error_type".
+            since: Start of the window.
+            application: Filter by application.
+            environment: Filter by environment.
+            use_rollups: Answer whole minutes, hours and days from the rollup table.
+
+        Returns:
+            Mapping of group value to error count; errors without a value
+            for the group are left out.
+        """
+        if group_by not in ("severity", "category", "error_type"):
+            raise ValueError(f"Unsupported group_by: {group_by}")
+
+        counts = self._aggregate_errors(since, group_by, application, environment, use_rollups)
+        counts.pop(None, None)
+        counts.pop("", None)
+        return counts
+
+    def _aggregate_errors(
+        self,
+        since: datetime,
+        group_by: Optional[str],
+        application: Optional[str],
+        environment: Optional[str],
+        use_rollups: bool,
+    ) -> Dict[Optional[str], int]:
+        """Sum error counts for a window, optionally grouped.
+
+        With rollups the window is split at its first minute, hour and day
+        boundaries: the partial minute is counted from error_logs, the rest
+        of the partial hour from minute buckets, the rest of the partial day
+        from hour buckets and everything after from day buckets, so results
+        match a direct count exactly.
+        """
+        session = self.get_session()
+        try:
+            counts: Counter = Counter()
+            boundaries = [_bucket_end(since, minutes) for minutes in ROLLUP_BUCKET_MINUTES]
+
+            query = self._grouped_query(session, group_by, application, environment)
+            query = query.filter(ErrorLog.timestamp >= since)
+            if use_rollups:
+                query = query.filter(ErrorLog.timestamp < boundaries[0])
+            for key, count in query:
+                counts[key] += count
+
+            if use_rollups:
+                segments = zip(ROLLUP_BUCKET_MINUTES, boundaries, boundaries[1:] + [None])
+                for bucket_minutes, start, end in segments:
+                    query = self._grouped_rollup_query(
+                        session, group_by, bucket_minutes, application, environment
+                    ).filter(ErrorRollup.bucket_start >= start)
+                    if end is not None:
+                        query = query.filter(ErrorRollup.bucket_start < end)
+                    for key, count in query:
+                        counts[key] += int(count or 0)
+
+            return {key: count for key, count in counts.items() if count}
+        finally:
+            session.close()
+
+    @staticmethod
+    def _grouped_query(session, group_by, application, environment):
+        """Build a (group value, count) query over error_logs.
+
+        Ungrouped queries use NULL as the group value so callers can treat
+        both shapes alike.
+        """
+        aggregate = func.count(ErrorLog.id)
+        if group_by == "category":
+            key = ErrorCategory.name
+            query = session.query(key, aggregate).join(
+                ErrorCategory, ErrorLog.category_id == ErrorCategory.id
+            )
+        elif group_by:
+            key = getattr(ErrorLog, group_by)
+            query = session.query(key, aggregate)
+        else:
+            key = None
+            query = session.query(null(), aggregate).select_from(ErrorLog)
+
+        if application:
+            query = query.filter(ErrorLog.application == application)
+        if environment:
+            query = query.filter(ErrorLog.environment == environment)
+
+        return query.group_by(key) if key is not None else query
+
+    @staticmethod
+    def _grouped_rollup_query(session, group_by, bucket_minutes, application, environment):
+        """Build a (group value, count) query over one rollup granularity.
+
+        Totals are summed over the severity rows, which count every error
+        once, including errors without a severity.
+        """
+        aggregate = func.sum(ErrorRollup.error_count)
+        if group_by == "category":
+            key = ErrorCategory.name
+            query = (
+                session.query(key, aggregate)
+                .select_from(ErrorRollup)
+                .join(ErrorCategory, ErrorRollup.category_id == ErrorCategory.id)
+                .filter(ErrorRollup.dimension == "category_id")
+            )
+        elif group_by:
+            key = ErrorRollup.value
+            query = session.query(key, aggregate).filter(ErrorRollup.dimension == group_by)
+        else:
+            key = None
+            query = session.query(null(), aggregate).filter(
+                ErrorRollup.dimension == "severity"
+            )
+
+        query = query.filter(ErrorRollup.bucket_minutes == bucket_minutes)
+        if application:
+            query = query.filter(ErrorRollup.application == application)
+        if environment:
+            query = query.filter(ErrorRollup.environment == environment)
+
+        return query.group_by(key) if key is not None else query
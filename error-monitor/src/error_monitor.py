@@ -20,6 +20,7 @@ class ErrorMonitor:
         self.config = config
         self.time_window_minutes = config.get("time_window_minutes", 60)
         self.error_rate_threshold = config.get("error_rate_threshold", 1.0)
+        self.use_rollups = config.get("use_rollups", False)
 
     def calculate_error_rate(
         self,
@@ -38,51 +39,39 @@ class ErrorMonitor:
             Dictionary with error rate metrics.
         """
         cutoff_time = datetime.utcnow() - timedelta(hours=hours)
-        session = self.db_manager.get_session()
 
-        try:
-            from src.database import ErrorLog
-
-            query = session.query(ErrorLog).filter(ErrorLog.timestamp >= cutoff_time)
-
-            if application:
-                query = query.filter(ErrorLog.application == application)
-            if environment:
-                query = query.filter(ErrorLog.environment == environment)
-
-            errors = query.all()
-            error_count = len(errors)
-
-            total_requests = self._estimate_total_requests(
-                application, environment, hours, error_count
-            )
-
-            error_rate = (error_count / total_requests * 100) if total_requests > 0 else 0.0
-
-            time_window_start = cutoff_time
-            time_window_end = datetime.utcnow()
-
-            self.db_manager.add_error_rate(
-                application or "unknown",
-                environment or "unknown",
-                error_count,
-                total_requests,
-                time_window_start,
-                time_window_end,
-            )
-
-            return {
-                "error_count": error_count,
-                "total_requests": total_requests,
-                "error_rate": error_rate,
-                "time_window_start": time_window_start,
-                "time_window_end": time_window_end,
-                "application": application,
-                "environment": environment,
-                "threshold_exceeded": error_rate > self.error_rate_threshold,
-            }
-        finally:
-            session.close()
+        error_count = self.db_manager.count_errors(
+            cutoff_time, application, environment, use_rollups=self.use_rollups
+        )
+
+        total_requests = self._estimate_total_requests(
+            application, environment, hours, error_count
+        )
+
+        error_rate = (error_count / total_requests * 100) if total_requests > 0 else 0.0
+
+        time_window_start = cutoff_time
+        time_window_end = datetime.utcnow()
+
+        self.db_manager.add_error_rate(
+            application or "unknown",
+            environment or "unknown",
+            error_count,
+            total_requests,
+            time_window_start,
+            time_window_end,
+        )
+
+        return {
+            "error_count": error_count,
+            "total_requests": total_requests,
+            "error_rate": error_rate,
+            "time_window_start": time_window_start,
+            "time_window_end": time_window_end,
+            "application": application,
+            "environment": environment,
+            "threshold_exceeded": error_rate > self.error_rate_threshold,
+        }
 
     def _estimate_total_requests(
         self,
@@ -127,46 +116,29 @@ class ErrorMonitor:
             Dictionary with error statistics.
         """
         cutoff_time = datetime.utcnow() - timedelta(hours=hours)
-        session = self.db_manager.get_session()
-
-        try:
-            from src.database import ErrorLog
-
-            query = session.query(ErrorLog).filter(ErrorLog.timestamp >= cutoff_time)
-
-            if application:
-                query = query.filter(ErrorLog.application == application)
-            if environment:
-                query = query.filter(ErrorLog.environment == environment)
-
-            errors = query.all()
-
-            severity_counts = {}
-            category_counts = {}
-            error_types = {}
-
-            for error in errors:
-                if error.severity:
-                    severity_counts[error.severity] = severity_counts.get(error.severity, 0) + 1
-
-                if error.category:
-                    category_name = error.category.name
-                    category_counts[category_name] = category_counts.get(category_name, 0) + 1
-
-                if error.error_type:
-                    error_types[error.error_type] = error_types.get(error.error_type, 0) + 1
-
-            return {
-                "total_errors": len(errors),
-                "severity_breakdown": severity_counts,
-                "category_breakdown": category_counts,
-                "error_types": error_types,
-                "time_period_hours": hours,
-                "application": application,
-                "environment": environment,
-            }
-        finally:
-            session.close()
+
+        breakdowns = {
+            group_by: self.db_manager.error_breakdown(
+                group_by,
+                cutoff_time,
+                application,
+                environment,
+                use_rollups=self.use_rollups,
+            )
+            for group_by in ("severity", "category", "error_type")
+        }
+
+        return {
+            "total_errors": self.db_manager.count_errors(
+                cutoff_time, application, environment, use_rollups=self.use_rollups
+            ),
+            "severity_breakdown": breakdowns["severity"],
+            "category_breakdown": breakdowns["category"],
+            "error_types": breakdowns["error_type"],
+            "time_period_hours": hours,
+            "application": application,
+            "environment": environment,
+        }
 
     def check_error_rate_threshold(
         self,
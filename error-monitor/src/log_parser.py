@@ -1,9 +1,126 @@
 """Parse application log files for error extraction."""
 
+import json
+import os
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+ERROR_KEYWORDS = ["ERROR", "EXCEPTION", "FATAL", "CRITICAL", "FAILED"]
+JSON_ERROR_LEVELS = ["ERROR", "FATAL", "CRITICAL"]
+
+# Byte-level prefilters, run against lowercased blocks (bytes.lower keeps
+# offsets) because case-sensitive alternation is several times faster than
+# re.IGNORECASE. Only lines matching these are handed to the parser.
+_STANDARD_PREFILTER = re.compile(
+    b"|".join(keyword.lower().encode() for keyword in ERROR_KEYWORDS)
+)
+_JSON_PREFILTER = re.compile(
+    b"|".join(level.lower().encode() for level in JSON_ERROR_LEVELS)
+)
+
+_TIMESTAMP_PATTERNS = [
+    re.compile(r"(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})"),
+    re.compile(r"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})"),
+    re.compile(r"\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\]"),
+]
+_ERROR_TYPE_PATTERNS = [
+    re.compile(r"(\w+Exception)", re.IGNORECASE),
+    re.compile(r"(\w+Error)", re.IGNORECASE),
+    re.compile(r"(\w+Failure)", re.IGNORECASE),
+    re.compile(r"ERROR:\s*(\w+)", re.IGNORECASE),
+]
+_ERROR_MESSAGE_PATTERNS = [
+    re.compile(r"ERROR[:\s]+(.+)", re.IGNORECASE),
+    re.compile(r"EXCEPTION[:\s]+(.+)", re.IGNORECASE),
+    re.compile(r"FATAL[:\s]+(.+)", re.IGNORECASE),
+    re.compile(r"CRITICAL[:\s]+(.+)", re.IGNORECASE),
+]
+_STACK_TRACE_INDICATORS = ("at ", 'File "', "Traceback", "Caused by:", "in ")
+
+
+@dataclass
+class ParseStats:
+    """Throughput counters for log parsing."""
+
+    files: int = 0
+    lines: int = 0
+    bytes: int = 0
+    errors: int = 0
+    seconds: float = 0.0
+
+    @property
+    def lines_per_second(self) -> float:
+        """Lines scanned per second."""
+        return self.lines / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Bytes scanned per second."""
+        return self.bytes / self.seconds if self.seconds > 0 else 0.0
+
+    def add(self, other: "ParseStats") -> None:
+        """Accumulate another set of counters into this one."""
+        self.files += other.files
+        self.lines += other.lines
+        self.bytes += other.bytes
+        self.errors += other.errors
+        self.seconds += other.seconds
+
+
+@dataclass
+class _ScanState:
+    """Error being assembled while scanning, carried across blocks."""
+
+    current: Optional[Dict[str, any]] = None
+    start: int = 0
+    stack_trace_lines: List[str] = field(default_factory=list)
+
+
+def load_checkpoints(checkpoint_file: Path) -> Dict[str, Dict[str, int]]:
+    """Load per-file tail checkpoints.
+
+    Args:
+        checkpoint_file: Path to JSON checkpoint file.
+
+    Returns:
+        Mapping of resolved log path to checkpoint, empty if the file is missing.
+    """
+    if not checkpoint_file.exists():
+        return {}
+
+    with open(checkpoint_file, "r") as f:
+        return json.load(f)
+
+
+def save_checkpoints(
+    checkpoints: Dict[str, Dict[str, int]], checkpoint_file: Path
+) -> None:
+    """Write tail checkpoints atomically.
+
+    Args:
+        checkpoints: Mapping of resolved log path to checkpoint.
+        checkpoint_file: Path to JSON checkpoint file.
+    """
+    checkpoint_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = checkpoint_file.with_name(checkpoint_file.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(checkpoints, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, checkpoint_file)
+
+
+def _tail_worker(
+    task: Tuple[Dict, str, Optional[Dict[str, int]]]
+) -> Tuple[str, List[Dict[str, any]], Dict[str, int], ParseStats]:
+    """Tail one file in a worker process."""
+    config, path, checkpoint = task
+    parser = LogParser(config)
+    errors, new_checkpoint = parser.tail_log_file(Path(path), checkpoint)
+    return path, errors, new_checkpoint, parser.stats
 
 
 class LogParser:
@@ -19,6 +136,12 @@ class LogParser:
         self.error_patterns = config.get("error_patterns", [])
         self.log_format = config.get("log_format", "standard")
         self.timestamp_format = config.get("timestamp_format", "%Y-%m-%d %H:%M:%S")
+        self.block_size = config.get("block_size_bytes", 8 * 1024 * 1024)
+        self.max_workers = config.get("max_workers", 4)
+        self.stats = ParseStats()
+        self._prefilter = (
+            _JSON_PREFILTER if self.log_format == "json" else _STANDARD_PREFILTER
+        )
 
     def parse_log_file(self, file_path: Path) -> List[Dict[str, any]]:
         """Parse log file and extract errors.
@@ -32,38 +155,264 @@ class LogParser:
         if not file_path.exists():
             return []
 
+        started = time.perf_counter()
         errors = []
-        current_error = None
-        stack_trace_lines = []
+        state = _ScanState()
 
-        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-            for line in f:
-                line = line.strip()
+        with open(file_path, "rb") as f:
+            for block_start, block in self._iter_blocks(f, 0, include_partial=True):
+                self._scan(block, block_start, state, errors)
 
-                if not line:
-                    continue
+        self._finish_error(state, errors)
+        self._record(1, errors, started)
+        return errors
 
-                error_info = self._parse_line(line)
-                if error_info:
-                    if current_error:
-                        current_error["stack_trace"] = "\n".join(stack_trace_lines)
-                        errors.append(current_error)
-                        stack_trace_lines = []
-
-                    current_error = error_info
-                elif current_error and self._is_stack_trace_line(line):
-                    stack_trace_lines.append(line)
-                elif current_error:
-                    current_error["stack_trace"] = "\n".join(stack_trace_lines)
-                    errors.append(current_error)
-                    current_error = None
-                    stack_trace_lines = []
-
-        if current_error:
-            current_error["stack_trace"] = "\n".join(stack_trace_lines)
-            errors.append(current_error)
+    def tail_log_file(
+        self, file_path: Path, checkpoint: Optional[Dict[str, int]] = None
+    ) -> Tuple[List[Dict[str, any]], Dict[str, int]]:
+        """Parse only the bytes appended since the last checkpoint.
 
-        return errors
+        The checkpoint records the file's device, inode and the byte offset
+        parsed up to. If the inode changed the file was rotated: the rest of
+        the rotated file is read from a sibling with the old inode when one
+        exists, then the new file is read from the start. A file smaller than
+        the checkpoint offset was truncated and is re-read from the start.
+
+        Only complete lines are consumed. An error whose stack trace runs to
+        the end of the data is held back until more lines arrive, or emitted
+        on the next run if the file has not grown.
+
+        Args:
+            file_path: Path to log file.
+            checkpoint: Checkpoint returned by the previous call, if any.
+
+        Returns:
+            Tuple of new error dictionaries and the updated checkpoint.
+        """
+        checkpoint = checkpoint or {}
+        if not file_path.exists():
+            return [], checkpoint
+
+        started = time.perf_counter()
+        errors: List[Dict[str, any]] = []
+        stat = file_path.stat()
+        offset = checkpoint.get("offset", 0)
+        pending_end = checkpoint.get("pending_end")
+
+        if checkpoint and (
+            checkpoint.get("device") != stat.st_dev
+            or checkpoint.get("inode") != stat.st_ino
+        ):
+            rotated = self._find_rotated(file_path, checkpoint)
+            if rotated is not None:
+                state = _ScanState()
+                with open(rotated, "rb") as f:
+                    for block_start, block in self._iter_blocks(
+                        f, offset, include_partial=True
+                    ):
+                        self._scan(block, block_start, state, errors)
+                self._finish_error(state, errors)
+            offset, pending_end = 0, None
+        elif stat.st_size < offset:
+            offset, pending_end = 0, None
+
+        state = _ScanState()
+        consumed = offset
+        with open(file_path, "rb") as f:
+            for block_start, block in self._iter_blocks(f, offset, include_partial=False):
+                self._scan(block, block_start, state, errors)
+                consumed = block_start + len(block)
+
+        new_offset = consumed
+        new_pending_end = None
+        if state.current is not None:
+            if pending_end is not None and consumed <= pending_end:
+                self._finish_error(state, errors)
+            else:
+                new_offset = state.start
+                new_pending_end = consumed
+
+        self._record(1, errors, started)
+        new_checkpoint = {
+            "device": stat.st_dev,
+            "inode": stat.st_ino,
+            "offset": new_offset,
+        }
+        if new_pending_end is not None:
+            new_checkpoint["pending_end"] = new_pending_end
+        return errors, new_checkpoint
+
+    def tail_log_files(
+        self,
+        file_paths: List[Path],
+        checkpoints: Dict[str, Dict[str, int]],
+        max_workers: Optional[int] = None,
+    ) -> Tuple[List[Dict[str, any]], Dict[str, Dict[str, int]]]:
+        """Tail several log files, parsing them in parallel worker processes.
+
+        Each returned error carries the path it came from under "log_file".
+
+        Args:
+            file_paths: Log files to tail.
+            checkpoints: Checkpoints keyed by resolved log path.
+            max_workers: Worker processes, defaults to the configured max_workers.
+
+        Returns:
+            Tuple of new error dictionaries and the updated checkpoints.
+        """
+        paths = [str(Path(path).resolve()) for path in file_paths]
+        tasks = [(self.config, path, checkpoints.get(path)) for path in paths]
+        workers = min(max_workers or self.max_workers, len(tasks))
+
+        if workers <= 1:
+            results = [_tail_worker(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_tail_worker, tasks))
+
+        errors: List[Dict[str, any]] = []
+        updated = dict(checkpoints)
+        for path, file_errors, checkpoint, stats in results:
+            for error in file_errors:
+                error["log_file"] = path
+            errors.extend(file_errors)
+            updated[path] = checkpoint
+            self.stats.add(stats)
+
+        return errors, updated
+
+    def _iter_blocks(
+        self, f: BinaryIO, offset: int, include_partial: bool
+    ) -> Iterator[Tuple[int, bytes]]:
+        """Read a file from offset in large blocks that end on line boundaries.
+
+        Args:
+            f: Binary file object.
+            offset: Byte offset to start reading at.
+            include_partial: Also yield a trailing line with no newline.
+
+        Yields:
+            Tuples of block start offset and block bytes.
+        """
+        f.seek(offset)
+        block_start = offset
+        carry = b""
+
+        while True:
+            chunk = f.read(self.block_size)
+            if not chunk:
+                break
+            data = carry + chunk
+            cut = data.rfind(b"\n") + 1
+            if cut == 0:
+                carry = data
+                continue
+            yield block_start, data[:cut]
+            block_start += cut
+            carry = data[cut:]
+
+        if include_partial and carry:
+            yield block_start, carry
+
+    def _scan(
+        self,
+        data: bytes,
+        base_offset: int,
+        state: _ScanState,
+        errors: List[Dict[str, any]],
+    ) -> None:
+        """Extract errors from a block of complete lines.
+
+        While no error is open, the block is searched with the precompiled
+        prefilter and lines without an error keyword are never decoded.
+
+        Args:
+            data: Block bytes.
+            base_offset: File offset of the block.
+            state: Error being assembled, carried across blocks.
+            errors: List completed errors are appended to.
+        """
+        prefilter = self._prefilter
+        lowered = data.lower()
+        position = 0
+        end = len(data)
+        self.stats.lines += data.count(b"\n")
+        self.stats.bytes += end
+
+        while position < end:
+            if state.current is None:
+                match = prefilter.search(lowered, position)
+                if match is None:
+                    return
+                newline = data.rfind(b"\n", position, match.start())
+                line_start = newline + 1 if newline >= 0 else position
+            else:
+                line_start = position
+
+            line_end = data.find(b"\n", line_start)
+            if line_end < 0:
+                line_end = end
+            position = line_end + 1
+
+            line = data[line_start:line_end].decode("utf-8", errors="ignore").strip()
+            if not line:
+                continue
+
+            error_info = (
+                self._parse_line(line)
+                if prefilter.search(lowered, line_start, line_end)
+                else None
+            )
+            if error_info:
+                self._finish_error(state, errors)
+                state.current = error_info
+                state.start = base_offset + line_start
+            elif state.current and self._is_stack_trace_line(line):
+                state.stack_trace_lines.append(line)
+            elif state.current:
+                self._finish_error(state, errors)
+
+    def _finish_error(self, state: _ScanState, errors: List[Dict[str, any]]) -> None:
+        """Close the open error, if any, and append it to errors."""
+        if state.current is None:
+            return
+        state.current["stack_trace"] = "\n".join(state.stack_trace_lines)
+        errors.append(state.current)
+        state.current = None
+        state.stack_trace_lines = []
+
+    def _record(
+        self, files: int, errors: List[Dict[str, any]], started: float
+    ) -> None:
+        """Add file, error and timing counts to the stats."""
+        self.stats.files += files
+        self.stats.errors += len(errors)
+        self.stats.seconds += time.perf_counter() - started
+
+    def _find_rotated(
+        self, file_path: Path, checkpoint: Dict[str, int]
+    ) -> Optional[Path]:
+        """Find the rotated copy of a log file by its checkpointed inode.
+
+        Args:
+            file_path: Current log file path.
+            checkpoint: Checkpoint recorded for the previous file.
+
+        Returns:
+            Path of the sibling carrying the old inode, or None.
+        """
+        for candidate in file_path.parent.glob(f"{file_path.name}*"):
+            try:
+                stat = candidate.stat()
+            except OSError:
+                continue
+            if (
+                stat.st_ino == checkpoint.get("inode")
+                and stat.st_dev == checkpoint.get("device")
+                and stat.st_size >= checkpoint.get("offset", 0)
+            ):
+                return candidate
+        return None
 
     def _parse_line(self, line: str) -> Optional[Dict[str, any]]:
         """Parse a single log line for error information.
@@ -90,10 +439,9 @@ class LogParser:
         Returns:
             Error dictionary or None.
         """
-        error_keywords = ["ERROR", "EXCEPTION", "FATAL", "CRITICAL", "FAILED"]
         line_upper = line.upper()
 
-        if not any(keyword in line_upper for keyword in error_keywords):
+        if not any(keyword in line_upper for keyword in ERROR_KEYWORDS):
             return None
 
         timestamp = self._extract_timestamp(line)
@@ -120,12 +468,10 @@ class LogParser:
             Error dictionary or None.
         """
         try:
-            import json
-
             log_entry = json.loads(line)
             level = log_entry.get("level", "").upper()
 
-            if level not in ["ERROR", "FATAL", "CRITICAL"]:
+            if level not in JSON_ERROR_LEVELS:
                 return None
 
             return {
@@ -150,14 +496,8 @@ class LogParser:
         Returns:
             Parsed datetime or None.
         """
-        timestamp_patterns = [
-            r"(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})",
-            r"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})",
-            r"\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\]",
-        ]
-
-        for pattern in timestamp_patterns:
-            match = re.search(pattern, line)
+        for pattern in _TIMESTAMP_PATTERNS:
+            match = pattern.search(line)
             if match:
                 try:
                     return datetime.strptime(match.group(1), self.timestamp_format)
@@ -195,15 +535,8 @@ class LogParser:
         Returns:
             Error type or None.
         """
-        error_type_patterns = [
-            r"(\w+Exception)",
-            r"(\w+Error)",
-            r"(\w+Failure)",
-            r"ERROR:\s*(\w+)",
-        ]
-
-        for pattern in error_type_patterns:
-            match = re.search(pattern, line, re.IGNORECASE)
+        for pattern in _ERROR_TYPE_PATTERNS:
+            match = pattern.search(line)
             if match:
                 return match.group(1)
 
@@ -218,15 +551,8 @@ class LogParser:
         Returns:
             Error message or None.
         """
-        error_message_patterns = [
-            r"ERROR[:\s]+(.+)",
-            r"EXCEPTION[:\s]+(.+)",
-            r"FATAL[:\s]+(.+)",
-            r"CRITICAL[:\s]+(.+)",
-        ]
-
-        for pattern in error_message_patterns:
-            match = re.search(pattern, line, re.IGNORECASE)
+        for pattern in _ERROR_MESSAGE_PATTERNS:
+            match = pattern.search(line)
             if match:
                 message = match.group(1).strip()
                 if len(message) > 10:
@@ -263,12 +589,4 @@ class LogParser:
         Returns:
             True if stack trace line.
         """
-        stack_trace_indicators = [
-            "at ",
-            "File \"",
-            "Traceback",
-            "Caused by:",
-            "in ",
-        ]
-
-        return any(indicator in line for indicator in stack_trace_indicators)
+        return any(indicator in line for indicator in _STACK_TRACE_INDICATORS)
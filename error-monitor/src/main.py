@@ -8,14 +8,14 @@ import argparse
 import logging
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from src.config import get_settings, load_config
 from src.database import DatabaseManager
 from src.bug_report_generator import BugReportGenerator
 from src.error_categorizer import ErrorCategorizer
 from src.error_monitor import ErrorMonitor
-from src.log_parser import LogParser
+from src.log_parser import LogParser, load_checkpoints, save_checkpoints
 from src.pattern_identifier import PatternIdentifier
 from src.report_generator import ReportGenerator
 
@@ -84,6 +84,102 @@ def parse_logs(
         logger.warning("No errors found in log file")
         return {"success": True, "imported_count": 0}
 
+    imported_count = _import_errors(
+        db_manager, categorizer, errors, application, environment
+    )
+
+    logger.info(f"Imported {imported_count} error logs from log file")
+
+    return {
+        "success": True,
+        "imported_count": imported_count,
+        "log_file": str(log_file),
+    }
+
+
+def tail_logs(
+    config: dict,
+    settings: object,
+    log_files: List[Path],
+    application: Optional[str] = None,
+    environment: Optional[str] = None,
+) -> dict:
+    """Import only the errors appended to log files since the last run.
+
+    Per-file checkpoints are kept in parsing.checkpoint_file, so repeated
+    runs (for example from cron) skip everything already imported.
+
+    Args:
+        config: Configuration dictionary.
+        settings: Application settings object.
+        log_files: Paths to log files.
+        application: Application name.
+        environment: Environment name.
+
+    Returns:
+        Dictionary with parsing results and throughput counters.
+    """
+    logger = logging.getLogger(__name__)
+
+    db_manager = DatabaseManager(settings.database.url)
+    db_manager.create_tables()
+
+    parsing_config = config.get("parsing", {})
+    log_parser = LogParser(parsing_config)
+    categorizer = ErrorCategorizer(config.get("categorization", {}))
+    checkpoint_file = Path(
+        parsing_config.get("checkpoint_file", "logs/parse_checkpoints.json")
+    )
+
+    logger.info(f"Tailing {len(log_files)} log files")
+
+    errors, checkpoints = log_parser.tail_log_files(
+        log_files, load_checkpoints(checkpoint_file)
+    )
+    imported_count = _import_errors(
+        db_manager, categorizer, errors, application, environment
+    )
+    save_checkpoints(checkpoints, checkpoint_file)
+
+    stats = log_parser.stats
+    logger.info(
+        f"Imported {imported_count} error logs from {stats.files} files "
+        f"({stats.lines_per_second:,.0f} lines/sec, "
+        f"{stats.bytes_per_second / 1_048_576:,.1f} MB/sec)"
+    )
+
+    return {
+        "success": True,
+        "imported_count": imported_count,
+        "log_files": [str(log_file) for log_file in log_files],
+        "lines_scanned": stats.lines,
+        "bytes_scanned": stats.bytes,
+        "lines_per_second": stats.lines_per_second,
+        "bytes_per_second": stats.bytes_per_second,
+    }
+
+
+def _import_errors(
+    db_manager: DatabaseManager,
+    categorizer: ErrorCategorizer,
+    errors: List[dict],
+    application: Optional[str],
+    environment: Optional[str],
+) -> int:
+    """Categorize parsed errors and store them.
+
+    Args:
+        db_manager: Database manager instance.
+        categorizer: Error categorizer.
+        errors: Parsed error dictionaries.
+        application: Application name override.
+        environment: Environment name override.
+
+    Returns:
+        Number of errors imported.
+    """
+    logger = logging.getLogger(__name__)
+
     imported_count = 0
     for error in errors:
         try:
@@ -98,7 +194,7 @@ def parse_logs(
                 category_info["description"],
             )
 
-            error_log = db_manager.add_error_log(
+            db_manager.add_error_log(
                 error_message=error.get("error_message", ""),
                 error_type=error.get("error_type"),
                 stack_trace=error.get("stack_trace"),
@@ -107,21 +203,14 @@ def parse_logs(
                 severity=category_info["severity"],
                 user_id=error.get("user_id"),
                 request_id=error.get("request_id"),
+                category_id=category.id,
             )
-
-            db_manager.update_error_category(error_log.id, category.id)
             imported_count += 1
 
         except Exception as e:
             logger.error(f"Error importing error log: {e}")
 
-    logger.info(f"Imported {imported_count} error logs from log file")
-
-    return {
-        "success": True,
-        "imported_count": imported_count,
-        "log_file": str(log_file),
-    }
+    return imported_count
 
 
 def analyze_errors(
@@ -185,19 +274,15 @@ def analyze_errors(
                 pattern["pattern_description"],
             )
 
-            matching_errors = [
-                e for e in errors if pattern_identifier._create_error_signature(
-                    {
-                        "error_message": e.error_message,
-                        "error_type": e.error_type,
-                    }
-                ) == pattern["error_signature"]
-            ]
+            for error_id in pattern["error_ids"]:
+                db_manager.update_error_pattern(error_id, pattern_obj.id)
 
-            for error in matching_errors:
-                db_manager.update_error_pattern(error.id, pattern_obj.id)
+        pattern_identifier.save_state()
 
-        logger.info(f"Identified {len(patterns)} error patterns")
+        logger.info(
+            f"Identified {len(patterns)} error patterns "
+            f"({len(pattern_identifier.miner)} known templates)"
+        )
 
         return {
             "success": True,
@@ -268,6 +353,30 @@ def generate_bug_reports(
         session.close()
 
 
+def rebuild_rollups(settings: object) -> dict:
+    """Recompute the minute, hour and day error rollups from stored errors.
+
+    Args:
+        settings: Application settings object.
+
+    Returns:
+        Dictionary with the number of rollup rows written.
+    """
+    logger = logging.getLogger(__name__)
+
+    db_manager = DatabaseManager(settings.database.url)
+    db_manager.create_tables()
+
+    rollup_rows = db_manager.rebuild_error_rollups()
+
+    logger.info(f"Rebuilt {rollup_rows} error rollup rows")
+
+    return {
+        "success": True,
+        "rollup_rows": rollup_rows,
+    }
+
+
 def generate_reports(
     config: dict,
     settings: object,
@@ -316,6 +425,13 @@ def main() -> None:
         metavar="LOG_FILE",
         help="Parse log file and import errors",
     )
+    parser.add_argument(
+        "--tail",
+        type=Path,
+        nargs="+",
+        metavar="LOG_FILE",
+        help="Import only errors appended since the last --tail run",
+    )
     parser.add_argument(
         "--analyze",
         action="store_true",
@@ -331,6 +447,11 @@ def main() -> None:
         action="store_true",
         help="Generate analysis reports",
     )
+    parser.add_argument(
+        "--rebuild-rollups",
+        action="store_true",
+        help="Recompute minute, hour and day error rollups from stored errors",
+    )
     parser.add_argument(
         "--application",
         help="Filter by application name",
@@ -353,7 +474,16 @@ def main() -> None:
 
     args = parser.parse_args()
 
-    if not any([args.parse, args.analyze, args.generate_bugs, args.report]):
+    if not any(
+        [
+            args.parse,
+            args.tail,
+            args.rebuild_rollups,
+            args.analyze,
+            args.generate_bugs,
+            args.report,
+        ]
+    ):
         parser.print_help()
         sys.exit(1)
 
@@ -381,6 +511,27 @@ def main() -> None:
             print(f"Imported errors: {result['imported_count']}")
             print(f"Log file: {result['log_file']}")
 
+        if args.tail:
+            result = tail_logs(
+                config=config,
+                settings=settings,
+                log_files=args.tail,
+                application=args.application,
+                environment=args.environment,
+            )
+            print(f"\nLog tailing completed:")
+            print(f"Imported errors: {result['imported_count']}")
+            print(
+                f"Scanned: {result['lines_scanned']} lines, "
+                f"{result['bytes_scanned']} bytes "
+                f"({result['lines_per_second']:,.0f} lines/sec)"
+            )
+
+        if args.rebuild_rollups:
+            result = rebuild_rollups(settings=settings)
+            print("\nRollup rebuild completed:")
+            print(f"Rollup rows: {result['rollup_rows']}")
+
         if args.analyze:
             result = analyze_errors(
                 config=config,
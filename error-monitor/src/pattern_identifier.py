@@ -1,11 +1,292 @@
 """Identify error patterns and trends."""
 
 import hashlib
+import json
+import os
 import re
 from collections import Counter
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+WILDCARD = "<*>"
+
+DIGITS_PATTERN = re.compile(r"\d+")
+HEX_PATTERN = re.compile(r"0x[0-9a-f]+")
+QUOTED_PATTERN = re.compile(r"['\"][^'\"]*['\"]")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_error_message(message: str) -> str:
+    """Lowercase a message and mask numbers, hex values and quoted strings.
+
+    Args:
+        message: Error message.
+
+    Returns:
+        Normalized message.
+    """
+    message = message.lower()
+
+    message = DIGITS_PATTERN.sub("N", message)
+    message = HEX_PATTERN.sub("HEX", message)
+    message = QUOTED_PATTERN.sub("STRING", message)
+    message = WHITESPACE_PATTERN.sub(" ", message)
+
+    return message.strip()
+
+
+def sequence_similarity(template: List[str], tokens: List[str]) -> float:
+    """Fraction of positions where two token sequences agree.
+
+    Wildcard positions in the template never count as agreement, so a
+    template that has generalised away most of its tokens scores low.
+
+    Args:
+        template: Template or reference tokens.
+        tokens: Tokens to compare.
+
+    Returns:
+        Similarity score (0.0 to 1.0).
+    """
+    length = max(len(template), len(tokens))
+    if length == 0:
+        return 1.0
+
+    equal = sum(
+        1 for left, right in zip(template, tokens) if left == right and left != WILDCARD
+    )
+    return equal / length
+
+
+@dataclass
+class TemplateCluster:
+    """A group of errors sharing one message template."""
+
+    cluster_id: int
+    error_type: str
+    template: List[str]
+    signature: str
+    size: int = 0
+
+    @property
+    def template_text(self) -> str:
+        """Template tokens joined back into a message."""
+        return " ".join(self.template)
+
+
+class TemplateMiner:
+    """Online Drain-style log template miner.
+
+    Errors are routed through a fixed-depth prefix tree keyed by error type
+    and token count, then by their first few tokens, so each assignment only
+    compares against the handful of clusters in one leaf regardless of how
+    many errors or clusters exist. Matching clusters generalise differing
+    tokens into wildcards. Errors added with an id are remembered, so adding
+    the same error again returns its cluster without growing it.
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = 0.4,
+        depth: int = 2,
+        max_children: int = 100,
+    ):
+        """Initialize template miner.
+
+        Args:
+            similarity_threshold: Minimum sequence similarity for an error
+                to join an existing cluster.
+            depth: Number of leading tokens used to route errors.
+            max_children: Maximum distinct tokens per tree node before new
+                tokens are routed to the wildcard branch.
+        """
+        self.similarity_threshold = similarity_threshold
+        self.depth = depth
+        self.max_children = max_children
+        self.clusters: Dict[int, TemplateCluster] = {}
+        self.tree: Dict[str, any] = {}
+        self.assignments: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        """Number of clusters."""
+        return len(self.clusters)
+
+    def add(
+        self,
+        error_type: str,
+        tokens: List[str],
+        signature: str,
+        error_id: Optional[int] = None,
+    ) -> TemplateCluster:
+        """Assign tokens to a cluster, creating or generalising one as needed.
+
+        Args:
+            error_type: Error type used to partition the tree.
+            tokens: Normalized message tokens.
+            signature: Signature recorded if a new cluster is created.
+            error_id: Stored error id; an error already added under this id
+                is not counted again.
+
+        Returns:
+            Cluster the error was assigned to.
+        """
+        if error_id is not None and error_id in self.assignments:
+            return self.clusters[self.assignments[error_id]]
+
+        leaf = self._leaf(error_type, tokens, create=True)
+        cluster, _ = self._best_match(leaf, tokens)
+
+        if cluster is None:
+            cluster = TemplateCluster(
+                cluster_id=len(self.clusters) + 1,
+                error_type=error_type,
+                template=list(tokens),
+                signature=signature,
+            )
+            self.clusters[cluster.cluster_id] = cluster
+            leaf.append(cluster.cluster_id)
+        else:
+            cluster.template = [
+                left if left == right else WILDCARD
+                for left, right in zip(cluster.template, tokens)
+            ]
+
+        cluster.size += 1
+        if error_id is not None:
+            self.assignments[error_id] = cluster.cluster_id
+        return cluster
+
+    def match(self, error_type: str, tokens: List[str]) -> Tuple[Optional[TemplateCluster], float]:
+        """Find the best cluster for tokens without modifying the miner.
+
+        Args:
+            error_type: Error type used to partition the tree.
+            tokens: Normalized message tokens.
+
+        Returns:
+            Tuple of (cluster or None, similarity score).
+        """
+        leaf = self._leaf(error_type, tokens, create=False)
+        if leaf is None:
+            return None, 0.0
+        return self._best_match(leaf, tokens)
+
+    def _leaf(self, error_type: str, tokens: List[str], create: bool) -> Optional[List[int]]:
+        """Walk the prefix tree to the leaf cluster list for tokens."""
+        node = self.tree
+        keys = [f"{error_type}|{len(tokens)}"] + [
+            self._route_token(token) for token in tokens[: self.depth]
+        ]
+
+        for level, key in enumerate(keys):
+            last = level == len(keys) - 1
+            if key not in node:
+                full = level > 0 and len(node) >= self.max_children
+                if full or (not create and level > 0):
+                    key = WILDCARD
+                if key not in node and not create:
+                    return None
+                node = node.setdefault(key, [] if last else {})
+            else:
+                node = node[key]
+
+        return node
+
+    @staticmethod
+    def _route_token(token: str) -> str:
+        """Route masked tokens (numbers, hex, quoted strings) to the wildcard branch."""
+        return WILDCARD if token != token.lower() else token
+
+    def _best_match(
+        self, leaf: List[int], tokens: List[str]
+    ) -> Tuple[Optional[TemplateCluster], float]:
+        """Pick the most similar cluster in a leaf above the threshold."""
+        best: Optional[TemplateCluster] = None
+        best_score = -1.0
+        best_wildcards = 0
+
+        for cluster_id in leaf:
+            cluster = self.clusters[cluster_id]
+            score = sequence_similarity(cluster.template, tokens)
+            wildcards = cluster.template.count(WILDCARD)
+            if score > best_score or (score == best_score and wildcards > best_wildcards):
+                best, best_score, best_wildcards = cluster, score, wildcards
+
+        if best is None or best_score < self.similarity_threshold:
+            return None, max(best_score, 0.0)
+        return best, best_score
+
+    def to_dict(self) -> Dict[str, any]:
+        """Serialize clusters and the prefix tree."""
+        return {
+            "depth": self.depth,
+            "max_children": self.max_children,
+            "clusters": [asdict(cluster) for cluster in self.clusters.values()],
+            "tree": self.tree,
+            "assignments": sorted(self.assignments.items()),
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, any], similarity_threshold: float = 0.4) -> "TemplateMiner":
+        """Rebuild a miner from to_dict output.
+
+        Args:
+            state: Serialized miner.
+            similarity_threshold: Minimum similarity for joining a cluster.
+
+        Returns:
+            TemplateMiner instance.
+        """
+        miner = cls(
+            similarity_threshold=similarity_threshold,
+            depth=state.get("depth", 2),
+            max_children=state.get("max_children", 100),
+        )
+        for data in state.get("clusters", []):
+            cluster = TemplateCluster(**data)
+            miner.clusters[cluster.cluster_id] = cluster
+        miner.tree = state.get("tree", {})
+        miner.assignments = {
+            error_id: cluster_id for error_id, cluster_id in state.get("assignments", [])
+        }
+        return miner
+
+
+def load_template_miner(state_file: Path, **kwargs) -> TemplateMiner:
+    """Load a persisted template miner, or start an empty one.
+
+    Args:
+        state_file: Path to JSON cluster state file.
+        **kwargs: TemplateMiner settings for a new or loaded miner.
+
+    Returns:
+        TemplateMiner instance.
+    """
+    if not state_file.exists():
+        return TemplateMiner(**kwargs)
+
+    with open(state_file, "r") as f:
+        state = json.load(f)
+    return TemplateMiner.from_dict(
+        state, similarity_threshold=kwargs.get("similarity_threshold", 0.4)
+    )
+
+
+def save_template_miner(miner: TemplateMiner, state_file: Path) -> None:
+    """Write template miner state atomically.
+
+    Args:
+        miner: Template miner to persist.
+        state_file: Path to JSON cluster state file.
+    """
+    state_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = state_file.with_name(state_file.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(miner.to_dict(), f)
+    os.replace(tmp_path, state_file)
+
 
 class PatternIdentifier:
     """Identify patterns in error logs."""
@@ -19,10 +300,33 @@ class PatternIdentifier:
         self.config = config
         self.min_frequency = config.get("min_frequency", 3)
         self.similarity_threshold = config.get("similarity_threshold", 0.8)
+        self.state_file = config.get("cluster_state_file")
+
+        miner_settings = {
+            "similarity_threshold": config.get("template_similarity_threshold", 0.4),
+            "depth": config.get("tree_depth", 2),
+            "max_children": config.get("max_children", 100),
+        }
+        if self.state_file:
+            self.miner = load_template_miner(Path(self.state_file), **miner_settings)
+        else:
+            self.miner = TemplateMiner(**miner_settings)
+
+    def save_state(self) -> None:
+        """Persist the cluster tree to cluster_state_file, if configured."""
+        if self.state_file:
+            save_template_miner(self.miner, Path(self.state_file))
 
     def identify_patterns(self, errors: List[Dict[str, any]]) -> List[Dict[str, any]]:
         """Identify error patterns from error list.
 
+        Each error is assigned to a template cluster in the miner, which keeps
+        clusters from earlier calls (and earlier runs when cluster_state_file
+        is set). Errors with an id that were mined before keep their cluster
+        and are not counted again, so re-analysing a window does not inflate
+        cluster sizes. Clusters with at least min_frequency errors in this
+        batch become patterns carrying the ids of their member errors.
+
         Args:
             errors: List of error dictionaries.
 
@@ -32,23 +336,45 @@ class PatternIdentifier:
         if not errors:
             return []
 
-        error_signatures = {}
+        cluster_errors: Dict[int, List[Dict[str, any]]] = {}
         for error in errors:
-            signature = self._create_error_signature(error)
-            if signature not in error_signatures:
-                error_signatures[signature] = []
-            error_signatures[signature].append(error)
+            cluster = self.assign_cluster(error)
+            cluster_errors.setdefault(cluster.cluster_id, []).append(error)
 
         patterns = []
-        for signature, signature_errors in error_signatures.items():
-            if len(signature_errors) >= self.min_frequency:
-                pattern = self._create_pattern(signature, signature_errors)
+        for cluster_id, members in cluster_errors.items():
+            if len(members) >= self.min_frequency:
+                cluster = self.miner.clusters[cluster_id]
+                pattern = self._create_pattern(cluster.signature, members)
+                pattern["cluster_id"] = cluster_id
+                pattern["template"] = cluster.template_text
+                pattern["error_ids"] = [
+                    error["id"] for error in members if error.get("id") is not None
+                ]
                 patterns.append(pattern)
 
         patterns.sort(key=lambda x: x.get("frequency", 0), reverse=True)
 
         return patterns
 
+    def assign_cluster(self, error: Dict[str, any]) -> TemplateCluster:
+        """Assign one error to its template cluster.
+
+        Args:
+            error: Error dictionary.
+
+        Returns:
+            Cluster the error joined.
+        """
+        error_type = error.get("error_type") or ""
+        normalized_message = self._normalize_error_message(error.get("error_message", ""))
+        return self.miner.add(
+            error_type,
+            normalized_message.split(),
+            self._signature_from_normalized(error_type, normalized_message),
+            error.get("id"),
+        )
+
     def _create_error_signature(self, error: Dict[str, any]) -> str:
         """Create error signature for pattern matching.
 
@@ -62,6 +388,11 @@ class PatternIdentifier:
         error_type = error.get("error_type", "")
 
         normalized_message = self._normalize_error_message(error_message)
+        return self._signature_from_normalized(error_type, normalized_message)
+
+    @staticmethod
+    def _signature_from_normalized(error_type: str, normalized_message: str) -> str:
+        """Hash an error type and normalized message into a signature."""
         signature_parts = [error_type, normalized_message]
 
         signature = "|".join(s for s in signature_parts if s)
@@ -77,14 +408,7 @@ class PatternIdentifier:
         Returns:
             Normalized message.
         """
-        message = message.lower()
-
-        message = re.sub(r"\d+", "N", message)
-        message = re.sub(r"0x[0-9a-f]+", "HEX", message)
-        message = re.sub(r"['\"][^'\"]*['\"]", "STRING", message)
-        message = re.sub(r"\s+", " ", message)
-
-        return message.strip()
+        return normalize_error_message(message)
 
     def _create_pattern(self, signature: str, errors: List[Dict[str, any]]) -> Dict[str, any]:
         """Create pattern from error signature and errors.
@@ -167,31 +491,43 @@ class PatternIdentifier:
             all_errors: List of all errors.
 
         Returns:
-            List of similar errors.
+            Copies of similar errors with a "similarity" score, most similar
+            first.
         """
-        target_signature = self._create_error_signature(target_error)
+        target_type = target_error.get("error_type") or ""
+        target_tokens = self._normalize_error_message(
+            target_error.get("error_message", "")
+        ).split()
+
         similar_errors = []
+        tokens_by_message: Dict[str, List[str]] = {}
 
         for error in all_errors:
-            signature = self._create_error_signature(error)
-            similarity = self._calculate_similarity(target_signature, signature)
+            if (error.get("error_type") or "") != target_type:
+                continue
+
+            message = error.get("error_message", "")
+            tokens = tokens_by_message.get(message)
+            if tokens is None:
+                tokens = self._normalize_error_message(message).split()
+                tokens_by_message[message] = tokens
 
+            similarity = self._calculate_similarity(target_tokens, tokens)
             if similarity >= self.similarity_threshold:
-                similar_errors.append(error)
+                similar_errors.append({**error, "similarity": similarity})
+
+        similar_errors.sort(key=lambda x: x["similarity"], reverse=True)
 
         return similar_errors
 
-    def _calculate_similarity(self, signature1: str, signature2: str) -> float:
-        """Calculate similarity between two signatures.
+    def _calculate_similarity(self, tokens1: List[str], tokens2: List[str]) -> float:
+        """Calculate similarity between two normalized token sequences.
 
         Args:
-            signature1: First signature.
-            signature2: Second signature.
+            tokens1: First token sequence.
+            tokens2: Second token sequence.
 
         Returns:
             Similarity score (0.0 to 1.0).
         """
-        if signature1 == signature2:
-            return 1.0
-
-        return 0.0
+        return sequence_similarity(tokens1, tokens2)
@@ -6,7 +6,14 @@ from pathlib import Path
 from unittest.mock import Mock, patch
 
 from src.config import load_config, get_settings
-from src.database import DatabaseManager, ErrorLog, ErrorCategory, ErrorPattern, BugReport
+from src.database import (
+    DatabaseManager,
+    ErrorLog,
+    ErrorCategory,
+    ErrorPattern,
+    ErrorRollup,
+    BugReport,
+)
 from src.log_parser import LogParser
 from src.error_categorizer import ErrorCategorizer
 from src.pattern_identifier import PatternIdentifier
@@ -241,3 +248,168 @@ def test_pattern_identifier_calculate_trend(sample_config):
     
     trend = identifier._calculate_trend(timestamps)
     assert trend in ["increasing", "decreasing", "stable"]
+
+
+def test_log_parser_tail_log_file_resumes_from_checkpoint(sample_config, tmp_path):
+    """Test tailing reads only appended lines and follows rotation."""
+    parser = LogParser(sample_config["parsing"])
+    log_file = tmp_path / "app.log"
+    log_file.write_text(
+        "2024-01-01 10:00:00 INFO started\n"
+        "2024-01-01 10:00:01 ERROR: Database connection failed\n"
+        "2024-01-01 10:00:02 INFO recovered\n"
+    )
+
+    errors, checkpoint = parser.tail_log_file(log_file)
+    assert [e["error_message"] for e in errors] == ["Database connection failed"]
+
+    errors, checkpoint = parser.tail_log_file(log_file, checkpoint)
+    assert errors == []
+
+    with open(log_file, "a") as f:
+        f.write("2024-01-01 10:00:03 FATAL: Worker pool exhausted\n")
+        f.write('  File "worker.py", line 10, in run\n')
+    errors, checkpoint = parser.tail_log_file(log_file, checkpoint)
+    assert errors == []
+
+    with open(log_file, "a") as f:
+        f.write("  at pool.acquire(pool.py:88)\n")
+    log_file.rename(tmp_path / "app.log.1")
+    log_file.write_text("2024-01-01 10:00:04 ERROR: Cache connection refused\n")
+    errors, checkpoint = parser.tail_log_file(log_file, checkpoint)
+
+    assert [e["error_message"] for e in errors] == ["Worker pool exhausted"]
+    assert errors[0]["stack_trace"].splitlines() == [
+        'File "worker.py", line 10, in run',
+        "at pool.acquire(pool.py:88)",
+    ]
+
+    errors, checkpoint = parser.tail_log_file(log_file, checkpoint)
+    assert [e["error_message"] for e in errors] == ["Cache connection refused"]
+    assert parser.stats.errors == 3
+
+
+def test_pattern_identifier_clusters_templates_and_persists(sample_config, tmp_path):
+    """Test that variable tokens merge into one template that survives a reload."""
+    config = dict(
+        sample_config["pattern_identification"],
+        cluster_state_file=str(tmp_path / "clusters.json"),
+    )
+    identifier = PatternIdentifier(config)
+    errors = [
+        {
+            "id": i,
+            "error_message": f"Cache miss for key {name} in region east",
+            "error_type": "LookupError",
+            "timestamp": datetime.utcnow(),
+        }
+        for i, name in enumerate(["alice", "bob", "carol", "dave"])
+    ]
+    patterns = identifier.identify_patterns(errors)
+    assert len(patterns) == 1
+    assert patterns[0]["template"] == "cache miss for key <*> in region east"
+    assert patterns[0]["error_ids"] == [0, 1, 2, 3]
+    identifier.save_state()
+
+    reloaded = PatternIdentifier(config)
+    cluster = reloaded.assign_cluster(
+        {"error_message": "Cache miss for key erin in region east", "error_type": "LookupError"}
+    )
+    assert cluster.cluster_id == patterns[0]["cluster_id"]
+    assert cluster.signature == patterns[0]["error_signature"]
+
+    similar = reloaded.find_similar_errors(errors[0], errors + [
+        {"error_message": "Disk full on volume data", "error_type": "LookupError"}
+    ])
+    assert [e["id"] for e in similar] == [0, 1, 2, 3]
+    assert similar[0]["similarity"] == 1.0
+    assert 0.8 <= similar[1]["similarity"] < 1.0
+
+
+def test_pattern_identifier_counts_reanalysed_errors_once(sample_config, tmp_path):
+    """Test that analysing the same errors again does not grow clusters."""
+    config = dict(
+        sample_config["pattern_identification"],
+        cluster_state_file=str(tmp_path / "clusters.json"),
+    )
+    identifier = PatternIdentifier(config)
+    errors = [
+        {
+            "id": i,
+            "error_message": f"Timeout after {i} ms calling billing",
+            "error_type": "TimeoutError",
+            "timestamp": datetime.utcnow(),
+        }
+        for i in range(4)
+    ]
+
+    first = identifier.identify_patterns(errors)
+    second = identifier.identify_patterns(errors)
+    identifier.save_state()
+    reloaded = PatternIdentifier(config)
+    third = reloaded.identify_patterns(errors + [dict(errors[0], id=4)])
+
+    cluster_id = first[0]["cluster_id"]
+    assert second[0]["cluster_id"] == third[0]["cluster_id"] == cluster_id
+    assert identifier.miner.clusters[cluster_id].size == 4
+    assert reloaded.miner.clusters[cluster_id].size == 5
+    assert third[0]["error_ids"] == [0, 1, 2, 3, 4]
+
+
+def test_error_monitor_statistics_match_with_and_without_rollups(db_manager, sample_config):
+    """Test that rollup-backed statistics match direct aggregation."""
+    from datetime import timedelta
+
+    db_manager.create_tables()
+    now = datetime.utcnow()
+    categories = [db_manager.add_error_category(name) for name in ("database", "network")]
+    for i in range(40):
+        error = db_manager.add_error_log(
+            error_message="Test error",
+            error_type=f"Type{i % 3}",
+            application="test_app",
+            environment="test",
+            severity="high" if i % 2 else "low",
+            timestamp=now - timedelta(minutes=i * 1.5),
+        )
+        db_manager.update_error_category(error.id, categories[i % 2].id)
+
+    rollup_monitor = ErrorMonitor(
+        db_manager, dict(sample_config["monitoring"], use_rollups=True)
+    )
+    direct_monitor = ErrorMonitor(db_manager, sample_config["monitoring"])
+    rollup_stats = rollup_monitor.get_error_statistics("test_app", "test", hours=1)
+    direct_stats = direct_monitor.get_error_statistics("test_app", "test", hours=1)
+
+    assert rollup_stats == direct_stats
+    assert rollup_stats["total_errors"] == 40
+    assert rollup_stats["category_breakdown"] == {"database": 20, "network": 20}
+    assert rollup_stats["severity_breakdown"] == {"high": 20, "low": 20}
+
+    assert db_manager.rebuild_error_rollups() > 0
+    assert rollup_monitor.get_error_statistics("test_app", "test", hours=1) == direct_stats
+
+
+def test_error_monitor_rollups_off_by_default(db_manager, sample_config):
+    """Test that a database without rollups is counted in full by default."""
+    db_manager.create_tables()
+    for _ in range(5):
+        db_manager.add_error_log(
+            error_message="Test error",
+            error_type="Type",
+            application="test_app",
+            environment="test",
+            severity="high",
+            timestamp=datetime.utcnow(),
+        )
+    session = db_manager.get_session()
+    try:
+        session.query(ErrorRollup).delete()
+        session.commit()
+    finally:
+        session.close()
+
+    monitor = ErrorMonitor(db_manager, sample_config["monitoring"])
+
+    assert monitor.use_rollups is False
+    assert monitor.get_error_statistics("test_app", "test", hours=1)["total_errors"] == 5
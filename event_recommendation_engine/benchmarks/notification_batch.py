@@ -0,0 +1,179 @@
+"""Benchmark notification throughput against a local SMTP stand-in.
+
+Starts a minimal threaded SMTP server that accepts every message, with an
+optional delay on each new connection (standing in for the TLS handshake
+and login of a real relay) and on each message. Then times sending a batch
+with one connection per message (the previous behaviour) and with the
+batched sender at several worker counts.
+
+Run from the repository root:
+
+    python -m event_recommendation_engine.benchmarks.notification_batch
+"""
+
+import argparse
+import logging
+import socketserver
+import threading
+import time
+from datetime import datetime, timedelta
+from email.mime.text import MIMEText
+from typing import List, Tuple
+
+from event_recommendation_engine.src.main import (
+    EventData,
+    NotificationConfig,
+    Recommendation,
+    build_notification_message,
+    send_notifications,
+)
+
+
+class StubSMTPHandler(socketserver.StreamRequestHandler):
+    """Speak just enough SMTP for smtplib to deliver messages."""
+
+    connect_delay = 0.0
+    message_delay = 0.0
+
+    def reply(self, line: str) -> None:
+        """Send one reply line."""
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self) -> None:
+        """Handle one SMTP session."""
+        time.sleep(self.connect_delay)
+        self.reply("220 localhost stub SMTP")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode(errors="replace").strip().upper()
+            if command.startswith("EHLO"):
+                self.reply("250-localhost")
+                self.reply("250 8BITMIME")
+            elif command.startswith("DATA"):
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                while self.rfile.readline() not in (b".\r\n", b""):
+                    pass
+                time.sleep(self.message_delay)
+                self.server.messages += 1
+                self.reply("250 OK")
+            elif command.startswith("QUIT"):
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("250 OK")
+
+
+class StubSMTPServer(socketserver.ThreadingTCPServer):
+    """Threaded SMTP stand-in counting accepted messages."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 256
+    messages = 0
+
+
+def start_stub_server(connect_delay: float, message_delay: float) -> Tuple[StubSMTPServer, int]:
+    """Start the stub SMTP server on an ephemeral port.
+
+    Args:
+        connect_delay: Seconds to wait before greeting each connection
+        message_delay: Seconds to wait before accepting each message
+
+    Returns:
+        Tuple of (server, port)
+    """
+    handler = type(
+        "ConfiguredStubSMTPHandler",
+        (StubSMTPHandler,),
+        {"connect_delay": connect_delay, "message_delay": message_delay},
+    )
+    server = StubSMTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, server.server_address[1]
+
+
+def build_messages(count: int, config: NotificationConfig) -> List[MIMEText]:
+    """Build notification messages for synthetic recommendations.
+
+    Args:
+        count: Number of messages
+        config: Notification configuration
+
+    Returns:
+        List of email messages
+    """
+    start = datetime.now() + timedelta(days=7)
+    return [
+        build_notification_message(
+            Recommendation(
+                event=EventData(
+                    event_id=f"evt_{index}",
+                    title=f"Event {index}",
+                    description="Benchmark event",
+                    category="technology",
+                    event_type="meetup",
+                    start_time=start,
+                    location={"latitude": 37.77, "longitude": -122.42},
+                ),
+                score=0.8,
+                reasons=["Matches your interests"],
+            ),
+            f"user{index}@example.com",
+            config,
+        )
+        for index in range(count)
+    ]
+
+
+def main() -> None:
+    """Run the benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=300)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--connect-delay-ms", type=float, default=20.0)
+    parser.add_argument("--message-delay-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    logging.getLogger("event_recommendation_engine").setLevel(logging.WARNING)
+
+    server, port = start_stub_server(
+        args.connect_delay_ms / 1000, args.message_delay_ms / 1000
+    )
+    base_config = NotificationConfig(
+        smtp_server="127.0.0.1",
+        smtp_port=port,
+        smtp_username="events@example.com",
+        use_tls=False,
+    )
+    messages = build_messages(args.messages, base_config)
+
+    print(f"{'mode':>22} {'sent':>6} {'connections':>12} {'seconds':>8} {'msg/s':>8}")
+    try:
+        start = time.perf_counter()
+        sent = sum(
+            send_notifications([message], base_config).sent for message in messages
+        )
+        elapsed = time.perf_counter() - start
+        print(
+            f"{'connection per message':>22} {sent:>6} {len(messages):>12} "
+            f"{elapsed:>8.2f} {sent / elapsed:>8.1f}"
+        )
+
+        for workers in args.workers:
+            config = base_config.model_copy(update={"max_workers": workers})
+            result = send_notifications(messages, config)
+            print(
+                f"{f'batched, {workers} workers':>22} {result.sent:>6} "
+                f"{result.connections:>12} {result.elapsed_seconds:>8.2f} "
+                f"{result.messages_per_second:>8.1f}"
+            )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -7,13 +7,19 @@ reminder notifications.
 
 import json
 import logging
+import queue
 import smtplib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from email.mime.text import MIMEText
+from math import asin, cos, degrees, floor, radians, sin, sqrt
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
+import numpy as np
 import pandas as pd
 import yaml
 from icalendar import Calendar, Event
@@ -26,6 +32,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+EARTH_RADIUS_KM = 6371.0
+
 
 class UserProfile(BaseModel):
     """User profile with interests and preferences."""
@@ -103,6 +111,24 @@ class RecommendationConfig(BaseModel):
     min_score_threshold: float = Field(
         default=0.3, description="Minimum recommendation score"
     )
+    prune_candidates: bool = Field(
+        default=True,
+        description=(
+            "Only score events within travel distance that match at least "
+            "one interest"
+        ),
+    )
+    grid_cell_degrees: float = Field(
+        default=0.5, description="Cell size of the spatial event grid in degrees"
+    )
+
+    @field_validator("grid_cell_degrees")
+    @classmethod
+    def validate_grid_cell_degrees(cls, v: float) -> float:
+        """Validate grid cell size."""
+        if not 0 < v <= 180:
+            raise ValueError("grid_cell_degrees must be between 0 and 180")
+        return v
 
 
 class CalendarConfig(BaseModel):
@@ -138,6 +164,29 @@ class NotificationConfig(BaseModel):
     smtp_password: Optional[str] = Field(
         default=None, description="SMTP password"
     )
+    use_tls: bool = Field(
+        default=True, description="Upgrade SMTP connections with STARTTLS"
+    )
+    smtp_timeout: float = Field(
+        default=30.0, description="SMTP socket timeout in seconds"
+    )
+    max_workers: int = Field(
+        default=4, description="Maximum concurrent SMTP connections per batch"
+    )
+    max_retries: int = Field(
+        default=2, description="Retries per message after transient failures"
+    )
+    retry_delay_seconds: float = Field(
+        default=5.0, description="Delay before retrying a failed message"
+    )
+
+    @field_validator("max_workers")
+    @classmethod
+    def validate_max_workers(cls, v: int) -> int:
+        """Validate worker count."""
+        if v < 1:
+            raise ValueError("max_workers must be at least 1")
+        return v
 
 
 class Config(BaseModel):
@@ -431,9 +480,7 @@ def calculate_distance_km(
     Returns:
         Distance in kilometers
     """
-    from math import asin, cos, radians, sin, sqrt
-
-    R = 6371.0
+    R = EARTH_RADIUS_KM
 
     lat1_rad = radians(lat1)
     lat2_rad = radians(lat2)
@@ -451,6 +498,47 @@ def calculate_distance_km(
     return R * c
 
 
+def calculate_distances_km(
+    lat: float, lon: float, latitudes: np.ndarray, longitudes: np.ndarray
+) -> np.ndarray:
+    """Calculate distances from one point to many coordinates in kilometers.
+
+    Vectorized Haversine formula, equivalent to calculate_distance_km.
+
+    Args:
+        lat: Latitude of the origin
+        lon: Longitude of the origin
+        latitudes: Latitudes of the destinations
+        longitudes: Longitudes of the destinations
+
+    Returns:
+        Array of distances in kilometers
+    """
+    lat_rad = radians(lat)
+    latitudes_rad = np.radians(latitudes)
+    delta_lat = latitudes_rad - lat_rad
+    delta_lon = np.radians(longitudes - lon)
+
+    a = (
+        np.sin(delta_lat / 2) ** 2
+        + cos(lat_rad) * np.cos(latitudes_rad) * np.sin(delta_lon / 2) ** 2
+    )
+    return EARTH_RADIUS_KM * 2 * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+def _event_text(event: EventData) -> str:
+    """Return the lowercased text that interests are matched against."""
+    return (
+        f"{event.title} {event.description or ''} "
+        f"{event.category} {event.event_type}"
+    ).lower()
+
+
+def _count_interest_matches(event_text: str, user_interests: List[str]) -> int:
+    """Count interests that occur in the event text."""
+    return sum(1 for interest in user_interests if interest.lower() in event_text)
+
+
 def calculate_interest_score(
     event: EventData, user_interests: List[str]
 ) -> float:
@@ -466,17 +554,7 @@ def calculate_interest_score(
     if not user_interests:
         return 0.5
 
-    event_text = (
-        f"{event.title} {event.description or ''} "
-        f"{event.category} {event.event_type}"
-    ).lower()
-
-    matches = sum(
-        1
-        for interest in user_interests
-        if interest.lower() in event_text
-    )
-
+    matches = _count_interest_matches(_event_text(event), user_interests)
     return min(1.0, matches / len(user_interests))
 
 
@@ -533,38 +611,256 @@ def calculate_past_attendance_score(
     return min(1.0, matches / len(event_categories))
 
 
+class EventIndex:
+    """Spatial and interest index over upcoming events.
+
+    Built once per run and shared by all users. Event coordinates are
+    bucketed into a latitude/longitude grid so a user only computes
+    distances to events in nearby cells. A whitespace-token inverted index
+    over the interest-matching text narrows the events that can match an
+    interest. Both lookups return a superset of the exact matches, so
+    scoring the candidates gives the same results as scoring every event.
+    """
+
+    def __init__(
+        self,
+        events: List[EventData],
+        now: Optional[datetime] = None,
+        cell_degrees: float = 0.5,
+    ):
+        """Index upcoming events.
+
+        Args:
+            events: List of available events
+            now: Reference time; events starting earlier are excluded
+            cell_degrees: Grid cell size in degrees
+        """
+        now = now or datetime.now()
+        self.events = [event for event in events if event.start_time >= now]
+        self.texts = [_event_text(event) for event in self.events]
+        self.latitudes = np.array(
+            [event.location["latitude"] for event in self.events], dtype=float
+        )
+        self.longitudes = np.array(
+            [event.location["longitude"] for event in self.events], dtype=float
+        )
+
+        self.cell_degrees = cell_degrees
+        self._lon_cells = int(np.ceil(360.0 / cell_degrees))
+        self._cells: Dict[int, np.ndarray] = {}
+        if self.events:
+            lat_cells = np.floor(self.latitudes / cell_degrees).astype(np.int64)
+            lon_cells = (
+                np.floor(self.longitudes / cell_degrees).astype(np.int64)
+                % self._lon_cells
+            )
+            keys = lat_cells * self._lon_cells + lon_cells
+            order = np.argsort(keys, kind="stable")
+            unique_keys, starts = np.unique(keys[order], return_index=True)
+            for key, cell_events in zip(unique_keys, np.split(order, starts[1:])):
+                self._cells[int(key)] = cell_events
+
+        postings: Dict[str, List[int]] = {}
+        for position, text in enumerate(self.texts):
+            for token in set(text.split()):
+                postings.setdefault(token, []).append(position)
+        self._postings = {
+            token: np.array(positions, dtype=np.int64)
+            for token, positions in postings.items()
+        }
+        self._term_matches: Dict[str, np.ndarray] = {}
+
+        logger.info(
+            f"Indexed {len(self.events)} upcoming events in {len(self._cells)} "
+            f"grid cells with {len(self._postings)} tokens"
+        )
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def events_within(
+        self, latitude: float, longitude: float, max_distance_km: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Find events within a distance of a location.
+
+        Args:
+            latitude: Latitude of the location
+            longitude: Longitude of the location
+            max_distance_km: Maximum distance in kilometers
+
+        Returns:
+            Tuple of sorted event positions and their distances in kilometers
+        """
+        candidates = self._nearby_cells(latitude, longitude, max_distance_km)
+        distances = calculate_distances_km(
+            latitude, longitude, self.latitudes[candidates], self.longitudes[candidates]
+        )
+        within = distances <= max_distance_km
+        return candidates[within], distances[within]
+
+    def _nearby_cells(
+        self, latitude: float, longitude: float, max_distance_km: float
+    ) -> np.ndarray:
+        """Return sorted positions of events in cells that may be in range."""
+        if not self._cells:
+            return np.zeros(0, dtype=np.int64)
+
+        angular_distance = max_distance_km / EARTH_RADIUS_KM
+        lat_span = degrees(angular_distance)
+        lat_low = latitude - lat_span
+        lat_high = latitude + lat_span
+
+        # Bound on the longitude difference of any point within the angular
+        # distance; if the circle reaches a pole every longitude is in range.
+        if lat_low <= -90 or lat_high >= 90 or sin(angular_distance) >= cos(
+            radians(latitude)
+        ):
+            lon_span = 180.0
+        else:
+            lon_span = degrees(asin(sin(angular_distance) / cos(radians(latitude))))
+
+        if lon_span * 2 >= 360 - self.cell_degrees:
+            lon_cells = range(self._lon_cells)
+        else:
+            lon_cells = [
+                cell % self._lon_cells
+                for cell in range(
+                    floor((longitude - lon_span) / self.cell_degrees),
+                    floor((longitude + lon_span) / self.cell_degrees) + 1,
+                )
+            ]
+
+        cell_events = []
+        for lat_cell in range(
+            floor(max(lat_low, -90.0) / self.cell_degrees),
+            floor(min(lat_high, 90.0) / self.cell_degrees) + 1,
+        ):
+            base = lat_cell * self._lon_cells
+            for lon_cell in lon_cells:
+                events = self._cells.get(base + lon_cell)
+                if events is not None:
+                    cell_events.append(events)
+
+        if not cell_events:
+            return np.zeros(0, dtype=np.int64)
+        return np.sort(np.concatenate(cell_events))
+
+    def events_matching(self, user_interests: List[str]) -> np.ndarray:
+        """Find events whose text may contain at least one interest.
+
+        An interest can only occur in the text if its longest word occurs
+        inside a single whitespace-separated token, so the union of the
+        postings of all tokens containing that word is a superset of the
+        exact matches.
+
+        Args:
+            user_interests: List of user interests
+
+        Returns:
+            Sorted event positions
+        """
+        matches = []
+        for interest in user_interests:
+            words = interest.lower().split()
+            if not words:
+                return np.arange(len(self.events))
+            matches.append(self._term_events(max(words, key=len)))
+
+        if not matches:
+            return np.zeros(0, dtype=np.int64)
+        return np.unique(np.concatenate(matches))
+
+    def _term_events(self, term: str) -> np.ndarray:
+        """Return positions of events with a token containing the term."""
+        events = self._term_matches.get(term)
+        if events is None:
+            postings = [
+                positions for token, positions in self._postings.items() if term in token
+            ]
+            events = (
+                np.unique(np.concatenate(postings))
+                if postings
+                else np.zeros(0, dtype=np.int64)
+            )
+            self._term_matches[term] = events
+        return events
+
+
 def generate_recommendations(
     user: UserProfile,
     events: List[EventData],
     past_attendance: List[str],
     config: RecommendationConfig,
+    event_index: Optional[EventIndex] = None,
 ) -> List[Recommendation]:
     """Generate personalized event recommendations for a user.
 
+    With candidate pruning enabled, only events within the user's maximum
+    travel distance that match at least one interest are scored (every
+    nearby event if the user has no interests).
+
     Args:
         user: User profile
         events: List of available events
         past_attendance: User's past attendance history
         config: Recommendation configuration
+        event_index: Index over the events, shared across users (built
+            from events if not given)
 
     Returns:
         List of recommendations sorted by score
     """
-    recommendations = []
-    now = datetime.now()
+    if event_index is None:
+        event_index = EventIndex(events, cell_degrees=config.grid_cell_degrees)
 
-    for event in events:
-        if event.start_time < now:
-            continue
+    latitude = user.location["latitude"]
+    longitude = user.location["longitude"]
+    max_distance = user.max_travel_distance_km
 
-        interest_score = calculate_interest_score(event, user.interests)
-        location_score = calculate_location_score(
-            event, user.location, user.max_travel_distance_km
+    if config.prune_candidates:
+        candidates, distances = event_index.events_within(
+            latitude, longitude, max_distance
         )
-        attendance_score = calculate_past_attendance_score(
-            event, past_attendance
+        if user.interests:
+            matching = np.isin(
+                candidates, event_index.events_matching(user.interests)
+            )
+            candidates = candidates[matching]
+            distances = distances[matching]
+    else:
+        candidates = np.arange(len(event_index))
+        distances = calculate_distances_km(
+            latitude, longitude, event_index.latitudes, event_index.longitudes
         )
 
+    location_scores = np.where(
+        distances > max_distance, 0.0, 1.0 - distances / max_distance
+    )
+
+    attendance_scores: Dict[Tuple[str, str], float] = {}
+    recommendations = []
+
+    for position, location_score in zip(candidates.tolist(), location_scores.tolist()):
+        event = event_index.events[position]
+
+        if user.interests:
+            matches = _count_interest_matches(
+                event_index.texts[position], user.interests
+            )
+            if matches == 0 and config.prune_candidates:
+                continue
+            interest_score = min(1.0, matches / len(user.interests))
+        else:
+            interest_score = 0.5
+
+        attendance_key = (event.category, event.event_type)
+        attendance_score = attendance_scores.get(attendance_key)
+        if attendance_score is None:
+            attendance_score = calculate_past_attendance_score(
+                event, past_attendance
+            )
+            attendance_scores[attendance_key] = attendance_score
+
         total_score = (
             interest_score * config.interest_weight
             + location_score * config.location_weight
@@ -592,25 +888,13 @@ def generate_recommendations(
     return recommendations[: config.max_recommendations]
 
 
-def add_to_calendar(
-    recommendation: Recommendation, calendar_file: Path
-) -> None:
-    """Add recommended event to calendar.
-
-    Args:
-        recommendation: Event recommendation to add
-        calendar_file: Path to calendar ICS file
-    """
-    calendar_file.parent.mkdir(parents=True, exist_ok=True)
+def _event_uid(event: EventData) -> str:
+    """Return the calendar UID for an event."""
+    return f"{event.event_id}@eventrec"
 
-    cal = Calendar()
-    if calendar_file.exists():
-        try:
-            with open(calendar_file, "rb") as f:
-                cal = Calendar.from_ical(f.read())
-        except Exception as e:
-            logger.warning(f"Failed to load existing calendar: {e}")
 
+def _build_calendar_event(recommendation: Recommendation) -> Event:
+    """Build an iCalendar event for a recommendation."""
     event = Event()
     event.add("summary", recommendation.event.title)
     if recommendation.event.description:
@@ -624,38 +908,97 @@ def add_to_calendar(
             recommendation.event.start_time + timedelta(hours=2),
         )
     event.add("dtstamp", datetime.now())
-    event.add("uid", f"{recommendation.event.event_id}@eventrec")
+    event.add("uid", _event_uid(recommendation.event))
 
     if recommendation.event.venue_name:
         event.add("location", recommendation.event.venue_name)
 
-    cal.add_component(event)
+    return event
+
+
+def write_calendar(
+    recommendations: List[Recommendation], calendar_file: Path
+) -> int:
+    """Add recommended events to the calendar in a single write.
+
+    The existing calendar is read once. Events are deduplicated by UID: a
+    recommended event replaces an existing entry with the same UID, and
+    repeated recommendations of one event are added once.
+
+    Args:
+        recommendations: Event recommendations to add
+        calendar_file: Path to calendar ICS file
+
+    Returns:
+        Number of distinct events written from the recommendations
+    """
+    if not recommendations:
+        return 0
+
+    calendar_file.parent.mkdir(parents=True, exist_ok=True)
+
+    new_events: Dict[str, Event] = {}
+    for recommendation in recommendations:
+        uid = _event_uid(recommendation.event)
+        if uid not in new_events:
+            new_events[uid] = _build_calendar_event(recommendation)
+
+    cal = Calendar()
+    if calendar_file.exists():
+        try:
+            with open(calendar_file, "rb") as f:
+                cal = Calendar.from_ical(f.read())
+        except Exception as e:
+            logger.warning(f"Failed to load existing calendar: {e}")
+
+    cal.subcomponents = [
+        component
+        for component in cal.subcomponents
+        if not (
+            isinstance(component, Event)
+            and str(component.get("uid")) in new_events
+        )
+    ]
+    for event in new_events.values():
+        cal.add_component(event)
 
     try:
         with open(calendar_file, "wb") as f:
             f.write(cal.to_ical())
-        logger.info(
-            f"Added event '{recommendation.event.title}' to calendar"
-        )
+        logger.info(f"Added {len(new_events)} events to calendar {calendar_file}")
     except Exception as e:
         logger.error(f"Failed to save calendar: {e}")
 
+    return len(new_events)
 
-def send_notification(
+
+def add_to_calendar(
+    recommendation: Recommendation, calendar_file: Path
+) -> None:
+    """Add recommended event to calendar.
+
+    Args:
+        recommendation: Event recommendation to add
+        calendar_file: Path to calendar ICS file
+    """
+    write_calendar([recommendation], calendar_file)
+
+
+def build_notification_message(
     recommendation: Recommendation,
     user_email: str,
     config: NotificationConfig,
-) -> None:
-    """Send email notification for recommended event.
+) -> MIMEText:
+    """Build the email notification for a recommended event.
 
     Args:
         recommendation: Event recommendation
         user_email: Recipient email address
         config: Notification configuration
-    """
-    if not config.enabled or not config.smtp_server:
-        return
 
+    Returns:
+        Email message
+    """
     subject = f"Event Recommendation: {recommendation.event.title}"
     body = f"""
 Event Recommendation
@@ -681,21 +1024,184 @@ Reasons:
     if recommendation.event.price:
         body += f"\nPrice: ${recommendation.event.price:.2f}\n"
 
-    try:
-        msg = MIMEText(body)
-        msg["Subject"] = subject
-        msg["From"] = config.smtp_username
-        msg["To"] = user_email
+    msg = MIMEText(body)
+    msg["Subject"] = subject
+    msg["From"] = config.smtp_username
+    msg["To"] = user_email
+    return msg
+
+
+@dataclass
+class NotificationResult:
+    """Outcome of a notification batch."""
+
+    sent: int = 0
+    failed: int = 0
+    retried: int = 0
+    connections: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def messages_per_second(self) -> float:
+        """Delivered messages per second of wall time."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.sent / self.elapsed_seconds
+
+
+@dataclass
+class _QueuedMessage:
+    """Message waiting in the send queue."""
+
+    message: MIMEText
+    attempts: int = 0
+    not_before: float = 0.0
+
 
-        with smtplib.SMTP(config.smtp_server, config.smtp_port) as server:
+def _open_smtp_connection(config: NotificationConfig) -> smtplib.SMTP:
+    """Open an SMTP connection, upgrading to TLS and logging in if configured."""
+    server = smtplib.SMTP(config.smtp_server, config.smtp_port, timeout=config.smtp_timeout)
+    try:
+        if config.use_tls:
             server.starttls()
-            if config.smtp_username and config.smtp_password:
-                server.login(config.smtp_username, config.smtp_password)
-            server.send_message(msg)
+        if config.smtp_username and config.smtp_password:
+            server.login(config.smtp_username, config.smtp_password)
+    except Exception:
+        server.close()
+        raise
+    return server
+
+
+def _close_smtp_connection(server: Optional[smtplib.SMTP]) -> None:
+    """Close an SMTP connection, ignoring errors from a dead connection."""
+    if server is None:
+        return
+    try:
+        server.quit()
+    except Exception:
+        server.close()
+
+
+def send_notifications(
+    messages: List[MIMEText], config: NotificationConfig
+) -> NotificationResult:
+    """Send a batch of email notifications over reused SMTP connections.
+
+    Up to max_workers workers drain a shared queue. Each worker opens one
+    authenticated connection and sends all of its messages over it. A
+    message that fails with a transient error (connection loss or a 4xx
+    reply) goes back on the queue, to be retried after
+    retry_delay_seconds on a fresh connection, up to max_retries times.
+    Permanent 5xx rejections are not retried.
+
+    Args:
+        messages: Email messages to send
+        config: Notification configuration
+
+    Returns:
+        Batch outcome with delivery counts and throughput
+    """
+    result = NotificationResult()
+    if not config.enabled or not config.smtp_server or not messages:
+        return result
+
+    start_time = time.perf_counter()
+    send_queue: "queue.Queue[Optional[_QueuedMessage]]" = queue.Queue()
+    for message in messages:
+        send_queue.put(_QueuedMessage(message))
+    result_lock = threading.Lock()
+
+    def record(**counts: int) -> None:
+        with result_lock:
+            for name, value in counts.items():
+                setattr(result, name, getattr(result, name) + value)
+
+    def worker() -> None:
+        server: Optional[smtplib.SMTP] = None
+        try:
+            while True:
+                item = send_queue.get()
+                if item is None:
+                    send_queue.task_done()
+                    return
+
+                delay = item.not_before - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+
+                try:
+                    if server is None:
+                        server = _open_smtp_connection(config)
+                        record(connections=1)
+                    server.send_message(item.message)
+                    record(sent=1)
+                except Exception as e:
+                    permanent = (
+                        isinstance(e, smtplib.SMTPResponseException)
+                        and 500 <= e.smtp_code < 600
+                    ) or isinstance(e, smtplib.SMTPRecipientsRefused)
+                    if not isinstance(e, smtplib.SMTPRecipientsRefused):
+                        _close_smtp_connection(server)
+                        server = None
+
+                    if permanent or item.attempts >= config.max_retries:
+                        logger.error(
+                            f"Failed to send notification to {item.message['To']}: {e}"
+                        )
+                        record(failed=1)
+                    else:
+                        logger.warning(
+                            f"Retrying notification to {item.message['To']}: {e}"
+                        )
+                        send_queue.put(
+                            _QueuedMessage(
+                                item.message,
+                                item.attempts + 1,
+                                time.monotonic() + config.retry_delay_seconds,
+                            )
+                        )
+                        record(retried=1)
+                send_queue.task_done()
+        finally:
+            _close_smtp_connection(server)
+
+    worker_count = min(config.max_workers, len(messages))
+    with ThreadPoolExecutor(max_workers=worker_count) as executor:
+        for _ in range(worker_count):
+            executor.submit(worker)
+        send_queue.join()
+        for _ in range(worker_count):
+            send_queue.put(None)
+
+    result.elapsed_seconds = time.perf_counter() - start_time
+    logger.info(
+        f"Sent {result.sent} notifications ({result.failed} failed, "
+        f"{result.retried} retries) over {result.connections} connections "
+        f"in {result.elapsed_seconds:.2f}s"
+    )
+    return result
 
+
+def send_notification(
+    recommendation: Recommendation,
+    user_email: str,
+    config: NotificationConfig,
+) -> None:
+    """Send email notification for recommended event.
+
+    Args:
+        recommendation: Event recommendation
+        user_email: Recipient email address
+        config: Notification configuration
+    """
+    if not config.enabled or not config.smtp_server:
+        return
+
+    result = send_notifications(
+        [build_notification_message(recommendation, user_email, config)], config
+    )
+    if result.sent:
         logger.info(f"Notification sent to {user_email}")
-    except Exception as e:
-        logger.error(f"Failed to send notification: {e}")
 
 
 def process_recommendations(config_path: Path) -> Dict[str, UserRecommendations]:
@@ -727,15 +1233,20 @@ def process_recommendations(config_path: Path) -> Dict[str, UserRecommendations]
             attendance_file = project_root / attendance_file
 
     past_attendance_all = load_past_attendance(attendance_file)
+    event_index = EventIndex(
+        events, cell_degrees=config.recommendation.grid_cell_degrees
+    )
 
     all_recommendations = {}
+    calendar_recommendations: List[Recommendation] = []
+    notification_messages: List[MIMEText] = []
 
     for user in config.users:
         logger.info(f"Generating recommendations for user: {user.user_id}")
         past_attendance = past_attendance_all.get(user.user_id, [])
 
         recommendations = generate_recommendations(
-            user, events, past_attendance, config.recommendation
+            user, events, past_attendance, config.recommendation, event_index
         )
 
         user_recs = UserRecommendations(
@@ -751,16 +1262,23 @@ def process_recommendations(config_path: Path) -> Dict[str, UserRecommendations]
         )
 
         if config.calendar.auto_add_recommendations:
-            calendar_file = Path(config.calendar.calendar_file)
-            if not calendar_file.is_absolute():
-                calendar_file = project_root / calendar_file
-
-            for rec in recommendations:
-                add_to_calendar(rec, calendar_file)
+            calendar_recommendations.extend(recommendations)
 
         if config.notification.enabled and user.email:
-            for rec in recommendations[:3]:
-                send_notification(rec, user.email, config.notification)
+            notification_messages.extend(
+                build_notification_message(rec, user.email, config.notification)
+                for rec in recommendations[:3]
+            )
+
+    if calendar_recommendations:
+        calendar_file = Path(config.calendar.calendar_file)
+        if not calendar_file.is_absolute():
+            calendar_file = project_root / calendar_file
+
+        write_calendar(calendar_recommendations, calendar_file)
+
+    if notification_messages:
+        send_notifications(notification_messages, config.notification)
 
     output_file = Path(config.output_file)
     if not output_file.is_absolute():
@@ -0,0 +1,393 @@
+"""Tests for event recommendations."""
+
+import socketserver
+import threading
+from datetime import datetime, timedelta
+from math import degrees
+
+import numpy as np
+import pytest
+from icalendar import Calendar, Event
+
+from event_recommendation_engine.src.main import (
+    EARTH_RADIUS_KM,
+    EventData,
+    EventIndex,
+    NotificationConfig,
+    Recommendation,
+    RecommendationConfig,
+    UserProfile,
+    build_notification_message,
+    calculate_distance_km,
+    calculate_interest_score,
+    calculate_location_score,
+    calculate_past_attendance_score,
+    generate_recommendations,
+    send_notifications,
+    write_calendar,
+)
+
+
+def make_event(event_id, latitude, longitude, title="Jazz night", **kwargs):
+    """Build an upcoming event."""
+    return EventData(
+        event_id=event_id,
+        title=title,
+        category=kwargs.pop("category", "music"),
+        event_type=kwargs.pop("event_type", "concert"),
+        start_time=datetime.now() + timedelta(days=3),
+        location={"latitude": latitude, "longitude": longitude},
+        **kwargs,
+    )
+
+
+def brute_force_within(events, latitude, longitude, max_distance_km):
+    """Event positions within range, computed one event at a time."""
+    return [
+        position
+        for position, event in enumerate(events)
+        if calculate_distance_km(
+            latitude,
+            longitude,
+            event.location["latitude"],
+            event.location["longitude"],
+        )
+        <= max_distance_km
+    ]
+
+
+def test_event_index_travel_distance_boundary():
+    """Test events just inside and outside the travel distance across cells."""
+    max_distance = 50.0
+    inside = degrees((max_distance - 0.01) / EARTH_RADIUS_KM)
+    outside = degrees((max_distance + 0.01) / EARTH_RADIUS_KM)
+    events = [
+        make_event("north-in", 0.3 + inside, 10.0),
+        make_event("north-out", 0.3 + outside, 10.0),
+        make_event("south-in", 0.3 - inside, 10.0),
+        make_event("south-out", 0.3 - outside, 10.0),
+        make_event("same-cell", 0.31, 10.01),
+    ]
+    index = EventIndex(events, cell_degrees=0.5)
+
+    positions, distances = index.events_within(0.3, 10.0, max_distance)
+
+    assert [index.events[p].event_id for p in positions] == [
+        "north-in",
+        "south-in",
+        "same-cell",
+    ]
+    assert np.all(distances <= max_distance)
+    assert positions.tolist() == brute_force_within(index.events, 0.3, 10.0, max_distance)
+
+
+@pytest.mark.parametrize(
+    "latitude,longitude",
+    [(0.0, 179.9), (0.0, -179.95), (52.0, 180.0), (-33.0, -180.0), (89.9, 45.0)],
+)
+def test_event_index_antimeridian_and_pole(latitude, longitude):
+    """Test grid lookups that wrap around the antimeridian or reach a pole."""
+    rng = np.random.default_rng(3)
+    events = [
+        make_event(
+            f"e{i}",
+            float(np.clip(latitude + rng.uniform(-2, 2), -90, 90)),
+            float((longitude + rng.uniform(-3, 3) + 180) % 360 - 180),
+        )
+        for i in range(300)
+    ]
+    index = EventIndex(events, cell_degrees=0.5)
+
+    for max_distance in (10.0, 75.0, 200.0):
+        positions, _ = index.events_within(latitude, longitude, max_distance)
+        assert positions.tolist() == brute_force_within(
+            index.events, latitude, longitude, max_distance
+        )
+
+    wrapped = EventIndex([make_event("east", 0.0, 179.95)], cell_degrees=0.5)
+    positions, distances = wrapped.events_within(0.0, -179.95, 20.0)
+    assert positions.tolist() == [0]
+    assert distances[0] == pytest.approx(11.1, abs=0.1)
+
+
+def test_event_index_token_pruning_is_superset():
+    """Test that interest pruning keeps every event an interest occurs in."""
+    titles = [
+        "Jazz night",
+        "Acid-jazz session",
+        "Live music festival",
+        "Music of the night",
+        "Cooking class",
+        "Outdoor yoga",
+    ]
+    events = [
+        make_event(f"e{i}", 0.0, 0.0, title=title, category="leisure", event_type="social")
+        for i, title in enumerate(titles)
+    ]
+    index = EventIndex(events)
+    interests = ["jazz", "live music"]
+
+    candidates = index.events_matching(interests).tolist()
+    exact = [
+        position
+        for position, event in enumerate(index.events)
+        if calculate_interest_score(event, interests) > 0
+    ]
+
+    assert set(exact) <= set(candidates)
+    assert [titles[p] for p in exact] == [
+        "Jazz night",
+        "Acid-jazz session",
+        "Live music festival",
+    ]
+    assert "Cooking class" not in [titles[p] for p in candidates]
+    assert "Outdoor yoga" not in [titles[p] for p in candidates]
+    assert index.events_matching([]).tolist() == []
+    assert index.events_matching(["  "]).tolist() == list(range(len(titles)))
+
+
+def test_generate_recommendations_matches_unpruned_scoring():
+    """Test pruned recommendations against scoring every event."""
+    rng = np.random.default_rng(11)
+    titles = ["Jazz night", "Rock concert", "Yoga class", "Tech meetup", "Art fair"]
+    events = [
+        make_event(
+            f"e{i}",
+            float(40.7 + rng.uniform(-1.0, 1.0)),
+            float(-74.0 + rng.uniform(-1.0, 1.0)),
+            title=titles[i % len(titles)],
+            category=["music", "wellness", "tech"][i % 3],
+            event_type=["show", "workshop", "meetup", "concert"][i % 4],
+        )
+        for i in range(200)
+    ]
+    events.append(make_event("far", 10.0, 10.0))
+    user = UserProfile(
+        user_id="u1",
+        interests=["jazz", "concert"],
+        location={"latitude": 40.7, "longitude": -74.0},
+        max_travel_distance_km=40.0,
+    )
+    past_attendance = ["music"]
+    config = RecommendationConfig(max_recommendations=500, min_score_threshold=0.0)
+
+    pruned = generate_recommendations(user, events, past_attendance, config)
+
+    expected = []
+    for event in events:
+        location_score = calculate_location_score(
+            event, user.location, user.max_travel_distance_km
+        )
+        interest_score = calculate_interest_score(event, user.interests)
+        distance = calculate_distance_km(
+            user.location["latitude"],
+            user.location["longitude"],
+            event.location["latitude"],
+            event.location["longitude"],
+        )
+        if distance > user.max_travel_distance_km or interest_score == 0:
+            continue
+        expected.append(
+            (
+                event.event_id,
+                interest_score * config.interest_weight
+                + location_score * config.location_weight
+                + calculate_past_attendance_score(event, past_attendance)
+                * config.past_attendance_weight,
+            )
+        )
+    expected.sort(key=lambda item: item[1], reverse=True)
+
+    assert pruned
+    assert [r.event.event_id for r in pruned] == [event_id for event_id, _ in expected]
+    assert [r.score for r in pruned] == pytest.approx([score for _, score in expected])
+
+    # Above this threshold neither out-of-range nor non-matching events can
+    # qualify, so pruning must not change the result.
+    strict = RecommendationConfig(max_recommendations=500, min_score_threshold=0.56)
+    unpruned = generate_recommendations(
+        user,
+        events,
+        [],
+        strict.model_copy(update={"prune_candidates": False}),
+    )
+    pruned = generate_recommendations(user, events, [], strict)
+    assert unpruned
+    assert [(r.event.event_id, r.score) for r in pruned] == [
+        (r.event.event_id, r.score) for r in unpruned
+    ]
+
+
+class StubSMTPHandler(socketserver.StreamRequestHandler):
+    """Speak just enough SMTP for smtplib, failing some recipients.
+
+    Messages to tempfail@ get a 451 reply and messages to drop@ lose the
+    connection on their first attempt. Messages to always-tempfail@ always
+    get 451 and messages to reject@ always get 554.
+    """
+
+    def reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.sessions += 1
+        self.reply("220 localhost stub SMTP")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode(errors="replace").strip().upper()
+            if command.startswith("EHLO"):
+                self.reply("250-localhost")
+                self.reply("250 8BITMIME")
+            elif command.startswith("DATA"):
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                recipient = ""
+                while True:
+                    data = self.rfile.readline()
+                    if data in (b".\r\n", b""):
+                        break
+                    if data.lower().startswith(b"to:"):
+                        recipient = data[3:].decode().strip().split("@")[0]
+                with server.lock:
+                    attempts = server.attempts.get(recipient, 0) + 1
+                    server.attempts[recipient] = attempts
+                if recipient == "drop" and attempts == 1:
+                    return
+                if recipient == "always-tempfail" or (
+                    recipient == "tempfail" and attempts == 1
+                ):
+                    self.reply("451 Try again later")
+                elif recipient == "reject":
+                    self.reply("554 Rejected")
+                else:
+                    with server.lock:
+                        server.delivered.append(recipient)
+                    self.reply("250 OK")
+            elif command.startswith("QUIT"):
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("250 OK")
+
+
+@pytest.fixture
+def smtp_server():
+    """Run the stub SMTP server on an ephemeral local port."""
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), StubSMTPHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.sessions = 0
+    server.attempts = {}
+    server.delivered = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def make_notification_config(server, **overrides):
+    """Build a notification configuration pointing at the stub server."""
+    settings = {
+        "smtp_server": "127.0.0.1",
+        "smtp_port": server.server_address[1],
+        "smtp_username": "events@example.com",
+        "use_tls": False,
+        "smtp_timeout": 5.0,
+        "max_workers": 1,
+        "max_retries": 2,
+        "retry_delay_seconds": 0.0,
+    }
+    settings.update(overrides)
+    return NotificationConfig(**settings)
+
+
+def make_messages(config, recipients):
+    """Build one notification per recipient."""
+    recommendation = Recommendation(
+        event=make_event("e1", 0.0, 0.0), score=0.9, reasons=["Matches your interests"]
+    )
+    return [
+        build_notification_message(recommendation, f"{recipient}@example.com", config)
+        for recipient in recipients
+    ]
+
+
+def test_send_notifications_reuses_connection(smtp_server):
+    """Test that a batch is sent over one connection per worker."""
+    config = make_notification_config(smtp_server)
+    recipients = [f"user{i}" for i in range(5)]
+
+    result = send_notifications(make_messages(config, recipients), config)
+
+    assert (result.sent, result.failed, result.retried) == (5, 0, 0)
+    assert result.connections == 1
+    assert smtp_server.sessions == 1
+    assert smtp_server.delivered == recipients
+    assert result.messages_per_second > 0
+
+
+def test_send_notifications_retries_transient_failures(smtp_server):
+    """Test that 4xx replies and disconnects are retried and 5xx are not."""
+    config = make_notification_config(smtp_server)
+    recipients = ["ok", "tempfail", "drop", "reject"]
+
+    result = send_notifications(make_messages(config, recipients), config)
+
+    assert result.sent == 3
+    assert result.failed == 1
+    assert result.retried == 2
+    assert result.connections == 4
+    assert smtp_server.attempts == {"ok": 1, "tempfail": 2, "drop": 2, "reject": 1}
+    assert sorted(smtp_server.delivered) == ["drop", "ok", "tempfail"]
+
+
+def test_send_notifications_gives_up_after_max_retries(smtp_server):
+    """Test that a message failing every attempt is counted as failed."""
+    config = make_notification_config(smtp_server, max_retries=2, max_workers=2)
+
+    result = send_notifications(
+        make_messages(config, ["always-tempfail", "ok"]), config
+    )
+
+    assert (result.sent, result.failed, result.retried) == (1, 1, 2)
+    assert smtp_server.attempts["always-tempfail"] == 3
+
+
+def test_write_calendar_deduplicates_uids(tmp_path):
+    """Test that events are written once per UID and replace older entries."""
+    calendar_file = tmp_path / "calendar.ics"
+    existing = Calendar()
+    for uid, summary in [("e1@eventrec", "Old title"), ("other@elsewhere", "Dentist")]:
+        entry = Event()
+        entry.add("summary", summary)
+        entry.add("uid", uid)
+        existing.add_component(entry)
+    calendar_file.write_bytes(existing.to_ical())
+
+    first = Recommendation(event=make_event("e1", 0.0, 0.0), score=0.9, reasons=[])
+    second = Recommendation(
+        event=make_event("e2", 0.0, 0.0, title="Rock concert"), score=0.8, reasons=[]
+    )
+
+    written = write_calendar([first, second, first], calendar_file)
+
+    cal = Calendar.from_ical(calendar_file.read_bytes())
+    summaries = {
+        str(component.get("uid")): str(component.get("summary"))
+        for component in cal.walk("VEVENT")
+    }
+    assert written == 2
+    assert len(list(cal.walk("VEVENT"))) == 3
+    assert summaries == {
+        "other@elsewhere": "Dentist",
+        "e1@eventrec": "Jazz night",
+        "e2@eventrec": "Rock concert",
+    }
+
+    assert write_calendar([first], calendar_file) == 1
+    cal = Calendar.from_ical(calendar_file.read_bytes())
+    assert len(list(cal.walk("VEVENT"))) == 3
@@ -0,0 +1,140 @@
+"""Benchmark daily sketch store updates against exact usage analysis.
+
+Writes synthetic usage history as daily files, builds the sketch store from
+them, then adds one more day of data and times:
+
+- exact: loading every file and running analyze_feature_usage and
+  calculate_adoption_rates
+- sketch: loading the store, folding in only the new day's file and
+  estimating usage and adoption from the sketches
+
+It also reports the worst relative error of the sketch's unique-user
+counts against the exact counts.
+
+Run from the repository root:
+
+    python -m feature_usage_monitor.benchmarks.sketch_store
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from feature_usage_monitor.src.main import (
+    AnalysisConfig,
+    Config,
+    FeatureConfig,
+    UsageDataConfig,
+    analyze_feature_usage,
+    calculate_adoption_rates,
+    load_usage_data,
+    update_feature_sketch_store,
+)
+
+
+def write_day(
+    directory: Path,
+    day: datetime,
+    rows: int,
+    user_count: int,
+    feature_count: int,
+    rng: np.random.Generator,
+) -> None:
+    """Write one day of usage events with a skewed feature popularity."""
+    start = np.datetime64(day.replace(hour=0, minute=0, second=0, microsecond=0))
+    features = np.minimum(rng.zipf(1.3, rows), feature_count)
+    pd.DataFrame(
+        {
+            "user_id": np.char.add(
+                "user_", rng.integers(0, user_count, rows).astype(str)
+            ),
+            "feature_name": np.char.add("feature_", features.astype(str)),
+            "timestamp": start + rng.integers(0, 86400, rows).astype("timedelta64[s]"),
+        }
+    ).to_csv(directory / "usage" / f"{day:%Y-%m-%d}.csv", index=False)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rows", type=int, default=1_000_000, help="Historical usage events"
+    )
+    parser.add_argument(
+        "--days", type=int, default=90, help="Daily files the history is split into"
+    )
+    parser.add_argument("--features", type=int, default=50, help="Distinct features")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    rng = np.random.default_rng(7)
+    rows_per_day = max(args.rows // args.days, 1)
+    user_count = max(args.rows // 10, 1)
+    now = datetime.now()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        (directory / "usage").mkdir()
+        for offset in range(args.days, 0, -1):
+            write_day(
+                directory,
+                now - timedelta(days=offset),
+                rows_per_day,
+                user_count,
+                args.features,
+                rng,
+            )
+
+        config = Config(
+            usage_data=UsageDataConfig(file_path="usage/*.csv"),
+            analysis=AnalysisConfig(lookback_days=args.days),
+            sketch={
+                "enabled": True,
+                "store_file": "store/sketches.npz",
+                "retention_days": args.days + 1,
+            },
+        )
+
+        start = time.perf_counter()
+        update_feature_sketch_store(config, directory, now)
+        build_seconds = time.perf_counter() - start
+
+        write_day(directory, now, rows_per_day, user_count, args.features, rng)
+
+        start = time.perf_counter()
+        df = load_usage_data(config.usage_data, directory)
+        exact_usage = analyze_feature_usage(df, config.usage_data, config.analysis)
+        calculate_adoption_rates(
+            df, config.usage_data, FeatureConfig(), config.analysis
+        )
+        exact_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        store = update_feature_sketch_store(config, directory, now)
+        sketch_usage = store.feature_usage(config.analysis, now)
+        store.adoption_metrics(config.analysis, now)
+        sketch_seconds = time.perf_counter() - start
+        store_bytes = (directory / "store" / "sketches.npz").stat().st_size
+
+    worst_error = max(
+        abs(sketch_usage[name].unique_users - usage.unique_users) / usage.unique_users
+        for name, usage in exact_usage.items()
+    )
+    print(
+        f"history: {rows_per_day * args.days} usage events in {args.days} files, "
+        f"{len(exact_usage)} features"
+    )
+    print(f"sketch store build: {build_seconds:.2f}s, {store_bytes / 2**20:.1f} MB")
+    print(f"exact analysis after one new day: {exact_seconds:.2f}s")
+    print(f"sketch update and estimates after one new day: {sketch_seconds:.2f}s")
+    print(f"worst unique-user relative error: {worst_error:.2%}")
+
+
+if __name__ == "__main__":
+    main()
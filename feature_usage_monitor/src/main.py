@@ -4,14 +4,18 @@ Monitors application feature usage, identifies unused features, tracks
 adoption rates, and generates product usage insights for product teams.
 """
 
+import argparse
+import glob
 import json
 import logging
+import os
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
+import numpy as np
 import pandas as pd
 import yaml
 from pydantic import BaseModel, Field, field_validator
@@ -92,6 +96,42 @@ class ReportConfig(BaseModel):
     )
 
 
+class SketchConfig(BaseModel):
+    """Configuration for approximate distinct-user sketches."""
+
+    enabled: bool = Field(
+        default=False,
+        description="Compute usage and adoption from persisted daily sketches",
+    )
+    store_file: str = Field(
+        default="data/feature_usage_sketches.npz",
+        description="Path to the persisted sketch store",
+    )
+    precision: int = Field(
+        default=12,
+        description="HyperLogLog precision; 2**precision registers per sketch",
+    )
+    retention_days: int = Field(
+        default=90, description="Days of daily sketches to keep"
+    )
+
+    @field_validator("precision")
+    @classmethod
+    def validate_precision(cls, v: int) -> int:
+        """Validate HyperLogLog precision."""
+        if not 4 <= v <= 16:
+            raise ValueError("precision must be between 4 and 16")
+        return v
+
+    @field_validator("retention_days")
+    @classmethod
+    def validate_retention_days(cls, v: int) -> int:
+        """Validate sketch retention."""
+        if v < 1:
+            raise ValueError("retention_days must be at least 1")
+        return v
+
+
 class Config(BaseModel):
     """Main configuration model."""
 
@@ -109,6 +149,10 @@ class Config(BaseModel):
     report: ReportConfig = Field(
         default_factory=ReportConfig, description="Report generation settings"
     )
+    sketch: SketchConfig = Field(
+        default_factory=SketchConfig,
+        description="Approximate distinct-user sketch settings",
+    )
 
 
 class AppSettings(BaseSettings):
@@ -198,14 +242,26 @@ def load_config(config_path: Path) -> Config:
         raise
 
 
-def load_usage_data(
-    config: UsageDataConfig, project_root: Path
-) -> pd.DataFrame:
-    """Load usage data from CSV or JSON file.
+def _data_paths(file_path: str, project_root: Path) -> List[Path]:
+    """Resolve a data file path or glob pattern relative to the project root.
+
+    A plain path is returned as is; a pattern returns the matching files
+    sorted by name.
+    """
+    data_path = Path(file_path)
+    if not data_path.is_absolute():
+        data_path = project_root / data_path
+    if not glob.has_magic(str(data_path)):
+        return [data_path]
+    return sorted(Path(match) for match in glob.glob(str(data_path)))
+
+
+def _read_usage_file(data_path: Path, config: UsageDataConfig) -> pd.DataFrame:
+    """Read and validate a single usage data file.
 
     Args:
+        data_path: Usage data file
         config: Usage data configuration
-        project_root: Project root directory
 
     Returns:
         DataFrame with usage data
@@ -214,10 +270,6 @@ def load_usage_data(
         FileNotFoundError: If data file does not exist
         ValueError: If data format is invalid
     """
-    data_path = Path(config.file_path)
-    if not data_path.is_absolute():
-        data_path = project_root / data_path
-
     if not data_path.exists():
         raise FileNotFoundError(f"Usage data file not found: {data_path}")
 
@@ -253,6 +305,42 @@ def load_usage_data(
         raise
 
 
+def load_usage_data(
+    config: UsageDataConfig,
+    project_root: Path,
+    data_paths: Optional[List[Path]] = None,
+) -> pd.DataFrame:
+    """Load usage data from CSV or JSON files.
+
+    config.file_path may be a glob pattern, in which case all matching
+    files are loaded and concatenated.
+
+    Args:
+        config: Usage data configuration
+        project_root: Project root directory
+        data_paths: Files to load instead of those matching config.file_path
+
+    Returns:
+        DataFrame with usage data
+
+    Raises:
+        FileNotFoundError: If data file does not exist
+        ValueError: If data format is invalid
+    """
+    if data_paths is None:
+        data_paths = _data_paths(config.file_path, project_root)
+        if not data_paths:
+            raise FileNotFoundError(f"No usage data files match: {config.file_path}")
+
+    frames = [_read_usage_file(data_path, config) for data_path in data_paths]
+    frames = [df for df in frames if not df.empty]
+    if not frames:
+        return pd.DataFrame()
+    if len(frames) == 1:
+        return frames[0]
+    return pd.concat(frames, ignore_index=True)
+
+
 def load_feature_list(features_file: Optional[Path]) -> Set[str]:
     """Load list of all features from file.
 
@@ -287,6 +375,18 @@ def load_feature_list(features_file: Optional[Path]) -> Set[str]:
     return set()
 
 
+def _usage_trend(recent_usage: int, older_usage: int) -> str:
+    """Classify a usage trend from recent and older event counts."""
+    if older_usage > 0:
+        trend_ratio = recent_usage / older_usage
+        if trend_ratio > 1.2:
+            return "increasing"
+        if trend_ratio < 0.8:
+            return "decreasing"
+        return "stable"
+    return "new" if recent_usage > 0 else "stable"
+
+
 def analyze_feature_usage(
     df: pd.DataFrame,
     config: UsageDataConfig,
@@ -341,18 +441,7 @@ def analyze_feature_usage(
         recent_usage = sum(
             1 for ts in stats["timestamps"] if ts >= trend_window
         )
-        older_usage = total_usage - recent_usage
-
-        if older_usage > 0:
-            trend_ratio = recent_usage / older_usage
-            if trend_ratio > 1.2:
-                trend = "increasing"
-            elif trend_ratio < 0.8:
-                trend = "decreasing"
-            else:
-                trend = "stable"
-        else:
-            trend = "new" if recent_usage > 0 else "stable"
+        trend = _usage_trend(recent_usage, total_usage - recent_usage)
 
         last_used = max(stats["timestamps"]) if stats["timestamps"] else None
 
@@ -450,6 +539,586 @@ def calculate_adoption_rates(
     return adoption_metrics
 
 
+def _user_hashes(user_ids: pd.Series) -> np.ndarray:
+    """Return stable 64-bit hashes of user IDs, compared as strings."""
+    return pd.util.hash_array(user_ids.astype(str).to_numpy(dtype=object))
+
+
+def _hll_positions(
+    hashes: np.ndarray, precision: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Split 64-bit hashes into HyperLogLog register indexes and ranks.
+
+    The top precision bits select the register. The rank is the position
+    of the first set bit in the remaining bits.
+
+    Args:
+        hashes: uint64 hashes
+        precision: Number of index bits
+
+    Returns:
+        Tuple of register indexes and ranks
+    """
+    index = (hashes >> np.uint64(64 - precision)).astype(np.int64)
+    rest = hashes << np.uint64(precision)
+    high = (rest >> np.uint64(32)).astype(np.float64)
+    low = (rest & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    bit_length = np.where(high > 0, 32 + np.frexp(high)[1], np.frexp(low)[1])
+    rank = np.minimum(65 - bit_length, 65 - precision).astype(np.uint8)
+    return index, rank
+
+
+def _hll_estimate(registers: np.ndarray, precision: int) -> np.ndarray:
+    """Estimate distinct counts from HyperLogLog registers.
+
+    Uses Ertl's improved estimator ("New cardinality estimation algorithms
+    for HyperLogLog sketches", 2017), which stays unbiased from small to
+    large cardinalities without empirical bias-correction tables.
+
+    Args:
+        registers: Register array, one sketch per row
+        precision: Number of index bits the sketches were built with
+
+    Returns:
+        Estimated distinct count per sketch
+    """
+    registers = np.atleast_2d(registers)
+    rows, m = registers.shape
+    q = 64 - precision
+    histogram = np.bincount(
+        (np.arange(rows)[:, None] * (q + 2) + registers).reshape(-1),
+        minlength=rows * (q + 2),
+    ).reshape(rows, q + 2)
+
+    # tau(1 - C[q+1]/m): correction for saturated registers.
+    x = 1.0 - histogram[:, q + 1] / m
+    tau = 1.0 - x
+    step = np.ones(rows)
+    for _ in range(64):
+        x = np.sqrt(x)
+        step *= 0.5
+        tau -= (1.0 - x) ** 2 * step
+    tau = np.where((x == 0.0) | (histogram[:, q + 1] == 0), 0.0, tau / 3.0)
+    z = m * tau
+
+    for k in range(q, 0, -1):
+        z = 0.5 * (z + histogram[:, k])
+
+    # sigma(C[0]/m): correction for empty registers.
+    x = histogram[:, 0] / m
+    empty = x >= 1.0
+    x = np.where(empty, 0.0, x)
+    sigma = x.copy()
+    step = np.ones(rows)
+    for _ in range(64):
+        x = x * x
+        sigma += x * step
+        step *= 2.0
+
+    z = z + m * sigma
+    with np.errstate(divide="ignore"):
+        estimate = m * m / (2.0 * np.log(2.0) * z)
+    return np.where(empty, 0.0, estimate)
+
+
+def _merge_sketch_rows(
+    keys: np.ndarray,
+    registers: np.ndarray,
+    new_keys: np.ndarray,
+    new_registers: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Merge two sets of keyed sketches by register-wise maximum.
+
+    Args:
+        keys: Sorted unique keys of the existing sketches
+        registers: Existing registers, one row per key
+        new_keys: Sorted unique keys of the sketches to merge in
+        new_registers: Registers to merge in, one row per key
+
+    Returns:
+        Tuple of merged keys, merged registers, and the positions of keys
+        and new_keys in the merged keys
+    """
+    merged_keys = np.union1d(keys, new_keys)
+    positions = np.searchsorted(merged_keys, keys)
+    new_positions = np.searchsorted(merged_keys, new_keys)
+    merged = np.zeros((len(merged_keys), registers.shape[1]), dtype=np.uint8)
+    merged[positions] = registers
+    merged[new_positions] = np.maximum(merged[new_positions], new_registers)
+    return merged_keys, merged, positions, new_positions
+
+
+class FeatureSketchStore:
+    """Persisted daily HyperLogLog sketches of feature usage.
+
+    Each (feature, day) partition keeps a HyperLogLog sketch of its users,
+    an event count and its first and last event time, and each day keeps
+    a sketch of all its users. Sketches merge by register-wise maximum, so
+    partitions built from different data files combine into the same
+    distinct counts as a single pass, and usage and adoption over any
+    window of retained days are computed from the sketches alone. Distinct
+    counts have a relative standard error of about 1.04 / sqrt(2**precision);
+    windows are applied in whole days.
+
+    Partitions are stored as sorted packed int64 keys, and features are
+    mapped to integer codes in order of first appearance. The store also
+    records each ingested data file with its size and modification time.
+    Data files are treated as immutable once ingested.
+    """
+
+    _KEY_SHIFT = 32
+    _DAY_MASK = (1 << 32) - 1
+    _DAY_OFFSET = 1 << 31
+
+    def __init__(self, precision: int = 12):
+        """Initialize an empty store.
+
+        Args:
+            precision: HyperLogLog precision; 2**precision registers per sketch
+        """
+        self.precision = precision
+        self.feature_names: List[str] = []
+        self.keys = np.zeros(0, dtype=np.int64)
+        self.registers = np.zeros((0, 1 << precision), dtype=np.uint8)
+        self.event_counts = np.zeros(0, dtype=np.int64)
+        self.first_seen = np.zeros(0, dtype="datetime64[ns]")
+        self.last_seen = np.zeros(0, dtype="datetime64[ns]")
+        self.days = np.zeros(0, dtype=np.int64)
+        self.user_registers = np.zeros((0, 1 << precision), dtype=np.uint8)
+        self.ingested_files: Dict[str, Tuple[int, int]] = {}
+        self._feature_index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Return the number of (feature, day) partitions in the store."""
+        return len(self.keys)
+
+    def _feature_codes(self, feature_names: pd.Series) -> np.ndarray:
+        """Return each row's feature code, adding unseen features."""
+        categories = pd.Categorical(feature_names.astype(str))
+        category_codes = np.empty(len(categories.categories), dtype=np.int64)
+        for position, feature_name in enumerate(categories.categories):
+            code = self._feature_index.get(feature_name)
+            if code is None:
+                code = len(self.feature_names)
+                self._feature_index[feature_name] = code
+                self.feature_names.append(feature_name)
+            category_codes[position] = code
+        return category_codes[categories.codes]
+
+    def _day_numbers(self, keys: np.ndarray) -> np.ndarray:
+        """Return the day number (days since epoch) of packed keys."""
+        return (keys & self._DAY_MASK) - self._DAY_OFFSET
+
+    @staticmethod
+    def _day_number(moment: datetime) -> int:
+        """Return the day number (days since epoch) of a datetime."""
+        return int(np.datetime64(moment, "D").astype(np.int64))
+
+    def add_events(self, df: pd.DataFrame, config: UsageDataConfig) -> None:
+        """Fold usage events into the daily sketches.
+
+        Args:
+            df: DataFrame with usage data
+            config: Usage data configuration
+        """
+        columns = [
+            config.user_id_column,
+            config.feature_name_column,
+            config.timestamp_column,
+        ]
+        df = df.dropna(subset=columns)
+        if df.empty:
+            return
+
+        features = self._feature_codes(df[config.feature_name_column])
+        timestamps = pd.to_datetime(df[config.timestamp_column]).to_numpy(
+            dtype="datetime64[ns]"
+        )
+        days = timestamps.astype("datetime64[D]").astype(np.int64)
+        index, rank = _hll_positions(
+            _user_hashes(df[config.user_id_column]), self.precision
+        )
+        m = 1 << self.precision
+
+        keys = (features << self._KEY_SHIFT) | (days + self._DAY_OFFSET)
+        batch_keys, groups = np.unique(keys, return_inverse=True)
+        registers = np.zeros((len(batch_keys), m), dtype=np.uint8)
+        np.maximum.at(registers.reshape(-1), groups * m + index, rank)
+        counts = np.bincount(groups, minlength=len(batch_keys))
+        first_seen = np.full(len(batch_keys), np.iinfo(np.int64).max)
+        np.minimum.at(first_seen, groups, timestamps.view(np.int64))
+        last_seen = np.full(len(batch_keys), np.iinfo(np.int64).min)
+        np.maximum.at(last_seen, groups, timestamps.view(np.int64))
+
+        merged_keys, merged, positions, new_positions = _merge_sketch_rows(
+            self.keys, self.registers, batch_keys, registers
+        )
+        merged_counts = np.zeros(len(merged_keys), dtype=np.int64)
+        merged_counts[positions] = self.event_counts
+        merged_counts[new_positions] += counts
+        merged_first = np.full(len(merged_keys), np.iinfo(np.int64).max)
+        merged_first[positions] = self.first_seen.view(np.int64)
+        merged_first[new_positions] = np.minimum(
+            merged_first[new_positions], first_seen
+        )
+        merged_last = np.full(len(merged_keys), np.iinfo(np.int64).min)
+        merged_last[positions] = self.last_seen.view(np.int64)
+        merged_last[new_positions] = np.maximum(merged_last[new_positions], last_seen)
+
+        self.keys = merged_keys
+        self.registers = merged
+        self.event_counts = merged_counts
+        self.first_seen = merged_first.view("datetime64[ns]")
+        self.last_seen = merged_last.view("datetime64[ns]")
+
+        batch_days, day_groups = np.unique(days, return_inverse=True)
+        user_registers = np.zeros((len(batch_days), m), dtype=np.uint8)
+        np.maximum.at(user_registers.reshape(-1), day_groups * m + index, rank)
+        self.days, self.user_registers, _, _ = _merge_sketch_rows(
+            self.days, self.user_registers, batch_days, user_registers
+        )
+
+    def prune(self, cutoff_date: datetime) -> None:
+        """Drop partitions for days before cutoff_date.
+
+        Args:
+            cutoff_date: Earliest time to keep (applied in whole days)
+        """
+        cutoff_day = self._day_number(cutoff_date)
+        keep = self._day_numbers(self.keys) >= cutoff_day
+        self.keys = self.keys[keep]
+        self.registers = self.registers[keep]
+        self.event_counts = self.event_counts[keep]
+        self.first_seen = self.first_seen[keep]
+        self.last_seen = self.last_seen[keep]
+        keep_days = self.days >= cutoff_day
+        self.days = self.days[keep_days]
+        self.user_registers = self.user_registers[keep_days]
+
+    def _file_key(self, data_path: Path, project_root: Path) -> str:
+        """Return the key a data file is recorded under."""
+        try:
+            return data_path.relative_to(project_root).as_posix()
+        except ValueError:
+            return str(data_path)
+
+    def new_files(self, data_paths: List[Path], project_root: Path) -> List[Path]:
+        """Return the data files that have not been ingested yet.
+
+        Previously ingested files that have changed since are not re-read;
+        a warning is logged instead.
+
+        Args:
+            data_paths: Candidate data files
+            project_root: Project root directory
+
+        Returns:
+            Data files to ingest
+        """
+        new_paths = []
+        for data_path in data_paths:
+            recorded = self.ingested_files.get(self._file_key(data_path, project_root))
+            if recorded is None:
+                new_paths.append(data_path)
+                continue
+            stat = data_path.stat() if data_path.exists() else None
+            if stat is None or recorded != (stat.st_size, stat.st_mtime_ns):
+                logger.warning(
+                    f"Data file changed since it was ingested and is not re-read: "
+                    f"{data_path} (rebuild the sketch store to include changes)"
+                )
+        return new_paths
+
+    def mark_ingested(self, data_paths: List[Path], project_root: Path) -> None:
+        """Record data files as ingested.
+
+        Args:
+            data_paths: Ingested data files
+            project_root: Project root directory
+        """
+        for data_path in data_paths:
+            stat = data_path.stat()
+            self.ingested_files[self._file_key(data_path, project_root)] = (
+                stat.st_size,
+                stat.st_mtime_ns,
+            )
+
+    def _window(
+        self, lookback_days: int, now: datetime
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the in-window partition mask and start of each feature's rows."""
+        cutoff_day = self._day_number(now - timedelta(days=lookback_days))
+        in_window = self._day_numbers(self.keys) >= cutoff_day
+        features = self.keys[in_window] >> self._KEY_SHIFT
+        starts = np.flatnonzero(np.r_[True, features[1:] != features[:-1]])
+        return in_window, starts[: len(features)]
+
+    def total_users(
+        self, lookback_days: Optional[int] = None, now: Optional[datetime] = None
+    ) -> int:
+        """Estimate distinct users across all features.
+
+        Args:
+            lookback_days: Days to include (defaults to every retained day)
+            now: Reference time for the lookback window (defaults to now)
+
+        Returns:
+            Estimated number of distinct users
+        """
+        registers = self.user_registers
+        if lookback_days is not None:
+            now = now or datetime.now()
+            cutoff_day = self._day_number(now - timedelta(days=lookback_days))
+            registers = registers[self.days >= cutoff_day]
+        if len(registers) == 0:
+            return 0
+        return int(np.rint(_hll_estimate(registers.max(axis=0), self.precision)[0]))
+
+    def feature_usage(
+        self, analysis_config: AnalysisConfig, now: Optional[datetime] = None
+    ) -> Dict[str, FeatureUsage]:
+        """Calculate usage statistics for each feature from the sketches.
+
+        Args:
+            analysis_config: Analysis configuration
+            now: Reference time for the lookback and trend windows
+                (defaults to now)
+
+        Returns:
+            Dictionary mapping feature name to FeatureUsage, as returned by
+            analyze_feature_usage
+        """
+        now = now or datetime.now()
+        in_window, starts = self._window(analysis_config.lookback_days, now)
+        if len(starts) == 0:
+            return {}
+
+        keys = self.keys[in_window]
+        counts = self.event_counts[in_window]
+        trend_day = self._day_number(
+            now - timedelta(days=analysis_config.analysis_window_days)
+        )
+        recent = np.where(self._day_numbers(keys) >= trend_day, counts, 0)
+
+        total_usage = np.add.reduceat(counts, starts)
+        recent_usage = np.add.reduceat(recent, starts)
+        unique_users = np.rint(
+            _hll_estimate(
+                np.maximum.reduceat(self.registers[in_window], starts),
+                self.precision,
+            )
+        ).astype(np.int64)
+        last_used = np.maximum.reduceat(
+            self.last_seen[in_window].view(np.int64), starts
+        ).view("datetime64[ns]")
+
+        feature_usage = {}
+        for position, start in enumerate(starts):
+            feature_name = self.feature_names[int(keys[start] >> self._KEY_SHIFT)]
+            total = int(total_usage[position])
+            users = int(unique_users[position])
+            recent_count = int(recent_usage[position])
+            feature_usage[feature_name] = FeatureUsage(
+                feature_name=feature_name,
+                total_usage_count=total,
+                unique_users=users,
+                adoption_rate=0.0,
+                avg_usage_per_user=total / users if users > 0 else 0.0,
+                last_used=pd.Timestamp(last_used[position]).to_pydatetime(),
+                usage_trend=_usage_trend(recent_count, total - recent_count),
+            )
+
+        logger.info(f"Analyzed usage for {len(feature_usage)} features from sketches")
+        return feature_usage
+
+    def adoption_metrics(
+        self, analysis_config: AnalysisConfig, now: Optional[datetime] = None
+    ) -> Dict[str, AdoptionMetrics]:
+        """Calculate adoption metrics for each feature from the sketches.
+
+        A feature's users first seen on a given day are estimated as the
+        users of that day and every earlier day in the window, less those
+        of the earlier days alone; days_to_adoption averages their age in
+        whole days.
+
+        Args:
+            analysis_config: Analysis configuration
+            now: Reference time for the lookback window (defaults to now)
+
+        Returns:
+            Dictionary mapping feature name to AdoptionMetrics, as returned
+            by calculate_adoption_rates
+        """
+        now = now or datetime.now()
+        in_window, starts = self._window(analysis_config.lookback_days, now)
+        if len(starts) == 0:
+            return {}
+
+        total_users = self.total_users(analysis_config.lookback_days, now)
+        keys = self.keys[in_window]
+        registers = self.registers[in_window]
+        ages = self._day_number(now) - self._day_numbers(keys)
+        ends = np.r_[starts[1:], len(keys)]
+
+        adoption_metrics = {}
+        for start, end in zip(starts, ends):
+            feature_name = self.feature_names[int(keys[start] >> self._KEY_SHIFT)]
+            reached = _hll_estimate(
+                np.maximum.accumulate(registers[start:end], axis=0), self.precision
+            )
+            first_seen = np.maximum(np.diff(reached, prepend=0.0), 0.0)
+            adopted_users = int(np.rint(reached[-1]))
+
+            days_to_adoption = None
+            if first_seen.sum() > 0:
+                days_to_adoption = float(
+                    (first_seen * ages[start:end]).sum() / first_seen.sum()
+                )
+
+            adoption_metrics[feature_name] = AdoptionMetrics(
+                feature_name=feature_name,
+                total_users=total_users,
+                adopted_users=adopted_users,
+                adoption_percentage=(
+                    (adopted_users / total_users) * 100 if total_users > 0 else 0.0
+                ),
+                adoption_velocity=(
+                    adopted_users / analysis_config.lookback_days
+                    if analysis_config.lookback_days > 0
+                    else 0.0
+                ),
+                days_to_adoption=days_to_adoption,
+            )
+
+        logger.info(
+            f"Calculated adoption rates for {len(adoption_metrics)} features "
+            f"from sketches"
+        )
+        return adoption_metrics
+
+    def save(self, path: Path) -> None:
+        """Persist the store to a NumPy archive.
+
+        Args:
+            path: Output file path
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(path.name + ".tmp")
+        file_stats = np.array(list(self.ingested_files.values()), dtype=np.int64)
+        with open(temp_path, "wb") as f:
+            np.savez(
+                f,
+                precision=np.array(self.precision),
+                feature_names=np.array(self.feature_names, dtype=str),
+                keys=self.keys,
+                registers=self.registers,
+                event_counts=self.event_counts,
+                first_seen=self.first_seen.view(np.int64),
+                last_seen=self.last_seen.view(np.int64),
+                days=self.days,
+                user_registers=self.user_registers,
+                ingested_files=np.array(list(self.ingested_files), dtype=str),
+                file_stats=file_stats.reshape(-1, 2),
+            )
+        os.replace(temp_path, path)
+        logger.info(
+            f"Sketch store saved to {path} ({len(self.feature_names)} features, "
+            f"{len(self.keys)} daily partitions)"
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "FeatureSketchStore":
+        """Load a persisted store.
+
+        Args:
+            path: Store file path
+
+        Returns:
+            Loaded sketch store
+
+        Raises:
+            FileNotFoundError: If the store file does not exist
+        """
+        if not path.exists():
+            raise FileNotFoundError(f"Sketch store not found: {path}")
+
+        with np.load(path, allow_pickle=False) as data:
+            store = cls(int(data["precision"]))
+            store.feature_names = data["feature_names"].tolist()
+            store.keys = data["keys"]
+            store.registers = data["registers"]
+            store.event_counts = data["event_counts"]
+            store.first_seen = data["first_seen"].view("datetime64[ns]")
+            store.last_seen = data["last_seen"].view("datetime64[ns]")
+            store.days = data["days"]
+            store.user_registers = data["user_registers"]
+            store.ingested_files = {
+                name: (int(size), int(mtime))
+                for name, (size, mtime) in zip(
+                    data["ingested_files"].tolist(), data["file_stats"].tolist()
+                )
+            }
+
+        store._feature_index = {
+            feature_name: code for code, feature_name in enumerate(store.feature_names)
+        }
+        logger.info(f"Loaded sketch store with {len(store.feature_names)} features")
+        return store
+
+
+def update_feature_sketch_store(
+    config: Config,
+    project_root: Path,
+    now: Optional[datetime] = None,
+    rebuild: bool = False,
+) -> FeatureSketchStore:
+    """Fold usage data files not yet ingested into the persisted sketch store.
+
+    Args:
+        config: Application configuration
+        project_root: Project root directory
+        now: Reference time for pruning old partitions (defaults to now)
+        rebuild: Discard the persisted store and ingest every data file
+
+    Returns:
+        Updated sketch store
+
+    Raises:
+        FileNotFoundError: If a data file does not exist
+        ValueError: If data format is invalid
+    """
+    now = now or datetime.now()
+    store_path = Path(config.sketch.store_file)
+    if not store_path.is_absolute():
+        store_path = project_root / store_path
+
+    if store_path.exists() and not rebuild:
+        store = FeatureSketchStore.load(store_path)
+        if store.precision != config.sketch.precision:
+            logger.warning(
+                f"Sketch store uses precision {store.precision}; rebuild it to "
+                f"apply precision {config.sketch.precision}"
+            )
+    else:
+        store = FeatureSketchStore(config.sketch.precision)
+
+    usage_files = store.new_files(
+        _data_paths(config.usage_data.file_path, project_root), project_root
+    )
+    if usage_files:
+        store.add_events(
+            load_usage_data(config.usage_data, project_root, usage_files),
+            config.usage_data,
+        )
+        store.mark_ingested(usage_files, project_root)
+
+    store.prune(now - timedelta(days=config.sketch.retention_days))
+    store.save(store_path)
+
+    logger.info(f"Ingested {len(usage_files)} usage files into the sketch store")
+    return store
+
+
 def identify_unused_features(
     feature_usage: Dict[str, FeatureUsage],
     all_features: Set[str],
@@ -700,11 +1369,32 @@ def write_markdown_report(insights: UsageInsights, output_path: Path) -> None:
     logger.info(f"Report written to {output_path}")
 
 
-def process_feature_usage(config_path: Path) -> UsageInsights:
+def _empty_usage_insights() -> UsageInsights:
+    """Return insights for a run with no usage data."""
+    return UsageInsights(
+        total_features=0,
+        active_features=0,
+        unused_features=0,
+        feature_usage_stats=[],
+        unused_features_list=[],
+        adoption_metrics=[],
+        top_features=[],
+        insights=[],
+        generated_at=datetime.now(),
+    )
+
+
+def process_feature_usage(
+    config_path: Path, rebuild_store: bool = False
+) -> UsageInsights:
     """Process feature usage data and generate insights.
 
+    With sketches enabled, only usage files not yet ingested are read, and
+    usage and adoption are estimated from the stored daily sketches.
+
     Args:
         config_path: Path to configuration file
+        rebuild_store: Rebuild the sketch store from every data file
 
     Returns:
         Complete usage insights
@@ -716,20 +1406,37 @@ def process_feature_usage(config_path: Path) -> UsageInsights:
     config = load_config(config_path)
     project_root = config_path.parent
 
-    df = load_usage_data(config.usage_data, project_root)
-
-    if df.empty:
-        logger.warning("No usage data available for analysis")
-        return UsageInsights(
-            total_features=0,
-            active_features=0,
-            unused_features=0,
-            feature_usage_stats=[],
-            unused_features_list=[],
-            adoption_metrics=[],
-            top_features=[],
-            insights=[],
-            generated_at=datetime.now(),
+    if config.sketch.enabled:
+        if config.analysis.lookback_days > config.sketch.retention_days:
+            logger.warning(
+                f"Sketch store only keeps {config.sketch.retention_days} days; "
+                f"the {config.analysis.lookback_days}-day lookback is truncated"
+            )
+        now = datetime.now()
+        store = update_feature_sketch_store(
+            config, project_root, now, rebuild=rebuild_store
+        )
+        if len(store) == 0:
+            logger.warning("No usage data available for analysis")
+            return _empty_usage_insights()
+
+        data_features = set(store.feature_names)
+        feature_usage = store.feature_usage(config.analysis, now)
+        total_users = store.total_users()
+        adoption_metrics_dict = store.adoption_metrics(config.analysis, now)
+    else:
+        df = load_usage_data(config.usage_data, project_root)
+        if df.empty:
+            logger.warning("No usage data available for analysis")
+            return _empty_usage_insights()
+
+        data_features = set(df[config.usage_data.feature_name_column].unique())
+        feature_usage = analyze_feature_usage(
+            df, config.usage_data, config.analysis
+        )
+        total_users = df[config.usage_data.user_id_column].nunique()
+        adoption_metrics_dict = calculate_adoption_rates(
+            df, config.usage_data, config.features, config.analysis
         )
 
     all_features = set()
@@ -740,22 +1447,12 @@ def process_feature_usage(config_path: Path) -> UsageInsights:
         all_features = load_feature_list(features_file)
 
     if not all_features:
-        all_features = set(df[config.usage_data.feature_name_column].unique())
-
-    feature_usage = analyze_feature_usage(
-        df, config.usage_data, config.analysis
-    )
-
-    total_users = df[config.usage_data.user_id_column].nunique()
+        all_features = data_features
 
     unused_features = identify_unused_features(
         feature_usage, all_features, config.features, total_users
     )
 
-    adoption_metrics_dict = calculate_adoption_rates(
-        df, config.usage_data, config.features, config.analysis
-    )
-
     top_features = [
         f.feature_name
         for f in sorted(
@@ -792,6 +1489,14 @@ def process_feature_usage(config_path: Path) -> UsageInsights:
 
 def main() -> None:
     """Main entry point for the feature usage monitor."""
+    parser = argparse.ArgumentParser(description="Feature usage monitor")
+    parser.add_argument(
+        "--rebuild-store",
+        action="store_true",
+        help="Rebuild the sketch store from every usage data file",
+    )
+    args = parser.parse_args()
+
     settings = AppSettings()
     config_path = Path(settings.config_path)
 
@@ -801,7 +1506,9 @@ def main() -> None:
 
     try:
         logger.info("Starting feature usage monitoring")
-        insights = process_feature_usage(config_path)
+        insights = process_feature_usage(
+            config_path, rebuild_store=args.rebuild_store
+        )
         logger.info(
             f"Analysis complete. Analyzed {insights.total_features} features, "
             f"identified {insights.unused_features} unused features, "
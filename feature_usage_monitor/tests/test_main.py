@@ -4,18 +4,24 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Set
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from feature_usage_monitor.src.main import (
     AdoptionMetrics,
+    AnalysisConfig,
+    Config,
     FeatureConfig,
+    FeatureSketchStore,
     FeatureUsage,
     UnusedFeature,
     UsageDataConfig,
     analyze_feature_usage,
     calculate_adoption_rates,
     identify_unused_features,
+    update_feature_sketch_store,
+    _hll_estimate,
 )
 
 
@@ -179,3 +185,60 @@ def test_trend_detection():
 
     assert "feature_a" in usage_stats
     assert usage_stats["feature_a"].usage_trend in ["increasing", "stable"]
+
+
+def test_sketch_store_matches_exact_counts(tmp_path):
+    """Test incremental sketch store estimates against exact analysis."""
+    now = datetime.now()
+    usage_dir = tmp_path / "usage"
+    usage_dir.mkdir()
+    df = pd.DataFrame(
+        {
+            "user_id": [f"user{i % 40}" for i in range(120)],
+            "feature_name": ["feature_a", "feature_b", "feature_a"] * 40,
+            "timestamp": [now - timedelta(days=(i % 5) + 1) for i in range(120)],
+        }
+    )
+    df.iloc[:60].to_csv(usage_dir / "day1.csv", index=False)
+
+    config = Config(
+        usage_data=UsageDataConfig(file_path="usage/*.csv"),
+        sketch={"enabled": True, "store_file": "store/sketches.npz"},
+    )
+    analysis_config = AnalysisConfig(lookback_days=30, analysis_window_days=7)
+
+    update_feature_sketch_store(config, tmp_path, now)
+    df.iloc[60:].to_csv(usage_dir / "day2.csv", index=False)
+    store = update_feature_sketch_store(config, tmp_path, now)
+
+    assert len(store.ingested_files) == 2
+    assert store.total_users() == 40
+
+    expected = analyze_feature_usage(df, config.usage_data, analysis_config)
+    usage = FeatureSketchStore.load(tmp_path / "store/sketches.npz").feature_usage(
+        analysis_config, now
+    )
+    for feature_name, stats in expected.items():
+        assert usage[feature_name].total_usage_count == stats.total_usage_count
+        assert usage[feature_name].unique_users == stats.unique_users
+
+    adoption = store.adoption_metrics(analysis_config, now)
+    expected_adoption = calculate_adoption_rates(
+        df, config.usage_data, FeatureConfig(), analysis_config
+    )
+    assert adoption["feature_a"].adopted_users == 40
+    assert adoption["feature_a"].adoption_percentage == pytest.approx(
+        expected_adoption["feature_a"].adoption_percentage
+    )
+
+
+def test_hll_estimate_empty_sketch(recwarn):
+    """Test that empty sketches estimate zero without numpy warnings."""
+    registers = np.zeros((2, 2**10), dtype=np.uint8)
+    registers[1, :5] = 1
+
+    estimates = _hll_estimate(registers, 10)
+
+    assert estimates[0] == 0.0
+    assert estimates[1] == pytest.approx(5, rel=0.05)
+    assert not [w for w in recwarn if issubclass(w.category, RuntimeWarning)]
@@ -0,0 +1,204 @@
+"""Benchmark load+analyze time and peak RSS for health analysis.
+
+Generates synthetic activity, sleep and health metrics files, then
+measures loading them and computing the activity, sleep and health
+summaries through the record-based path (one dataclass per row) and the
+columnar path (typed DataFrames). Each measurement runs in a fresh
+subprocess so peak RSS is reported per run.
+
+Run from the repository root:
+
+    python -m health_recommendation_engine.benchmarks.load_analyze
+"""
+
+import argparse
+import json
+import logging
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from health_recommendation_engine.src.main import (
+    ActivityDataConfig,
+    HealthMetricsConfig,
+    RecommendationConfig,
+    SleepDataConfig,
+    analyze_activity,
+    analyze_activity_frame,
+    analyze_sleep,
+    analyze_sleep_frame,
+    load_activity_data,
+    load_activity_frame,
+    load_health_metrics,
+    load_health_metrics_frame,
+    load_sleep_data,
+    load_sleep_frame,
+    summarize_health_metrics_frame,
+)
+
+
+def generate_data(directory: Path, rows: int, seed: int = 7) -> None:
+    """Write synthetic activity, sleep and health metrics files."""
+    rng = np.random.default_rng(seed)
+    dates = np.datetime64("2000-01-01") + np.arange(rows).astype("timedelta64[h]")
+
+    steps = rng.integers(1000, 20000, rows).astype(np.float64)
+    steps[rng.random(rows) < 0.05] = np.nan
+    pd.DataFrame(
+        {
+            "date": dates,
+            "steps": steps,
+            "calories": rng.uniform(1500, 3500, rows).round(1),
+            "active_minutes": rng.integers(0, 120, rows),
+            "distance": rng.uniform(0, 15, rows).round(2),
+        }
+    ).to_csv(directory / "activity.csv", index=False)
+
+    bedtime = dates + np.timedelta64(22, "h")
+    pd.DataFrame(
+        {
+            "date": dates,
+            "sleep_hours": rng.uniform(4, 10, rows).round(2),
+            "sleep_quality": rng.uniform(1, 10, rows).round(1),
+            "bedtime": bedtime,
+            "wake_time": bedtime + np.timedelta64(8, "h"),
+        }
+    ).to_csv(directory / "sleep.csv", index=False)
+
+    systolic = rng.integers(100, 150, rows).astype(str)
+    diastolic = rng.integers(60, 95, rows).astype(str)
+    pd.DataFrame(
+        {
+            "date": dates,
+            "weight": rng.uniform(50, 110, rows).round(1),
+            "heart_rate": rng.integers(50, 90, rows),
+            "blood_pressure": np.char.add(np.char.add(systolic, "/"), diastolic),
+        }
+    ).to_csv(directory / "health_metrics.csv", index=False)
+
+
+def _configs(directory: Path):
+    """Build data configurations for the generated files."""
+    activity_config = ActivityDataConfig(
+        file_path=str(directory / "activity.csv"),
+        steps_column="steps",
+        calories_column="calories",
+        active_minutes_column="active_minutes",
+        distance_column="distance",
+    )
+    sleep_config = SleepDataConfig(
+        file_path=str(directory / "sleep.csv"),
+        sleep_quality_column="sleep_quality",
+        bedtime_column="bedtime",
+        wake_time_column="wake_time",
+    )
+    health_config = HealthMetricsConfig(
+        file_path=str(directory / "health_metrics.csv"),
+        weight_column="weight",
+        heart_rate_column="heart_rate",
+        blood_pressure_column="blood_pressure",
+    )
+    return activity_config, sleep_config, health_config
+
+
+def measure(mode: str, directory: Path) -> Dict[str, float]:
+    """Load and analyze the generated data once in this process."""
+    activity_config, sleep_config, health_config = _configs(directory)
+    recommendation_config = RecommendationConfig()
+
+    start = time.perf_counter()
+    if mode == "records":
+        activities = load_activity_data(activity_config, directory)
+        sleep_records = load_sleep_data(sleep_config, directory)
+        health_metrics = load_health_metrics(health_config, directory)
+        activity_summary = analyze_activity(activities, recommendation_config)
+        analyze_sleep(sleep_records, recommendation_config)
+        weights = [m.weight for m in health_metrics if m.weight is not None]
+        if weights:
+            sum(weights) / len(weights)
+    else:
+        activities = load_activity_frame(activity_config, directory)
+        sleep_records = load_sleep_frame(sleep_config, directory)
+        health_metrics = load_health_metrics_frame(health_config, directory)
+        activity_summary = analyze_activity_frame(activities, recommendation_config)
+        analyze_sleep_frame(sleep_records, recommendation_config)
+        summarize_health_metrics_frame(health_metrics)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "seconds": elapsed,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "days_with_data": activity_summary.get("days_with_data", 0),
+    }
+
+
+def _measure_in_subprocess(mode: str, directory: Path) -> Dict[str, float]:
+    """Run measure() in a fresh interpreter and return its result."""
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "health_recommendation_engine.benchmarks.load_analyze",
+            "--measure",
+            mode,
+            str(directory),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    """Run the benchmark across row counts."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rows",
+        type=int,
+        nargs="+",
+        default=[100_000, 1_000_000, 10_000_000],
+        help="Row counts per data file to benchmark",
+    )
+    parser.add_argument(
+        "--max-record-rows",
+        type=int,
+        default=1_000_000,
+        help="Skip the record-based path above this many rows",
+    )
+    parser.add_argument(
+        "--measure", nargs=2, metavar=("MODE", "DIR"), help=argparse.SUPPRESS
+    )
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    if args.measure:
+        mode, directory = args.measure
+        print(json.dumps(measure(mode, Path(directory))))
+        return
+
+    print(f"{'rows':>10} {'path':>9} {'seconds':>9} {'peak RSS MB':>12}")
+    for rows in args.rows:
+        with tempfile.TemporaryDirectory() as tmp:
+            directory = Path(tmp)
+            generate_data(directory, rows)
+            modes: List[str] = ["columnar"]
+            if rows <= args.max_record_rows:
+                modes.insert(0, "records")
+            for mode in modes:
+                result = _measure_in_subprocess(mode, directory)
+                print(
+                    f"{rows:>10} {mode:>9} {result['seconds']:>9.2f} "
+                    f"{result['peak_rss_mb']:>12.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 import yaml
 from pydantic import BaseModel, Field, field_validator
@@ -277,248 +278,303 @@ def load_config(config_path: Path) -> Config:
         raise
 
 
-def load_activity_data(
-    config: ActivityDataConfig, project_root: Path
-) -> List[ActivityMetrics]:
-    """Load activity data from file.
+def _resolve_data_path(file_path: str, project_root: Path) -> Path:
+    """Resolve a data file path relative to the project root."""
+    data_path = Path(file_path)
+    if not data_path.is_absolute():
+        data_path = project_root / data_path
+    return data_path
 
-    Args:
-        config: Activity data configuration
-        project_root: Project root directory
 
-    Returns:
-        List of ActivityMetrics objects
+def _read_data_frame(data_path: Path, file_format: str) -> pd.DataFrame:
+    """Read a CSV or JSON data file into a DataFrame.
 
     Raises:
-        FileNotFoundError: If data file does not exist
-        ValueError: If data format is invalid
+        ValueError: If the format is unsupported
     """
-    data_path = Path(config.file_path)
-    if not data_path.is_absolute():
-        data_path = project_root / data_path
+    if file_format.lower() == "csv":
+        return pd.read_csv(data_path)
+    if file_format.lower() == "json":
+        return pd.read_json(data_path)
+    raise ValueError(f"Unsupported format: {file_format}")
 
-    if not data_path.exists():
-        raise FileNotFoundError(f"Activity data file not found: {data_path}")
 
-    try:
-        if config.format.lower() == "csv":
-            df = pd.read_csv(data_path)
-        elif config.format.lower() == "json":
-            df = pd.read_json(data_path)
-        else:
-            raise ValueError(f"Unsupported format: {config.format}")
+def _optional_column(
+    df: pd.DataFrame, column: Optional[str], dtype: str
+) -> pd.Series:
+    """Return a configured optional column, or an all-missing column.
 
-        if config.date_column not in df.columns:
-            raise ValueError(f"Date column '{config.date_column}' not found")
+    Integer columns are truncated toward zero, matching int().
+    """
+    if not column or column not in df.columns:
+        return pd.Series(pd.NA, index=df.index, dtype=dtype)
+    if dtype == "Int64":
+        return np.trunc(df[column].astype("Float64")).astype("Int64")
+    return df[column].astype(dtype)
 
-        df[config.date_column] = pd.to_datetime(df[config.date_column])
 
-        activities = []
-        for _, row in df.iterrows():
-            activity = ActivityMetrics(date=row[config.date_column])
+def _optional_datetime_column(df: pd.DataFrame, column: Optional[str]) -> pd.Series:
+    """Return a configured optional datetime column, or an all-NaT column."""
+    if not column or column not in df.columns:
+        return pd.Series(pd.NaT, index=df.index, dtype="datetime64[ns]")
+    return pd.to_datetime(df[column])
 
-            if config.steps_column and config.steps_column in df.columns:
-                activity.steps = (
-                    int(row[config.steps_column])
-                    if pd.notna(row[config.steps_column])
-                    else None
-                )
 
-            if config.calories_column and config.calories_column in df.columns:
-                activity.calories = (
-                    float(row[config.calories_column])
-                    if pd.notna(row[config.calories_column])
-                    else None
-                )
+def _nullable_values(series: pd.Series) -> List:
+    """Convert a column to a list with missing values as None."""
+    return series.astype(object).where(series.notna(), None).tolist()
 
-            if (
-                config.active_minutes_column
-                and config.active_minutes_column in df.columns
-            ):
-                activity.active_minutes = (
-                    int(row[config.active_minutes_column])
-                    if pd.notna(row[config.active_minutes_column])
-                    else None
-                )
 
-            if config.distance_column and config.distance_column in df.columns:
-                activity.distance = (
-                    float(row[config.distance_column])
-                    if pd.notna(row[config.distance_column])
-                    else None
-                )
+def load_activity_frame(
+    config: ActivityDataConfig, project_root: Path
+) -> pd.DataFrame:
+    """Load activity data into a typed DataFrame.
 
-            activities.append(activity)
+    Args:
+        config: Activity data configuration
+        project_root: Project root directory
 
-        logger.info(f"Loaded {len(activities)} activity records")
-        return activities
+    Returns:
+        DataFrame with date, steps, calories, active_minutes and distance
+        columns (nullable numeric dtypes)
 
+    Raises:
+        FileNotFoundError: If data file does not exist
+        ValueError: If data format is invalid
+    """
+    data_path = _resolve_data_path(config.file_path, project_root)
+    if not data_path.exists():
+        raise FileNotFoundError(f"Activity data file not found: {data_path}")
+
+    try:
+        df = _read_data_frame(data_path, config.format)
     except pd.errors.EmptyDataError:
         logger.warning(f"Activity data file is empty: {data_path}")
-        return []
+        df = pd.DataFrame({config.date_column: []})
     except Exception as e:
         logger.error(f"Failed to load activity data: {e}")
         raise
 
+    if config.date_column not in df.columns:
+        raise ValueError(f"Date column '{config.date_column}' not found")
+
+    frame = pd.DataFrame(
+        {
+            "date": pd.to_datetime(df[config.date_column]),
+            "steps": _optional_column(df, config.steps_column, "Int64"),
+            "calories": _optional_column(df, config.calories_column, "Float64"),
+            "active_minutes": _optional_column(
+                df, config.active_minutes_column, "Int64"
+            ),
+            "distance": _optional_column(df, config.distance_column, "Float64"),
+        }
+    )
+
+    logger.info(f"Loaded {len(frame)} activity records")
+    return frame
 
-def load_sleep_data(
-    config: SleepDataConfig, project_root: Path
-) -> List[SleepMetrics]:
-    """Load sleep data from file.
+
+def load_sleep_frame(config: SleepDataConfig, project_root: Path) -> pd.DataFrame:
+    """Load sleep data into a typed DataFrame.
 
     Args:
         config: Sleep data configuration
         project_root: Project root directory
 
     Returns:
-        List of SleepMetrics objects
+        DataFrame with date, sleep_hours, sleep_quality, bedtime and
+        wake_time columns
 
     Raises:
         FileNotFoundError: If data file does not exist
         ValueError: If data format is invalid
     """
-    data_path = Path(config.file_path)
-    if not data_path.is_absolute():
-        data_path = project_root / data_path
-
+    data_path = _resolve_data_path(config.file_path, project_root)
     if not data_path.exists():
         raise FileNotFoundError(f"Sleep data file not found: {data_path}")
 
     try:
-        if config.format.lower() == "csv":
-            df = pd.read_csv(data_path)
-        elif config.format.lower() == "json":
-            df = pd.read_json(data_path)
-        else:
-            raise ValueError(f"Unsupported format: {config.format}")
-
-        if config.date_column not in df.columns:
-            raise ValueError(f"Date column '{config.date_column}' not found")
-        if config.sleep_hours_column not in df.columns:
-            raise ValueError(
-                f"Sleep hours column '{config.sleep_hours_column}' not found"
-            )
+        df = _read_data_frame(data_path, config.format)
+    except pd.errors.EmptyDataError:
+        logger.warning(f"Sleep data file is empty: {data_path}")
+        df = pd.DataFrame({config.date_column: [], config.sleep_hours_column: []})
+    except Exception as e:
+        logger.error(f"Failed to load sleep data: {e}")
+        raise
 
-        df[config.date_column] = pd.to_datetime(df[config.date_column])
+    if config.date_column not in df.columns:
+        raise ValueError(f"Date column '{config.date_column}' not found")
+    if config.sleep_hours_column not in df.columns:
+        raise ValueError(
+            f"Sleep hours column '{config.sleep_hours_column}' not found"
+        )
 
-        sleep_records = []
-        for _, row in df.iterrows():
-            sleep_hours = float(row[config.sleep_hours_column])
+    frame = pd.DataFrame(
+        {
+            "date": pd.to_datetime(df[config.date_column]),
+            "sleep_hours": df[config.sleep_hours_column].astype("float64"),
+            "sleep_quality": _optional_column(
+                df, config.sleep_quality_column, "Float64"
+            ),
+            "bedtime": _optional_datetime_column(df, config.bedtime_column),
+            "wake_time": _optional_datetime_column(df, config.wake_time_column),
+        }
+    )
 
-            sleep_metric = SleepMetrics(
-                date=row[config.date_column], sleep_hours=sleep_hours
-            )
+    logger.info(f"Loaded {len(frame)} sleep records")
+    return frame
 
-            if (
-                config.sleep_quality_column
-                and config.sleep_quality_column in df.columns
-            ):
-                sleep_metric.sleep_quality = (
-                    float(row[config.sleep_quality_column])
-                    if pd.notna(row[config.sleep_quality_column])
-                    else None
-                )
 
-            if config.bedtime_column and config.bedtime_column in df.columns:
-                if pd.notna(row[config.bedtime_column]):
-                    sleep_metric.bedtime = pd.to_datetime(
-                        row[config.bedtime_column]
-                    )
+def load_health_metrics_frame(
+    config: HealthMetricsConfig, project_root: Path
+) -> pd.DataFrame:
+    """Load health metrics data into a typed DataFrame.
 
-            if config.wake_time_column and config.wake_time_column in df.columns:
-                if pd.notna(row[config.wake_time_column]):
-                    sleep_metric.wake_time = pd.to_datetime(
-                        row[config.wake_time_column]
-                    )
+    Args:
+        config: Health metrics configuration
+        project_root: Project root directory
 
-            sleep_records.append(sleep_metric)
+    Returns:
+        DataFrame with date, weight, heart_rate and blood_pressure
+        (categorical) columns
 
-        logger.info(f"Loaded {len(sleep_records)} sleep records")
-        return sleep_records
+    Raises:
+        FileNotFoundError: If data file does not exist
+        ValueError: If data format is invalid
+    """
+    data_path = _resolve_data_path(config.file_path, project_root)
+    if not data_path.exists():
+        raise FileNotFoundError(f"Health metrics file not found: {data_path}")
 
+    try:
+        df = _read_data_frame(data_path, config.format)
     except pd.errors.EmptyDataError:
-        logger.warning(f"Sleep data file is empty: {data_path}")
-        return []
+        logger.warning(f"Health metrics file is empty: {data_path}")
+        df = pd.DataFrame({config.date_column: []})
     except Exception as e:
-        logger.error(f"Failed to load sleep data: {e}")
+        logger.error(f"Failed to load health metrics: {e}")
         raise
 
+    if config.date_column not in df.columns:
+        raise ValueError(f"Date column '{config.date_column}' not found")
+
+    blood_pressure = _optional_column(df, config.blood_pressure_column, "object")
+    frame = pd.DataFrame(
+        {
+            "date": pd.to_datetime(df[config.date_column]),
+            "weight": _optional_column(df, config.weight_column, "Float64"),
+            "heart_rate": _optional_column(df, config.heart_rate_column, "Int64"),
+            "blood_pressure": blood_pressure.where(
+                blood_pressure.isna(), blood_pressure.astype(str)
+            ).astype("category"),
+        }
+    )
+
+    logger.info(f"Loaded {len(frame)} health metric records")
+    return frame
 
-def load_health_metrics(
-    config: HealthMetricsConfig, project_root: Path
-) -> List[HealthMetrics]:
-    """Load health metrics data from file.
+
+def load_activity_data(
+    config: ActivityDataConfig, project_root: Path
+) -> List[ActivityMetrics]:
+    """Load activity data from file.
 
     Args:
-        config: Health metrics configuration
+        config: Activity data configuration
         project_root: Project root directory
 
     Returns:
-        List of HealthMetrics objects
+        List of ActivityMetrics objects
 
     Raises:
         FileNotFoundError: If data file does not exist
         ValueError: If data format is invalid
     """
-    data_path = Path(config.file_path)
-    if not data_path.is_absolute():
-        data_path = project_root / data_path
-
-    if not data_path.exists():
-        raise FileNotFoundError(f"Health metrics file not found: {data_path}")
+    frame = load_activity_frame(config, project_root)
+    return [
+        ActivityMetrics(
+            date=date,
+            steps=steps,
+            calories=calories,
+            active_minutes=active_minutes,
+            distance=distance,
+        )
+        for date, steps, calories, active_minutes, distance in zip(
+            frame["date"].tolist(),
+            _nullable_values(frame["steps"]),
+            _nullable_values(frame["calories"]),
+            _nullable_values(frame["active_minutes"]),
+            _nullable_values(frame["distance"]),
+        )
+    ]
 
-    try:
-        if config.format.lower() == "csv":
-            df = pd.read_csv(data_path)
-        elif config.format.lower() == "json":
-            df = pd.read_json(data_path)
-        else:
-            raise ValueError(f"Unsupported format: {config.format}")
 
-        if config.date_column not in df.columns:
-            raise ValueError(f"Date column '{config.date_column}' not found")
+def load_sleep_data(
+    config: SleepDataConfig, project_root: Path
+) -> List[SleepMetrics]:
+    """Load sleep data from file.
 
-        df[config.date_column] = pd.to_datetime(df[config.date_column])
+    Args:
+        config: Sleep data configuration
+        project_root: Project root directory
 
-        metrics = []
-        for _, row in df.iterrows():
-            health_metric = HealthMetrics(date=row[config.date_column])
+    Returns:
+        List of SleepMetrics objects
 
-            if config.weight_column and config.weight_column in df.columns:
-                health_metric.weight = (
-                    float(row[config.weight_column])
-                    if pd.notna(row[config.weight_column])
-                    else None
-                )
+    Raises:
+        FileNotFoundError: If data file does not exist
+        ValueError: If data format is invalid
+    """
+    frame = load_sleep_frame(config, project_root)
+    return [
+        SleepMetrics(
+            date=date,
+            sleep_hours=sleep_hours,
+            sleep_quality=sleep_quality,
+            bedtime=bedtime,
+            wake_time=wake_time,
+        )
+        for date, sleep_hours, sleep_quality, bedtime, wake_time in zip(
+            frame["date"].tolist(),
+            frame["sleep_hours"].tolist(),
+            _nullable_values(frame["sleep_quality"]),
+            _nullable_values(frame["bedtime"]),
+            _nullable_values(frame["wake_time"]),
+        )
+    ]
 
-            if config.heart_rate_column and config.heart_rate_column in df.columns:
-                health_metric.heart_rate = (
-                    int(row[config.heart_rate_column])
-                    if pd.notna(row[config.heart_rate_column])
-                    else None
-                )
 
-            if (
-                config.blood_pressure_column
-                and config.blood_pressure_column in df.columns
-            ):
-                health_metric.blood_pressure = (
-                    str(row[config.blood_pressure_column])
-                    if pd.notna(row[config.blood_pressure_column])
-                    else None
-                )
+def load_health_metrics(
+    config: HealthMetricsConfig, project_root: Path
+) -> List[HealthMetrics]:
+    """Load health metrics data from file.
 
-            metrics.append(health_metric)
+    Args:
+        config: Health metrics configuration
+        project_root: Project root directory
 
-        logger.info(f"Loaded {len(metrics)} health metric records")
-        return metrics
+    Returns:
+        List of HealthMetrics objects
 
-    except pd.errors.EmptyDataError:
-        logger.warning(f"Health metrics file is empty: {data_path}")
-        return []
-    except Exception as e:
-        logger.error(f"Failed to load health metrics: {e}")
-        raise
+    Raises:
+        FileNotFoundError: If data file does not exist
+        ValueError: If data format is invalid
+    """
+    frame = load_health_metrics_frame(config, project_root)
+    return [
+        HealthMetrics(
+            date=date,
+            weight=weight,
+            heart_rate=heart_rate,
+            blood_pressure=blood_pressure,
+        )
+        for date, weight, heart_rate, blood_pressure in zip(
+            frame["date"].tolist(),
+            _nullable_values(frame["weight"]),
+            _nullable_values(frame["heart_rate"]),
+            _nullable_values(frame["blood_pressure"]),
+        )
+    ]
 
 
 def analyze_activity(
@@ -606,6 +662,108 @@ def analyze_sleep(
     return summary
 
 
+def analyze_activity_frame(
+    activities: pd.DataFrame, config: RecommendationConfig
+) -> Dict[str, float]:
+    """Analyze activity data directly on columns.
+
+    Columnar equivalent of analyze_activity.
+
+    Args:
+        activities: Activity DataFrame from load_activity_frame
+        config: Recommendation configuration
+
+    Returns:
+        Dictionary of summary statistics
+    """
+    if activities.empty:
+        return {}
+
+    summary = {}
+    steps = activities["steps"].dropna().to_numpy(dtype=np.int64)
+    calories = activities["calories"].dropna().to_numpy(dtype=np.float64)
+    active_minutes = activities["active_minutes"].dropna().to_numpy(dtype=np.int64)
+
+    if len(steps):
+        summary["avg_steps_per_day"] = float(steps.sum() / len(steps))
+        summary["total_steps"] = int(steps.sum())
+        summary["days_with_data"] = len(steps)
+        summary["steps_target_met_days"] = int(
+            (steps >= config.target_steps_per_day).sum()
+        )
+    else:
+        summary["avg_steps_per_day"] = 0.0
+
+    if len(calories):
+        summary["avg_calories_per_day"] = float(calories.sum() / len(calories))
+        summary["total_calories"] = float(calories.sum())
+
+    if len(active_minutes):
+        summary["avg_active_minutes"] = float(
+            active_minutes.sum() / len(active_minutes)
+        )
+        summary["active_minutes_target_met_days"] = int(
+            (active_minutes >= config.target_active_minutes).sum()
+        )
+
+    return summary
+
+
+def analyze_sleep_frame(
+    sleep_records: pd.DataFrame, config: RecommendationConfig
+) -> Dict[str, float]:
+    """Analyze sleep data directly on columns.
+
+    Columnar equivalent of analyze_sleep.
+
+    Args:
+        sleep_records: Sleep DataFrame from load_sleep_frame
+        config: Recommendation configuration
+
+    Returns:
+        Dictionary of summary statistics
+    """
+    if sleep_records.empty:
+        return {}
+
+    summary = {}
+    sleep_hours = sleep_records["sleep_hours"].to_numpy(dtype=np.float64)
+    quality = sleep_records["sleep_quality"].dropna().to_numpy(dtype=np.float64)
+
+    summary["avg_sleep_hours"] = float(sleep_hours.sum() / len(sleep_hours))
+    summary["min_sleep_hours"] = float(sleep_hours.min())
+    summary["max_sleep_hours"] = float(sleep_hours.max())
+    summary["days_with_data"] = len(sleep_hours)
+
+    summary["sleep_target_met_days"] = int(
+        (
+            (sleep_hours >= config.min_sleep_hours)
+            & (sleep_hours <= config.max_sleep_hours)
+        ).sum()
+    )
+
+    if len(quality):
+        summary["avg_sleep_quality"] = float(quality.sum() / len(quality))
+
+    return summary
+
+
+def summarize_health_metrics_frame(health_metrics: pd.DataFrame) -> Dict[str, float]:
+    """Summarize health metrics directly on columns.
+
+    Args:
+        health_metrics: Health metrics DataFrame from load_health_metrics_frame
+
+    Returns:
+        Dictionary of summary statistics
+    """
+    summary = {}
+    weights = health_metrics["weight"].dropna().to_numpy(dtype=np.float64)
+    if len(weights):
+        summary["avg_weight"] = float(weights.sum() / len(weights))
+    return summary
+
+
 def generate_recommendations(
     activity_summary: Dict[str, float],
     sleep_summary: Dict[str, float],
@@ -929,18 +1087,13 @@ def process_health_analysis(config_path: Path) -> HealthAnalysis:
     config = load_config(config_path)
     project_root = config_path.parent
 
-    activities = load_activity_data(config.activity_data, project_root)
-    sleep_records = load_sleep_data(config.sleep_data, project_root)
-    health_metrics = load_health_metrics(config.health_metrics, project_root)
-
-    activity_summary = analyze_activity(activities, config.recommendation)
-    sleep_summary = analyze_sleep(sleep_records, config.recommendation)
-    health_summary = {}
+    activities = load_activity_frame(config.activity_data, project_root)
+    sleep_records = load_sleep_frame(config.sleep_data, project_root)
+    health_metrics = load_health_metrics_frame(config.health_metrics, project_root)
 
-    if health_metrics:
-        weight_list = [m.weight for m in health_metrics if m.weight is not None]
-        if weight_list:
-            health_summary["avg_weight"] = sum(weight_list) / len(weight_list)
+    activity_summary = analyze_activity_frame(activities, config.recommendation)
+    sleep_summary = analyze_sleep_frame(sleep_records, config.recommendation)
+    health_summary = summarize_health_metrics_frame(health_metrics)
 
     recommendations = generate_recommendations(
         activity_summary, sleep_summary, health_summary, config.recommendation
@@ -13,8 +13,14 @@ from health_recommendation_engine.src.main import (
     SleepDataConfig,
     SleepMetrics,
     analyze_activity,
+    analyze_activity_frame,
     analyze_sleep,
+    analyze_sleep_frame,
     generate_recommendations,
+    load_activity_data,
+    load_activity_frame,
+    load_sleep_data,
+    load_sleep_frame,
 )
 
 
@@ -175,3 +181,53 @@ def test_activity_summary_calculation():
     assert "avg_steps_per_day" in summary
     assert summary["avg_steps_per_day"] == 10000.0
     assert summary["days_with_data"] == 1
+
+
+def test_activity_frame_matches_records(tmp_path):
+    """Test columnar activity loading and analysis match the record path."""
+    pd.DataFrame(
+        {
+            "date": ["2024-01-01", "2024-01-02", "2024-01-03"],
+            "steps": [12000, None, 6000],
+            "calories": [2100.5, 1800.0, None],
+            "active_minutes": [45, 20, None],
+        }
+    ).to_csv(tmp_path / "activity.csv", index=False)
+    data_config = ActivityDataConfig(
+        file_path="activity.csv",
+        steps_column="steps",
+        calories_column="calories",
+        active_minutes_column="active_minutes",
+    )
+    config = RecommendationConfig()
+
+    frame = load_activity_frame(data_config, tmp_path)
+    records = load_activity_data(data_config, tmp_path)
+
+    assert str(frame["steps"].dtype) == "Int64"
+    assert [r.steps for r in records] == [12000, None, 6000]
+    assert analyze_activity_frame(frame, config) == pytest.approx(
+        analyze_activity(records, config)
+    )
+
+
+def test_sleep_frame_matches_records(tmp_path):
+    """Test columnar sleep loading and analysis match the record path."""
+    pd.DataFrame(
+        {
+            "date": ["2024-01-01", "2024-01-02", "2024-01-03"],
+            "sleep_hours": [6.5, 8.0, 9.5],
+            "sleep_quality": [70.0, None, 85.0],
+        }
+    ).to_csv(tmp_path / "sleep.csv", index=False)
+    data_config = SleepDataConfig(
+        file_path="sleep.csv", sleep_quality_column="sleep_quality"
+    )
+    config = RecommendationConfig()
+
+    frame = load_sleep_frame(data_config, tmp_path)
+    records = load_sleep_data(data_config, tmp_path)
+
+    assert analyze_sleep_frame(frame, config) == pytest.approx(
+        analyze_sleep(records, config)
+    )
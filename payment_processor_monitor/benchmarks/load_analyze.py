@@ -0,0 +1,187 @@
+"""Benchmark load+analyze time and peak RSS for payment analytics.
+
+Generates a synthetic payment file, then measures loading it, identifying
+failed payments and calculating analytics through the record-based path
+(one dataclass per row), the columnar path (typed DataFrames) and the
+streaming path (fixed-size chunks folded into daily rollups). Each
+measurement runs in a fresh subprocess so peak RSS is reported per run.
+
+Run from the repository root:
+
+    python -m payment_processor_monitor.benchmarks.load_analyze
+"""
+
+import argparse
+import json
+import logging
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from payment_processor_monitor.src.main import (
+    FailureReason,
+    ForecastingConfig,
+    PaymentAccumulator,
+    PaymentDataConfig,
+    RetryConfig,
+    calculate_analytics,
+    calculate_analytics_frame,
+    calculate_analytics_from_rollup,
+    identify_failed_payments,
+    identify_failed_payments_frame,
+    iter_payment_frames,
+    load_payment_data,
+    load_payment_frame,
+)
+
+STATUSES = np.array(["success"] * 8 + ["failed", "pending"])
+REASONS = np.array([reason.value for reason in FailureReason])
+
+
+def generate_data(
+    directory: Path, rows: int, seed: int = 7, chunk_rows: int = 1_000_000
+) -> None:
+    """Write a synthetic payments.csv with rows payments, chunk by chunk."""
+    rng = np.random.default_rng(seed)
+    now = np.datetime64(datetime.now().replace(microsecond=0))
+    customer_count = max(rows // 10, 1)
+
+    for offset in range(0, rows, chunk_rows):
+        size = min(chunk_rows, rows - offset)
+        status = rng.choice(STATUSES, size)
+        reasons = rng.choice(REASONS, size).astype(object)
+        reasons[status != "failed"] = None
+
+        pd.DataFrame(
+            {
+                "payment_id": np.char.add(
+                    "pay_", np.arange(offset, offset + size).astype(str)
+                ),
+                "customer_id": np.char.add(
+                    "cust_", rng.integers(0, customer_count, size).astype(str)
+                ),
+                "amount": rng.uniform(1, 500, size).round(2),
+                "status": status,
+                "timestamp": now
+                - rng.integers(0, 365 * 86400, size).astype("timedelta64[s]"),
+                "failure_reason": reasons,
+                "retry_count": rng.integers(0, 5, size),
+            }
+        ).to_csv(
+            directory / "payments.csv",
+            mode="w" if offset == 0 else "a",
+            header=offset == 0,
+            index=False,
+        )
+
+
+def measure(mode: str, directory: Path) -> Dict[str, float]:
+    """Load and analyze the generated data once in this process."""
+    data_config = PaymentDataConfig(
+        file_path=str(directory / "payments.csv"),
+        failure_reason_column="failure_reason",
+        retry_count_column="retry_count",
+    )
+    retry_config = RetryConfig()
+    forecasting_config = ForecastingConfig()
+
+    start = time.perf_counter()
+    if mode == "records":
+        payments = load_payment_data(data_config, directory)
+        failed = len(identify_failed_payments(payments, retry_config))
+        analytics = calculate_analytics(payments, forecasting_config)
+    elif mode == "streaming":
+        accumulator = PaymentAccumulator()
+        for chunk in iter_payment_frames(data_config, directory, 100_000):
+            accumulator.add(chunk)
+        failed = len(
+            identify_failed_payments_frame(accumulator.failed_payments(), retry_config)
+        )
+        analytics = calculate_analytics_from_rollup(
+            accumulator.rollup, forecasting_config
+        )
+    else:
+        payments = load_payment_frame(data_config, directory)
+        failed = len(identify_failed_payments_frame(payments, retry_config))
+        analytics = calculate_analytics_frame(payments, forecasting_config)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "seconds": elapsed,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "total_payments": analytics.total_payments,
+        "failed_payments": failed,
+    }
+
+
+def _measure_in_subprocess(mode: str, directory: Path) -> Dict[str, float]:
+    """Run measure() in a fresh interpreter and return its result."""
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "payment_processor_monitor.benchmarks.load_analyze",
+            "--measure",
+            mode,
+            str(directory),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    """Run the benchmark across row counts."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rows",
+        type=int,
+        nargs="+",
+        default=[100_000, 1_000_000, 10_000_000],
+        help="Payment row counts to benchmark",
+    )
+    parser.add_argument(
+        "--max-record-rows",
+        type=int,
+        default=1_000_000,
+        help="Skip the record-based path above this many rows",
+    )
+    parser.add_argument(
+        "--measure", nargs=2, metavar=("MODE", "DIR"), help=argparse.SUPPRESS
+    )
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    if args.measure:
+        mode, directory = args.measure
+        print(json.dumps(measure(mode, Path(directory))))
+        return
+
+    print(f"{'rows':>10} {'path':>9} {'seconds':>9} {'peak RSS MB':>12}")
+    for rows in args.rows:
+        with tempfile.TemporaryDirectory() as tmp:
+            directory = Path(tmp)
+            generate_data(directory, rows)
+            modes: List[str] = ["columnar", "streaming"]
+            if rows <= args.max_record_rows:
+                modes.insert(0, "records")
+            for mode in modes:
+                result = _measure_in_subprocess(mode, directory)
+                print(
+                    f"{rows:>10} {mode:>9} {result['seconds']:>9.2f} "
+                    f"{result['peak_rss_mb']:>12.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ reminders, and generates payment analytics with revenue forecasting.
 
 import json
 import logging
+import os
 import smtplib
 from collections import defaultdict
 from dataclasses import dataclass, field
@@ -13,8 +14,9 @@ from datetime import datetime, timedelta
 from email.mime.text import MIMEText
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import yaml
 from pydantic import BaseModel, Field, field_validator
@@ -49,6 +51,10 @@ class FailureReason(str, Enum):
     UNKNOWN = "unknown"
 
 
+_STATUS_VALUES = pd.Index([status.value for status in PaymentStatus])
+_REASON_VALUES = pd.Index([reason.value for reason in FailureReason])
+
+
 class PaymentDataConfig(BaseModel):
     """Configuration for payment data source."""
 
@@ -146,6 +152,26 @@ class AnalyticsConfig(BaseModel):
     )
 
 
+class StreamingConfig(BaseModel):
+    """Configuration for streamed analytics and the daily rollup store."""
+
+    chunk_size: int = Field(
+        default=100_000, description="Payment rows read per chunk"
+    )
+    rollup_file: Optional[str] = Field(
+        default="data/payment_daily_rollup.csv",
+        description="Path to the persisted per-day rollup (None to disable)",
+    )
+
+    @field_validator("chunk_size")
+    @classmethod
+    def validate_chunk_size(cls, v: int) -> int:
+        """Validate chunk size is positive."""
+        if v < 1:
+            raise ValueError("chunk_size must be at least 1")
+        return v
+
+
 class Config(BaseModel):
     """Main configuration model."""
 
@@ -170,6 +196,10 @@ class Config(BaseModel):
         default_factory=AnalyticsConfig,
         description="Analytics generation settings",
     )
+    streaming: StreamingConfig = Field(
+        default_factory=StreamingConfig,
+        description="Streamed analytics and daily rollup settings",
+    )
     failed_payments_output: str = Field(
         default="logs/failed_payments.json",
         description="Path to save failed payments list",
@@ -262,97 +292,323 @@ def load_config(config_path: Path) -> Config:
         raise
 
 
-def load_payment_data(
-    config: PaymentDataConfig, project_root: Path
-) -> List[PaymentRecord]:
-    """Load payment data from CSV or JSON file.
+def _resolve_data_path(file_path: str, project_root: Path) -> Path:
+    """Resolve a data file path relative to the project root."""
+    data_path = Path(file_path)
+    if not data_path.is_absolute():
+        data_path = project_root / data_path
+    return data_path
+
+
+def _string_categories(df: pd.DataFrame, category_columns: List[str]) -> None:
+    """Convert the categories of CSV-read categorical columns to strings."""
+    for column in category_columns:
+        if column in df.columns:
+            df[column] = df[column].cat.rename_categories(
+                df[column].cat.categories.astype(str)
+            )
+
+
+def _read_data_frame(
+    data_path: Path,
+    file_format: str,
+    id_columns: List[str],
+    category_columns: List[Optional[str]],
+) -> pd.DataFrame:
+    """Read a CSV or JSON data file into a DataFrame.
+
+    Args:
+        data_path: Path to the data file
+        file_format: File format (csv or json)
+        id_columns: Columns to read as strings
+        category_columns: Columns to read as string categoricals (None
+            entries are ignored)
+
+    Raises:
+        ValueError: If the format is unsupported
+    """
+    category_columns = [column for column in category_columns if column]
+    if file_format.lower() == "csv":
+        dtypes = {column: str for column in id_columns}
+        dtypes.update(
+            {column: pd.CategoricalDtype() for column in category_columns}
+        )
+        df = pd.read_csv(data_path, dtype=dtypes)
+        _string_categories(df, category_columns)
+        return df
+    if file_format.lower() == "json":
+        df = pd.read_json(data_path)
+        for column in id_columns + category_columns:
+            if column in df.columns:
+                df[column] = df[column].where(df[column].isna(), df[column].astype(str))
+        for column in category_columns:
+            if column in df.columns:
+                df[column] = df[column].astype("category")
+        return df
+    raise ValueError(f"Unsupported format: {file_format}")
+
+
+def _iter_data_frames(
+    data_path: Path,
+    file_format: str,
+    id_columns: List[str],
+    category_columns: List[Optional[str]],
+    chunk_size: int,
+) -> Iterator[pd.DataFrame]:
+    """Read a CSV or JSON data file as DataFrames of at most chunk_size rows.
+
+    CSV files are streamed; JSON files are read whole and then sliced,
+    since a JSON array cannot be parsed incrementally.
+
+    Raises:
+        ValueError: If the format is unsupported
+    """
+    if file_format.lower() == "csv":
+        category_columns = [column for column in category_columns if column]
+        dtypes = {column: str for column in id_columns}
+        dtypes.update(
+            {column: pd.CategoricalDtype() for column in category_columns}
+        )
+        with pd.read_csv(data_path, dtype=dtypes, chunksize=chunk_size) as reader:
+            for df in reader:
+                _string_categories(df, category_columns)
+                yield df
+        return
+
+    df = _read_data_frame(data_path, file_format, id_columns, category_columns)
+    for start in range(0, len(df), chunk_size):
+        yield df.iloc[start : start + chunk_size].reset_index(drop=True)
+
+
+def _lowercase_codes(series: pd.Series, values: pd.Index) -> np.ndarray:
+    """Map a categorical column to codes in values, case-insensitively.
+
+    Args:
+        series: Categorical column
+        values: Allowed lowercase values
+
+    Returns:
+        Code per row into values, -1 for missing or unknown values
+    """
+    lowered = series.cat.categories.astype(str).str.lower()
+    category_codes = np.append(values.get_indexer(lowered), -1)
+    return category_codes[series.cat.codes.to_numpy()]
+
+
+def _payment_source_columns(
+    config: PaymentDataConfig,
+) -> Tuple[List[str], List[Optional[str]]]:
+    """Return the ID and categorical source columns for payment data."""
+    return (
+        [config.payment_id_column],
+        [
+            config.customer_id_column,
+            config.status_column,
+            config.failure_reason_column,
+        ],
+    )
+
+
+def _empty_payment_frame() -> pd.DataFrame:
+    """Return an empty payment DataFrame with the loader's dtypes."""
+    return pd.DataFrame(
+        {
+            "payment_id": pd.Series([], dtype=object),
+            "customer_id": pd.Categorical([]),
+            "amount": pd.Series([], dtype="float64"),
+            "status": pd.Categorical([], categories=_STATUS_VALUES),
+            "timestamp": pd.to_datetime(pd.Series([], dtype=object)),
+            "failure_reason": pd.Categorical([], categories=_REASON_VALUES),
+            "retry_count": pd.Series([], dtype="int64"),
+        }
+    )
+
+
+def _type_payment_frame(df: pd.DataFrame, config: PaymentDataConfig) -> pd.DataFrame:
+    """Convert raw payment columns into the loader's typed layout.
+
+    Raises:
+        ValueError: If required columns are missing
+    """
+    required_columns = [
+        config.payment_id_column,
+        config.customer_id_column,
+        config.amount_column,
+        config.status_column,
+        config.timestamp_column,
+    ]
+    missing = [col for col in required_columns if col not in df.columns]
+    if missing:
+        raise ValueError(f"Missing required columns: {missing}")
+
+    status_codes = _lowercase_codes(df[config.status_column], _STATUS_VALUES)
+    known = status_codes >= 0
+    if not known.all():
+        unknown = (
+            df.loc[~known, config.status_column]
+            .astype(object)
+            .astype(str)
+            .str.lower()
+            .value_counts()
+        )
+        for status_str, count in unknown.items():
+            logger.warning(
+                f"Unknown payment status: {status_str} ({count} rows skipped)"
+            )
+
+    reason_codes = np.full(len(df), -1)
+    if config.failure_reason_column and config.failure_reason_column in df.columns:
+        reasons = df[config.failure_reason_column]
+        reason_codes = _lowercase_codes(reasons, _REASON_VALUES)
+        reason_codes[(reason_codes < 0) & reasons.notna().to_numpy()] = (
+            _REASON_VALUES.get_loc(FailureReason.UNKNOWN.value)
+        )
+
+    retry_count = np.zeros(len(df), dtype=np.int64)
+    if config.retry_count_column and config.retry_count_column in df.columns:
+        retry_values = df[config.retry_count_column].to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        retry_count = np.trunc(np.nan_to_num(retry_values)).astype(np.int64)
+
+    return pd.DataFrame(
+        {
+            "payment_id": df[config.payment_id_column].astype(str),
+            "customer_id": df[config.customer_id_column],
+            "amount": df[config.amount_column].astype("float64"),
+            "status": pd.Categorical.from_codes(
+                status_codes, categories=_STATUS_VALUES
+            ),
+            "timestamp": pd.to_datetime(df[config.timestamp_column]),
+            "failure_reason": pd.Categorical.from_codes(
+                reason_codes, categories=_REASON_VALUES
+            ),
+            "retry_count": retry_count,
+        }
+    )[known].reset_index(drop=True)
+
+
+def load_payment_frame(config: PaymentDataConfig, project_root: Path) -> pd.DataFrame:
+    """Load payment data into a typed DataFrame.
+
+    Rows with an unknown payment status are dropped; unrecognized failure
+    reasons become unknown.
 
     Args:
         config: Payment data configuration
         project_root: Project root directory
 
     Returns:
-        List of PaymentRecord objects
+        DataFrame with payment_id, amount, timestamp and retry_count columns
+        and categorical customer_id, status and failure_reason columns
 
     Raises:
         FileNotFoundError: If data file does not exist
         ValueError: If data format is invalid
     """
-    data_path = Path(config.file_path)
-    if not data_path.is_absolute():
-        data_path = project_root / data_path
-
+    data_path = _resolve_data_path(config.file_path, project_root)
     if not data_path.exists():
         raise FileNotFoundError(f"Payment data file not found: {data_path}")
 
-    payments = []
-
     try:
-        if config.format.lower() == "csv":
-            df = pd.read_csv(data_path)
-        elif config.format.lower() == "json":
-            df = pd.read_json(data_path)
-        else:
-            raise ValueError(f"Unsupported format: {config.format}")
+        df = _read_data_frame(
+            data_path, config.format, *_payment_source_columns(config)
+        )
+    except pd.errors.EmptyDataError:
+        logger.warning(f"Payment data file is empty: {data_path}")
+        return _empty_payment_frame()
+    except Exception as e:
+        logger.error(f"Failed to load payment data: {e}")
+        raise
 
-        required_columns = [
-            config.payment_id_column,
-            config.customer_id_column,
-            config.amount_column,
-            config.status_column,
-            config.timestamp_column,
-        ]
-        missing = [col for col in required_columns if col not in df.columns]
-        if missing:
-            raise ValueError(f"Missing required columns: {missing}")
-
-        df[config.timestamp_column] = pd.to_datetime(df[config.timestamp_column])
-
-        for _, row in df.iterrows():
-            status_str = str(row[config.status_column]).lower()
-            try:
-                status = PaymentStatus(status_str)
-            except ValueError:
-                logger.warning(f"Unknown payment status: {status_str}")
-                continue
-
-            failure_reason = None
-            if config.failure_reason_column and config.failure_reason_column in df.columns:
-                if pd.notna(row[config.failure_reason_column]):
-                    try:
-                        failure_reason = FailureReason(
-                            str(row[config.failure_reason_column]).lower()
-                        )
-                    except ValueError:
-                        failure_reason = FailureReason.UNKNOWN
-
-            retry_count = 0
-            if config.retry_count_column and config.retry_count_column in df.columns:
-                if pd.notna(row[config.retry_count_column]):
-                    retry_count = int(row[config.retry_count_column])
-
-            payment = PaymentRecord(
-                payment_id=str(row[config.payment_id_column]),
-                customer_id=str(row[config.customer_id_column]),
-                amount=float(row[config.amount_column]),
-                status=status,
-                timestamp=row[config.timestamp_column],
-                failure_reason=failure_reason,
-                retry_count=retry_count,
-            )
-            payments.append(payment)
+    frame = _type_payment_frame(df, config)
+    logger.info(f"Loaded {len(frame)} payment records")
+    return frame
 
-        logger.info(f"Loaded {len(payments)} payment records")
-        return payments
 
+def iter_payment_frames(
+    config: PaymentDataConfig, project_root: Path, chunk_size: int
+) -> Iterator[pd.DataFrame]:
+    """Stream payment data as typed DataFrames of at most chunk_size rows.
+
+    Each chunk has the layout returned by load_payment_frame.
+
+    Args:
+        config: Payment data configuration
+        project_root: Project root directory
+        chunk_size: Maximum rows read per chunk
+
+    Yields:
+        Typed payment DataFrames
+
+    Raises:
+        FileNotFoundError: If data file does not exist
+        ValueError: If data format is invalid
+    """
+    data_path = _resolve_data_path(config.file_path, project_root)
+    if not data_path.exists():
+        raise FileNotFoundError(f"Payment data file not found: {data_path}")
+
+    try:
+        for df in _iter_data_frames(
+            data_path, config.format, *_payment_source_columns(config), chunk_size
+        ):
+            yield _type_payment_frame(df, config)
     except pd.errors.EmptyDataError:
         logger.warning(f"Payment data file is empty: {data_path}")
-        return []
     except Exception as e:
         logger.error(f"Failed to load payment data: {e}")
         raise
 
 
+def load_payment_data(
+    config: PaymentDataConfig, project_root: Path
+) -> List[PaymentRecord]:
+    """Load payment data from CSV or JSON file.
+
+    Args:
+        config: Payment data configuration
+        project_root: Project root directory
+
+    Returns:
+        List of PaymentRecord objects
+
+    Raises:
+        FileNotFoundError: If data file does not exist
+        ValueError: If data format is invalid
+    """
+    frame = load_payment_frame(config, project_root)
+    reasons = frame["failure_reason"]
+    return [
+        PaymentRecord(
+            payment_id=payment_id,
+            customer_id=customer_id,
+            amount=amount,
+            status=PaymentStatus(status),
+            timestamp=timestamp,
+            failure_reason=FailureReason(reason) if reason is not None else None,
+            retry_count=retry_count,
+        )
+        for (
+            payment_id,
+            customer_id,
+            amount,
+            status,
+            timestamp,
+            reason,
+            retry_count,
+        ) in zip(
+            frame["payment_id"].tolist(),
+            frame["customer_id"].astype(str).tolist(),
+            frame["amount"].tolist(),
+            frame["status"].tolist(),
+            frame["timestamp"].tolist(),
+            reasons.astype(object).where(reasons.notna(), None).tolist(),
+            frame["retry_count"].tolist(),
+        )
+    ]
+
+
 def load_customer_emails(
     customer_file: Optional[Path],
 ) -> Dict[str, str]:
@@ -445,6 +701,80 @@ def identify_failed_payments(
     return failed_payments
 
 
+def identify_failed_payments_frame(
+    payments: pd.DataFrame,
+    retry_config: RetryConfig,
+    now: Optional[datetime] = None,
+) -> pd.DataFrame:
+    """Identify failed payments requiring attention on columns.
+
+    Columnar equivalent of identify_failed_payments.
+
+    Args:
+        payments: Payment DataFrame from load_payment_frame
+        retry_config: Retry configuration
+        now: Reference time for days since failure (defaults to now)
+
+    Returns:
+        DataFrame of failed payments with added days_since_failure and
+        requires_reminder columns
+    """
+    now = now or datetime.now()
+    failed = payments[payments["status"] == PaymentStatus.FAILED.value].copy()
+    failed["days_since_failure"] = (
+        (pd.Timestamp(now) - failed["timestamp"]).dt.days.astype("int64")
+    )
+    failed["requires_reminder"] = (
+        failed["retry_count"] < retry_config.max_retries
+    ) & (failed["days_since_failure"] >= retry_config.retry_delay_days)
+
+    logger.info(f"Identified {len(failed)} failed payments")
+    return failed
+
+
+def failed_payments_from_frame(failed: pd.DataFrame) -> List[FailedPayment]:
+    """Convert a failed payments DataFrame into FailedPayment records.
+
+    Args:
+        failed: DataFrame from identify_failed_payments_frame
+
+    Returns:
+        List of FailedPayment objects in frame order
+    """
+    reasons = failed["failure_reason"]
+    return [
+        FailedPayment(
+            payment_id=payment_id,
+            customer_id=customer_id,
+            amount=amount,
+            failure_reason=FailureReason(reason) if reason is not None else None,
+            timestamp=timestamp,
+            retry_count=retry_count,
+            days_since_failure=days_since_failure,
+            requires_reminder=requires_reminder,
+        )
+        for (
+            payment_id,
+            customer_id,
+            amount,
+            reason,
+            timestamp,
+            retry_count,
+            days_since_failure,
+            requires_reminder,
+        ) in zip(
+            failed["payment_id"].tolist(),
+            failed["customer_id"].astype(str).tolist(),
+            failed["amount"].tolist(),
+            reasons.astype(object).where(reasons.notna(), None).tolist(),
+            failed["timestamp"].tolist(),
+            failed["retry_count"].tolist(),
+            failed["days_since_failure"].tolist(),
+            failed["requires_reminder"].tolist(),
+        )
+    ]
+
+
 def send_retry_reminder(
     failed_payment: FailedPayment,
     customer_email: str,
@@ -504,6 +834,58 @@ def send_retry_reminder(
         return False
 
 
+def _forecast_revenue(
+    daily_revenue: Dict[str, float], forecasting_config: ForecastingConfig
+) -> List[Dict[str, any]]:
+    """Forecast daily revenue from recent daily totals.
+
+    Args:
+        daily_revenue: Revenue per date key, in first-seen order
+        forecasting_config: Forecasting configuration
+
+    Returns:
+        List of forecast entries with date, forecasted_revenue and method
+    """
+    revenue_forecast = []
+    if daily_revenue and forecasting_config.method == "moving_average":
+        recent_revenues = list(daily_revenue.values())
+        if recent_revenues:
+            avg_daily_revenue = sum(recent_revenues[-7:]) / min(7, len(recent_revenues))
+
+            forecast_date = datetime.now()
+            for _ in range(forecasting_config.forecast_days):
+                forecast_date += timedelta(days=1)
+                revenue_forecast.append(
+                    {
+                        "date": forecast_date.strftime("%Y-%m-%d"),
+                        "forecasted_revenue": avg_daily_revenue,
+                        "method": "moving_average",
+                    }
+                )
+
+    elif daily_revenue and forecasting_config.method == "trend":
+        sorted_dates = sorted(daily_revenue.keys())
+        if len(sorted_dates) >= 2:
+            recent_revenues = [daily_revenue[d] for d in sorted_dates[-7:]]
+            if len(recent_revenues) >= 2:
+                trend = (recent_revenues[-1] - recent_revenues[0]) / len(recent_revenues)
+
+                forecast_date = datetime.now()
+                base_revenue = recent_revenues[-1] if recent_revenues else 0.0
+                for i in range(forecasting_config.forecast_days):
+                    forecast_date += timedelta(days=1)
+                    forecasted = base_revenue + (trend * (i + 1))
+                    revenue_forecast.append(
+                        {
+                            "date": forecast_date.strftime("%Y-%m-%d"),
+                            "forecasted_revenue": max(0.0, forecasted),
+                            "method": "trend",
+                        }
+                    )
+
+    return revenue_forecast
+
+
 def calculate_analytics(
     payments: List[PaymentRecord],
     forecasting_config: ForecastingConfig,
@@ -584,42 +966,7 @@ def calculate_analytics(
             "payment_count": daily_counts[date_key],
         }
 
-    revenue_forecast = []
-    if daily_trends and forecasting_config.method == "moving_average":
-        recent_revenues = list(daily_revenue.values())
-        if recent_revenues:
-            avg_daily_revenue = sum(recent_revenues[-7:]) / min(7, len(recent_revenues))
-
-            forecast_date = datetime.now()
-            for _ in range(forecasting_config.forecast_days):
-                forecast_date += timedelta(days=1)
-                revenue_forecast.append(
-                    {
-                        "date": forecast_date.strftime("%Y-%m-%d"),
-                        "forecasted_revenue": avg_daily_revenue,
-                        "method": "moving_average",
-                    }
-                )
-
-    elif daily_trends and forecasting_config.method == "trend":
-        sorted_dates = sorted(daily_revenue.keys())
-        if len(sorted_dates) >= 2:
-            recent_revenues = [daily_revenue[d] for d in sorted_dates[-7:]]
-            if len(recent_revenues) >= 2:
-                trend = (recent_revenues[-1] - recent_revenues[0]) / len(recent_revenues)
-
-                forecast_date = datetime.now()
-                base_revenue = recent_revenues[-1] if recent_revenues else 0.0
-                for i in range(forecasting_config.forecast_days):
-                    forecast_date += timedelta(days=1)
-                    forecasted = base_revenue + (trend * (i + 1))
-                    revenue_forecast.append(
-                        {
-                            "date": forecast_date.strftime("%Y-%m-%d"),
-                            "forecasted_revenue": max(0.0, forecasted),
-                            "method": "trend",
-                        }
-                    )
+    revenue_forecast = _forecast_revenue(daily_revenue, forecasting_config)
 
     return PaymentAnalytics(
         total_payments=total_payments,
@@ -635,6 +982,278 @@ def calculate_analytics(
     )
 
 
+def calculate_analytics_frame(
+    payments: pd.DataFrame,
+    forecasting_config: ForecastingConfig,
+) -> PaymentAnalytics:
+    """Calculate payment analytics and generate forecast on columns.
+
+    Columnar equivalent of calculate_analytics.
+
+    Args:
+        payments: Payment DataFrame from load_payment_frame
+        forecasting_config: Forecasting configuration
+
+    Returns:
+        PaymentAnalytics object with analytics data
+    """
+    if payments.empty:
+        return calculate_analytics([], forecasting_config)
+
+    status = payments["status"].to_numpy(dtype=object)
+    amounts = payments["amount"].to_numpy(dtype=np.float64)
+    success = status == PaymentStatus.SUCCESS.value
+    failed = status == PaymentStatus.FAILED.value
+
+    total_payments = len(payments)
+    successful_payments = int(success.sum())
+    failed_payments = int(failed.sum())
+
+    failure_reasons = (
+        payments["failure_reason"][failed]
+        .astype(object)
+        .fillna(FailureReason.UNKNOWN.value)
+        .value_counts()
+    )
+
+    cutoff_date = datetime.now() - timedelta(days=forecasting_config.lookback_days)
+    recent = (payments["timestamp"] >= cutoff_date).to_numpy()
+    days = payments["timestamp"].to_numpy(dtype="datetime64[D]")[recent]
+    recent_success = success[recent]
+
+    daily_revenue = (
+        pd.Series(amounts[recent][recent_success])
+        .groupby(days[recent_success], sort=False)
+        .sum()
+    )
+    daily_counts = pd.Series(days).value_counts()
+    date_keys = pd.DatetimeIndex(daily_revenue.index).strftime("%Y-%m-%d")
+    revenue_by_date = dict(zip(date_keys, daily_revenue.tolist()))
+    counts_by_date = dict(
+        zip(date_keys, daily_counts.reindex(daily_revenue.index).tolist())
+    )
+
+    daily_trends = {
+        date_key: {
+            "revenue": revenue_by_date[date_key],
+            "payment_count": counts_by_date[date_key],
+        }
+        for date_key in sorted(revenue_by_date)
+    }
+
+    return PaymentAnalytics(
+        total_payments=total_payments,
+        successful_payments=successful_payments,
+        failed_payments=failed_payments,
+        success_rate=successful_payments / total_payments,
+        total_revenue=float(amounts[success].sum()),
+        failed_revenue=float(amounts[failed].sum()),
+        avg_payment_amount=float(amounts.sum()) / total_payments,
+        failure_reasons={
+            reason: int(count) for reason, count in failure_reasons.items()
+        },
+        daily_trends=daily_trends,
+        revenue_forecast=_forecast_revenue(revenue_by_date, forecasting_config),
+    )
+
+
+ROLLUP_COLUMNS = [
+    "payment_count",
+    "successful_payments",
+    "failed_payments",
+    "successful_revenue",
+    "failed_revenue",
+    "total_amount",
+] + [f"reason_{reason.value}" for reason in FailureReason]
+
+
+def rollup_payments(payments: pd.DataFrame) -> pd.DataFrame:
+    """Aggregate payments into one row per calendar day.
+
+    Failed payments without a failure reason are counted as unknown, as in
+    calculate_analytics.
+
+    Args:
+        payments: Payment DataFrame from load_payment_frame
+
+    Returns:
+        DataFrame indexed by day (datetime64) with ROLLUP_COLUMNS
+    """
+    status = payments["status"].cat.codes.to_numpy()
+    amounts = payments["amount"].to_numpy(dtype=np.float64)
+    success = status == _STATUS_VALUES.get_loc(PaymentStatus.SUCCESS.value)
+    failed = status == _STATUS_VALUES.get_loc(PaymentStatus.FAILED.value)
+
+    reason_codes = payments["failure_reason"].cat.codes.to_numpy()
+    unknown_code = _REASON_VALUES.get_loc(FailureReason.UNKNOWN.value)
+    reason_codes = np.where(reason_codes < 0, unknown_code, reason_codes)
+    reasons = np.zeros((len(payments), len(_REASON_VALUES)), dtype=np.int64)
+    reasons[np.flatnonzero(failed), reason_codes[failed]] = 1
+
+    columns = {
+        "payment_count": np.ones(len(payments), dtype=np.int64),
+        "successful_payments": success.astype(np.int64),
+        "failed_payments": failed.astype(np.int64),
+        "successful_revenue": np.where(success, amounts, 0.0),
+        "failed_revenue": np.where(failed, amounts, 0.0),
+        "total_amount": amounts,
+    }
+    for code, reason in enumerate(_REASON_VALUES):
+        columns[f"reason_{reason}"] = reasons[:, code]
+
+    days = payments["timestamp"].to_numpy(dtype="datetime64[D]")
+    rollup = pd.DataFrame(columns).groupby(days).sum()
+    rollup.index = pd.DatetimeIndex(rollup.index, name="date")
+    return rollup
+
+
+def _combine_rollups(left: pd.DataFrame, right: pd.DataFrame) -> pd.DataFrame:
+    """Add two daily rollups, keeping integer counts integral."""
+    combined = left.add(right, fill_value=0)
+    count_columns = [
+        column
+        for column in ROLLUP_COLUMNS
+        if not column.endswith(("revenue", "amount"))
+    ]
+    combined[count_columns] = combined[count_columns].astype(np.int64)
+    return combined
+
+
+class PaymentAccumulator:
+    """Single-pass accumulator for streamed payment chunks.
+
+    Each chunk is folded into a per-day rollup and only failed payments are
+    kept row by row, so memory grows with the number of days and failures
+    rather than with the size of the payment file.
+    """
+
+    def __init__(self):
+        """Initialize an empty accumulator."""
+        self.rollup = pd.DataFrame(
+            {column: pd.Series([], dtype=np.int64) for column in ROLLUP_COLUMNS},
+            index=pd.DatetimeIndex([], name="date"),
+        )
+        self.total_payments = 0
+        self._failed_chunks: List[pd.DataFrame] = []
+
+    def add(self, payments: pd.DataFrame) -> None:
+        """Fold one chunk of payments into the accumulator.
+
+        Args:
+            payments: Payment DataFrame chunk from iter_payment_frames
+        """
+        if payments.empty:
+            return
+        self.rollup = _combine_rollups(self.rollup, rollup_payments(payments))
+        self.total_payments += len(payments)
+        failed = payments[payments["status"] == PaymentStatus.FAILED.value]
+        if not failed.empty:
+            self._failed_chunks.append(failed)
+
+    def failed_payments(self) -> pd.DataFrame:
+        """Return all failed payments seen so far.
+
+        Returns:
+            Payment DataFrame containing only failed payments
+        """
+        if not self._failed_chunks:
+            return _empty_payment_frame()
+        return pd.concat(self._failed_chunks, ignore_index=True)
+
+
+def update_daily_rollup(path: Path, rollup: pd.DataFrame) -> pd.DataFrame:
+    """Merge a run's daily rollup into the persisted rollup file.
+
+    Days present in rollup replace the stored rows for those days, since
+    the payment file is authoritative for the days it covers; older days
+    are kept, so trends can reach past the file's retention.
+
+    Args:
+        path: Rollup CSV file path
+        rollup: Daily rollup from this run
+
+    Returns:
+        Merged daily rollup, sorted by day
+    """
+    if path.exists():
+        stored = pd.read_csv(path, index_col="date", parse_dates=["date"])
+        stored = stored.reindex(columns=ROLLUP_COLUMNS, fill_value=0)
+        merged = pd.concat([stored[~stored.index.isin(rollup.index)], rollup])
+    else:
+        merged = rollup
+    merged = merged.sort_index()
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(path.name + ".tmp")
+    merged.to_csv(temp_path, date_format="%Y-%m-%d")
+    os.replace(temp_path, path)
+    logger.info(f"Daily rollup saved to {path} ({len(merged)} days)")
+    return merged
+
+
+def calculate_analytics_from_rollup(
+    rollup: pd.DataFrame,
+    forecasting_config: ForecastingConfig,
+    history: Optional[pd.DataFrame] = None,
+    now: Optional[datetime] = None,
+) -> PaymentAnalytics:
+    """Calculate payment analytics and generate forecast from daily rollups.
+
+    Totals come from rollup. Daily trends and the forecast come from
+    history (defaulting to rollup) over the lookback window, applied in
+    whole days and in date order.
+
+    Args:
+        rollup: Daily rollup of the payments being reported on
+        forecasting_config: Forecasting configuration
+        history: Daily rollup used for trends and forecasting
+        now: Reference time for the lookback window (defaults to now)
+
+    Returns:
+        PaymentAnalytics object with analytics data
+    """
+    total_payments = int(rollup["payment_count"].sum())
+    if total_payments == 0:
+        return calculate_analytics([], forecasting_config)
+
+    history = rollup if history is None else history
+    now = now or datetime.now()
+    totals = rollup.sum()
+
+    cutoff_day = pd.Timestamp(now - timedelta(days=forecasting_config.lookback_days))
+    recent = history[
+        (history.index >= cutoff_day.normalize()) & (history["successful_payments"] > 0)
+    ].sort_index()
+    date_keys = recent.index.strftime("%Y-%m-%d")
+    revenue_by_date = dict(zip(date_keys, recent["successful_revenue"].tolist()))
+    daily_trends = {
+        date_key: {"revenue": revenue, "payment_count": int(count)}
+        for date_key, revenue, count in zip(
+            date_keys,
+            recent["successful_revenue"].tolist(),
+            recent["payment_count"].tolist(),
+        )
+    }
+
+    successful_payments = int(totals["successful_payments"])
+    return PaymentAnalytics(
+        total_payments=total_payments,
+        successful_payments=successful_payments,
+        failed_payments=int(totals["failed_payments"]),
+        success_rate=successful_payments / total_payments,
+        total_revenue=float(totals["successful_revenue"]),
+        failed_revenue=float(totals["failed_revenue"]),
+        avg_payment_amount=float(totals["total_amount"]) / total_payments,
+        failure_reasons={
+            reason.value: int(totals[f"reason_{reason.value}"])
+            for reason in FailureReason
+            if totals[f"reason_{reason.value}"] > 0
+        },
+        daily_trends=daily_trends,
+        revenue_forecast=_forecast_revenue(revenue_by_date, forecasting_config),
+    )
+
+
 def write_analytics_report(
     analytics: PaymentAnalytics, output_path: Path
 ) -> None:
@@ -699,6 +1318,9 @@ def write_analytics_report(
 def process_payments(config_path: Path) -> Dict[str, any]:
     """Process payment data and generate analytics.
 
+    The payment file is read once, in chunks of streaming.chunk_size rows.
+    Trends and forecasts are computed from the persisted daily rollup.
+
     Args:
         config_path: Path to configuration file
 
@@ -712,9 +1334,14 @@ def process_payments(config_path: Path) -> Dict[str, any]:
     config = load_config(config_path)
     project_root = config_path.parent
 
-    payments = load_payment_data(config.payment_data, project_root)
+    accumulator = PaymentAccumulator()
+    for chunk in iter_payment_frames(
+        config.payment_data, project_root, config.streaming.chunk_size
+    ):
+        accumulator.add(chunk)
+    logger.info(f"Streamed {accumulator.total_payments} payment records")
 
-    if not payments:
+    if accumulator.total_payments == 0:
         logger.warning("No payment data available for processing")
         return {
             "failed_payments": [],
@@ -722,7 +1349,9 @@ def process_payments(config_path: Path) -> Dict[str, any]:
             "analytics": None,
         }
 
-    failed_payments = identify_failed_payments(payments, config.retry)
+    failed_payments = failed_payments_from_frame(
+        identify_failed_payments_frame(accumulator.failed_payments(), config.retry)
+    )
 
     customer_emails = {}
     if config.customer_data_file:
@@ -751,7 +1380,15 @@ def process_payments(config_path: Path) -> Dict[str, any]:
                 ):
                     reminders_sent += 1
 
-    analytics = calculate_analytics(payments, config.forecasting)
+    history = accumulator.rollup
+    if config.streaming.rollup_file:
+        history = update_daily_rollup(
+            _resolve_data_path(config.streaming.rollup_file, project_root),
+            accumulator.rollup,
+        )
+    analytics = calculate_analytics_from_rollup(
+        accumulator.rollup, config.forecasting, history
+    )
 
     analytics_path = Path(config.analytics.output_path)
     if not analytics_path.is_absolute():
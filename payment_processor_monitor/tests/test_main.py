@@ -2,17 +2,30 @@
 
 from datetime import datetime, timedelta
 
+import pandas as pd
 import pytest
 
 from payment_processor_monitor.src.main import (
     FailedPayment,
     FailureReason,
+    ForecastingConfig,
+    PaymentAccumulator,
     PaymentAnalytics,
+    PaymentDataConfig,
     PaymentRecord,
     PaymentStatus,
     RetryConfig,
     calculate_analytics,
+    calculate_analytics_frame,
+    calculate_analytics_from_rollup,
+    failed_payments_from_frame,
     identify_failed_payments,
+    identify_failed_payments_frame,
+    iter_payment_frames,
+    load_payment_data,
+    load_payment_frame,
+    rollup_payments,
+    update_daily_rollup,
 )
 
 
@@ -184,3 +197,106 @@ def test_failed_payment_requires_reminder():
     assert failed[0].requires_reminder is True
     assert failed[1].requires_reminder is False
     assert failed[2].requires_reminder is False
+
+
+def test_payment_frame_matches_records(tmp_path):
+    """Test columnar payment loading and analysis match the record path."""
+    now = datetime.now()
+    pd.DataFrame(
+        {
+            "payment_id": ["pay_001", "pay_002", "pay_003", "pay_004"],
+            "customer_id": ["cust_001", "cust_002", "cust_001", "cust_003"],
+            "amount": [100.0, 50.0, 75.0, 20.0],
+            "status": ["success", "FAILED", "failed", "bogus"],
+            "timestamp": [
+                (now - timedelta(days=days)).isoformat() for days in (1, 5, 2, 3)
+            ],
+            "failure_reason": [None, "insufficient_funds", "mystery", None],
+            "retry_count": [0, 0, 1, 0],
+        }
+    ).to_csv(tmp_path / "payments.csv", index=False)
+    data_config = PaymentDataConfig(
+        file_path="payments.csv",
+        failure_reason_column="failure_reason",
+        retry_count_column="retry_count",
+    )
+    retry_config = RetryConfig(max_retries=3, retry_delay_days=3)
+
+    frame = load_payment_frame(data_config, tmp_path)
+    records = load_payment_data(data_config, tmp_path)
+
+    assert isinstance(frame["customer_id"].dtype, pd.CategoricalDtype)
+    assert len(frame) == len(records) == 3
+
+    failed = failed_payments_from_frame(
+        identify_failed_payments_frame(frame, retry_config, now=now)
+    )
+    expected = identify_failed_payments(records, retry_config)
+    assert [(f.payment_id, f.failure_reason, f.requires_reminder) for f in failed] == [
+        (f.payment_id, f.failure_reason, f.requires_reminder) for f in expected
+    ]
+    assert failed[1].failure_reason == FailureReason.UNKNOWN
+
+    analytics = calculate_analytics_frame(frame, ForecastingConfig())
+    expected_analytics = calculate_analytics(records, ForecastingConfig())
+    assert analytics.total_payments == expected_analytics.total_payments
+    assert analytics.success_rate == pytest.approx(expected_analytics.success_rate)
+    assert analytics.failure_reasons == expected_analytics.failure_reasons
+
+
+
+def test_streamed_rollup_matches_frame_analytics(tmp_path):
+    """Test chunked rollup analytics match the full-frame path."""
+    now = datetime.now()
+    pd.DataFrame(
+        {
+            "payment_id": [f"pay_{i:03d}" for i in range(6)],
+            "customer_id": ["cust_001", "cust_002", "cust_001"] + ["cust_003"] * 3,
+            "amount": [100.0, 50.0, 75.0, 20.0, 30.0, 10.0],
+            "status": ["success", "failed", "failed", "success", "success", "failed"],
+            "timestamp": [
+                (now - timedelta(days=days)).isoformat() for days in (1, 5, 2, 3, 1, 2)
+            ],
+            "failure_reason": [
+                None,
+                "insufficient_funds",
+                None,
+                None,
+                None,
+                "expired_card",
+            ],
+            "retry_count": [0, 0, 1, 0, 0, 0],
+        }
+    ).to_csv(tmp_path / "payments.csv", index=False)
+    data_config = PaymentDataConfig(
+        file_path="payments.csv",
+        failure_reason_column="failure_reason",
+        retry_count_column="retry_count",
+    )
+    forecasting_config = ForecastingConfig()
+
+    accumulator = PaymentAccumulator()
+    for chunk in iter_payment_frames(data_config, tmp_path, chunk_size=4):
+        accumulator.add(chunk)
+
+    frame = load_payment_frame(data_config, tmp_path)
+    expected = calculate_analytics_frame(frame, forecasting_config)
+    analytics = calculate_analytics_from_rollup(
+        accumulator.rollup, forecasting_config, now=now
+    )
+
+    assert accumulator.total_payments == 6
+    assert len(accumulator.failed_payments()) == 3
+    assert analytics.total_payments == expected.total_payments
+    assert analytics.total_revenue == pytest.approx(expected.total_revenue)
+    assert analytics.avg_payment_amount == pytest.approx(expected.avg_payment_amount)
+    assert analytics.failure_reasons == expected.failure_reasons
+    assert analytics.daily_trends == expected.daily_trends
+
+    rollup_path = tmp_path / "rollup.csv"
+    update_daily_rollup(rollup_path, accumulator.rollup)
+    latest = rollup_payments(frame[frame["timestamp"] > now - timedelta(days=2)])
+    history = update_daily_rollup(rollup_path, latest)
+
+    assert len(history) == len(accumulator.rollup)
+    assert history["payment_count"].sum() == 6
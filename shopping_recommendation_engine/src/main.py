@@ -7,13 +7,16 @@ availability checking.
 
 import json
 import logging
+import os
+import time
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
+import numpy as np
 import pandas as pd
 import yaml
 from pydantic import BaseModel, Field, field_validator
@@ -25,6 +28,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+ACTION_MULTIPLIERS = {
+    "view": 1.0,
+    "add_to_cart": 2.0,
+    "wishlist": 1.5,
+    "compare": 1.2,
+}
+
 
 class RecommendationPriority(str, Enum):
     """Priority level for recommendations."""
@@ -138,6 +148,35 @@ class RecommendationConfig(BaseModel):
     require_in_stock: bool = Field(
         default=True, description="Only recommend in-stock items"
     )
+    co_purchase_weight: float = Field(
+        default=0.5, description="Weight for co-purchase similarity"
+    )
+
+
+class CoPurchaseConfig(BaseModel):
+    """Configuration for the item-to-item co-purchase index."""
+
+    enabled: bool = Field(
+        default=True, description="Add customers-also-bought candidates"
+    )
+    index_file: str = Field(
+        default="data/co_purchase_index.npz",
+        description="Path to the persisted co-purchase index",
+    )
+    neighbors_per_product: int = Field(
+        default=20, description="Number of neighbours kept per product"
+    )
+    min_co_purchases: int = Field(
+        default=1, description="Minimum shared customers for a neighbour"
+    )
+
+    @field_validator("neighbors_per_product", "min_co_purchases")
+    @classmethod
+    def validate_positive(cls, v: int) -> int:
+        """Validate that counts are positive."""
+        if v < 1:
+            raise ValueError("Value must be at least 1")
+        return v
 
 
 class Config(BaseModel):
@@ -160,10 +199,18 @@ class Config(BaseModel):
         default_factory=RecommendationConfig,
         description="Recommendation generation settings",
     )
+    co_purchase: CoPurchaseConfig = Field(
+        default_factory=CoPurchaseConfig,
+        description="Co-purchase index settings",
+    )
     output_file: str = Field(
         default="logs/recommendations.json",
         description="Path to save recommendations",
     )
+    batch_output_file: str = Field(
+        default="logs/batch_recommendations.csv",
+        description="Path to save recommendations for all customers",
+    )
     report_file: str = Field(
         default="logs/recommendation_report.md",
         description="Path for recommendation report",
@@ -264,163 +311,305 @@ def load_config(config_path: Path) -> Config:
         raise
 
 
-def load_purchase_history(
+def _resolve_data_path(file_path: str, project_root: Path) -> Path:
+    """Resolve a data file path relative to the project root."""
+    data_path = Path(file_path)
+    if not data_path.is_absolute():
+        data_path = project_root / data_path
+    return data_path
+
+
+def _read_data_frame(
+    data_path: Path, file_format: str, id_columns: Optional[List[Optional[str]]] = None
+) -> pd.DataFrame:
+    """Read a CSV or JSON data file into a DataFrame.
+
+    Args:
+        data_path: Path to the data file
+        file_format: File format (csv or json)
+        id_columns: Columns to read as categorical strings (None entries
+            are ignored)
+
+    Raises:
+        ValueError: If the format is unsupported
+    """
+    id_columns = [column for column in id_columns or [] if column]
+    if file_format.lower() == "csv":
+        df = pd.read_csv(data_path, dtype={column: str for column in id_columns})
+    elif file_format.lower() == "json":
+        df = pd.read_json(data_path)
+        for column in id_columns:
+            if column in df.columns:
+                df[column] = df[column].astype(str)
+    else:
+        raise ValueError(f"Unsupported format: {file_format}")
+
+    for column in id_columns:
+        if column in df.columns:
+            df[column] = df[column].astype("category")
+    return df
+
+
+def _optional_column(
+    df: pd.DataFrame, column: Optional[str], dtype: str
+) -> pd.Series:
+    """Return a configured optional column, or an all-missing column."""
+    if column and column in df.columns:
+        return df[column].astype(dtype)
+    return pd.Series(pd.NA, index=df.index, dtype=dtype)
+
+
+def _nullable_values(series: pd.Series) -> List:
+    """Convert a column to a list with missing values as None."""
+    return series.astype(object).where(series.notna(), None).tolist()
+
+
+def load_purchase_frame(
     config: PurchaseHistoryConfig, project_root: Path
-) -> List[PurchaseRecord]:
-    """Load purchase history data from file.
+) -> pd.DataFrame:
+    """Load purchase history into a normalized DataFrame.
 
     Args:
         config: Purchase history configuration
         project_root: Project root directory
 
     Returns:
-        List of PurchaseRecord objects
+        DataFrame with customer_id and product_id (categorical),
+        purchase_date, quantity, category and price columns
 
     Raises:
         FileNotFoundError: If data file does not exist
         ValueError: If data format is invalid
     """
-    data_path = Path(config.file_path)
-    if not data_path.is_absolute():
-        data_path = project_root / data_path
-
+    data_path = _resolve_data_path(config.file_path, project_root)
     if not data_path.exists():
         raise FileNotFoundError(f"Purchase history file not found: {data_path}")
 
-    purchases = []
+    columns = ["customer_id", "product_id", "purchase_date", "quantity", "category", "price"]
 
     try:
-        if config.format.lower() == "csv":
-            df = pd.read_csv(data_path)
-        elif config.format.lower() == "json":
-            df = pd.read_json(data_path)
-        else:
-            raise ValueError(f"Unsupported format: {config.format}")
+        df = _read_data_frame(
+            data_path,
+            config.format,
+            [config.customer_id_column, config.product_id_column, config.category_column],
+        )
+    except pd.errors.EmptyDataError:
+        logger.warning(f"Purchase history file is empty: {data_path}")
+        return pd.DataFrame(columns=columns)
 
-        required_columns = [
-            config.customer_id_column,
-            config.product_id_column,
-            config.purchase_date_column,
-        ]
-        missing = [col for col in required_columns if col not in df.columns]
-        if missing:
-            raise ValueError(f"Missing required columns: {missing}")
+    required_columns = [
+        config.customer_id_column,
+        config.product_id_column,
+        config.purchase_date_column,
+    ]
+    missing = [col for col in required_columns if col not in df.columns]
+    if missing:
+        raise ValueError(f"Missing required columns: {missing}")
+
+    quantity = _optional_column(df, config.quantity_column, "Float64")
+    frame = pd.DataFrame(
+        {
+            "customer_id": df[config.customer_id_column],
+            "product_id": df[config.product_id_column],
+            "purchase_date": pd.to_datetime(df[config.purchase_date_column]),
+            "quantity": quantity.fillna(1).astype("int64"),
+            "category": _optional_column(df, config.category_column, "category"),
+            "price": _optional_column(df, config.price_column, "Float64"),
+        }
+    )
 
-        df[config.purchase_date_column] = pd.to_datetime(
-            df[config.purchase_date_column]
-        )
+    logger.info(f"Loaded {len(frame)} purchase records")
+    return frame
 
-        for _, row in df.iterrows():
-            purchase = PurchaseRecord(
-                customer_id=str(row[config.customer_id_column]),
-                product_id=str(row[config.product_id_column]),
-                purchase_date=row[config.purchase_date_column],
-            )
 
-            if config.quantity_column and config.quantity_column in df.columns:
-                if pd.notna(row[config.quantity_column]):
-                    purchase.quantity = int(row[config.quantity_column])
+def load_browsing_frame(
+    config: BrowsingBehaviorConfig, project_root: Path
+) -> pd.DataFrame:
+    """Load browsing behavior into a normalized DataFrame.
 
-            if config.category_column and config.category_column in df.columns:
-                if pd.notna(row[config.category_column]):
-                    purchase.category = str(row[config.category_column])
+    Args:
+        config: Browsing behavior configuration
+        project_root: Project root directory
 
-            if config.price_column and config.price_column in df.columns:
-                if pd.notna(row[config.price_column]):
-                    purchase.price = float(row[config.price_column])
+    Returns:
+        DataFrame with customer_id and product_id (categorical), timestamp,
+        action_type and view_duration columns
 
-            purchases.append(purchase)
+    Raises:
+        FileNotFoundError: If data file does not exist
+        ValueError: If data format is invalid
+    """
+    data_path = _resolve_data_path(config.file_path, project_root)
+    if not data_path.exists():
+        raise FileNotFoundError(f"Browsing behavior file not found: {data_path}")
 
-        logger.info(f"Loaded {len(purchases)} purchase records")
-        return purchases
+    columns = ["customer_id", "product_id", "timestamp", "action_type", "view_duration"]
 
+    try:
+        df = _read_data_frame(
+            data_path,
+            config.format,
+            [config.customer_id_column, config.product_id_column, config.action_type_column],
+        )
     except pd.errors.EmptyDataError:
-        logger.warning(f"Purchase history file is empty: {data_path}")
-        return []
-    except Exception as e:
-        logger.error(f"Failed to load purchase history: {e}")
-        raise
+        logger.warning(f"Browsing behavior file is empty: {data_path}")
+        return pd.DataFrame(columns=columns)
 
+    required_columns = [
+        config.customer_id_column,
+        config.product_id_column,
+        config.timestamp_column,
+    ]
+    missing = [col for col in required_columns if col not in df.columns]
+    if missing:
+        raise ValueError(f"Missing required columns: {missing}")
+
+    frame = pd.DataFrame(
+        {
+            "customer_id": df[config.customer_id_column],
+            "product_id": df[config.product_id_column],
+            "timestamp": pd.to_datetime(df[config.timestamp_column]),
+            "action_type": _optional_column(df, config.action_type_column, "category"),
+            "view_duration": _optional_column(df, config.view_duration_column, "Float64"),
+        }
+    )
 
-def load_browsing_behavior(
-    config: BrowsingBehaviorConfig, project_root: Path
-) -> List[BrowsingRecord]:
-    """Load browsing behavior data from file.
+    logger.info(f"Loaded {len(frame)} browsing records")
+    return frame
+
+
+def load_inventory_frame(config: InventoryConfig, project_root: Path) -> pd.DataFrame:
+    """Load inventory into a DataFrame indexed by product ID.
 
     Args:
-        config: Browsing behavior configuration
+        config: Inventory configuration
         project_root: Project root directory
 
     Returns:
-        List of BrowsingRecord objects
+        DataFrame indexed by product_id with quantity and in_stock columns
 
     Raises:
         FileNotFoundError: If data file does not exist
         ValueError: If data format is invalid
     """
-    data_path = Path(config.file_path)
-    if not data_path.is_absolute():
-        data_path = project_root / data_path
-
+    data_path = _resolve_data_path(config.file_path, project_root)
     if not data_path.exists():
-        raise FileNotFoundError(f"Browsing behavior file not found: {data_path}")
-
-    browsing_records = []
+        raise FileNotFoundError(f"Inventory file not found: {data_path}")
 
     try:
-        if config.format.lower() == "csv":
-            df = pd.read_csv(data_path)
-        elif config.format.lower() == "json":
-            df = pd.read_json(data_path)
-        else:
-            raise ValueError(f"Unsupported format: {config.format}")
+        df = _read_data_frame(data_path, config.format, [config.product_id_column])
+    except pd.errors.EmptyDataError:
+        logger.warning(f"Inventory file is empty: {data_path}")
+        return pd.DataFrame(
+            {"quantity": pd.Series(dtype="int64"), "in_stock": pd.Series(dtype=bool)},
+            index=pd.Index([], name="product_id", dtype=str),
+        )
 
-        required_columns = [
-            config.customer_id_column,
-            config.product_id_column,
-            config.timestamp_column,
-        ]
-        missing = [col for col in required_columns if col not in df.columns]
-        if missing:
-            raise ValueError(f"Missing required columns: {missing}")
+    required_columns = [
+        config.product_id_column,
+        config.quantity_column,
+    ]
+    missing = [col for col in required_columns if col not in df.columns]
+    if missing:
+        raise ValueError(f"Missing required columns: {missing}")
+
+    quantity = df[config.quantity_column].astype("int64")
+    in_stock = quantity > 0
+    if config.in_stock_column and config.in_stock_column in df.columns:
+        flags = df[config.in_stock_column]
+        in_stock = flags.where(flags.notna(), in_stock).astype(bool)
+
+    frame = pd.DataFrame(
+        {"quantity": quantity.to_numpy(), "in_stock": in_stock.to_numpy()},
+        index=pd.Index(df[config.product_id_column].astype(str).to_numpy(), name="product_id"),
+    )
+    frame = frame[~frame.index.duplicated(keep="last")]
 
-        df[config.timestamp_column] = pd.to_datetime(df[config.timestamp_column])
+    logger.info(f"Loaded inventory for {len(frame)} products")
+    return frame
 
-        for _, row in df.iterrows():
-            browsing = BrowsingRecord(
-                customer_id=str(row[config.customer_id_column]),
-                product_id=str(row[config.product_id_column]),
-                timestamp=row[config.timestamp_column],
-            )
 
-            if (
-                config.action_type_column
-                and config.action_type_column in df.columns
-            ):
-                if pd.notna(row[config.action_type_column]):
-                    browsing.action_type = str(row[config.action_type_column])
+def load_purchase_history(
+    config: PurchaseHistoryConfig, project_root: Path
+) -> List[PurchaseRecord]:
+    """Load purchase history data from file.
 
-            if (
-                config.view_duration_column
-                and config.view_duration_column in df.columns
-            ):
-                if pd.notna(row[config.view_duration_column]):
-                    browsing.view_duration = float(
-                        row[config.view_duration_column]
-                    )
+    Args:
+        config: Purchase history configuration
+        project_root: Project root directory
 
-            browsing_records.append(browsing)
+    Returns:
+        List of PurchaseRecord objects
 
-        logger.info(f"Loaded {len(browsing_records)} browsing records")
-        return browsing_records
+    Raises:
+        FileNotFoundError: If data file does not exist
+        ValueError: If data format is invalid
+    """
+    try:
+        frame = load_purchase_frame(config, project_root)
+    except Exception as e:
+        logger.error(f"Failed to load purchase history: {e}")
+        raise
 
-    except pd.errors.EmptyDataError:
-        logger.warning(f"Browsing behavior file is empty: {data_path}")
-        return []
+    return [
+        PurchaseRecord(
+            customer_id=customer_id,
+            product_id=product_id,
+            purchase_date=purchase_date,
+            quantity=quantity,
+            category=category,
+            price=price,
+        )
+        for customer_id, product_id, purchase_date, quantity, category, price in zip(
+            frame["customer_id"].tolist(),
+            frame["product_id"].tolist(),
+            frame["purchase_date"].tolist(),
+            frame["quantity"].tolist(),
+            _nullable_values(frame["category"]),
+            _nullable_values(frame["price"]),
+        )
+    ]
+
+
+def load_browsing_behavior(
+    config: BrowsingBehaviorConfig, project_root: Path
+) -> List[BrowsingRecord]:
+    """Load browsing behavior data from file.
+
+    Args:
+        config: Browsing behavior configuration
+        project_root: Project root directory
+
+    Returns:
+        List of BrowsingRecord objects
+
+    Raises:
+        FileNotFoundError: If data file does not exist
+        ValueError: If data format is invalid
+    """
+    try:
+        frame = load_browsing_frame(config, project_root)
     except Exception as e:
         logger.error(f"Failed to load browsing behavior: {e}")
         raise
 
+    return [
+        BrowsingRecord(
+            customer_id=customer_id,
+            product_id=product_id,
+            timestamp=timestamp,
+            action_type=action_type,
+            view_duration=view_duration,
+        )
+        for customer_id, product_id, timestamp, action_type, view_duration in zip(
+            frame["customer_id"].tolist(),
+            frame["product_id"].tolist(),
+            frame["timestamp"].tolist(),
+            _nullable_values(frame["action_type"]),
+            _nullable_values(frame["view_duration"]),
+        )
+    ]
+
 
 def load_inventory(
     config: InventoryConfig, project_root: Path
@@ -438,58 +627,23 @@ def load_inventory(
         FileNotFoundError: If data file does not exist
         ValueError: If data format is invalid
     """
-    data_path = Path(config.file_path)
-    if not data_path.is_absolute():
-        data_path = project_root / data_path
-
-    if not data_path.exists():
-        raise FileNotFoundError(f"Inventory file not found: {data_path}")
-
-    inventory = {}
-
     try:
-        if config.format.lower() == "csv":
-            df = pd.read_csv(data_path)
-        elif config.format.lower() == "json":
-            df = pd.read_json(data_path)
-        else:
-            raise ValueError(f"Unsupported format: {config.format}")
-
-        required_columns = [
-            config.product_id_column,
-            config.quantity_column,
-        ]
-        missing = [col for col in required_columns if col not in df.columns]
-        if missing:
-            raise ValueError(f"Missing required columns: {missing}")
-
-        for _, row in df.iterrows():
-            product_id = str(row[config.product_id_column])
-            quantity = int(row[config.quantity_column])
-
-            in_stock = True
-            if config.in_stock_column and config.in_stock_column in df.columns:
-                if pd.notna(row[config.in_stock_column]):
-                    in_stock = bool(row[config.in_stock_column])
-                else:
-                    in_stock = quantity > 0
-            else:
-                in_stock = quantity > 0
-
-            inventory[product_id] = InventoryItem(
-                product_id=product_id, quantity=quantity, in_stock=in_stock
-            )
-
-        logger.info(f"Loaded inventory for {len(inventory)} products")
-        return inventory
-
-    except pd.errors.EmptyDataError:
-        logger.warning(f"Inventory file is empty: {data_path}")
-        return {}
+        frame = load_inventory_frame(config, project_root)
     except Exception as e:
         logger.error(f"Failed to load inventory: {e}")
         raise
 
+    return {
+        product_id: InventoryItem(
+            product_id=product_id, quantity=quantity, in_stock=in_stock
+        )
+        for product_id, quantity, in_stock in zip(
+            frame.index.tolist(),
+            frame["quantity"].tolist(),
+            frame["in_stock"].tolist(),
+        )
+    }
+
 
 def analyze_purchase_history(
     purchases: List[PurchaseRecord], customer_id: str
@@ -557,13 +711,7 @@ def analyze_browsing_behavior(
 
         action_factor = 1.0
         if browsing.action_type:
-            action_multipliers = {
-                "view": 1.0,
-                "add_to_cart": 2.0,
-                "wishlist": 1.5,
-                "compare": 1.2,
-            }
-            action_factor = action_multipliers.get(
+            action_factor = ACTION_MULTIPLIERS.get(
                 browsing.action_type.lower(), 1.0
             )
 
@@ -642,6 +790,7 @@ def generate_recommendations(
     purchases: List[PurchaseRecord],
     config: RecommendationConfig,
     seasonal_config: SeasonalTrendsConfig,
+    co_purchase_scores: Optional[Dict[str, float]] = None,
 ) -> List[Recommendation]:
     """Generate personalized recommendations for a customer.
 
@@ -654,13 +803,24 @@ def generate_recommendations(
         purchases: List of purchase records
         config: Recommendation configuration
         seasonal_config: Seasonal trends configuration
+        co_purchase_scores: Optional customers-also-bought similarity scores
+            from CoPurchaseIndex.score_candidates
 
     Returns:
         List of recommendations sorted by score
     """
-    all_products = set(purchase_scores.keys()) | set(browsing_scores.keys())
+    co_purchase_scores = co_purchase_scores or {}
+    all_products = (
+        set(purchase_scores.keys())
+        | set(browsing_scores.keys())
+        | set(co_purchase_scores.keys())
+    )
     purchased_products = set(purchase_scores.keys())
 
+    product_categories: Dict[str, Optional[str]] = {}
+    for purchase in purchases:
+        product_categories.setdefault(purchase.product_id, purchase.category)
+
     recommendations = []
 
     for product_id in all_products:
@@ -677,6 +837,7 @@ def generate_recommendations(
 
         purchase_score = purchase_scores.get(product_id, 0.0)
         browsing_score = browsing_scores.get(product_id, 0.0)
+        co_purchase_score = co_purchase_scores.get(product_id, 0.0)
 
         seasonal_score = 0.0
         if product_id in seasonal_products:
@@ -686,6 +847,7 @@ def generate_recommendations(
             purchase_score * config.purchase_history_weight
             + browsing_score * config.browsing_weight
             + seasonal_score * config.seasonal_weight
+            + co_purchase_score * config.co_purchase_weight
         )
 
         if total_score < config.min_score_threshold:
@@ -698,6 +860,8 @@ def generate_recommendations(
             reasons.append("Based on your browsing behavior")
         if product_id in seasonal_products:
             reasons.append("Seasonal trend")
+        if co_purchase_score > 0:
+            reasons.append("Customers who bought your items also bought this")
 
         priority = RecommendationPriority.MEDIUM
         if total_score > 0.7:
@@ -705,11 +869,7 @@ def generate_recommendations(
         elif total_score < 0.5:
             priority = RecommendationPriority.LOW
 
-        category = None
-        for purchase in purchases:
-            if purchase.product_id == product_id:
-                category = purchase.category
-                break
+        category = product_categories.get(product_id)
 
         in_stock = True
         available_quantity = 0
@@ -735,6 +895,668 @@ def generate_recommendations(
     return recommendations[: config.max_recommendations]
 
 
+def score_purchase_frame(
+    purchases: pd.DataFrame, now: Optional[datetime] = None
+) -> pd.DataFrame:
+    """Score purchase history for every customer at once.
+
+    Vectorized equivalent of analyze_purchase_history over all customers.
+
+    Args:
+        purchases: Purchase DataFrame from load_purchase_frame
+        now: Reference time (defaults to now)
+
+    Returns:
+        DataFrame with customer_id, product_id and purchase_score columns
+    """
+    now = now or datetime.now()
+    days_ago = (now - purchases["purchase_date"]).dt.days
+    recency_factor = np.where(
+        purchases["purchase_date"] >= now - timedelta(days=90),
+        1.0 + (1.0 - days_ago / 90.0),
+        1.0,
+    )
+
+    scored = purchases[["customer_id", "product_id"]].assign(
+        purchase_score=recency_factor * purchases["quantity"].to_numpy(dtype="float64")
+    )
+    return (
+        scored.groupby(["customer_id", "product_id"], observed=True, sort=False)[
+            "purchase_score"
+        ]
+        .sum()
+        .reset_index()
+    )
+
+
+def score_browsing_frame(
+    browsing: pd.DataFrame, now: Optional[datetime] = None
+) -> pd.DataFrame:
+    """Score browsing behavior for every customer at once.
+
+    Vectorized equivalent of analyze_browsing_behavior over all customers.
+
+    Args:
+        browsing: Browsing DataFrame from load_browsing_frame
+        now: Reference time (defaults to now)
+
+    Returns:
+        DataFrame with customer_id, product_id and browsing_score columns
+    """
+    now = now or datetime.now()
+    recent = browsing[browsing["timestamp"] >= now - timedelta(days=30)]
+
+    days_ago = (now - recent["timestamp"]).dt.days
+    recency_factor = 1.0 + (1.0 - days_ago / 30.0)
+
+    duration = recent["view_duration"].to_numpy(dtype="float64", na_value=np.nan)
+    duration_factor = np.where(
+        np.nan_to_num(duration) != 0, np.minimum(2.0, duration / 60.0), 1.0
+    )
+
+    action_type = recent["action_type"].astype("category")
+    multipliers = np.append(
+        action_type.cat.categories.astype(str)
+        .str.lower()
+        .map(ACTION_MULTIPLIERS)
+        .to_numpy(dtype="float64", na_value=np.nan),
+        1.0,
+    )
+    multipliers = np.nan_to_num(multipliers, nan=1.0)
+    # Missing action types have code -1 and pick the trailing neutral factor.
+    action_factor = multipliers[action_type.cat.codes.to_numpy()]
+
+    scored = recent[["customer_id", "product_id"]].assign(
+        browsing_score=recency_factor * duration_factor * action_factor
+    )
+    return (
+        scored.groupby(["customer_id", "product_id"], observed=True, sort=False)[
+            "browsing_score"
+        ]
+        .sum()
+        .reset_index()
+    )
+
+
+def identify_seasonal_products_frame(
+    purchases: pd.DataFrame,
+    seasonal_config: SeasonalTrendsConfig,
+    now: Optional[datetime] = None,
+) -> Set[str]:
+    """Identify seasonal products from a purchase DataFrame.
+
+    Vectorized equivalent of identify_seasonal_products.
+
+    Args:
+        purchases: Purchase DataFrame from load_purchase_frame
+        seasonal_config: Seasonal trends configuration
+        now: Reference time used to pick the current season
+
+    Returns:
+        Set of product IDs with seasonal patterns
+    """
+    if not seasonal_config.enable_seasonal_boost or purchases.empty:
+        return set()
+
+    current_month = (now or datetime.now()).month
+    season_months = next(
+        (
+            months
+            for months in seasonal_config.seasonal_categories.values()
+            if current_month in months
+        ),
+        None,
+    )
+    if not season_months:
+        return set()
+
+    in_season = purchases["purchase_date"].dt.month.isin(season_months)
+    totals = (
+        purchases.assign(in_season=in_season)
+        .groupby(["product_id", "in_season"], observed=True)["quantity"]
+        .sum()
+        .unstack(fill_value=0)
+    )
+    season_total = totals[True] if True in totals.columns else 0
+    other_total = totals[False] if False in totals.columns else 0
+
+    seasonal = (
+        (season_total > 0)
+        & (other_total > 0)
+        & (season_total / (other_total + 1) >= 1.5)
+    )
+    if not isinstance(seasonal, pd.Series):
+        return set()
+    return set(seasonal[seasonal].index.astype(str))
+
+
+def generate_batch_recommendations(
+    purchase_scores: pd.DataFrame,
+    browsing_scores: pd.DataFrame,
+    seasonal_products: Set[str],
+    inventory: pd.DataFrame,
+    product_categories: pd.Series,
+    config: RecommendationConfig,
+    seasonal_config: SeasonalTrendsConfig,
+    co_purchase_scores: Optional[pd.DataFrame] = None,
+) -> pd.DataFrame:
+    """Generate recommendations for every customer at once.
+
+    Applies the same candidate, scoring, priority and inventory rules as
+    generate_recommendations with column operations instead of per-customer
+    loops.
+
+    Args:
+        purchase_scores: Output of score_purchase_frame
+        browsing_scores: Output of score_browsing_frame
+        seasonal_products: Set of seasonal product IDs
+        inventory: Output of load_inventory_frame
+        product_categories: Series mapping product_id to category
+        config: Recommendation configuration
+        seasonal_config: Seasonal trends configuration
+        co_purchase_scores: Optional output of CoPurchaseIndex.score_frame
+
+    Returns:
+        DataFrame of recommendations sorted by customer and descending score,
+        limited to max_recommendations per customer
+    """
+    keys = ["customer_id", "product_id"]
+    if co_purchase_scores is None:
+        co_purchase_scores = pd.DataFrame(
+            {"customer_id": [], "product_id": [], "co_purchase_score": []}
+        )
+    frames = [browsing_scores.copy(), purchase_scores.copy(), co_purchase_scores.copy()]
+    for key in keys:
+        categories = frames[0][key].astype("category").cat.categories
+        for frame in frames[1:]:
+            categories = categories.union(frame[key].astype("category").cat.categories)
+        for frame in frames:
+            frame[key] = frame[key].astype(pd.CategoricalDtype(categories))
+    browsing_scores, purchase_scores, co_purchase_scores = frames
+
+    candidates = browsing_scores.merge(co_purchase_scores, on=keys, how="outer")
+    candidates = candidates.merge(purchase_scores, on=keys, how="left")
+    candidates = candidates[candidates["purchase_score"].isna()]
+    candidates = pd.DataFrame(
+        {
+            "customer_id": candidates["customer_id"].astype(str).to_numpy(),
+            "product_id": candidates["product_id"].astype(str).to_numpy(),
+            "purchase_score": 0.0,
+            "browsing_score": candidates["browsing_score"].fillna(0.0).to_numpy(),
+            "co_purchase_score": candidates["co_purchase_score"].fillna(0.0).to_numpy(),
+        }
+    )
+
+    in_inventory = candidates["product_id"].isin(inventory.index)
+    in_stock = (
+        candidates["product_id"].map(inventory["in_stock"]).astype("boolean").fillna(True)
+    )
+    if config.require_in_stock:
+        keep = in_inventory & in_stock
+        candidates = candidates[keep.to_numpy()]
+        in_stock = in_stock[keep]
+
+    seasonal = candidates["product_id"].isin(seasonal_products)
+    seasonal_score = np.where(seasonal, seasonal_config.seasonal_boost_multiplier, 0.0)
+
+    candidates = candidates.assign(
+        score=(
+            candidates["purchase_score"] * config.purchase_history_weight
+            + candidates["browsing_score"] * config.browsing_weight
+            + seasonal_score * config.seasonal_weight
+            + candidates["co_purchase_score"] * config.co_purchase_weight
+        ),
+        seasonal=seasonal,
+        in_stock=in_stock.astype(bool).to_numpy(),
+    )
+    candidates = candidates[candidates["score"] >= config.min_score_threshold]
+
+    reason_labels = [
+        "Based on your purchase history",
+        "Based on your browsing behavior",
+        "Seasonal trend",
+        "Customers who bought your items also bought this",
+    ]
+    reason_texts = np.array(
+        [
+            "; ".join(label for bit, label in enumerate(reason_labels) if code & (1 << bit))
+            for code in range(1 << len(reason_labels))
+        ],
+        dtype=object,
+    )
+    reason_codes = (
+        (candidates["purchase_score"].to_numpy() > 0).astype(int)
+        | (candidates["browsing_score"].to_numpy() > 0).astype(int) << 1
+        | candidates["seasonal"].to_numpy().astype(int) << 2
+        | (candidates["co_purchase_score"].to_numpy() > 0).astype(int) << 3
+    )
+
+    recommendations = pd.DataFrame(
+        {
+            "customer_id": candidates["customer_id"],
+            "product_id": candidates["product_id"],
+            "score": candidates["score"],
+            "priority": np.select(
+                [candidates["score"] > 0.7, candidates["score"] < 0.5],
+                [RecommendationPriority.HIGH.value, RecommendationPriority.LOW.value],
+                default=RecommendationPriority.MEDIUM.value,
+            ),
+            "reasons": reason_texts[reason_codes],
+            "category": candidates["product_id"].map(product_categories),
+            "in_stock": candidates["in_stock"],
+            "available_quantity": (
+                candidates["product_id"].map(inventory["quantity"]).fillna(0).astype("int64")
+            ),
+        }
+    )
+
+    recommendations = recommendations.sort_values(
+        ["customer_id", "score"], ascending=[True, False], kind="stable"
+    )
+    return (
+        recommendations.groupby("customer_id", sort=False)
+        .head(config.max_recommendations)
+        .reset_index(drop=True)
+    )
+
+
+class CoPurchaseIndex:
+    """Sparse item-to-item co-purchase index with precomputed neighbours.
+
+    Products and customers are mapped to integer codes. Co-occurrence counts
+    are kept as a sorted array of packed (a, b) pair keys with a < b, one
+    entry per product pair that shares at least one customer. The distinct
+    customer/product baskets are kept alongside them as sorted packed keys,
+    so new purchases can be folded in without re-reading the full history.
+    Neighbours are stored in a dense (products x K) table, so a lookup is a
+    single O(K) row slice.
+
+    Similarity is cosine over customer sets:
+    shared_customers / sqrt(customers_a * customers_b).
+    """
+
+    _KEY_SHIFT = 32
+    _KEY_MASK = (1 << 32) - 1
+
+    def __init__(self, neighbors_per_product: int = 20, min_co_purchases: int = 1):
+        """Initialize an empty index.
+
+        Args:
+            neighbors_per_product: Number of neighbours kept per product
+            min_co_purchases: Minimum shared customers for a neighbour
+        """
+        self.neighbors_per_product = neighbors_per_product
+        self.min_co_purchases = min_co_purchases
+        self.product_ids: List[str] = []
+        self.customer_ids: List[str] = []
+        self.item_counts = np.zeros(0, dtype=np.int64)
+        self.pair_keys = np.zeros(0, dtype=np.int64)
+        self.pair_counts = np.zeros(0, dtype=np.int64)
+        self.basket_keys = np.zeros(0, dtype=np.int64)
+        self.neighbors = np.full((0, neighbors_per_product), -1, dtype=np.int64)
+        self.neighbor_scores = np.zeros((0, neighbors_per_product))
+        self._product_index: Dict[str, int] = {}
+        self._customer_index: Dict[str, int] = {}
+
+    @classmethod
+    def build(
+        cls,
+        purchases: pd.DataFrame,
+        neighbors_per_product: int = 20,
+        min_co_purchases: int = 1,
+    ) -> "CoPurchaseIndex":
+        """Build an index from a full purchase history.
+
+        Args:
+            purchases: DataFrame with customer_id and product_id columns
+            neighbors_per_product: Number of neighbours kept per product
+            min_co_purchases: Minimum shared customers for a neighbour
+
+        Returns:
+            Populated co-purchase index
+        """
+        index = cls(neighbors_per_product, min_co_purchases)
+        index.update(purchases)
+        return index
+
+    def update(self, purchases: pd.DataFrame) -> int:
+        """Fold new purchases into the index.
+
+        Only customer/product pairs not already in the index contribute, so
+        re-applying purchases that were already indexed has no effect. Only
+        the neighbour lists whose similarities changed are recomputed.
+
+        Args:
+            purchases: DataFrame with customer_id and product_id columns
+
+        Returns:
+            Number of new customer/product pairs added
+        """
+        if purchases.empty:
+            return 0
+
+        customers = self._encode(
+            purchases["customer_id"], self.customer_ids, self._customer_index
+        )
+        products = self._encode(
+            purchases["product_id"], self.product_ids, self._product_index
+        )
+        if len(self.product_ids) > len(self.item_counts):
+            self.item_counts = np.concatenate(
+                [
+                    self.item_counts,
+                    np.zeros(len(self.product_ids) - len(self.item_counts), dtype=np.int64),
+                ]
+            )
+
+        new_keys = np.unique(self._pack(customers, products))
+        new_keys = new_keys[~self._contains(self.basket_keys, new_keys)]
+        if len(new_keys) == 0:
+            return 0
+
+        new_customers, new_products = self._unpack(new_keys)
+        np.add.at(self.item_counts, new_products, 1)
+
+        existing_customers, existing_products = self._basket_items(
+            np.unique(new_customers)
+        )
+        new_frame = pd.DataFrame({"customer": new_customers, "product": new_products})
+        within = new_frame.merge(new_frame, on="customer", suffixes=("_a", "_b"))
+        across = new_frame.merge(
+            pd.DataFrame({"customer": existing_customers, "product": existing_products}),
+            on="customer",
+            suffixes=("_a", "_b"),
+        )
+        within = within[within["product_a"] < within["product_b"]]
+        a = np.concatenate([within["product_a"].to_numpy(), across["product_a"].to_numpy()])
+        b = np.concatenate([within["product_b"].to_numpy(), across["product_b"].to_numpy()])
+        changed_pairs = self._add_pairs(np.minimum(a, b), np.maximum(a, b))
+
+        self.basket_keys = np.union1d(self.basket_keys, new_keys)
+        self._rebuild_neighbors(np.unique(new_products), changed_pairs)
+        return len(new_keys)
+
+    @staticmethod
+    def _encode(
+        values: pd.Series, ids: List[str], lookup: Dict[str, int]
+    ) -> np.ndarray:
+        """Map identifiers to integer codes, assigning codes to new ones."""
+        inverse, uniques = pd.factorize(values.astype(str))
+        codes = np.empty(len(uniques), dtype=np.int64)
+        for i, value in enumerate(uniques.tolist()):
+            code = lookup.get(value)
+            if code is None:
+                code = len(ids)
+                lookup[value] = code
+                ids.append(value)
+            codes[i] = code
+        return codes[inverse]
+
+    @classmethod
+    def _pack(cls, high: np.ndarray, low: np.ndarray) -> np.ndarray:
+        """Pack two code arrays into sortable int64 keys."""
+        return (high.astype(np.int64) << cls._KEY_SHIFT) | low.astype(np.int64)
+
+    @classmethod
+    def _unpack(cls, keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Split packed keys back into their two code arrays."""
+        return keys >> cls._KEY_SHIFT, keys & cls._KEY_MASK
+
+    @staticmethod
+    def _contains(sorted_keys: np.ndarray, keys: np.ndarray) -> np.ndarray:
+        """Return a mask of keys present in a sorted key array."""
+        positions = np.searchsorted(sorted_keys, keys)
+        found = positions < len(sorted_keys)
+        found[found] = sorted_keys[positions[found]] == keys[found]
+        return found
+
+    def _basket_items(self, customers: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the indexed (customer, product) codes for given customers."""
+        starts = np.searchsorted(self.basket_keys, self._pack(customers, np.zeros_like(customers)))
+        ends = np.searchsorted(self.basket_keys, self._pack(customers + 1, np.zeros_like(customers)))
+        lengths = ends - starts
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        return self._unpack(self.basket_keys[np.arange(lengths.sum()) + offsets])
+
+    def _add_pairs(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """Add one co-occurrence per (a, b) pair and return the changed keys."""
+        keys, counts = np.unique(self._pack(a, b), return_counts=True)
+        if len(keys) == 0:
+            return keys
+
+        found = self._contains(self.pair_keys, keys)
+        positions = np.searchsorted(self.pair_keys, keys)
+        self.pair_counts[positions[found]] += counts[found]
+        self.pair_keys = np.insert(self.pair_keys, positions[~found], keys[~found])
+        self.pair_counts = np.insert(self.pair_counts, positions[~found], counts[~found])
+        return keys
+
+    def _rebuild_neighbors(
+        self,
+        changed_products: Optional[np.ndarray] = None,
+        changed_pairs: Optional[np.ndarray] = None,
+    ) -> None:
+        """Recompute top-K neighbour lists from the pair counts.
+
+        Args:
+            changed_products: Products whose customer counts changed; every
+                similarity involving them is refreshed (default: rebuild all)
+            changed_pairs: Pair keys whose co-occurrence counts changed
+        """
+        n = len(self.product_ids)
+        k = self.neighbors_per_product
+        if len(self.neighbors) < n:
+            self.neighbors = np.vstack(
+                [self.neighbors, np.full((n - len(self.neighbors), k), -1, dtype=np.int64)]
+            )
+            self.neighbor_scores = np.vstack(
+                [self.neighbor_scores, np.zeros((n - len(self.neighbor_scores), k))]
+            )
+
+        rows, cols = self._unpack(self.pair_keys)
+        if changed_products is None:
+            affected = np.ones(n, dtype=bool)
+        else:
+            changed = np.zeros(n, dtype=bool)
+            changed[changed_products] = True
+            touched = changed[rows] | changed[cols]
+            if changed_pairs is not None and len(changed_pairs):
+                touched |= self._contains(changed_pairs, self.pair_keys)
+            affected = changed
+            affected[rows[touched]] = True
+            affected[cols[touched]] = True
+
+        self.neighbors[affected] = -1
+        self.neighbor_scores[affected] = 0.0
+
+        keep = self.pair_counts >= self.min_co_purchases
+        keep &= affected[rows] | affected[cols]
+        rows = rows[keep]
+        cols = cols[keep]
+        if len(rows) == 0:
+            return
+
+        similarity = self.pair_counts[keep] / np.sqrt(
+            self.item_counts[rows] * self.item_counts[cols]
+        )
+        source = np.concatenate([rows, cols])
+        target = np.concatenate([cols, rows])
+        similarity = np.concatenate([similarity, similarity])
+        directed = affected[source]
+        source = source[directed]
+        target = target[directed]
+        similarity = similarity[directed]
+
+        # Similarity is in (0, 1], so this key orders by source, then by
+        # descending similarity, with a single sort.
+        order = np.argsort(source * 2.0 + (1.0 - similarity), kind="stable")
+        source = source[order]
+        target = target[order]
+        similarity = similarity[order]
+
+        rank = np.arange(len(source)) - np.searchsorted(source, source)
+        top = rank < k
+        self.neighbors[source[top], rank[top]] = target[top]
+        self.neighbor_scores[source[top], rank[top]] = similarity[top]
+
+    def neighbors_of(
+        self, product_id: str, limit: Optional[int] = None
+    ) -> List[Tuple[str, float]]:
+        """Return the most co-purchased products for a product.
+
+        Args:
+            product_id: Product identifier
+            limit: Maximum number of neighbours (default: all stored)
+
+        Returns:
+            List of (product_id, similarity) sorted by similarity
+        """
+        code = self._product_index.get(product_id)
+        if code is None:
+            return []
+
+        row = self.neighbors[code, :limit]
+        scores = self.neighbor_scores[code, :limit]
+        return [
+            (self.product_ids[neighbor], float(score))
+            for neighbor, score in zip(row, scores)
+            if neighbor >= 0
+        ]
+
+    def score_candidates(self, purchased_products: Iterable[str]) -> Dict[str, float]:
+        """Score customers-also-bought candidates for a customer.
+
+        Args:
+            purchased_products: Products the customer has purchased
+
+        Returns:
+            Dictionary mapping candidate product IDs to their highest
+            similarity to any purchased product
+        """
+        scores: Dict[str, float] = {}
+        for product_id in purchased_products:
+            for neighbor, similarity in self.neighbors_of(product_id):
+                if similarity > scores.get(neighbor, 0.0):
+                    scores[neighbor] = similarity
+        return scores
+
+    def score_frame(self, purchases: pd.DataFrame) -> pd.DataFrame:
+        """Score customers-also-bought candidates for every customer at once.
+
+        Vectorized equivalent of score_candidates over all customers.
+
+        Args:
+            purchases: DataFrame with customer_id and product_id columns
+
+        Returns:
+            DataFrame with customer_id, product_id and co_purchase_score
+            columns, one row per customer and candidate
+        """
+        pairs = purchases[["customer_id", "product_id"]].astype(str).drop_duplicates()
+        codes = pairs["product_id"].map(self._product_index)
+        known = codes.notna().to_numpy()
+        codes = codes[known].to_numpy(dtype=np.int64)
+
+        k = self.neighbors.shape[1]
+        neighbors = self.neighbors[codes].ravel()
+        scores = self.neighbor_scores[codes].ravel()
+        customers = np.repeat(pairs["customer_id"].to_numpy()[known], k)
+        valid = neighbors >= 0
+
+        scored = pd.DataFrame(
+            {
+                "customer_id": customers[valid],
+                "product_id": np.array(self.product_ids, dtype=object)[neighbors[valid]],
+                "co_purchase_score": scores[valid],
+            }
+        )
+        return (
+            scored.groupby(["customer_id", "product_id"], sort=False)["co_purchase_score"]
+            .max()
+            .reset_index()
+        )
+
+    def save(self, path: Path) -> None:
+        """Persist the index to a NumPy archive.
+
+        Args:
+            path: Output file path
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(path.name + ".tmp")
+        with open(temp_path, "wb") as f:
+            np.savez(
+                f,
+                product_ids=np.array(self.product_ids, dtype=str),
+                customer_ids=np.array(self.customer_ids, dtype=str),
+                item_counts=self.item_counts,
+                pair_keys=self.pair_keys,
+                pair_counts=self.pair_counts,
+                basket_keys=self.basket_keys,
+                neighbors=self.neighbors,
+                neighbor_scores=self.neighbor_scores,
+                min_co_purchases=np.array(self.min_co_purchases),
+            )
+        os.replace(temp_path, path)
+        logger.info(
+            f"Co-purchase index saved to {path} ({len(self.product_ids)} products, "
+            f"{len(self.pair_keys)} pairs)"
+        )
+
+    @classmethod
+    def load(
+        cls,
+        path: Path,
+        neighbors_per_product: int = 20,
+        min_co_purchases: int = 1,
+    ) -> "CoPurchaseIndex":
+        """Load a persisted index.
+
+        The neighbour table is recomputed if it was saved with different
+        neighbour settings.
+
+        Args:
+            path: Index file path
+            neighbors_per_product: Number of neighbours kept per product
+            min_co_purchases: Minimum shared customers for a neighbour
+
+        Returns:
+            Loaded co-purchase index
+
+        Raises:
+            FileNotFoundError: If the index file does not exist
+        """
+        if not path.exists():
+            raise FileNotFoundError(f"Co-purchase index not found: {path}")
+
+        index = cls(neighbors_per_product, min_co_purchases)
+        with np.load(path, allow_pickle=False) as data:
+            index.product_ids = data["product_ids"].tolist()
+            index.customer_ids = data["customer_ids"].tolist()
+            index.item_counts = data["item_counts"]
+            index.pair_keys = data["pair_keys"]
+            index.pair_counts = data["pair_counts"]
+            index.basket_keys = data["basket_keys"]
+            neighbors = data["neighbors"]
+            if (
+                neighbors.shape[1] == neighbors_per_product
+                and int(data["min_co_purchases"]) == min_co_purchases
+            ):
+                index.neighbors = neighbors
+                index.neighbor_scores = data["neighbor_scores"]
+            else:
+                index._rebuild_neighbors()
+
+        index._product_index = {
+            product_id: code for code, product_id in enumerate(index.product_ids)
+        }
+        index._customer_index = {
+            customer_id: code for code, customer_id in enumerate(index.customer_ids)
+        }
+        logger.info(f"Loaded co-purchase index with {len(index.product_ids)} products")
+        return index
+
+
 def write_markdown_report(
     analysis: RecommendationAnalysis, output_path: Path
 ) -> None:
@@ -798,6 +1620,129 @@ def write_markdown_report(
     logger.info(f"Report written to {output_path}")
 
 
+def _co_purchase_index_path(config: Config, project_root: Path) -> Path:
+    """Resolve the co-purchase index path relative to the project root."""
+    return _resolve_data_path(config.co_purchase.index_file, project_root)
+
+
+def build_co_purchase_index(config_path: Path) -> CoPurchaseIndex:
+    """Rebuild the co-purchase index from the full purchase history.
+
+    Args:
+        config_path: Path to configuration file
+
+    Returns:
+        Rebuilt co-purchase index
+
+    Raises:
+        FileNotFoundError: If config or data files are missing
+        ValueError: If configuration is invalid
+    """
+    config = load_config(config_path)
+    project_root = config_path.parent
+
+    start_time = time.perf_counter()
+    purchases = load_purchase_frame(config.purchase_history, project_root)
+    index = CoPurchaseIndex.build(
+        purchases,
+        config.co_purchase.neighbors_per_product,
+        config.co_purchase.min_co_purchases,
+    )
+    index.save(_co_purchase_index_path(config, project_root))
+
+    elapsed = time.perf_counter() - start_time
+    logger.info(f"Built co-purchase index in {elapsed:.2f}s")
+    return index
+
+
+def update_co_purchase_index(config_path: Path, purchases_path: Path) -> CoPurchaseIndex:
+    """Fold a file of new purchases into the persisted co-purchase index.
+
+    The file must use the same layout as the configured purchase history.
+    If no index exists yet, one is built from the full purchase history
+    first.
+
+    Args:
+        config_path: Path to configuration file
+        purchases_path: Path to the new purchases file
+
+    Returns:
+        Updated co-purchase index
+
+    Raises:
+        FileNotFoundError: If config or data files are missing
+        ValueError: If configuration is invalid
+    """
+    config = load_config(config_path)
+    project_root = config_path.parent
+    index_path = _co_purchase_index_path(config, project_root)
+
+    if not index_path.exists():
+        index = build_co_purchase_index(config_path)
+    else:
+        index = CoPurchaseIndex.load(
+            index_path,
+            config.co_purchase.neighbors_per_product,
+            config.co_purchase.min_co_purchases,
+        )
+
+    new_purchases = load_purchase_frame(
+        config.purchase_history.model_copy(update={"file_path": str(purchases_path)}),
+        project_root,
+    )
+    added = index.update(new_purchases)
+    index.save(index_path)
+
+    logger.info(f"Added {added} new customer/product pairs to co-purchase index")
+    return index
+
+
+def _load_co_purchase_index(
+    config: Config, project_root: Path, purchases: pd.DataFrame
+) -> CoPurchaseIndex:
+    """Load the co-purchase index for scoring without writing it.
+
+    A missing index is built in memory from the purchase history. An index
+    older than the purchase history file has the history folded in, so
+    recommendations never use stale neighbours. Neither case saves the
+    index; run --build-index or --update-index to persist it.
+
+    Args:
+        config: Loaded configuration
+        project_root: Project root directory
+        purchases: DataFrame with customer_id and product_id columns
+
+    Returns:
+        Co-purchase index covering the current purchase history
+    """
+    index_path = _co_purchase_index_path(config, project_root)
+    if not index_path.exists():
+        logger.info(
+            "Co-purchase index not found, building in memory from purchase history; "
+            "run --build-index to persist it"
+        )
+        return CoPurchaseIndex.build(
+            purchases,
+            config.co_purchase.neighbors_per_product,
+            config.co_purchase.min_co_purchases,
+        )
+
+    index = CoPurchaseIndex.load(
+        index_path,
+        config.co_purchase.neighbors_per_product,
+        config.co_purchase.min_co_purchases,
+    )
+    history_path = _resolve_data_path(config.purchase_history.file_path, project_root)
+    if history_path.stat().st_mtime > index_path.stat().st_mtime:
+        added = index.update(purchases)
+        logger.warning(
+            f"Co-purchase index {index_path} is older than {history_path}; "
+            f"folded in {added} new customer/product pairs in memory, "
+            "run --build-index to persist them"
+        )
+    return index
+
+
 def process_recommendations(config_path: Path, customer_id: str) -> RecommendationAnalysis:
     """Process data and generate recommendations for a customer.
 
@@ -827,6 +1772,20 @@ def process_recommendations(config_path: Path, customer_id: str) -> Recommendati
         purchases, config.seasonal
     )
 
+    co_purchase_scores = None
+    if config.co_purchase.enabled:
+        index = _load_co_purchase_index(
+            config,
+            project_root,
+            pd.DataFrame(
+                {
+                    "customer_id": [p.customer_id for p in purchases],
+                    "product_id": [p.product_id for p in purchases],
+                }
+            ),
+        )
+        co_purchase_scores = index.score_candidates(purchase_scores.keys())
+
     recommendations = generate_recommendations(
         customer_id,
         purchase_scores,
@@ -836,6 +1795,7 @@ def process_recommendations(config_path: Path, customer_id: str) -> Recommendati
         purchases,
         config.recommendation,
         config.seasonal,
+        co_purchase_scores,
     )
 
     purchase_summary = {
@@ -903,6 +1863,72 @@ def process_recommendations(config_path: Path, customer_id: str) -> Recommendati
     return analysis
 
 
+def process_all_recommendations(config_path: Path) -> pd.DataFrame:
+    """Generate recommendations for all customers in one pass.
+
+    Data files are loaded once into DataFrames and every customer is scored
+    with grouped column operations, including customers-also-bought
+    candidates when the co-purchase index is enabled. Results are written to
+    a single CSV file.
+
+    Args:
+        config_path: Path to configuration file
+
+    Returns:
+        DataFrame of recommendations for all customers
+
+    Raises:
+        FileNotFoundError: If config or data files are missing
+        ValueError: If configuration is invalid
+    """
+    config = load_config(config_path)
+    project_root = config_path.parent
+    start_time = time.perf_counter()
+
+    purchases = load_purchase_frame(config.purchase_history, project_root)
+    browsing = load_browsing_frame(config.browsing_behavior, project_root)
+    inventory = load_inventory_frame(config.inventory, project_root)
+
+    now = datetime.now()
+    first_purchases = purchases.drop_duplicates("product_id")
+    product_categories = pd.Series(
+        first_purchases["category"].to_numpy(),
+        index=first_purchases["product_id"].astype(str),
+    )
+
+    co_purchase_scores = None
+    if config.co_purchase.enabled:
+        index = _load_co_purchase_index(config, project_root, purchases)
+        co_purchase_scores = index.score_frame(purchases)
+
+    recommendations = generate_batch_recommendations(
+        score_purchase_frame(purchases, now),
+        score_browsing_frame(browsing, now),
+        identify_seasonal_products_frame(purchases, config.seasonal, now),
+        inventory,
+        product_categories,
+        config.recommendation,
+        config.seasonal,
+        co_purchase_scores,
+    )
+
+    output_path = Path(config.batch_output_file)
+    if not output_path.is_absolute():
+        output_path = project_root / output_path
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    recommendations.to_csv(output_path, index=False)
+
+    elapsed = time.perf_counter() - start_time
+    logger.info(
+        f"Generated {len(recommendations)} recommendations for "
+        f"{recommendations['customer_id'].nunique()} customers in {elapsed:.2f}s"
+    )
+    logger.info(f"Recommendations saved to {output_path}")
+
+    return recommendations
+
+
 def main() -> None:
     """Main entry point for the shopping recommendation engine."""
     import sys
@@ -915,12 +1941,31 @@ def main() -> None:
         config_path = project_root / config_path
 
     if len(sys.argv) < 2:
-        logger.error("Customer ID required as command line argument")
+        logger.error(
+            "Customer ID, --all, --build-index or --update-index FILE required "
+            "as command line argument"
+        )
         sys.exit(1)
 
     customer_id = sys.argv[1]
 
     try:
+        if customer_id == "--all":
+            logger.info("Starting recommendation generation for all customers")
+            process_all_recommendations(config_path)
+            return
+
+        if customer_id == "--build-index":
+            build_co_purchase_index(config_path)
+            return
+
+        if customer_id == "--update-index":
+            if len(sys.argv) < 3:
+                logger.error("Purchases file required for --update-index")
+                sys.exit(1)
+            update_co_purchase_index(config_path, Path(sys.argv[2]).resolve())
+            return
+
         logger.info(f"Starting recommendation generation for customer: {customer_id}")
         analysis = process_recommendations(config_path, customer_id)
         logger.info(
@@ -1,11 +1,16 @@
 """Tests for shopping recommendation engine."""
 
+import os
+import shutil
 from datetime import datetime, timedelta
+from pathlib import Path
 
+import pandas as pd
 import pytest
 
 from shopping_recommendation_engine.src.main import (
     BrowsingRecord,
+    CoPurchaseIndex,
     InventoryItem,
     PurchaseRecord,
     RecommendationConfig,
@@ -13,8 +18,13 @@ from shopping_recommendation_engine.src.main import (
     SeasonalTrendsConfig,
     analyze_browsing_behavior,
     analyze_purchase_history,
+    generate_batch_recommendations,
     generate_recommendations,
     identify_seasonal_products,
+    process_all_recommendations,
+    process_recommendations,
+    score_browsing_frame,
+    score_purchase_frame,
 )
 
 
@@ -268,3 +278,233 @@ def test_seasonal_boost():
     seasonal_rec = next((r for r in recommendations if r.product_id == "prod_001"), None)
     assert seasonal_rec is not None
     assert "Seasonal trend" in seasonal_rec.reasons
+
+
+def test_batch_scoring_matches_per_customer_analysis():
+    """Test vectorized scoring matches per-customer analysis."""
+    now = datetime.now()
+    purchases = [
+        PurchaseRecord("cust_001", "prod_001", now - timedelta(days=10), quantity=2),
+        PurchaseRecord("cust_001", "prod_002", now - timedelta(days=100)),
+        PurchaseRecord("cust_002", "prod_001", now - timedelta(days=5)),
+    ]
+    browsing = [
+        BrowsingRecord("cust_001", "prod_003", now - timedelta(days=5), "view", 120.0),
+        BrowsingRecord("cust_001", "prod_003", now - timedelta(days=1), "add_to_cart"),
+        BrowsingRecord("cust_002", "prod_002", now - timedelta(days=2), "Wishlist", 30.0),
+        BrowsingRecord("cust_002", "prod_004", now - timedelta(days=40), "view"),
+    ]
+
+    purchase_frame = pd.DataFrame([vars(p) for p in purchases])
+    browsing_frame = pd.DataFrame([vars(b) for b in browsing])
+
+    purchase_scores = score_purchase_frame(purchase_frame, now)
+    browsing_scores = score_browsing_frame(browsing_frame, now)
+
+    for customer_id in ["cust_001", "cust_002"]:
+        expected_purchase = analyze_purchase_history(purchases, customer_id)
+        expected_browsing = analyze_browsing_behavior(browsing, customer_id)
+        actual_purchase = purchase_scores[purchase_scores["customer_id"] == customer_id]
+        actual_browsing = browsing_scores[browsing_scores["customer_id"] == customer_id]
+
+        assert dict(
+            zip(actual_purchase["product_id"], actual_purchase["purchase_score"])
+        ) == pytest.approx(expected_purchase)
+        assert dict(
+            zip(actual_browsing["product_id"], actual_browsing["browsing_score"])
+        ) == pytest.approx(expected_browsing)
+
+
+def test_generate_batch_recommendations():
+    """Test batch recommendations for all customers."""
+    purchase_scores = pd.DataFrame(
+        {"customer_id": ["cust_001"], "product_id": ["prod_001"], "purchase_score": [5.0]}
+    )
+    browsing_scores = pd.DataFrame(
+        {
+            "customer_id": ["cust_001", "cust_001", "cust_002", "cust_002"],
+            "product_id": ["prod_001", "prod_003", "prod_001", "prod_005"],
+            "browsing_score": [4.0, 4.0, 2.0, 3.0],
+        }
+    )
+    inventory = pd.DataFrame(
+        {"quantity": [10, 5, 0], "in_stock": [True, True, False]},
+        index=pd.Index(["prod_001", "prod_003", "prod_005"], name="product_id"),
+    )
+    categories = pd.Series({"prod_001": "electronics"})
+    config = RecommendationConfig(max_recommendations=10, min_score_threshold=0.1)
+
+    recommendations = generate_batch_recommendations(
+        purchase_scores,
+        browsing_scores,
+        {"prod_003"},
+        inventory,
+        categories,
+        config,
+        SeasonalTrendsConfig(),
+    )
+
+    pairs = set(zip(recommendations["customer_id"], recommendations["product_id"]))
+    assert pairs == {("cust_001", "prod_003"), ("cust_002", "prod_001")}
+
+    seasonal_rec = recommendations[recommendations["product_id"] == "prod_003"].iloc[0]
+    assert seasonal_rec["reasons"] == "Based on your browsing behavior; Seasonal trend"
+    assert seasonal_rec["priority"] == RecommendationPriority.HIGH.value
+
+    electronics_rec = recommendations[recommendations["customer_id"] == "cust_002"].iloc[0]
+    assert electronics_rec["category"] == "electronics"
+    assert electronics_rec["available_quantity"] == 10
+
+
+def test_co_purchase_index_neighbors():
+    """Test co-purchase neighbours and incremental updates."""
+    purchases = pd.DataFrame(
+        {
+            "customer_id": ["cust_001", "cust_001", "cust_002", "cust_002", "cust_002", "cust_003"],
+            "product_id": ["prod_001", "prod_002", "prod_001", "prod_002", "prod_003", "prod_003"],
+        }
+    )
+
+    index = CoPurchaseIndex.build(purchases, neighbors_per_product=5)
+
+    neighbors = index.neighbors_of("prod_001")
+    assert [product_id for product_id, _ in neighbors] == ["prod_002", "prod_003"]
+    assert neighbors[0][1] == pytest.approx(1.0)
+    assert neighbors[1][1] == pytest.approx(1 / 2)
+    assert index.neighbors_of("prod_001", limit=1) == neighbors[:1]
+    assert index.neighbors_of("prod_999") == []
+
+    incremental = CoPurchaseIndex(neighbors_per_product=5)
+    assert incremental.update(purchases.iloc[:3]) == 3
+    assert incremental.update(purchases.iloc[2:]) == 3
+    assert incremental.update(purchases) == 0
+    for product_id in ["prod_001", "prod_002", "prod_003"]:
+        assert incremental.neighbors_of(product_id) == pytest.approx(
+            index.neighbors_of(product_id)
+        )
+
+
+def test_co_purchase_index_save_and_load(tmp_path):
+    """Test co-purchase index persistence."""
+    purchases = pd.DataFrame(
+        {
+            "customer_id": ["cust_001", "cust_001", "cust_001", "cust_002"],
+            "product_id": ["prod_001", "prod_002", "prod_003", "prod_001"],
+        }
+    )
+    index = CoPurchaseIndex.build(purchases, neighbors_per_product=2)
+    index_path = tmp_path / "index.npz"
+    index.save(index_path)
+
+    loaded = CoPurchaseIndex.load(index_path, neighbors_per_product=2)
+    assert loaded.neighbors_of("prod_001") == index.neighbors_of("prod_001")
+
+    loaded.update(pd.DataFrame({"customer_id": ["cust_002"], "product_id": ["prod_004"]}))
+    assert loaded.neighbors_of("prod_004") == [("prod_001", pytest.approx(1 / 2**0.5))]
+
+    resized = CoPurchaseIndex.load(index_path, neighbors_per_product=1)
+    assert resized.neighbors_of("prod_002") == index.neighbors_of("prod_002")[:1]
+
+
+def test_generate_recommendations_co_purchase_candidates():
+    """Test customers-also-bought candidates are recommended."""
+    now = datetime.now()
+    purchases = [
+        PurchaseRecord("cust_001", "prod_001", now - timedelta(days=5), category="books"),
+        PurchaseRecord("cust_002", "prod_002", now - timedelta(days=5), category="books"),
+    ]
+    inventory = {
+        "prod_001": InventoryItem(product_id="prod_001", quantity=10, in_stock=True),
+        "prod_002": InventoryItem(product_id="prod_002", quantity=3, in_stock=True),
+    }
+
+    recommendations = generate_recommendations(
+        "cust_001",
+        {"prod_001": 1.0},
+        {},
+        set(),
+        inventory,
+        purchases,
+        RecommendationConfig(min_score_threshold=0.1),
+        SeasonalTrendsConfig(),
+        {"prod_001": 1.0, "prod_002": 0.8},
+    )
+
+    assert [rec.product_id for rec in recommendations] == ["prod_002"]
+    assert recommendations[0].score == pytest.approx(0.4)
+    assert recommendations[0].category == "books"
+    assert recommendations[0].reasons == ["Customers who bought your items also bought this"]
+
+
+@pytest.fixture
+def project_dir(tmp_path):
+    """Create a project with config and data files for end-to-end runs."""
+    shutil.copy(Path(__file__).parent.parent / "config.yaml", tmp_path / "config.yaml")
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+
+    day = (datetime.now() - timedelta(days=3)).strftime("%Y-%m-%d")
+    purchases = [
+        ("cust_001", "prod_001"),
+        ("cust_001", "prod_002"),
+        ("cust_002", "prod_001"),
+        ("cust_002", "prod_003"),
+        ("cust_003", "prod_002"),
+        ("cust_003", "prod_004"),
+        ("cust_004", "prod_003"),
+    ]
+    (data_dir / "purchases.csv").write_text(
+        "customer_id,product_id,purchase_date,quantity,category,price\n"
+        + "".join(f"{c},{p},{day},1,books,10.0\n" for c, p in purchases)
+    )
+    (data_dir / "browsing.csv").write_text(
+        "customer_id,product_id,timestamp,action_type,view_duration_seconds\n"
+        f"cust_001,prod_003,{day},add_to_cart,90\n"
+        f"cust_004,prod_002,{day},view,30\n"
+    )
+    (data_dir / "inventory.csv").write_text(
+        "product_id,quantity,in_stock\n"
+        "prod_001,5,true\nprod_002,5,true\nprod_003,5,true\nprod_004,5,true\n"
+    )
+    return tmp_path
+
+
+def test_batch_recommendations_match_per_customer_with_co_purchase(project_dir):
+    """Test batch and single-customer runs agree and leave the index unwritten."""
+    config_path = project_dir / "config.yaml"
+    index_path = project_dir / "data" / "co_purchase_index.npz"
+
+    batch = process_all_recommendations(config_path)
+    assert (batch["reasons"].str.contains("Customers who bought")).any()
+
+    for customer_id in ["cust_001", "cust_002", "cust_003", "cust_004"]:
+        single = process_recommendations(config_path, customer_id).recommendations
+        rows = batch[batch["customer_id"] == customer_id]
+        assert dict(zip(rows["product_id"], rows["score"])) == pytest.approx(
+            {rec.product_id: rec.score for rec in single}
+        )
+        assert dict(zip(rows["product_id"], rows["reasons"])) == {
+            rec.product_id: "; ".join(rec.reasons) for rec in single
+        }
+
+    assert not index_path.exists()
+
+
+def test_stale_co_purchase_index_is_refreshed_in_memory(project_dir):
+    """Test an index older than the purchase history is not used as-is."""
+    config_path = project_dir / "config.yaml"
+    index_path = project_dir / "data" / "co_purchase_index.npz"
+    purchases_path = project_dir / "data" / "purchases.csv"
+
+    CoPurchaseIndex.build(
+        pd.DataFrame({"customer_id": ["cust_001"], "product_id": ["prod_001"]})
+    ).save(index_path)
+    saved_mtime = index_path.stat().st_mtime
+    os.utime(purchases_path, (saved_mtime + 10, saved_mtime + 10))
+
+    batch = process_all_recommendations(config_path)
+    cust_001 = batch[batch["customer_id"] == "cust_001"]
+    assert "prod_004" in set(cust_001["product_id"])
+
+    assert index_path.stat().st_mtime == saved_mtime
+    assert CoPurchaseIndex.load(index_path).neighbors_of("prod_001") == []
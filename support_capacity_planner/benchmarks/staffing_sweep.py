@@ -0,0 +1,140 @@
+"""Benchmark the 7x24 demand model and the Erlang-C staffing sweep.
+
+Builds a synthetic ticket history split across several queues, then times:
+
+- model: building the per-queue 168-slot demand model
+- sweep: Erlang-C service levels for every queue, horizon hour and agent
+  count from zero to max_agents_per_shift, plus required agents and shift
+  plans for each candidate shift length
+- scalar: the same service-level grid for one queue, computed slot by slot
+  with a textbook per-call Erlang-C formula
+
+Run from the repository root:
+
+    python -m support_capacity_planner.benchmarks.staffing_sweep
+"""
+
+import argparse
+import logging
+import math
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from support_capacity_planner.src.main import (
+    PredictionConfig,
+    StaffingConfig,
+    TicketDataConfig,
+    build_demand_model,
+    erlang_c_service_level,
+    plan_shifts,
+    required_agents,
+)
+
+
+def build_tickets(tickets: int, queues: int, days: int, now: datetime) -> pd.DataFrame:
+    """Build a ticket frame with a daytime-heavy arrival pattern."""
+    rng = np.random.default_rng(7)
+    offsets = rng.integers(0, days * 86400, tickets)
+    created = pd.Timestamp(now) - pd.to_timedelta(offsets, unit="s")
+    keep = rng.random(tickets) < 0.35 + 0.65 * np.sin(np.pi * created.hour / 24)
+    created = created[keep]
+    count = len(created)
+    return pd.DataFrame(
+        {
+            "ticket_id": np.arange(count),
+            "created_at": created,
+            "resolved_at": created
+            + pd.to_timedelta(rng.exponential(90, count), unit="m"),
+            "category": np.char.add("queue_", rng.integers(0, queues, count).astype(str)),
+        }
+    )
+
+
+def scalar_service_level(
+    arrival_rate: float, agents: int, config: StaffingConfig
+) -> float:
+    """Erlang-C service level for one slot using the factorial form."""
+    load = arrival_rate / config.avg_tickets_per_agent_per_hour
+    if load <= 0:
+        return 1.0
+    if agents <= load:
+        return 0.0
+    top = load**agents / math.factorial(agents) * agents / (agents - load)
+    bottom = sum(load**k / math.factorial(k) for k in range(agents)) + top
+    answer_hours = config.target_answer_time_minutes / 60
+    return 1 - top / bottom * math.exp(
+        -(agents - load) * config.avg_tickets_per_agent_per_hour * answer_hours
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tickets", type=int, default=2_000_000, help="Tickets")
+    parser.add_argument("--queues", type=int, default=20, help="Support queues")
+    parser.add_argument(
+        "--horizon-days", type=int, default=28, help="Staffing horizon in days"
+    )
+    parser.add_argument(
+        "--max-agents", type=int, default=60, help="Largest head count swept"
+    )
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    now = datetime.now().replace(minute=0, second=0, microsecond=0)
+    ticket_config = TicketDataConfig(
+        file_path="tickets.csv", resolved_time_column="resolved_at"
+    )
+    prediction_config = PredictionConfig(lookback_days=90)
+    staffing_config = StaffingConfig(max_agents_per_shift=args.max_agents)
+    df = build_tickets(args.tickets, args.queues, prediction_config.lookback_days, now)
+
+    start = time.perf_counter()
+    model = build_demand_model(
+        df, ticket_config, prediction_config, queue_column="category", now=now
+    )
+    model_seconds = time.perf_counter() - start
+
+    hours = args.horizon_days * 24
+    start = time.perf_counter()
+    arrivals = model.arrival_rates(now, hours)
+    agent_counts = np.arange(args.max_agents + 1).reshape(-1, 1, 1)
+    service_levels = erlang_c_service_level(arrivals, agent_counts, staffing_config)
+    for shift_hours in (4, 6, 8, 10, 12):
+        shift_config = staffing_config.model_copy(
+            update={"shift_duration_hours": shift_hours}
+        )
+        plan_shifts(required_agents(arrivals, shift_config), shift_config, now.hour)
+    sweep_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scalar = np.array(
+        [
+            [scalar_service_level(rate, agents, staffing_config) for rate in arrivals[0]]
+            for agents in range(args.max_agents + 1)
+        ]
+    )
+    scalar_seconds = time.perf_counter() - start
+    error = float(np.nanmax(np.abs(scalar - service_levels[:, 0])))
+
+    print(
+        f"history: {len(df)} tickets in {len(model.queues)} queues, "
+        f"{prediction_config.lookback_days} days"
+    )
+    print(f"demand model: {model_seconds:.2f}s")
+    print(
+        f"sweep: {service_levels.size:,} service levels "
+        f"({len(model.queues)} queues x {hours} hours x {args.max_agents + 1} "
+        f"head counts) plus 5 shift lengths in {sweep_seconds:.2f}s"
+    )
+    print(
+        f"scalar Erlang-C, one queue: {scalar_seconds:.2f}s "
+        f"(max abs difference {error:.2e})"
+    )
+
+
+if __name__ == "__main__":
+    main()
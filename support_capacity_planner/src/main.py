@@ -12,6 +12,7 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import yaml
 from pydantic import BaseModel, Field, field_validator
@@ -44,6 +45,10 @@ class TicketDataConfig(BaseModel):
     category_column: Optional[str] = Field(
         default=None, description="Column name for ticket category"
     )
+    queue_column: Optional[str] = Field(
+        default=None,
+        description="Column splitting tickets into separately staffed queues",
+    )
 
 
 class PredictionConfig(BaseModel):
@@ -84,6 +89,21 @@ class StaffingConfig(BaseModel):
     target_service_level: float = Field(
         default=0.80, description="Target service level (tickets handled)"
     )
+    target_answer_time_minutes: float = Field(
+        default=60.0,
+        description="Time within which target_service_level of tickets are picked up",
+    )
+    shift_start_interval_hours: int = Field(
+        default=1, description="Shifts may start on multiples of this many hours"
+    )
+
+    @field_validator("shift_duration_hours", "shift_start_interval_hours")
+    @classmethod
+    def validate_hours(cls, v: int) -> int:
+        """Validate shift hour settings."""
+        if v < 1:
+            raise ValueError("shift hours must be at least 1")
+        return v
 
 
 class ReportConfig(BaseModel):
@@ -135,6 +155,9 @@ class TimeSlotMetrics:
     ticket_count: int
     avg_resolution_time_minutes: Optional[float] = None
     peak_indicator: bool = False
+    median_resolution_time_minutes: Optional[float] = None
+    p90_resolution_time_minutes: Optional[float] = None
+    weekly_variance: Optional[float] = None
 
 
 @dataclass
@@ -157,6 +180,39 @@ class StaffingSchedule:
     predicted_ticket_volume: int
     cost_per_shift: float
     service_level: float
+    queue: str = "all"
+
+
+@dataclass
+class DemandModel:
+    """Ticket demand over the 168 hour-of-week slots.
+
+    Slot index is day_of_week * 24 + hour. Every array has one row per queue
+    and one column per slot.
+    """
+
+    queues: List[str]
+    ticket_counts: np.ndarray
+    hourly_mean: np.ndarray
+    hourly_variance: np.ndarray
+    resolution_mean_minutes: np.ndarray
+    resolution_p50_minutes: np.ndarray
+    resolution_p90_minutes: np.ndarray
+    slot_occurrences: np.ndarray
+
+    def arrival_rates(self, start: datetime, hours: int) -> np.ndarray:
+        """Expected tickets per hour for consecutive hours from start.
+
+        Args:
+            start: First hour of the horizon
+            hours: Number of hours in the horizon
+
+        Returns:
+            Array of shape (queues, hours)
+        """
+        first_hour = np.datetime64(start, "h").astype(np.int64)
+        slots = _hour_of_week(np.arange(first_hour, first_hour + hours))
+        return self.hourly_mean[:, slots]
 
 
 @dataclass
@@ -233,6 +289,8 @@ def load_ticket_data(config: TicketDataConfig, project_root: Path) -> pd.DataFra
             config.ticket_id_column,
             config.created_time_column,
         ]
+        if config.queue_column:
+            required_columns.append(config.queue_column)
         missing = [col for col in required_columns if col not in df.columns]
         if missing:
             raise ValueError(f"Missing required columns: {missing}")
@@ -257,8 +315,125 @@ def load_ticket_data(config: TicketDataConfig, project_root: Path) -> pd.DataFra
         raise
 
 
+SLOTS_PER_WEEK = 168
+
+
+def _hour_of_week(hours: np.ndarray) -> np.ndarray:
+    """Map hours since the Unix epoch to day_of_week * 24 + hour slots.
+
+    Args:
+        hours: Integer hours since 1970-01-01 00:00 (a Thursday)
+
+    Returns:
+        Hour-of-week slot index for each hour, Monday 00:00 being slot 0
+    """
+    return ((hours // 24 + 3) % 7) * 24 + hours % 24
+
+
+def build_demand_model(
+    df: pd.DataFrame,
+    config: TicketDataConfig,
+    prediction_config: PredictionConfig,
+    queue_column: Optional[str] = None,
+    now: Optional[datetime] = None,
+) -> DemandModel:
+    """Build the 7x24 demand model from ticket history.
+
+    Tickets inside the lookback window are bucketed by clock hour in one
+    bincount; buckets are then folded onto their hour-of-week slot, so each
+    slot's mean and variance are taken over the weeks it actually occurred
+    in the window. Resolution-time statistics come from a single groupby.
+
+    Args:
+        df: DataFrame with ticket data
+        config: Ticket data configuration
+        prediction_config: Prediction configuration
+        queue_column: Optional column splitting tickets into queues
+        now: End of the lookback window, defaults to the current time
+
+    Returns:
+        Demand model with one row per queue
+    """
+    now = now or datetime.now()
+    cutoff = now - timedelta(days=prediction_config.lookback_days)
+
+    created = df[config.created_time_column] if not df.empty else pd.Series(
+        [], dtype="datetime64[ns]"
+    )
+    mask = (created >= cutoff).to_numpy()
+    created_hours = (
+        created.to_numpy()[mask].astype("datetime64[h]").astype(np.int64)
+    )
+
+    if queue_column and not df.empty:
+        queue_values = df.loc[mask, queue_column].astype(str)
+        queue_codes, queue_index = pd.factorize(queue_values, sort=True)
+        queues = [str(queue) for queue in queue_index]
+    else:
+        queue_codes = np.zeros(len(created_hours), dtype=np.int64)
+        queues = ["all"]
+    queue_count = len(queues)
+
+    first_hour = np.datetime64(cutoff, "h").astype(np.int64)
+    last_hour = np.datetime64(now, "h").astype(np.int64)
+    hour_count = int(last_hour - first_hour) + 1
+    bucket = created_hours - first_hour
+    in_window = (bucket >= 0) & (bucket < hour_count)
+
+    hourly = np.bincount(
+        queue_codes[in_window] * hour_count + bucket[in_window],
+        minlength=queue_count * hour_count,
+    ).reshape(queue_count, hour_count)
+
+    bucket_slots = _hour_of_week(np.arange(first_hour, last_hour + 1))
+    slot_matrix = np.zeros((hour_count, SLOTS_PER_WEEK))
+    slot_matrix[np.arange(hour_count), bucket_slots] = 1.0
+    occurrences = slot_matrix.sum(axis=0)
+
+    ticket_counts = hourly @ slot_matrix
+    squares = (hourly.astype(float) ** 2) @ slot_matrix
+    with np.errstate(divide="ignore", invalid="ignore"):
+        hourly_mean = np.where(occurrences > 0, ticket_counts / occurrences, 0.0)
+        hourly_variance = np.where(
+            occurrences > 1,
+            (squares - occurrences * hourly_mean**2) / (occurrences - 1),
+            0.0,
+        )
+
+    resolution = np.full((3, queue_count * SLOTS_PER_WEEK), np.nan)
+    if config.resolved_time_column and config.resolved_time_column in df.columns:
+        minutes = (
+            (df[config.resolved_time_column] - created).dt.total_seconds() / 60
+        ).to_numpy()[mask]
+        valid = in_window & (minutes > 0)
+        if valid.any():
+            keys = (
+                queue_codes[valid] * SLOTS_PER_WEEK
+                + _hour_of_week(created_hours[valid])
+            )
+            grouped = pd.Series(minutes[valid]).groupby(keys)
+            stats = grouped.quantile([0.5, 0.9]).unstack()
+            stats.insert(0, "mean", grouped.mean())
+            resolution[:, stats.index.to_numpy()] = stats.to_numpy().T
+    resolution = resolution.reshape(3, queue_count, SLOTS_PER_WEEK)
+
+    return DemandModel(
+        queues=queues,
+        ticket_counts=ticket_counts.round().astype(np.int64),
+        hourly_mean=hourly_mean,
+        hourly_variance=np.maximum(hourly_variance, 0.0),
+        resolution_mean_minutes=resolution[0],
+        resolution_p50_minutes=resolution[1],
+        resolution_p90_minutes=resolution[2],
+        slot_occurrences=occurrences.astype(np.int64),
+    )
+
+
 def analyze_historical_metrics(
-    df: pd.DataFrame, config: TicketDataConfig, prediction_config: PredictionConfig
+    df: pd.DataFrame,
+    config: TicketDataConfig,
+    prediction_config: PredictionConfig,
+    model: Optional[DemandModel] = None,
 ) -> List[TimeSlotMetrics]:
     """Analyze historical ticket volume metrics by time slot.
 
@@ -266,62 +441,41 @@ def analyze_historical_metrics(
         df: DataFrame with ticket data
         config: Ticket data configuration
         prediction_config: Prediction configuration
+        model: Prebuilt single-queue demand model, built from df if omitted
 
     Returns:
-        List of time slot metrics
+        List of time slot metrics for every slot that received tickets
     """
     if df.empty:
         return []
 
-    cutoff_date = datetime.now() - timedelta(days=prediction_config.lookback_days)
-    df_filtered = df[df[config.created_time_column] >= cutoff_date].copy()
-
-    df_filtered["hour"] = df_filtered[config.created_time_column].dt.hour
-    df_filtered["day_of_week"] = df_filtered[config.created_time_column].dt.dayofweek
-
-    metrics_by_slot: Dict[Tuple[int, int], List[int]] = defaultdict(list)
-
-    for _, row in df_filtered.iterrows():
-        slot_key = (row["hour"], row["day_of_week"])
-        metrics_by_slot[slot_key].append(1)
-
-        if (
-            config.resolved_time_column
-            and config.resolved_time_column in df_filtered.columns
-            and pd.notna(row[config.resolved_time_column])
-        ):
-            resolution_time = (
-                row[config.resolved_time_column] - row[config.created_time_column]
-            )
-            resolution_minutes = resolution_time.total_seconds() / 60
-            if resolution_minutes > 0:
-                metrics_by_slot[slot_key].append(resolution_minutes)
+    if model is None:
+        model = build_demand_model(df, config, prediction_config)
 
-    time_slot_metrics = []
-    all_counts = [len(counts) for counts in metrics_by_slot.values()]
-    avg_count = sum(all_counts) / len(all_counts) if all_counts else 0
+    counts = model.ticket_counts.sum(axis=0)
+    populated = np.flatnonzero(counts)
+    avg_count = counts[populated].mean() if len(populated) else 0
     peak_threshold = avg_count * prediction_config.peak_threshold_multiplier
 
-    for (hour, day_of_week), values in metrics_by_slot.items():
-        ticket_count = len([v for v in values if isinstance(v, int)])
-        resolution_times = [v for v in values if isinstance(v, (int, float)) and v > 0]
-        avg_resolution = (
-            sum(resolution_times) / len(resolution_times)
-            if resolution_times
-            else None
-        )
-
-        is_peak = ticket_count >= peak_threshold
-
-        time_slot_metrics.append(
-            TimeSlotMetrics(
-                hour=hour,
-                day_of_week=day_of_week,
-                ticket_count=ticket_count,
-                avg_resolution_time_minutes=avg_resolution,
-                peak_indicator=is_peak,
-            )
+    def _optional(values: np.ndarray, slot: int) -> Optional[float]:
+        value = values[0, slot]
+        return None if np.isnan(value) else float(value)
+
+    time_slot_metrics = [
+        TimeSlotMetrics(
+            hour=int(slot % 24),
+            day_of_week=int(slot // 24),
+            ticket_count=int(counts[slot]),
+            avg_resolution_time_minutes=_optional(model.resolution_mean_minutes, slot),
+            peak_indicator=bool(counts[slot] >= peak_threshold),
+            median_resolution_time_minutes=_optional(
+                model.resolution_p50_minutes, slot
+            ),
+            p90_resolution_time_minutes=_optional(model.resolution_p90_minutes, slot),
+            weekly_variance=float(model.hourly_variance[0, slot]),
         )
+        for slot in populated
+    ]
 
     logger.info(f"Analyzed {len(time_slot_metrics)} time slots")
     return time_slot_metrics
@@ -500,6 +654,218 @@ def optimize_staffing_schedule(
     return schedules
 
 
+def _erlang_b_table(load: np.ndarray, max_agents: int) -> np.ndarray:
+    """Erlang-B blocking probability for 0..max_agents agents.
+
+    Uses the recursion B(n) = A * B(n - 1) / (n + A * B(n - 1)), which is
+    numerically stable and runs once per agent count across every load.
+
+    Args:
+        load: Offered load in Erlangs, any shape
+        max_agents: Largest agent count to tabulate
+
+    Returns:
+        Array of shape (max_agents + 1, *load.shape)
+    """
+    table = np.empty((max_agents + 1,) + load.shape)
+    table[0] = 1.0
+    for agents in range(1, max_agents + 1):
+        blocked = load * table[agents - 1]
+        table[agents] = blocked / (agents + blocked)
+    return table
+
+
+def _service_level_from_table(
+    table: np.ndarray,
+    agents: np.ndarray,
+    load: np.ndarray,
+    config: StaffingConfig,
+) -> np.ndarray:
+    """Convert Erlang-B values to Erlang-C service levels.
+
+    Args:
+        table: Erlang-B values for the given agent counts
+        agents: Agent counts, broadcastable against load
+        load: Offered load in Erlangs
+        config: Staffing configuration
+
+    Returns:
+        Fraction of tickets picked up within the target answer time
+    """
+    answer_hours = config.target_answer_time_minutes / 60
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        wait_probability = agents * table / (agents - load * (1 - table))
+        service_level = 1 - wait_probability * np.exp(
+            -(agents - load) * config.avg_tickets_per_agent_per_hour * answer_hours
+        )
+    service_level = np.where(agents > load, np.clip(service_level, 0.0, 1.0), 0.0)
+    return np.where(load <= 0, 1.0, service_level)
+
+
+def erlang_c_service_level(
+    arrival_rate: np.ndarray, agents: np.ndarray, config: StaffingConfig
+) -> np.ndarray:
+    """Erlang-C service level for any grid of arrival rates and agent counts.
+
+    Arguments broadcast against each other, so a (queues, hours) array of
+    arrival rates against an (agents, 1, 1) array of head counts evaluates a
+    whole staffing sweep in one call.
+
+    Args:
+        arrival_rate: Tickets arriving per hour
+        agents: Agents on duty
+        config: Staffing configuration
+
+    Returns:
+        Fraction of tickets picked up within target_answer_time_minutes
+    """
+    arrival_rate = np.asarray(arrival_rate, dtype=float)
+    agents = np.asarray(agents, dtype=np.int64)
+    load = arrival_rate / config.avg_tickets_per_agent_per_hour
+    shape = np.broadcast_shapes(load.shape, agents.shape)
+    max_agents = int(agents.max()) if agents.size else 0
+
+    table = _erlang_b_table(load, max(max_agents, 0))
+    table = np.broadcast_to(
+        table[(slice(None),) + (np.newaxis,) * (len(shape) - load.ndim)],
+        (max_agents + 1,) + shape,
+    )
+    agents = np.broadcast_to(np.maximum(agents, 0), shape)
+    blocking = np.take_along_axis(table, agents[np.newaxis], axis=0)[0]
+    return _service_level_from_table(blocking, agents, load, config)
+
+
+def required_agents(arrival_rate: np.ndarray, config: StaffingConfig) -> np.ndarray:
+    """Smallest head count meeting the target service level per slot.
+
+    Args:
+        arrival_rate: Tickets arriving per hour, any shape
+        config: Staffing configuration
+
+    Returns:
+        Integer array of agents, clipped to the configured per-shift bounds
+    """
+    arrival_rate = np.asarray(arrival_rate, dtype=float)
+    load = arrival_rate / config.avg_tickets_per_agent_per_hour
+    agent_counts = np.arange(config.max_agents_per_shift + 1).reshape(
+        (-1,) + (1,) * load.ndim
+    )
+    service_levels = _service_level_from_table(
+        _erlang_b_table(load, config.max_agents_per_shift), agent_counts, load, config
+    )
+    meets_target = (service_levels >= config.target_service_level) & (
+        agent_counts >= config.min_agents_per_shift
+    )
+    return np.where(
+        meets_target.any(axis=0),
+        meets_target.argmax(axis=0),
+        config.max_agents_per_shift,
+    )
+
+
+def plan_shifts(
+    required: np.ndarray,
+    config: StaffingConfig,
+    first_hour_of_day: int = 0,
+) -> np.ndarray:
+    """Cover hourly requirements with fixed-length shifts.
+
+    Walks the horizon once, vectorized across queues: whenever coverage
+    falls short, the shortfall starts a shift at the latest allowed start
+    hour. With unrestricted start hours this greedy cover is minimal.
+
+    Args:
+        required: Agents needed per hour, shape (..., hours)
+        config: Staffing configuration
+        first_hour_of_day: Clock hour of the first horizon hour
+
+    Returns:
+        Agents starting a shift at each hour, same shape as required
+    """
+    required = np.asarray(required, dtype=np.int64)
+    hours = required.shape[-1]
+    duration = config.shift_duration_hours
+    interval = min(config.shift_start_interval_hours, duration)
+
+    starts = np.zeros_like(required)
+    coverage = np.zeros_like(required)
+    for hour in range(hours):
+        shortfall = np.maximum(required[..., hour] - coverage[..., hour], 0)
+        if not shortfall.any():
+            continue
+        start = max(hour - (first_hour_of_day + hour) % interval, 0)
+        starts[..., start] += shortfall
+        coverage[..., start : start + duration] += shortfall[..., np.newaxis]
+    return starts
+
+
+def plan_staffing(
+    model: DemandModel,
+    config: StaffingConfig,
+    prediction_config: PredictionConfig,
+    start: Optional[datetime] = None,
+) -> List[StaffingSchedule]:
+    """Build an Erlang-C staffing schedule for the prediction horizon.
+
+    Every hour of the horizon is sized against the demand model, and the
+    resulting requirement is covered with shifts. Each queue in the model
+    is staffed separately, all queues in one vectorized pass.
+
+    Args:
+        model: Demand model
+        config: Staffing configuration
+        prediction_config: Prediction configuration
+        start: First hour of the horizon, defaults to the current hour
+
+    Returns:
+        One schedule per queue and shift start, ordered by start time
+    """
+    start = (start or datetime.now()).replace(minute=0, second=0, microsecond=0)
+    hours = prediction_config.prediction_horizon_days * 24
+    if hours <= 0:
+        return []
+
+    arrivals = model.arrival_rates(start, hours)
+    starts = plan_shifts(required_agents(arrivals, config), config, start.hour)
+
+    duration = config.shift_duration_hours
+    cumulative = np.cumsum(starts, axis=-1)
+    coverage = cumulative.copy()
+    coverage[:, duration:] -= cumulative[:, :-duration]
+    service_levels = erlang_c_service_level(arrivals, coverage, config)
+
+    schedules = []
+    for hour, queue in zip(*np.nonzero(starts.T)):
+        shift = slice(hour, min(hour + duration, hours))
+        volume = arrivals[queue, shift].sum()
+        service_level = (
+            float(
+                np.average(service_levels[queue, shift], weights=arrivals[queue, shift])
+            )
+            if volume > 0
+            else 1.0
+        )
+        agents = int(starts[queue, hour])
+        shift_start = start + timedelta(hours=int(hour))
+        schedules.append(
+            StaffingSchedule(
+                start_time=shift_start,
+                end_time=shift_start + timedelta(hours=duration),
+                recommended_agents=agents,
+                predicted_ticket_volume=int(round(volume)),
+                cost_per_shift=agents * duration * config.cost_per_agent_per_hour,
+                service_level=service_level,
+                queue=model.queues[queue],
+            )
+        )
+
+    logger.info(
+        f"Planned {len(schedules)} shifts for {len(model.queues)} queue(s) "
+        f"over {hours} hours"
+    )
+    return schedules
+
+
 def calculate_summary_stats(
     historical_metrics: List[TimeSlotMetrics],
     predictions: List[PeakTimePrediction],
@@ -643,15 +1009,20 @@ def generate_markdown_report(
         )
 
         if analysis.staffing_schedule:
+            by_queue = len({s.queue for s in analysis.staffing_schedule}) > 1
             f.write(
-                "| Start Time | End Time | Agents | Predicted Volume | "
+                ("| Queue " if by_queue else "")
+                + "| Start Time | End Time | Agents | Predicted Volume | "
                 "Cost/Shift | Service Level |\n"
             )
             f.write(
-                "|------------|----------|--------|------------------|"
+                ("|-------" if by_queue else "")
+                + "|------------|----------|--------|------------------|"
                 "------------|--------------|\n"
             )
             for schedule in analysis.staffing_schedule:
+                if by_queue:
+                    f.write(f"| {schedule.queue} ")
                 f.write(
                     f"| {schedule.start_time.strftime('%Y-%m-%d %H:%M')} | "
                     f"{schedule.end_time.strftime('%Y-%m-%d %H:%M')} | "
@@ -699,16 +1070,24 @@ def process_capacity_planning(config_path: Path) -> CapacityAnalysis:
             generated_at=datetime.now(),
         )
 
+    demand_model = build_demand_model(df, config.ticket_data, config.prediction)
     historical_metrics = analyze_historical_metrics(
-        df, config.ticket_data, config.prediction
+        df, config.ticket_data, config.prediction, demand_model
     )
+    if config.ticket_data.queue_column:
+        demand_model = build_demand_model(
+            df,
+            config.ticket_data,
+            config.prediction,
+            queue_column=config.ticket_data.queue_column,
+        )
 
     peak_predictions = predict_peak_times(
         historical_metrics, config.prediction, config.staffing
     )
 
-    staffing_schedule = optimize_staffing_schedule(
-        peak_predictions, config.staffing
+    staffing_schedule = plan_staffing(
+        demand_model, config.staffing, config.prediction
     )
 
     summary_stats = calculate_summary_stats(
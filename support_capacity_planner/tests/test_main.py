@@ -0,0 +1,189 @@
+"""Tests for support capacity planning."""
+
+import math
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+import yaml
+
+from support_capacity_planner.src.main import (
+    PredictionConfig,
+    StaffingConfig,
+    TicketDataConfig,
+    build_demand_model,
+    erlang_c_service_level,
+    plan_shifts,
+    process_capacity_planning,
+    required_agents,
+)
+
+
+def factorial_service_level(arrival_rate, agents, config):
+    """Erlang-C service level for one slot using the factorial form."""
+    load = arrival_rate / config.avg_tickets_per_agent_per_hour
+    if load <= 0:
+        return 1.0
+    if agents <= load:
+        return 0.0
+    top = load**agents / math.factorial(agents) * agents / (agents - load)
+    bottom = sum(load**k / math.factorial(k) for k in range(agents)) + top
+    answer_hours = config.target_answer_time_minutes / 60
+    return 1 - top / bottom * math.exp(
+        -(agents - load) * config.avg_tickets_per_agent_per_hour * answer_hours
+    )
+
+
+def test_build_demand_model_folds_slots_per_week():
+    """Test hour-of-week folding, per-week variance and queue rows."""
+    now = datetime(2024, 1, 29)  # Monday 00:00
+    monday_9am = [datetime(2024, 1, 15, 9, 10), datetime(2024, 1, 22, 9, 20)]
+    created = (
+        [monday_9am[0]] * 2
+        + [monday_9am[1]] * 4
+        + [datetime(2024, 1, 17, 14, 5)]
+        + [datetime(2024, 1, 10, 9, 0)]  # before the lookback window
+    )
+    df = pd.DataFrame(
+        {
+            "ticket_id": range(len(created)),
+            "created_at": pd.to_datetime(created),
+            "resolved_at": pd.to_datetime(created) + pd.to_timedelta(
+                [30, 30, 10, 20, 40, 90, 15, 5], unit="m"
+            ),
+            "queue": ["billing", "tech", "tech", "tech", "billing", "billing", "tech", "tech"],
+        }
+    )
+    config = TicketDataConfig(file_path="tickets.csv", resolved_time_column="resolved_at")
+    prediction_config = PredictionConfig(lookback_days=14)
+
+    model = build_demand_model(df, config, prediction_config, now=now)
+
+    monday_slot = 9
+    wednesday_slot = 2 * 24 + 14
+    assert model.queues == ["all"]
+    assert model.ticket_counts.sum() == 7
+    assert model.ticket_counts[0, monday_slot] == 6
+    assert model.ticket_counts[0, wednesday_slot] == 1
+    assert model.slot_occurrences[monday_slot] == 2
+    assert model.slot_occurrences[0] == 3
+    assert model.slot_occurrences.sum() == 14 * 24 + 1
+    assert model.hourly_mean[0, monday_slot] == pytest.approx(3.0)
+    assert model.hourly_variance[0, monday_slot] == pytest.approx(2.0)
+    assert model.hourly_variance[0, wednesday_slot] == pytest.approx(0.5)
+    assert model.resolution_p50_minutes[0, monday_slot] == pytest.approx(30.0)
+
+    by_queue = build_demand_model(
+        df, config, prediction_config, queue_column="queue", now=now
+    )
+    assert by_queue.queues == ["billing", "tech"]
+    assert by_queue.ticket_counts[:, monday_slot].tolist() == [3, 3]
+    assert by_queue.hourly_variance[:, monday_slot] == pytest.approx([0.5, 0.5])
+    np.testing.assert_array_equal(
+        by_queue.ticket_counts.sum(axis=0), model.ticket_counts[0]
+    )
+
+
+def test_erlang_c_service_level_matches_factorial_form():
+    """Test broadcasting a head-count sweep against the factorial Erlang-C."""
+    config = StaffingConfig(target_answer_time_minutes=5)
+    arrivals = np.array([[12.0, 0.0, 20.0, 31.5], [5.0, 9.0, 14.0, 2.5]])
+    agent_counts = np.arange(3, 8).reshape(-1, 1, 1)
+
+    service_levels = erlang_c_service_level(arrivals, agent_counts, config)
+
+    assert service_levels.shape == (5, 2, 4)
+    expected = np.array(
+        [
+            [[factorial_service_level(rate, int(agents), config) for rate in row]
+             for row in arrivals]
+            for agents in agent_counts.ravel()
+        ]
+    )
+    np.testing.assert_allclose(service_levels, expected, atol=1e-12)
+
+    elementwise = erlang_c_service_level(arrivals, np.full(arrivals.shape, 6), config)
+    np.testing.assert_allclose(elementwise, service_levels[3])
+
+
+def test_required_agents_clips_to_shift_bounds():
+    """Test the smallest head count meeting target, clipped to min and max."""
+    config = StaffingConfig(
+        min_agents_per_shift=2,
+        max_agents_per_shift=20,
+        target_service_level=0.8,
+        target_answer_time_minutes=10,
+    )
+    arrivals = np.array([0.0, 1.0, 22.0, 40.0, 500.0])
+
+    agents = required_agents(arrivals, config)
+
+    smallest = next(
+        n
+        for n in range(config.max_agents_per_shift + 1)
+        if factorial_service_level(40.0, n, config) >= config.target_service_level
+    )
+    assert agents[0] == config.min_agents_per_shift
+    assert agents[1] == config.min_agents_per_shift
+    assert agents[3] == smallest
+    assert agents[4] == config.max_agents_per_shift
+    assert factorial_service_level(22.0, int(agents[2]), config) >= 0.8
+    assert factorial_service_level(22.0, int(agents[2]) - 1, config) < 0.8
+
+
+@pytest.mark.parametrize("first_hour_of_day", [0, 1, 5])
+def test_plan_shifts_covers_requirement_on_allowed_starts(first_hour_of_day):
+    """Test shift cover with a start interval longer than one hour."""
+    config = StaffingConfig(shift_duration_hours=4, shift_start_interval_hours=3)
+    required = np.array(
+        [
+            [0, 0, 3, 3, 0, 0, 2, 2, 2, 2, 5, 1],
+            [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+        ]
+    )
+
+    starts = plan_shifts(required, config, first_hour_of_day)
+
+    hours = required.shape[1]
+    coverage = np.zeros_like(required)
+    for hour in range(hours):
+        coverage[:, hour : hour + 4] += starts[:, hour : hour + 1]
+    assert (coverage >= required).all()
+
+    start_hours = np.flatnonzero(starts.any(axis=0))
+    assert all(
+        hour == 0 or (first_hour_of_day + hour) % 3 == 0 for hour in start_hours
+    )
+    if first_hour_of_day == 0:
+        assert starts[0].tolist() == [3, 0, 0, 0, 0, 0, 2, 0, 0, 5, 0, 0]
+
+
+def test_process_capacity_planning_staffs_each_queue(tmp_path):
+    """Test queue_column from config gives every queue its own shifts."""
+    now = datetime.now().replace(minute=0, second=0, microsecond=0)
+    created = [now - timedelta(days=day, hours=hour) for day in range(1, 8) for hour in range(24)]
+    pd.DataFrame(
+        {
+            "ticket_id": range(len(created) * 2),
+            "created_at": created * 2,
+            "queue": ["billing"] * len(created) + ["tech"] * len(created),
+        }
+    ).to_csv(tmp_path / "tickets.csv", index=False)
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        yaml.safe_dump(
+            {
+                "ticket_data": {"file_path": "tickets.csv", "queue_column": "queue"},
+                "prediction": {"lookback_days": 14, "prediction_horizon_days": 1},
+                "report": {"output_path": "report.md"},
+            }
+        )
+    )
+
+    analysis = process_capacity_planning(config_path)
+
+    queues = {schedule.queue for schedule in analysis.staffing_schedule}
+    assert queues == {"billing", "tech"}
+    assert sum(m.ticket_count for m in analysis.historical_metrics) == len(created) * 2
+    assert "| Queue |" in (tmp_path / "report.md").read_text()
@@ -0,0 +1,166 @@
+"""Benchmark compiled keyword matching for categorisation and quote extraction.
+
+Builds synthetic testimonials and a keyword catalogue with thousands of
+product and service keywords, then reports testimonials/sec for:
+
+- substring: the previous per-keyword ``keyword in text`` categorisation and
+  per-indicator sentence checks, on a subset of the testimonials
+- compiled: categorize_testimonial and extract_quotes with matchers compiled
+  once, one testimonial at a time
+- batch: annotate_testimonials over the whole batch
+
+Run from the repository root:
+
+    python -m testimonial_processor.benchmarks.keyword_matching
+"""
+
+import argparse
+import logging
+import re
+import time
+from typing import List, Optional
+
+import numpy as np
+
+from testimonial_processor.src.main import (
+    CategorizationConfig,
+    QuoteExtractionConfig,
+    TestimonialRecord,
+    annotate_testimonials,
+    build_category_matcher,
+    build_indicator_matcher,
+    categorize_testimonial,
+    extract_quotes,
+)
+
+FILLER = np.array(
+    [
+        "The onboarding went smoothly.",
+        "Our team said it saved hours every week!",
+        "Pricing was fair for what we got.",
+        "Support answered quickly and stated the fix clearly.",
+        "We would recommend it to other teams.",
+        "Setup took longer than expected?",
+    ]
+)
+
+
+def build_config(keywords: int, rng: np.random.Generator) -> CategorizationConfig:
+    """Spread keywords over products and services, four per label."""
+    terms = [f"widget {i:05d}" for i in range(keywords)]
+    rng.shuffle(terms)
+    labels = max(keywords // 4, 1)
+    products = {f"Product {i}": terms[i::labels] for i in range(labels // 2)}
+    services = {f"Service {i}": terms[i::labels] for i in range(labels // 2, labels)}
+    return CategorizationConfig(product_keywords=products, service_keywords=services)
+
+
+def build_testimonials(
+    count: int, keywords: int, rng: np.random.Generator
+) -> List[TestimonialRecord]:
+    """Build testimonials of three sentences, half mentioning a keyword."""
+    sentences = rng.choice(FILLER, (count, 3))
+    mentions = rng.integers(0, keywords * 2, count)
+    texts = [
+        f"{a} I use widget {m:05d} daily. {b} {c}" if m < keywords else f"{a} {b} {c}"
+        for (a, b, c), m in zip(sentences.tolist(), mentions.tolist())
+    ]
+    return [
+        TestimonialRecord(
+            testimonial_id=str(i), customer_name="Customer", testimonial_text=text
+        )
+        for i, text in enumerate(texts)
+    ]
+
+
+def substring_categorize(
+    text: str, config: CategorizationConfig
+) -> Optional[str]:
+    """Previous categorisation: one substring test per keyword."""
+    text_lower = text.lower()
+    for keywords_map in (config.product_keywords, config.service_keywords):
+        for label, keywords in keywords_map.items():
+            if any(keyword.lower() in text_lower for keyword in keywords):
+                return label
+    return None
+
+
+def substring_quotes(text: str, config: QuoteExtractionConfig) -> int:
+    """Previous sentence pass: re-lowercase each sentence per indicator."""
+    quotes = 0
+    sentences = re.findall(r"[^.!?]*[.!?]", text)
+    for sentence in sentences:
+        sentence = sentence.strip()
+        if config.min_quote_length <= len(sentence) <= config.max_quote_length:
+            if any(
+                indicator.lower() in sentence.lower()
+                for indicator in config.quote_indicators
+            ) or len(sentences) == 1:
+                text.find(sentence)
+                text.find(sentence)
+                quotes += 1
+    return quotes
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--testimonials", type=int, default=1_000_000, help="Number of testimonials"
+    )
+    parser.add_argument(
+        "--keywords", type=int, default=5_000, help="Category keywords"
+    )
+    parser.add_argument(
+        "--substring-testimonials",
+        type=int,
+        default=2_000,
+        help="Testimonials run through the substring baseline",
+    )
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    rng = np.random.default_rng(7)
+    categorization = build_config(args.keywords, rng)
+    quote_config = QuoteExtractionConfig()
+    testimonials = build_testimonials(args.testimonials, args.keywords, rng)
+
+    subset = testimonials[: args.substring_testimonials]
+    start = time.perf_counter()
+    for testimonial in subset:
+        substring_quotes(testimonial.testimonial_text, quote_config)
+        substring_categorize(testimonial.testimonial_text, categorization)
+    elapsed = time.perf_counter() - start
+    print(
+        f"substring: {len(subset)} testimonials, {args.keywords} keywords, "
+        f"{len(subset) / elapsed:,.0f} testimonials/sec"
+    )
+
+    start = time.perf_counter()
+    category_matcher = build_category_matcher(categorization)
+    indicator_matcher = build_indicator_matcher(quote_config)
+    compile_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for testimonial in testimonials:
+        extract_quotes(testimonial, quote_config, indicator_matcher)
+        categorize_testimonial(testimonial, categorization, category_matcher)
+    elapsed = time.perf_counter() - start
+    print(
+        f"compiled: {len(testimonials)} testimonials in {elapsed:.2f}s "
+        f"(compile {compile_seconds:.2f}s), "
+        f"{len(testimonials) / elapsed:,.0f} testimonials/sec"
+    )
+
+    start = time.perf_counter()
+    annotate_testimonials(testimonials, quote_config, categorization)
+    elapsed = time.perf_counter() - start
+    categorized = sum(1 for t in testimonials if t.category)
+    print(
+        f"batch: {len(testimonials)} testimonials ({categorized} categorised) in "
+        f"{elapsed:.2f}s, {len(testimonials) / elapsed:,.0f} testimonials/sec"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -4,15 +4,18 @@ Automatically processes customer testimonials by extracting quotes, categorizing
 by product or service, and generating marketing materials with permission tracking.
 """
 
+import bisect
 import json
 import logging
 import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 
+import numpy as np
 import pandas as pd
 import yaml
 from pydantic import BaseModel, Field, field_validator
@@ -24,6 +27,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_SENTENCE_PATTERN = re.compile(r"[^.!?]*[.!?]")
+
 
 class PermissionStatus(str, Enum):
     """Permission status enumeration."""
@@ -312,14 +317,232 @@ def load_testimonial_data(
         raise
 
 
+@dataclass
+class KeywordHit:
+    """Occurrence of a configured keyword in a text."""
+
+    keyword: str
+    labels: List[str]
+    start: int
+    end: int
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """Compile keywords into a trie-shaped regular expression.
+
+    Sibling branches start with different characters, so the engine never
+    backtracks between keywords and greedy optional groups yield the longest
+    keyword at each position.
+    """
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [
+            re.escape(char) + build(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """Case-insensitive multi-keyword substring matcher.
+
+    All keywords are compiled once into a single regular expression, so each
+    text is scanned in one pass no matter how many keywords are configured.
+    Overlapping occurrences are reported, giving the same answers as testing
+    ``keyword.lower() in text.lower()`` for every keyword.
+    """
+
+    def __init__(self, keywords_by_label: Sequence[Tuple[str, Sequence[str]]]) -> None:
+        """Compile the matcher.
+
+        Args:
+            keywords_by_label: (label, keywords) pairs in priority order
+        """
+        self.labels = [label for label, _ in keywords_by_label]
+        self._keyword_labels: Dict[str, List[int]] = {}
+        for rank, (_, keywords) in enumerate(keywords_by_label):
+            for keyword in keywords:
+                keyword = keyword.lower()
+                if not keyword or "\x00" in keyword:
+                    continue
+                ranks = self._keyword_labels.setdefault(keyword, [])
+                if rank not in ranks:
+                    ranks.append(rank)
+
+        self._prefixes = {
+            keyword: [
+                keyword[:length]
+                for length in range(len(keyword), 0, -1)
+                if keyword[:length] in self._keyword_labels
+            ]
+            for keyword in self._keyword_labels
+        }
+        self._pattern = (
+            re.compile(f"(?=({_trie_pattern(self._keyword_labels)}))", re.IGNORECASE)
+            if self._keyword_labels
+            else None
+        )
+
+    def _occurrences(self, text: str) -> Iterator[Tuple[int, str]]:
+        """Yield (start, keyword) for every keyword occurrence in text."""
+        if self._pattern is None:
+            return
+        for match in self._pattern.finditer(text):
+            longest = match.group(1).lower()
+            for keyword in self._prefixes.get(longest, ()):
+                yield match.start(), keyword
+
+    def finditer(self, text: str) -> Iterator[KeywordHit]:
+        """Yield every keyword occurrence in text, ordered by start offset.
+
+        Args:
+            text: Text to scan
+
+        Yields:
+            KeywordHit for each occurrence, longest keyword first at a position
+        """
+        for start, keyword in self._occurrences(text):
+            yield KeywordHit(
+                keyword=keyword,
+                labels=[self.labels[rank] for rank in self._keyword_labels[keyword]],
+                start=start,
+                end=start + len(keyword),
+            )
+
+    def first_label(self, text: str) -> Optional[str]:
+        """Highest-priority label with a keyword in text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Label name, or None if no keyword occurs
+        """
+        best = min(
+            (
+                self._keyword_labels[keyword][0]
+                for _, keyword in self._occurrences(text)
+            ),
+            default=None,
+        )
+        return self.labels[best] if best is not None else None
+
+    def first_labels(self, texts: Sequence[str]) -> List[Optional[str]]:
+        """Batch version of first_label over many texts.
+
+        Texts are joined with NUL separators and scanned in a single pass,
+        then hits are mapped back to their text by offset.
+
+        Args:
+            texts: Texts to scan
+
+        Returns:
+            Highest-priority label per text, None where nothing matched
+        """
+        if self._pattern is None or not texts:
+            return [None] * len(texts)
+
+        lengths = np.fromiter((len(text) + 1 for text in texts), dtype=np.int64)
+        offsets = np.cumsum(lengths) - lengths
+        positions = []
+        ranks = []
+        for start, keyword in self._occurrences("\x00".join(texts)):
+            positions.append(start)
+            ranks.append(self._keyword_labels[keyword][0])
+
+        best = np.full(len(texts), len(self.labels), dtype=np.int64)
+        if positions:
+            owners = np.searchsorted(offsets, positions, side="right") - 1
+            np.minimum.at(best, owners, ranks)
+        return [
+            self.labels[rank] if rank < len(self.labels) else None
+            for rank in best.tolist()
+        ]
+
+
+def build_category_matcher(config: CategorizationConfig) -> KeywordMatcher:
+    """Compile product then service keywords into one matcher.
+
+    Args:
+        config: Categorization configuration
+
+    Returns:
+        Matcher whose label priority follows the configuration order
+    """
+    return KeywordMatcher(
+        list(config.product_keywords.items()) + list(config.service_keywords.items())
+    )
+
+
+def build_indicator_matcher(config: QuoteExtractionConfig) -> KeywordMatcher:
+    """Compile quote indicators into one matcher.
+
+    Args:
+        config: Quote extraction configuration
+
+    Returns:
+        Matcher labelling every hit "indicator"
+    """
+    return KeywordMatcher([("indicator", config.quote_indicators)])
+
+
+@lru_cache(maxsize=32)
+def _cached_matcher(
+    keywords_by_label: Tuple[Tuple[str, Tuple[str, ...]], ...]
+) -> KeywordMatcher:
+    """Compile a matcher once per distinct keyword configuration."""
+    return KeywordMatcher(keywords_by_label)
+
+
+def _category_matcher(config: CategorizationConfig) -> KeywordMatcher:
+    """Cached build_category_matcher for per-record callers."""
+    return _cached_matcher(
+        tuple(
+            (label, tuple(keywords))
+            for keywords_map in (config.product_keywords, config.service_keywords)
+            for label, keywords in keywords_map.items()
+        )
+    )
+
+
+def _indicator_matcher(config: QuoteExtractionConfig) -> KeywordMatcher:
+    """Cached build_indicator_matcher for per-record callers."""
+    return _cached_matcher((("indicator", tuple(config.quote_indicators)),))
+
+
+def _contains_hit(hits: List[Tuple[int, int]], start: int, end: int) -> bool:
+    """Whether any (hit_start, hit_end) span, sorted by start, lies in [start, end)."""
+    position = bisect.bisect_left(hits, (start,))
+    while position < len(hits) and hits[position][0] < end:
+        if hits[position][1] <= end:
+            return True
+        position += 1
+    return False
+
+
 def extract_quotes(
-    testimonial: TestimonialRecord, config: QuoteExtractionConfig
+    testimonial: TestimonialRecord,
+    config: QuoteExtractionConfig,
+    indicator_matcher: Optional[KeywordMatcher] = None,
 ) -> List[Quote]:
     """Extract quotes from testimonial text.
 
     Args:
         testimonial: Testimonial record
         config: Quote extraction configuration
+        indicator_matcher: Compiled quote indicators, built from config if omitted
 
     Returns:
         List of extracted quotes
@@ -328,25 +551,26 @@ def extract_quotes(
     text = testimonial.testimonial_text
 
     if config.extract_full_sentences:
-        sentence_pattern = r"[^.!?]*[.!?]"
-        sentences = re.findall(sentence_pattern, text)
+        sentences = list(_SENTENCE_PATTERN.finditer(text))
+        matcher = indicator_matcher or _indicator_matcher(config)
+        hits = [(hit.start, hit.end) for hit in matcher.finditer(text)]
 
-        for sentence in sentences:
-            sentence = sentence.strip()
+        for match in sentences:
+            raw = match.group()
+            sentence = raw.strip()
             if (
                 config.min_quote_length
                 <= len(sentence)
                 <= config.max_quote_length
             ):
-                has_indicator = any(
-                    indicator.lower() in sentence.lower()
-                    for indicator in config.quote_indicators
-                )
+                start = match.start() + len(raw) - len(raw.lstrip())
+                end = start + len(sentence)
+                has_indicator = _contains_hit(hits, start, end)
                 if has_indicator or len(sentences) == 1:
                     quote = Quote(
                         quote_text=sentence,
-                        start_position=text.find(sentence),
-                        end_position=text.find(sentence) + len(sentence),
+                        start_position=start,
+                        end_position=end,
                     )
                     quotes.append(quote)
     else:
@@ -384,13 +608,16 @@ def extract_quotes(
 
 
 def categorize_testimonial(
-    testimonial: TestimonialRecord, config: CategorizationConfig
+    testimonial: TestimonialRecord,
+    config: CategorizationConfig,
+    matcher: Optional[KeywordMatcher] = None,
 ) -> Optional[str]:
     """Categorize testimonial by product or service.
 
     Args:
         testimonial: Testimonial record
         config: Categorization configuration
+        matcher: Compiled category keywords, built from config if omitted
 
     Returns:
         Category name if found, None otherwise
@@ -404,17 +631,51 @@ def categorize_testimonial(
     if not config.auto_categorize:
         return None
 
-    text_lower = testimonial.testimonial_text.lower()
+    return (matcher or _category_matcher(config)).first_label(
+        testimonial.testimonial_text
+    )
+
+
+def annotate_testimonials(
+    testimonials: List[TestimonialRecord],
+    quote_config: QuoteExtractionConfig,
+    categorization_config: CategorizationConfig,
+) -> int:
+    """Extract quotes and categories for a whole batch of testimonials.
+
+    Keyword and indicator matchers are compiled once for the batch, and
+    testimonials without a category or product are categorized in a single
+    scan over their concatenated texts.
+
+    Args:
+        testimonials: Testimonial records, updated in place
+        quote_config: Quote extraction configuration
+        categorization_config: Categorization configuration
+
+    Returns:
+        Number of quotes extracted
+    """
+    indicator_matcher = build_indicator_matcher(quote_config)
+    quotes_count = 0
+    for testimonial in testimonials:
+        testimonial.quotes = extract_quotes(
+            testimonial, quote_config, indicator_matcher
+        )
+        quotes_count += len(testimonial.quotes)
 
-    for product, keywords in config.product_keywords.items():
-        if any(keyword.lower() in text_lower for keyword in keywords):
-            return product
+    for testimonial in testimonials:
+        if not testimonial.category and testimonial.product:
+            testimonial.category = testimonial.product
 
-    for service, keywords in config.service_keywords.items():
-        if any(keyword.lower() in text_lower for keyword in keywords):
-            return service
+    if categorization_config.auto_categorize:
+        uncategorized = [t for t in testimonials if not t.category]
+        categories = build_category_matcher(categorization_config).first_labels(
+            [t.testimonial_text for t in uncategorized]
+        )
+        for testimonial, category in zip(uncategorized, categories):
+            testimonial.category = category
 
-    return None
+    return quotes_count
 
 
 def load_permissions(permission_file: Path) -> Dict[str, PermissionStatus]:
@@ -634,16 +895,11 @@ def process_testimonials(config_path: Path) -> Dict[str, any]:
 
     permissions = load_permissions(permission_file)
 
-    quotes_count = 0
-    for testimonial in testimonials:
-        quotes = extract_quotes(testimonial, config.quote_extraction)
-        testimonial.quotes = quotes
-        quotes_count += len(quotes)
-
-        category = categorize_testimonial(testimonial, config.categorization)
-        if category:
-            testimonial.category = category
+    quotes_count = annotate_testimonials(
+        testimonials, config.quote_extraction, config.categorization
+    )
 
+    for testimonial in testimonials:
         if testimonial.testimonial_id not in permissions:
             permissions[testimonial.testimonial_id] = (
                 config.permission.default_permission_status
@@ -4,6 +4,7 @@ import pytest
 
 from testimonial_processor.src.main import (
     CategorizationConfig,
+    KeywordMatcher,
     PermissionStatus,
     QuoteExtractionConfig,
     TestimonialRecord,
@@ -166,3 +167,40 @@ def test_extract_quotes_length_limits():
 
     assert all(len(q.quote_text) <= config.max_quote_length for q in quotes)
     assert all(len(q.quote_text) >= config.min_quote_length for q in quotes)
+
+
+def test_keyword_matcher_matches_substring_checks():
+    """Test compiled matcher agrees with per-keyword substring checks."""
+    keywords = [
+        ("Support", ["help", "helpdesk"]),
+        ("Product A", ["desk", "Product A", "product"]),
+        ("Product B", ["a f", "feature z"]),
+    ]
+    texts = [
+        "The HELPDESK team was great.",
+        "Product a features were solid.",
+        "Loved feature Z and the desk.",
+        "Nothing relevant here.",
+        "",
+    ]
+    matcher = KeywordMatcher(keywords)
+
+    for text in texts:
+        expected = {
+            keyword.lower()
+            for _, label_keywords in keywords
+            for keyword in label_keywords
+            if keyword.lower() in text.lower()
+        }
+        hits = list(matcher.finditer(text))
+        assert {hit.keyword for hit in hits} == expected
+        assert all(text[hit.start : hit.end].lower() == hit.keyword for hit in hits)
+
+    assert matcher.first_labels(texts) == [matcher.first_label(t) for t in texts]
+    assert matcher.first_labels(texts) == [
+        "Support",
+        "Product A",
+        "Product A",
+        None,
+        None,
+    ]
@@ -0,0 +1,159 @@
+"""Benchmark batch claim validation and provider dispatch throughput.
+
+Builds in-memory warranty and claim frames, then reports claims/sec for
+process_claims_frame (column-wise coverage validation plus heap dispatch)
+and, separately, for dispatching approved claims through the provider heap
+versus re-sorting the provider list for every claim.
+
+Run from the repository root:
+
+    python -m warranty_claims_processor.benchmarks.claims_dispatch
+"""
+
+import argparse
+import logging
+import time
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from warranty_claims_processor.src.main import (
+    ProviderDispatcher,
+    ServiceProvider,
+    ValidationConfig,
+    process_claims_frame,
+)
+
+ISSUES = np.array(
+    [
+        "Screen cracked",
+        "Battery does not charge",
+        "Accidental water damage",
+        "Will not power on",
+        "Accidental drop damage",
+    ]
+)
+COVERAGE_TYPES = np.array(["standard", "extended", "accidental"])
+
+
+def build_frames(claims: int, seed: int = 7):
+    """Build warranty and claim frames shaped like the loader output."""
+    rng = np.random.default_rng(seed)
+    warranty_count = max(claims // 2, 1)
+
+    warranty_ids = np.char.add("W", np.arange(warranty_count).astype(str))
+    warranties = pd.DataFrame(
+        {
+            "warranty_start_date": np.datetime64("2022-01-01", "ns")
+            + rng.integers(0, 730, warranty_count) * np.timedelta64(1, "D"),
+            "warranty_duration_months": rng.choice([12, 24, 36], warranty_count),
+            "coverage_type": pd.Categorical(
+                rng.choice(COVERAGE_TYPES, warranty_count)
+            ),
+        },
+        index=pd.Index(warranty_ids, name="warranty_id"),
+    )
+
+    claim_frame = pd.DataFrame(
+        {
+            "claim_id": np.char.add("CL", np.arange(claims).astype(str)),
+            "warranty_id": pd.Categorical(
+                np.char.add(
+                    "W",
+                    rng.integers(0, int(warranty_count * 1.05) + 1, claims).astype(
+                        str
+                    ),
+                )
+            ),
+            "claim_date": np.datetime64("2022-06-01", "ns")
+            + rng.integers(0, 1100, claims) * np.timedelta64(1, "D"),
+            "issue_description": pd.Categorical(rng.choice(ISSUES, claims)),
+            "status": pd.Categorical(np.full(claims, "submitted")),
+            "service_provider": pd.Categorical(np.full(claims, None, dtype=object)),
+            "claim_amount": rng.uniform(50, 800, claims).round(2),
+        }
+    )
+    return warranties, claim_frame
+
+
+def build_providers(count: int) -> Dict[str, ServiceProvider]:
+    """Build providers with capacity for roughly all generated claims."""
+    return {
+        f"SP{i}": ServiceProvider(
+            provider_id=f"SP{i}", provider_name=f"Provider {i}", capacity=None
+        )
+        for i in range(count)
+    }
+
+
+def _sorted_list_assign(providers: Dict[str, ServiceProvider]) -> Optional[str]:
+    """Previous dispatch: filter and sort all providers for every claim."""
+    available = [
+        p
+        for p in providers.values()
+        if p.capacity is None or p.active_claims < p.capacity
+    ]
+    if not available:
+        return None
+    available.sort(key=lambda x: x.active_claims)
+    available[0].active_claims += 1
+    return available[0].provider_id
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--claims", type=int, default=1_000_000, help="Number of claims"
+    )
+    parser.add_argument(
+        "--providers", type=int, default=200, help="Number of service providers"
+    )
+    parser.add_argument(
+        "--sorted-list-claims",
+        type=int,
+        default=100_000,
+        help="Claims dispatched through the sorted-list baseline",
+    )
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    warranties, claims = build_frames(args.claims)
+    config = ValidationConfig(validate_coverage_type=True)
+
+    start = time.perf_counter()
+    processed = process_claims_frame(
+        claims, warranties, build_providers(args.providers), config
+    )
+    elapsed = time.perf_counter() - start
+    assigned = int(processed["service_provider"].notna().sum())
+    print(
+        f"process_claims_frame: {args.claims} claims ({assigned} dispatched) "
+        f"in {elapsed:.2f}s, {args.claims / elapsed:,.0f} claims/sec"
+    )
+
+    dispatcher = ProviderDispatcher(build_providers(args.providers))
+    start = time.perf_counter()
+    for _ in range(args.claims):
+        dispatcher.assign()
+    elapsed = time.perf_counter() - start
+    print(
+        f"heap dispatch: {args.claims} claims over {args.providers} providers, "
+        f"{args.claims / elapsed:,.0f} claims/sec"
+    )
+
+    providers = build_providers(args.providers)
+    start = time.perf_counter()
+    for _ in range(args.sorted_list_claims):
+        _sorted_list_assign(providers)
+    elapsed = time.perf_counter() - start
+    print(
+        f"sorted-list dispatch: {args.sorted_list_claims} claims over "
+        f"{args.providers} providers, "
+        f"{args.sorted_list_claims / elapsed:,.0f} claims/sec"
+    )
+
+
+if __name__ == "__main__":
+    main()
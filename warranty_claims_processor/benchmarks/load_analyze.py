@@ -0,0 +1,203 @@
+"""Benchmark load+analyze time and peak RSS for warranty claims.
+
+Generates synthetic warranty and claim files, then measures loading the
+files and running validation and analytics through the record-based path
+(one dataclass per row) and the columnar path (typed DataFrames). Each
+measurement runs in a fresh subprocess so peak RSS is reported per run.
+
+Run from the repository root:
+
+    python -m warranty_claims_processor.benchmarks.load_analyze
+"""
+
+import argparse
+import json
+import logging
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from warranty_claims_processor.src.main import (
+    ClaimDataConfig,
+    ServiceProvider,
+    ValidationConfig,
+    WarrantyDataConfig,
+    generate_analytics,
+    generate_analytics_frame,
+    load_claim_data,
+    load_claim_frame,
+    load_warranty_data,
+    load_warranty_frame,
+    process_claims,
+    process_claims_frame,
+)
+
+ISSUES = np.array(
+    [
+        "Screen cracked",
+        "Battery does not charge",
+        "Accidental water damage",
+        "Will not power on",
+        "Accidental drop damage",
+    ]
+)
+COVERAGE_TYPES = np.array(["standard", "extended", "accidental"])
+STATUSES = np.array(["submitted", "submitted", "submitted", "completed"])
+
+
+def generate_data(directory: Path, rows: int, seed: int = 7) -> None:
+    """Write synthetic warranties.csv and claims.csv with rows claims."""
+    rng = np.random.default_rng(seed)
+    warranty_count = max(rows // 2, 1)
+
+    start = np.datetime64("2022-01-01") + rng.integers(0, 730, warranty_count)
+    pd.DataFrame(
+        {
+            "warranty_id": np.char.add("W", np.arange(warranty_count).astype(str)),
+            "customer_id": np.char.add(
+                "C", rng.integers(0, warranty_count // 3 + 1, warranty_count).astype(str)
+            ),
+            "product_id": np.char.add(
+                "P", rng.integers(0, 5000, warranty_count).astype(str)
+            ),
+            "purchase_date": start,
+            "warranty_start_date": start,
+            "warranty_duration_months": rng.choice([12, 24, 36], warranty_count),
+            "coverage_type": rng.choice(COVERAGE_TYPES, warranty_count),
+        }
+    ).to_csv(directory / "warranties.csv", index=False)
+
+    amounts = rng.uniform(50, 1500, rows).round(2)
+    amounts[rng.random(rows) < 0.1] = np.nan
+    pd.DataFrame(
+        {
+            "claim_id": np.char.add("CL", np.arange(rows).astype(str)),
+            "warranty_id": np.char.add(
+                "W", rng.integers(0, int(warranty_count * 1.05) + 1, rows).astype(str)
+            ),
+            "claim_date": np.datetime64("2022-06-01") + rng.integers(0, 1100, rows),
+            "issue_description": rng.choice(ISSUES, rows),
+            "status": rng.choice(STATUSES, rows),
+            "claim_amount": amounts,
+        }
+    ).to_csv(directory / "claims.csv", index=False)
+
+
+def _configs(directory: Path):
+    """Build data configurations for the generated files."""
+    warranty_config = WarrantyDataConfig(
+        file_path=str(directory / "warranties.csv"),
+        coverage_type_column="coverage_type",
+    )
+    claim_config = ClaimDataConfig(
+        file_path=str(directory / "claims.csv"),
+        status_column="status",
+        claim_amount_column="claim_amount",
+    )
+    validation = ValidationConfig(validate_coverage_type=True)
+    return warranty_config, claim_config, validation
+
+
+def _providers() -> Dict[str, ServiceProvider]:
+    """Build a fixed set of service providers."""
+    return {
+        f"SP{i}": ServiceProvider(provider_id=f"SP{i}", provider_name=f"Provider {i}")
+        for i in range(20)
+    }
+
+
+def measure(mode: str, directory: Path) -> Dict[str, float]:
+    """Load and analyze the generated data once in this process."""
+    warranty_config, claim_config, validation = _configs(directory)
+    providers = _providers()
+
+    start = time.perf_counter()
+    if mode == "records":
+        warranties = load_warranty_data(warranty_config, directory)
+        claims = load_claim_data(claim_config, directory)
+        processed = process_claims(claims, warranties, providers, validation)
+        analytics = generate_analytics(processed, warranties, providers)
+    else:
+        warranties = load_warranty_frame(warranty_config, directory)
+        claims = load_claim_frame(claim_config, directory)
+        processed = process_claims_frame(claims, warranties, providers, validation)
+        analytics = generate_analytics_frame(processed, len(warranties), providers)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "seconds": elapsed,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "total_claims": analytics.total_claims,
+    }
+
+
+def _measure_in_subprocess(mode: str, directory: Path) -> Dict[str, float]:
+    """Run measure() in a fresh interpreter and return its result."""
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "warranty_claims_processor.benchmarks.load_analyze",
+            "--measure",
+            mode,
+            str(directory),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    """Run the benchmark across row counts."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rows",
+        type=int,
+        nargs="+",
+        default=[100_000, 1_000_000, 10_000_000],
+        help="Claim row counts to benchmark",
+    )
+    parser.add_argument(
+        "--max-record-rows",
+        type=int,
+        default=1_000_000,
+        help="Skip the record-based path above this many rows",
+    )
+    parser.add_argument(
+        "--measure", nargs=2, metavar=("MODE", "DIR"), help=argparse.SUPPRESS
+    )
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    if args.measure:
+        mode, directory = args.measure
+        print(json.dumps(measure(mode, Path(directory))))
+        return
+
+    print(f"{'rows':>10} {'path':>9} {'seconds':>9} {'peak RSS MB':>12}")
+    for rows in args.rows:
+        with tempfile.TemporaryDirectory() as tmp:
+            directory = Path(tmp)
+            generate_data(directory, rows)
+            modes: List[str] = ["columnar"]
+            if rows <= args.max_record_rows:
+                modes.insert(0, "records")
+            for mode in modes:
+                result = _measure_in_subprocess(mode, directory)
+                print(
+                    f"{rows:>10} {mode:>9} {result['seconds']:>9.2f} "
+                    f"{result['peak_rss_mb']:>12.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
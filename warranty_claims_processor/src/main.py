@@ -4,6 +4,7 @@ Automatically processes customer warranty claims by validating coverage, trackin
 claim status, coordinating with service providers, and generating warranty analytics.
 """
 
+import heapq
 import json
 import logging
 from collections import defaultdict
@@ -11,8 +12,9 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 
+import numpy as np
 import pandas as pd
 import yaml
 from pydantic import BaseModel, Field, field_validator
@@ -277,179 +279,384 @@ def load_config(config_path: Path) -> Config:
         raise
 
 
-def load_warranty_data(
+def _resolve_data_path(file_path: str, project_root: Path) -> Path:
+    """Resolve a data file path relative to the project root."""
+    data_path = Path(file_path)
+    if not data_path.is_absolute():
+        data_path = project_root / data_path
+    return data_path
+
+
+def _read_data_frame(
+    data_path: Path,
+    file_format: str,
+    id_columns: Optional[List[Optional[str]]] = None,
+    category_columns: Optional[List[Optional[str]]] = None,
+) -> pd.DataFrame:
+    """Read a CSV or JSON data file into a DataFrame.
+
+    Args:
+        data_path: Path to the data file
+        file_format: File format (csv or json)
+        id_columns: Columns to read as strings (None entries are ignored)
+        category_columns: Columns to read as string categoricals (None
+            entries are ignored)
+
+    Raises:
+        ValueError: If the format is unsupported
+    """
+    id_columns = [column for column in id_columns or [] if column]
+    category_columns = [column for column in category_columns or [] if column]
+    if file_format.lower() == "csv":
+        dtypes = {column: str for column in id_columns}
+        dtypes.update(
+            {column: pd.CategoricalDtype() for column in category_columns}
+        )
+        df = pd.read_csv(data_path, dtype=dtypes)
+        for column in category_columns:
+            if column in df.columns:
+                df[column] = df[column].cat.rename_categories(
+                    df[column].cat.categories.astype(str)
+                )
+        return df
+    if file_format.lower() == "json":
+        df = pd.read_json(data_path)
+        for column in id_columns:
+            if column in df.columns:
+                df[column] = df[column].where(df[column].isna(), df[column].astype(str))
+        for column in category_columns:
+            if column in df.columns:
+                df[column] = (
+                    df[column]
+                    .where(df[column].isna(), df[column].astype(str))
+                    .astype("category")
+                )
+        return df
+    raise ValueError(f"Unsupported format: {file_format}")
+
+
+def _optional_column(
+    df: pd.DataFrame, column: Optional[str], dtype: str
+) -> pd.Series:
+    """Return a configured optional column, or an all-missing column."""
+    if column and column in df.columns:
+        return df[column].astype(dtype)
+    return pd.Series(pd.NA, index=df.index, dtype=dtype)
+
+
+def _nullable_values(series: pd.Series) -> List:
+    """Convert a column to a list with missing values as None."""
+    return series.astype(object).where(series.notna(), None).tolist()
+
+
+def _category_column(df: pd.DataFrame, column: Optional[str]) -> pd.Series:
+    """Return a configured column as a string categorical.
+
+    Missing optional columns become an all-missing categorical column.
+    """
+    if not column or column not in df.columns:
+        return pd.Series(pd.NA, index=df.index, dtype="category")
+    series = df[column]
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series
+    return series.where(series.isna(), series.astype(str)).astype("category")
+
+
+def _category_positions(series: pd.Series, index: pd.Index) -> np.ndarray:
+    """Return each row's position in index, or -1 where it is absent.
+
+    Lookups are done once per category rather than once per row.
+    """
+    series = series.astype("category")
+    category_positions = index.get_indexer(series.cat.categories.astype(str))
+    return np.append(category_positions, -1)[series.cat.codes.to_numpy()]
+
+
+def _category_flags(
+    series: pd.Series, predicate: Callable[[pd.Index], Iterable[bool]]
+) -> np.ndarray:
+    """Evaluate predicate once per category and broadcast it to the rows.
+
+    Missing values are False.
+    """
+    series = series.astype("category")
+    category_flags = np.asarray(
+        predicate(series.cat.categories.astype(str)), dtype=bool
+    )
+    return np.append(category_flags, False)[series.cat.codes.to_numpy()]
+
+
+def _format_dates(values: np.ndarray, date_format: str) -> np.ndarray:
+    """Format datetime64 values, formatting each distinct date only once."""
+    unique_values, inverse = np.unique(values, return_inverse=True)
+    formatted = pd.DatetimeIndex(unique_values).strftime(date_format)
+    return np.asarray(formatted, dtype=object)[inverse]
+
+
+def load_warranty_frame(
     config: WarrantyDataConfig, project_root: Path
-) -> Dict[str, WarrantyRecord]:
-    """Load warranty data from file.
+) -> pd.DataFrame:
+    """Load warranty data into a typed DataFrame.
 
     Args:
         config: Warranty data configuration
         project_root: Project root directory
 
     Returns:
-        Dictionary mapping warranty_id to WarrantyRecord
+        DataFrame indexed by warranty_id (last row wins for duplicates) with
+        customer_id, product_id and coverage_type (categorical),
+        purchase_date, warranty_start_date and warranty_duration_months
+        columns
 
     Raises:
         FileNotFoundError: If data file does not exist
         ValueError: If data format is invalid
     """
-    data_path = Path(config.file_path)
-    if not data_path.is_absolute():
-        data_path = project_root / data_path
-
+    data_path = _resolve_data_path(config.file_path, project_root)
     if not data_path.exists():
         raise FileNotFoundError(f"Warranty data file not found: {data_path}")
 
-    warranties = {}
+    columns = [
+        "customer_id",
+        "product_id",
+        "purchase_date",
+        "warranty_start_date",
+        "warranty_duration_months",
+        "coverage_type",
+    ]
 
     try:
-        if config.format.lower() == "csv":
-            df = pd.read_csv(data_path)
-        elif config.format.lower() == "json":
-            df = pd.read_json(data_path)
-        else:
-            raise ValueError(f"Unsupported format: {config.format}")
-
-        required_columns = [
-            config.warranty_id_column,
-            config.customer_id_column,
-            config.product_id_column,
-            config.purchase_date_column,
-            config.warranty_start_date_column,
-            config.warranty_duration_months_column,
-        ]
-        missing = [col for col in required_columns if col not in df.columns]
-        if missing:
-            raise ValueError(f"Missing required columns: {missing}")
-
-        df[config.purchase_date_column] = pd.to_datetime(
-            df[config.purchase_date_column]
-        )
-        df[config.warranty_start_date_column] = pd.to_datetime(
-            df[config.warranty_start_date_column]
+        df = _read_data_frame(
+            data_path,
+            config.format,
+            [config.warranty_id_column],
+            [
+                config.customer_id_column,
+                config.product_id_column,
+                config.coverage_type_column,
+            ],
         )
-
-        for _, row in df.iterrows():
-            warranty = WarrantyRecord(
-                warranty_id=str(row[config.warranty_id_column]),
-                customer_id=str(row[config.customer_id_column]),
-                product_id=str(row[config.product_id_column]),
-                purchase_date=row[config.purchase_date_column],
-                warranty_start_date=row[config.warranty_start_date_column],
-                warranty_duration_months=int(
-                    row[config.warranty_duration_months_column]
-                ),
-            )
-
-            if (
-                config.coverage_type_column
-                and config.coverage_type_column in df.columns
-            ):
-                if pd.notna(row[config.coverage_type_column]):
-                    warranty.coverage_type = str(row[config.coverage_type_column])
-
-            warranties[warranty.warranty_id] = warranty
-
-        logger.info(f"Loaded {len(warranties)} warranty records")
-        return warranties
-
     except pd.errors.EmptyDataError:
         logger.warning(f"Warranty data file is empty: {data_path}")
-        return {}
+        return pd.DataFrame(columns=columns, index=pd.Index([], name="warranty_id"))
     except Exception as e:
         logger.error(f"Failed to load warranty data: {e}")
         raise
 
+    required_columns = [
+        config.warranty_id_column,
+        config.customer_id_column,
+        config.product_id_column,
+        config.purchase_date_column,
+        config.warranty_start_date_column,
+        config.warranty_duration_months_column,
+    ]
+    missing = [col for col in required_columns if col not in df.columns]
+    if missing:
+        raise ValueError(f"Missing required columns: {missing}")
+
+    frame = pd.DataFrame(
+        {
+            "warranty_id": df[config.warranty_id_column].astype(str),
+            "customer_id": _category_column(df, config.customer_id_column),
+            "product_id": _category_column(df, config.product_id_column),
+            "purchase_date": pd.to_datetime(df[config.purchase_date_column]),
+            "warranty_start_date": pd.to_datetime(df[config.warranty_start_date_column]),
+            "warranty_duration_months": np.trunc(
+                df[config.warranty_duration_months_column].astype("float64")
+            ).astype("int64"),
+            "coverage_type": _category_column(df, config.coverage_type_column),
+        }
+    )
+    frame = frame.drop_duplicates("warranty_id", keep="last").set_index("warranty_id")
+
+    logger.info(f"Loaded {len(frame)} warranty records")
+    return frame
 
-def load_claim_data(
-    config: ClaimDataConfig, project_root: Path
-) -> List[ClaimRecord]:
-    """Load claim data from file.
+
+def load_claim_frame(config: ClaimDataConfig, project_root: Path) -> pd.DataFrame:
+    """Load claim data into a typed DataFrame.
 
     Args:
         config: Claim data configuration
         project_root: Project root directory
 
     Returns:
-        List of ClaimRecord objects
+        DataFrame with claim_id, claim_date and claim_amount columns and
+        categorical warranty_id, issue_description, status (claim status
+        values, defaulting to submitted) and service_provider columns
 
     Raises:
         FileNotFoundError: If data file does not exist
         ValueError: If data format is invalid
     """
-    data_path = Path(config.file_path)
-    if not data_path.is_absolute():
-        data_path = project_root / data_path
-
+    data_path = _resolve_data_path(config.file_path, project_root)
     if not data_path.exists():
         raise FileNotFoundError(f"Claim data file not found: {data_path}")
 
-    claims = []
+    columns = [
+        "claim_id",
+        "warranty_id",
+        "claim_date",
+        "issue_description",
+        "status",
+        "service_provider",
+        "claim_amount",
+    ]
 
     try:
-        if config.format.lower() == "csv":
-            df = pd.read_csv(data_path)
-        elif config.format.lower() == "json":
-            df = pd.read_json(data_path)
-        else:
-            raise ValueError(f"Unsupported format: {config.format}")
+        df = _read_data_frame(
+            data_path,
+            config.format,
+            [config.claim_id_column],
+            [
+                config.warranty_id_column,
+                config.issue_description_column,
+                config.status_column,
+                config.service_provider_column,
+            ],
+        )
+    except pd.errors.EmptyDataError:
+        logger.warning(f"Claim data file is empty: {data_path}")
+        return pd.DataFrame(columns=columns)
+    except Exception as e:
+        logger.error(f"Failed to load claim data: {e}")
+        raise
 
-        required_columns = [
-            config.claim_id_column,
-            config.warranty_id_column,
-            config.claim_date_column,
-            config.issue_description_column,
-        ]
-        missing = [col for col in required_columns if col not in df.columns]
-        if missing:
-            raise ValueError(f"Missing required columns: {missing}")
+    required_columns = [
+        config.claim_id_column,
+        config.warranty_id_column,
+        config.claim_date_column,
+        config.issue_description_column,
+    ]
+    missing = [col for col in required_columns if col not in df.columns]
+    if missing:
+        raise ValueError(f"Missing required columns: {missing}")
 
-        df[config.claim_date_column] = pd.to_datetime(df[config.claim_date_column])
+    status_values = pd.Index([status_value.value for status_value in ClaimStatus])
+    status_codes = np.full(
+        len(df), status_values.get_loc(ClaimStatus.SUBMITTED.value)
+    )
+    if config.status_column and config.status_column in df.columns:
+        raw_status = _category_column(df, config.status_column)
+        category_codes = status_values.get_indexer(
+            raw_status.cat.categories.str.lower()
+        )
+        raw_codes = raw_status.cat.codes.to_numpy()
+        mapped = np.append(category_codes, -1)[raw_codes]
+        status_codes = np.where(mapped >= 0, mapped, status_codes)
+    status = pd.Categorical.from_codes(status_codes, categories=status_values)
 
-        for _, row in df.iterrows():
-            claim = ClaimRecord(
-                claim_id=str(row[config.claim_id_column]),
-                warranty_id=str(row[config.warranty_id_column]),
-                claim_date=row[config.claim_date_column],
-                issue_description=str(row[config.issue_description_column]),
-            )
+    frame = pd.DataFrame(
+        {
+            "claim_id": df[config.claim_id_column].astype(str),
+            "warranty_id": _category_column(df, config.warranty_id_column),
+            "claim_date": pd.to_datetime(df[config.claim_date_column]),
+            "issue_description": _category_column(
+                df, config.issue_description_column
+            ),
+            "status": status,
+            "service_provider": _category_column(df, config.service_provider_column),
+            "claim_amount": _optional_column(df, config.claim_amount_column, "Float64"),
+        }
+    )
 
-            if config.status_column and config.status_column in df.columns:
-                if pd.notna(row[config.status_column]):
-                    try:
-                        claim.status = ClaimStatus(
-                            str(row[config.status_column]).lower()
-                        )
-                    except ValueError:
-                        pass
+    logger.info(f"Loaded {len(frame)} claim records")
+    return frame
 
-            if (
-                config.service_provider_column
-                and config.service_provider_column in df.columns
-            ):
-                if pd.notna(row[config.service_provider_column]):
-                    claim.service_provider = str(
-                        row[config.service_provider_column]
-                    )
 
-            if (
-                config.claim_amount_column
-                and config.claim_amount_column in df.columns
-            ):
-                if pd.notna(row[config.claim_amount_column]):
-                    claim.claim_amount = float(row[config.claim_amount_column])
+def load_warranty_data(
+    config: WarrantyDataConfig, project_root: Path
+) -> Dict[str, WarrantyRecord]:
+    """Load warranty data from file.
+
+    Args:
+        config: Warranty data configuration
+        project_root: Project root directory
 
-            claims.append(claim)
+    Returns:
+        Dictionary mapping warranty_id to WarrantyRecord
 
-        logger.info(f"Loaded {len(claims)} claim records")
-        return claims
+    Raises:
+        FileNotFoundError: If data file does not exist
+        ValueError: If data format is invalid
+    """
+    frame = load_warranty_frame(config, project_root)
+    return {
+        warranty_id: WarrantyRecord(
+            warranty_id=warranty_id,
+            customer_id=customer_id,
+            product_id=product_id,
+            purchase_date=purchase_date,
+            warranty_start_date=warranty_start_date,
+            warranty_duration_months=duration,
+            coverage_type=coverage_type,
+        )
+        for (
+            warranty_id,
+            customer_id,
+            product_id,
+            purchase_date,
+            warranty_start_date,
+            duration,
+            coverage_type,
+        ) in zip(
+            frame.index.tolist(),
+            frame["customer_id"].tolist(),
+            frame["product_id"].tolist(),
+            frame["purchase_date"].tolist(),
+            frame["warranty_start_date"].tolist(),
+            frame["warranty_duration_months"].tolist(),
+            _nullable_values(frame["coverage_type"]),
+        )
+    }
 
-    except pd.errors.EmptyDataError:
-        logger.warning(f"Claim data file is empty: {data_path}")
-        return []
-    except Exception as e:
-        logger.error(f"Failed to load claim data: {e}")
-        raise
+
+def load_claim_data(
+    config: ClaimDataConfig, project_root: Path
+) -> List[ClaimRecord]:
+    """Load claim data from file.
+
+    Args:
+        config: Claim data configuration
+        project_root: Project root directory
+
+    Returns:
+        List of ClaimRecord objects
+
+    Raises:
+        FileNotFoundError: If data file does not exist
+        ValueError: If data format is invalid
+    """
+    frame = load_claim_frame(config, project_root)
+    return [
+        ClaimRecord(
+            claim_id=claim_id,
+            warranty_id=warranty_id,
+            claim_date=claim_date,
+            issue_description=issue_description,
+            status=ClaimStatus(status),
+            service_provider=service_provider,
+            claim_amount=claim_amount,
+        )
+        for (
+            claim_id,
+            warranty_id,
+            claim_date,
+            issue_description,
+            status,
+            service_provider,
+            claim_amount,
+        ) in zip(
+            frame["claim_id"].tolist(),
+            frame["warranty_id"].tolist(),
+            frame["claim_date"].tolist(),
+            frame["issue_description"].astype(str).tolist(),
+            frame["status"].tolist(),
+            _nullable_values(frame["service_provider"]),
+            _nullable_values(frame["claim_amount"]),
+        )
+    ]
 
 
 def load_service_providers(
@@ -579,23 +786,59 @@ def assign_service_provider(
     Returns:
         Provider ID if assigned, None otherwise
     """
-    if not providers:
-        return None
+    return ProviderDispatcher(providers).assign()
 
-    available_providers = [
-        p
-        for p in providers.values()
-        if p.capacity is None or p.active_claims < p.capacity
-    ]
 
-    if not available_providers:
-        return None
+class ProviderDispatcher:
+    """Dispatch claims to the least loaded provider with spare capacity.
 
-    available_providers.sort(key=lambda x: x.active_claims)
-    assigned = available_providers[0]
-    assigned.active_claims += 1
+    Providers are kept in a min-heap keyed by (active_claims, position in
+    the providers dictionary), so each assignment costs O(log P) and ties go
+    to the provider listed first. Providers that reach capacity leave the
+    heap. Assignments update ServiceProvider.active_claims in place.
+    """
 
-    return assigned.provider_id
+    def __init__(self, providers: Dict[str, ServiceProvider]):
+        """Build the heap from providers that have spare capacity.
+
+        Args:
+            providers: Dictionary of available providers
+        """
+        self._providers = list(providers.values())
+        self._heap = [
+            (provider.active_claims, order)
+            for order, provider in enumerate(self._providers)
+            if self._has_capacity(provider)
+        ]
+        heapq.heapify(self._heap)
+
+    @staticmethod
+    def _has_capacity(provider: ServiceProvider) -> bool:
+        """Check whether a provider can take another claim."""
+        return provider.capacity is None or provider.active_claims < provider.capacity
+
+    def __bool__(self) -> bool:
+        """Return True while any provider has spare capacity."""
+        return bool(self._heap)
+
+    def assign(self) -> Optional[str]:
+        """Assign one claim to the least loaded provider.
+
+        Returns:
+            Provider ID if assigned, None if every provider is at capacity
+        """
+        if not self._heap:
+            return None
+
+        _, order = self._heap[0]
+        provider = self._providers[order]
+        provider.active_claims += 1
+        if self._has_capacity(provider):
+            heapq.heapreplace(self._heap, (provider.active_claims, order))
+        else:
+            heapq.heappop(self._heap)
+
+        return provider.provider_id
 
 
 def process_claims(
@@ -616,6 +859,7 @@ def process_claims(
         List of processed claim records
     """
     processed_claims = []
+    dispatcher = ProviderDispatcher(providers)
 
     for claim in claims:
         warranty = warranties.get(claim.warranty_id)
@@ -635,7 +879,7 @@ def process_claims(
                     claim.status = ClaimStatus.APPROVED
 
             if claim.status == ClaimStatus.APPROVED and not claim.service_provider:
-                provider_id = assign_service_provider(claim, providers)
+                provider_id = dispatcher.assign()
                 if provider_id:
                     claim.service_provider = provider_id
                     claim.status = ClaimStatus.IN_PROGRESS
@@ -654,6 +898,149 @@ def process_claims(
     return processed_claims
 
 
+def process_claims_frame(
+    claims: pd.DataFrame,
+    warranties: pd.DataFrame,
+    providers: Dict[str, ServiceProvider],
+    config: ValidationConfig,
+) -> pd.DataFrame:
+    """Process claims through validation and assignment on columns.
+
+    Columnar equivalent of process_claims: coverage and status transitions
+    are computed for all claims at once, and only approved claims without
+    a provider go through the ProviderDispatcher heap in claim order.
+
+    Args:
+        claims: Claim DataFrame from load_claim_frame
+        warranties: Warranty DataFrame from load_warranty_frame
+        providers: Dictionary of service providers
+        config: Validation configuration
+
+    Returns:
+        Copy of claims with updated status and service_provider columns
+        and added coverage_status and validation_notes columns
+    """
+    processed = claims.copy()
+    positions = _category_positions(processed["warranty_id"], warranties.index)
+    found = positions >= 0
+
+    start_dates = np.append(
+        warranties["warranty_start_date"].to_numpy(dtype="datetime64[ns]"),
+        np.datetime64("NaT"),
+    )[positions]
+    durations = np.append(
+        warranties["warranty_duration_months"].to_numpy(dtype=np.int64), 0
+    )[positions]
+    end_dates = start_dates + durations * np.timedelta64(30, "D")
+    claim_dates = processed["claim_date"].to_numpy(dtype="datetime64[ns]")
+
+    expired = found & (
+        config.require_active_warranty
+        & ~((start_dates <= claim_dates) & (claim_dates <= end_dates))
+    )
+
+    coverage_type = warranties["coverage_type"]
+    has_coverage_type = np.append(
+        _category_flags(coverage_type, lambda values: values != ""), False
+    )[positions]
+    accidental_coverage = np.append(
+        _category_flags(
+            coverage_type,
+            lambda values: values.str.lower().str.contains("accidental", regex=False),
+        ),
+        False,
+    )[positions]
+    accidental_issue = _category_flags(
+        processed["issue_description"],
+        lambda values: values.str.lower().str.contains("accidental", regex=False),
+    )
+    not_covered = (
+        found
+        & ~expired
+        & config.validate_coverage_type
+        & has_coverage_type
+        & accidental_issue
+        & ~accidental_coverage
+    )
+
+    coverage_values = [coverage.value for coverage in CoverageStatus]
+    coverage_codes = np.select(
+        [~found, expired, not_covered],
+        [
+            coverage_values.index(CoverageStatus.INVALID.value),
+            coverage_values.index(CoverageStatus.EXPIRED.value),
+            coverage_values.index(CoverageStatus.NOT_COVERED.value),
+        ],
+        coverage_values.index(CoverageStatus.COVERED.value),
+    )
+    processed["coverage_status"] = pd.Categorical.from_codes(
+        coverage_codes, categories=coverage_values
+    )
+
+    notes = np.full(len(processed), "Coverage validated", dtype=object)
+    notes[~found] = "Warranty not found"
+    notes[expired] = "Warranty expired on " + _format_dates(
+        end_dates[expired], "%Y-%m-%d"
+    )
+    notes[not_covered] = "Issue type not covered by warranty"
+    processed["validation_notes"] = notes
+
+    status_values = pd.Index([status_value.value for status_value in ClaimStatus])
+    status_codes = (
+        processed["status"]
+        .astype(pd.CategoricalDtype(status_values))
+        .cat.codes.to_numpy()
+        .copy()
+    )
+    covered = coverage_codes == coverage_values.index(CoverageStatus.COVERED.value)
+    submitted = status_codes == status_values.get_loc(ClaimStatus.SUBMITTED.value)
+    status_codes[covered & submitted] = status_values.get_loc(
+        ClaimStatus.VALIDATED.value
+    )
+    status_codes[~covered & submitted] = status_values.get_loc(
+        ClaimStatus.DENIED.value
+    )
+
+    amounts = processed["claim_amount"].to_numpy(dtype=np.float64, na_value=np.nan)
+    auto_approve = (amounts != 0) & (amounts <= config.auto_approve_threshold)
+    validated = status_codes == status_values.get_loc(ClaimStatus.VALIDATED.value)
+    status_codes[covered & auto_approve & validated] = status_values.get_loc(
+        ClaimStatus.APPROVED.value
+    )
+
+    service_provider = processed["service_provider"].astype("category")
+    # Category codes are int8 for up to 127 providers; dispatch can add more.
+    provider_codes = service_provider.cat.codes.to_numpy().astype(np.int64)
+    provider_categories = list(service_provider.cat.categories)
+    provider_code_map = {
+        provider_id: code for code, provider_id in enumerate(provider_categories)
+    }
+    needs_provider = np.flatnonzero(
+        (status_codes == status_values.get_loc(ClaimStatus.APPROVED.value))
+        & (provider_codes < 0)
+    )
+    dispatcher = ProviderDispatcher(providers)
+    for position in needs_provider:
+        provider_id = dispatcher.assign()
+        if provider_id is None:
+            break
+        if provider_id not in provider_code_map:
+            provider_code_map[provider_id] = len(provider_categories)
+            provider_categories.append(provider_id)
+        provider_codes[position] = provider_code_map[provider_id]
+        status_codes[position] = status_values.get_loc(ClaimStatus.IN_PROGRESS.value)
+
+    processed["status"] = pd.Categorical.from_codes(
+        status_codes, categories=status_values
+    )
+    processed["service_provider"] = pd.Categorical.from_codes(
+        provider_codes, categories=provider_categories
+    )
+
+    logger.info(f"Processed {len(processed)} claims")
+    return processed
+
+
 def generate_analytics(
     claims: List[ClaimRecord],
     warranties: Dict[str, WarrantyRecord],
@@ -735,6 +1122,88 @@ def generate_analytics(
     )
 
 
+def _value_counts(series: pd.Series) -> Dict[str, int]:
+    """Count non-missing values, leaving out unused categories."""
+    counts = series.value_counts(sort=False)
+    return {str(value): int(count) for value, count in counts.items() if count}
+
+
+def generate_analytics_frame(
+    claims: pd.DataFrame,
+    total_warranties: int,
+    providers: Dict[str, ServiceProvider],
+) -> WarrantyAnalytics:
+    """Generate warranty analytics directly on columns.
+
+    Columnar equivalent of generate_analytics.
+
+    Args:
+        claims: Processed claim DataFrame from process_claims_frame
+        total_warranties: Number of warranty records
+        providers: Dictionary of service providers
+
+    Returns:
+        WarrantyAnalytics object
+    """
+    claims_by_status = _value_counts(claims["status"])
+    coverage_results = _value_counts(claims["coverage_status"])
+
+    amounts = claims["claim_amount"].to_numpy(dtype=np.float64, na_value=np.nan)
+    amounts = amounts[~np.isnan(amounts) & (amounts != 0)]
+    total_claim_amount = float(amounts.sum()) if len(amounts) else 0.0
+    avg_claim_amount = total_claim_amount / len(amounts) if len(amounts) else 0.0
+
+    approved_count = claims_by_status.get(ClaimStatus.APPROVED.value, 0)
+    completed_count = claims_by_status.get(ClaimStatus.COMPLETED.value, 0)
+    denied_count = claims_by_status.get(ClaimStatus.DENIED.value, 0)
+    total_processed = approved_count + completed_count + denied_count
+    approval_rate = (
+        (approved_count + completed_count) / total_processed
+        if total_processed > 0
+        else 0.0
+    )
+
+    provider_totals = _value_counts(claims["service_provider"])
+    provider_completed = _value_counts(
+        claims["service_provider"][claims["status"] == ClaimStatus.COMPLETED.value]
+    )
+    provider_performance = {}
+    for provider_id, provider in providers.items():
+        total = provider_totals.get(provider_id, 0)
+        if total:
+            completed = provider_completed.get(provider_id, 0)
+            provider_performance[provider_id] = {
+                "name": provider.provider_name,
+                "total_claims": total,
+                "completed_claims": completed,
+                "completion_rate": completed / total,
+            }
+
+    months, month_counts = np.unique(
+        claims["claim_date"].dropna().to_numpy(dtype="datetime64[M]"),
+        return_counts=True,
+    )
+    claims_by_month = dict(
+        zip(
+            pd.DatetimeIndex(months).strftime("%Y-%m").tolist(),
+            month_counts.tolist(),
+        )
+    )
+
+    return WarrantyAnalytics(
+        total_claims=len(claims),
+        total_warranties=total_warranties,
+        claims_by_status=claims_by_status,
+        coverage_validation_results=coverage_results,
+        total_claim_amount=total_claim_amount,
+        avg_claim_amount=avg_claim_amount,
+        approval_rate=approval_rate,
+        provider_performance=provider_performance,
+        claims_by_month=claims_by_month,
+        generated_at=datetime.now(),
+    )
+
+
 def write_markdown_report(
     analytics: WarrantyAnalytics, output_path: Path
 ) -> None:
@@ -821,24 +1290,26 @@ def process_warranty_claims(config_path: Path) -> Dict[str, any]:
     config = load_config(config_path)
     project_root = config_path.parent
 
-    warranties = load_warranty_data(config.warranty_data, project_root)
-    claims = load_claim_data(config.claim_data, project_root)
+    warranties = load_warranty_frame(config.warranty_data, project_root)
+    claims = load_claim_frame(config.claim_data, project_root)
     providers = load_service_providers(
         config.service_provider, project_root
     )
 
-    if not claims:
+    if claims.empty:
         logger.warning("No claims available for processing")
         return {
             "claims_processed": 0,
             "analytics": None,
         }
 
-    processed_claims = process_claims(
+    processed_claims = process_claims_frame(
         claims, warranties, providers, config.validation
     )
 
-    analytics = generate_analytics(processed_claims, warranties, providers)
+    analytics = generate_analytics_frame(
+        processed_claims, len(warranties), providers
+    )
 
     report_path = Path(config.analytics.output_path)
     if not report_path.is_absolute():
@@ -853,17 +1324,31 @@ def process_warranty_claims(config_path: Path) -> Dict[str, any]:
     claims_output.parent.mkdir(parents=True, exist_ok=True)
     claims_data = [
         {
-            "claim_id": claim.claim_id,
-            "warranty_id": claim.warranty_id,
-            "status": claim.status.value,
-            "coverage_status": (
-                claim.coverage_status.value if claim.coverage_status else None
-            ),
-            "service_provider": claim.service_provider,
-            "claim_amount": claim.claim_amount,
-            "validation_notes": claim.validation_notes,
+            "claim_id": claim_id,
+            "warranty_id": warranty_id,
+            "status": status,
+            "coverage_status": coverage_status,
+            "service_provider": service_provider,
+            "claim_amount": claim_amount,
+            "validation_notes": validation_notes,
         }
-        for claim in processed_claims
+        for (
+            claim_id,
+            warranty_id,
+            status,
+            coverage_status,
+            service_provider,
+            claim_amount,
+            validation_notes,
+        ) in zip(
+            processed_claims["claim_id"].tolist(),
+            processed_claims["warranty_id"].tolist(),
+            processed_claims["status"].tolist(),
+            processed_claims["coverage_status"].tolist(),
+            _nullable_values(processed_claims["service_provider"]),
+            _nullable_values(processed_claims["claim_amount"]),
+            processed_claims["validation_notes"].tolist(),
+        )
     ]
 
     with open(claims_output, "w", encoding="utf-8") as f:
@@ -2,17 +2,28 @@
 
 from datetime import datetime, timedelta
 
+import pandas as pd
 import pytest
 
 from warranty_claims_processor.src.main import (
+    ClaimDataConfig,
     ClaimRecord,
     ClaimStatus,
     CoverageStatus,
+    ProviderDispatcher,
     ServiceProvider,
     ValidationConfig,
+    WarrantyDataConfig,
     WarrantyRecord,
     assign_service_provider,
+    generate_analytics,
+    generate_analytics_frame,
+    load_claim_data,
+    load_claim_frame,
+    load_warranty_data,
+    load_warranty_frame,
     process_claims,
+    process_claims_frame,
     validate_coverage,
 )
 
@@ -238,3 +249,161 @@ def test_process_claims_denied():
     assert len(processed) == 1
     assert processed[0].status == ClaimStatus.DENIED
     assert processed[0].coverage_status == CoverageStatus.EXPIRED
+
+
+def test_process_claims_frame_matches_records(tmp_path):
+    """Test columnar claim processing matches the record path."""
+    now = datetime.now()
+    pd.DataFrame(
+        {
+            "warranty_id": ["warr_001", "warr_002", "warr_003"],
+            "customer_id": ["cust_001", "cust_002", "cust_003"],
+            "product_id": ["prod_001", "prod_002", "prod_003"],
+            "purchase_date": [(now - timedelta(days=100)).isoformat()] * 3,
+            "warranty_start_date": [
+                (now - timedelta(days=days)).isoformat() for days in (100, 900, 50)
+            ],
+            "warranty_duration_months": [24, 12, 12],
+            "coverage_type": ["standard", "standard", "accidental"],
+        }
+    ).to_csv(tmp_path / "warranties.csv", index=False)
+    pd.DataFrame(
+        {
+            "claim_id": ["claim_001", "claim_002", "claim_003", "claim_004"],
+            "warranty_id": ["warr_001", "warr_002", "warr_003", "warr_999"],
+            "claim_date": [now.isoformat()] * 4,
+            "issue_description": [
+                "Screen cracked",
+                "Battery failure",
+                "Accidental drop damage",
+                "Will not power on",
+            ],
+            "status": ["submitted"] * 4,
+            "claim_amount": [300.0, 100.0, 900.0, 50.0],
+        }
+    ).to_csv(tmp_path / "claims.csv", index=False)
+    warranty_config = WarrantyDataConfig(
+        file_path="warranties.csv", coverage_type_column="coverage_type"
+    )
+    claim_config = ClaimDataConfig(
+        file_path="claims.csv",
+        status_column="status",
+        claim_amount_column="claim_amount",
+    )
+    config = ValidationConfig(validate_coverage_type=True)
+
+    def providers():
+        return {
+            "prov_001": ServiceProvider(
+                provider_id="prov_001", provider_name="Provider A", capacity=10
+            ),
+        }
+
+    warranties = load_warranty_data(warranty_config, tmp_path)
+    expected = process_claims(
+        load_claim_data(claim_config, tmp_path), warranties, providers(), config
+    )
+    expected_analytics = generate_analytics(expected, warranties, providers())
+
+    warranty_frame = load_warranty_frame(warranty_config, tmp_path)
+    processed = process_claims_frame(
+        load_claim_frame(claim_config, tmp_path), warranty_frame, providers(), config
+    )
+    analytics = generate_analytics_frame(processed, len(warranty_frame), providers())
+
+    assert processed["status"].astype(str).tolist() == [
+        claim.status.value for claim in expected
+    ]
+    assert processed["coverage_status"].astype(str).tolist() == [
+        claim.coverage_status.value for claim in expected
+    ]
+    assert analytics.claims_by_status == expected_analytics.claims_by_status
+    assert analytics.coverage_validation_results == (
+        expected_analytics.coverage_validation_results
+    )
+    assert analytics.approval_rate == pytest.approx(expected_analytics.approval_rate)
+
+
+def test_process_claims_frame_assigns_more_than_127_providers(tmp_path):
+    """Test provider assignment past the int8 range of category codes."""
+    now = datetime.now()
+    count = 200
+    warranty_ids = [f"warr_{i:03d}" for i in range(count)]
+    pd.DataFrame(
+        {
+            "warranty_id": warranty_ids,
+            "customer_id": [f"cust_{i:03d}" for i in range(count)],
+            "product_id": ["prod_001"] * count,
+            "purchase_date": [(now - timedelta(days=30)).isoformat()] * count,
+            "warranty_start_date": [(now - timedelta(days=30)).isoformat()] * count,
+            "warranty_duration_months": [12] * count,
+        }
+    ).to_csv(tmp_path / "warranties.csv", index=False)
+    pd.DataFrame(
+        {
+            "claim_id": [f"claim_{i:03d}" for i in range(count)],
+            "warranty_id": warranty_ids,
+            "claim_date": [now.isoformat()] * count,
+            "issue_description": ["Will not power on"] * count,
+            "claim_amount": [100.0] * count,
+        }
+    ).to_csv(tmp_path / "claims.csv", index=False)
+    providers = {
+        f"prov_{i:03d}": ServiceProvider(
+            provider_id=f"prov_{i:03d}", provider_name=f"Provider {i}", capacity=1
+        )
+        for i in range(count)
+    }
+
+    processed = process_claims_frame(
+        load_claim_frame(
+            ClaimDataConfig(file_path="claims.csv", claim_amount_column="claim_amount"),
+            tmp_path,
+        ),
+        load_warranty_frame(WarrantyDataConfig(file_path="warranties.csv"), tmp_path),
+        providers,
+        ValidationConfig(),
+    )
+
+    assert processed["status"].astype(str).tolist() == ["in_progress"] * count
+    assert sorted(processed["service_provider"].astype(str)) == sorted(providers)
+    assert all(provider.active_claims == 1 for provider in providers.values())
+
+
+def test_provider_dispatcher_balances_load_within_capacity():
+    """Test heap dispatch picks the least loaded provider and honours capacity."""
+    providers = {
+        "prov_001": ServiceProvider(
+            provider_id="prov_001", provider_name="A", capacity=1
+        ),
+        "prov_002": ServiceProvider(
+            provider_id="prov_002", provider_name="B", active_claims=1
+        ),
+        "prov_003": ServiceProvider(
+            provider_id="prov_003", provider_name="C", capacity=2
+        ),
+    }
+
+    dispatcher = ProviderDispatcher(providers)
+    assigned = [dispatcher.assign() for _ in range(5)]
+
+    assert assigned == ["prov_001", "prov_003", "prov_002", "prov_003", "prov_002"]
+    assert providers["prov_001"].active_claims == 1
+    assert providers["prov_002"].active_claims == 3
+    assert providers["prov_003"].active_claims == 2
+    assert dispatcher
+
+
+def test_provider_dispatcher_exhausted():
+    """Test dispatch returns None once every provider is at capacity."""
+    providers = {
+        "prov_001": ServiceProvider(
+            provider_id="prov_001", provider_name="A", capacity=1
+        ),
+    }
+
+    dispatcher = ProviderDispatcher(providers)
+
+    assert dispatcher.assign() == "prov_001"
+    assert not dispatcher
+    assert dispatcher.assign() is None